@@ -0,0 +1,5 @@
+"""Allow running sully as ``python -m sully``."""
+
+from sully.cli import cli
+
+cli(prog_name="sully")
@@ -0,0 +1,265 @@
+"""In-process API: run sully's gates against a project and get structured results.
+
+Unlike the CLI commands, these functions never print or exit, and they take
+the project directory explicitly instead of relying on the working directory.
+That makes them safe to call concurrently for many projects from threads, or
+from asyncio via ``asyncio.to_thread``::
+
+    with ThreadPoolExecutor() as pool:
+        results = list(pool.map(sully.api.check, project_dirs))
+
+A missing pyproject.toml raises FileNotFoundError; a missing uv, or pyright
+output that isn't a JSON report, raises RuntimeError.
+"""
+
+import json
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+from sully import perf, stubs, uv
+from sully.cache import artifact_cache, input_key, pack_dir, unpack_dir
+from sully.commands.test import fixture_cache_env, memory_args
+from sully.config import (
+    find_pyproject,
+    get_check_config,
+    get_doc_config,
+    get_main_script,
+    get_perf_config,
+    get_stubs_config,
+)
+from sully.diagnostics import Diagnostic
+from sully.imports import HEAVY_MODULES, find_deferrable_imports
+from sully.index import project_files
+from sully.pytest_plugins import plugin_env
+
+__all__ = ["Result", "check", "doc", "run", "sync", "test"]
+
+
+class Result(NamedTuple):
+    """Outcome of one sully operation on one project."""
+
+    project: Path
+    returncode: int
+    output: str
+    timings: dict[str, float]
+    diagnostics: tuple[Diagnostic, ...] = ()
+    artifacts: tuple[Path, ...] = ()
+
+    @property
+    def ok(self) -> bool:
+        """True if the operation succeeded."""
+        return self.returncode == 0
+
+    @property
+    def seconds(self) -> float:
+        """Total wall-clock time across all stages."""
+        return sum(self.timings.values())
+
+
+def check(project: Path | str = ".", *, imports: bool = False) -> Result:
+    """Run pyright, the performance checks and (optionally) the heavy-import check.
+
+    Unlike ``sully check``, every stage runs even if an earlier one fails, so the
+    result carries all diagnostics at once.
+    """
+    root = _project_root(project)
+    cfg = get_check_config(root)
+    returncode = 0
+    output: list[str] = []
+    timings: dict[str, float] = {}
+    diagnostics: list[Diagnostic] = []
+
+    if cfg["mode"] != "off":
+        stubs_cfg = get_stubs_config(root)
+        if stubs_cfg["auto"] and stubs.stub_path(root) == stubs.STUB_DIR and (root / "uv.lock").is_file():
+            start = time.perf_counter()
+            if not stubs.is_fresh(root, stubs_cfg["exclude"]):
+                _require_uv()
+                try:
+                    stubs.build(root, stubs_cfg["exclude"])
+                except RuntimeError as exc:
+                    output.append(f"Stubs not regenerated: {exc}\n")
+            timings["stubs"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        rc, out, found = _pyright(root, cfg["mode"])
+        timings["pyright"] = time.perf_counter() - start
+        returncode = returncode or rc
+        output.append(out)
+        diagnostics.extend(found)
+
+    src = root / "src"
+    perf_cfg = get_perf_config(root)
+    if perf_cfg["enabled"] and src.is_dir():
+        start = time.perf_counter()
+        entries = project_files(root, ["src"], ".py")
+        found = perf.scan(
+            [root / e.path for e in entries],
+            root,
+            perf_cfg["severity"],
+            perf_cfg["hot-modules"],
+            cache_file=root / ".sully" / "cache" / "perf.json",
+            digests={str(root / e.path): e.sha256 for e in entries},
+        )
+        timings["perf"] = time.perf_counter() - start
+        if any(d.severity == "error" for d in found):
+            returncode = returncode or 1
+        diagnostics.extend(found)
+
+    if imports and src.is_dir():
+        start = time.perf_counter()
+        heavy = HEAVY_MODULES | frozenset(cfg["heavy-imports"])
+        files = [root / e.path for e in project_files(root, ["src"], ".py") if heavy.intersection(e.imports)]
+        found = [d for py_file in files for d in find_deferrable_imports(py_file, heavy)]
+        timings["imports"] = time.perf_counter() - start
+        if found:
+            returncode = returncode or 1
+        diagnostics.extend(found)
+
+    return Result(root, returncode, "".join(output), timings, tuple(diagnostics))
+
+
+def test(project: Path | str = ".", args: list[str] | None = None, *, memory: bool = False) -> Result:
+    """Run pytest; the JUnit XML report is returned as an artifact."""
+    root = _project_root(project)
+    _require_uv()
+    report = root / ".sully" / "reports" / "junit.xml"
+    report.parent.mkdir(parents=True, exist_ok=True)
+    extra = memory_args(root) if memory else []
+
+    start = time.perf_counter()
+    proc = uv.run_captured(
+        ["pytest", f"--junitxml={report}", *extra, *(args or [])],
+        cwd=root,
+        env={**plugin_env(), **fixture_cache_env(root)},
+    )
+    timings = {"pytest": time.perf_counter() - start}
+    artifacts = (report,) if report.is_file() else ()
+    return Result(root, proc.returncode, proc.stdout, timings, artifacts=artifacts)
+
+
+def doc(project: Path | str = ".") -> Result:
+    """Generate docs with pdoc; the output directory is returned as an artifact."""
+    root = _project_root(project)
+    _require_uv()
+    name = get_doc_config(root)["output"]
+    output = root / name
+    start = time.perf_counter()
+
+    cache = artifact_cache(root)
+    key = input_key("pdoc", root, ["pyproject.toml", "uv.lock", "src"], {"output": name})
+    cached = cache.get(key) if cache is not None else None
+    if cached is not None and unpack_dir(cached, output):
+        return Result(root, 0, "", {"pdoc": time.perf_counter() - start}, artifacts=(output,))
+
+    proc = uv.run_captured(["pdoc", f"--output-directory={name}", "src/"], cwd=root)
+    if cache is not None and proc.returncode == 0 and output.is_dir():
+        cache.put(key, pack_dir(output))
+    timings = {"pdoc": time.perf_counter() - start}
+    artifacts = (output,) if proc.returncode == 0 and output.is_dir() else ()
+    return Result(root, proc.returncode, proc.stdout, timings, artifacts=artifacts)
+
+
+def run(project: Path | str = ".", *, no_check: bool = False, no_doc: bool = False) -> Result:
+    """Run the configured gates, then the main script; stops at the first failing gate."""
+    root = _project_root(project)
+    main_script = get_main_script(root)
+    if not main_script:
+        raise ValueError("No main script configured. Set [tool.sully] main = 'src/…/main.py' in pyproject.toml.")
+
+    output: list[str] = []
+    timings: dict[str, float] = {}
+    diagnostics: tuple[Diagnostic, ...] = ()
+    artifacts: tuple[Path, ...] = ()
+
+    cfg = get_check_config(root)
+    if not no_check and cfg["check-before-run"] and cfg["mode"] != "off":
+        gate = check(root)
+        output.append(gate.output)
+        timings.update(gate.timings)
+        diagnostics = gate.diagnostics
+        if not gate.ok:
+            return Result(root, gate.returncode, "".join(output), timings, diagnostics)
+
+    if not no_doc and get_doc_config(root)["doc-before-run"]:
+        gate = doc(root)
+        output.append(gate.output)
+        timings.update(gate.timings)
+        artifacts = gate.artifacts
+        if not gate.ok:
+            return Result(root, gate.returncode, "".join(output), timings, diagnostics, artifacts)
+
+    start = time.perf_counter()
+    proc = uv.run_captured(["python", main_script], cwd=root)
+    timings["main"] = time.perf_counter() - start
+    output.append(proc.stdout)
+    return Result(root, proc.returncode, "".join(output), timings, diagnostics, artifacts)
+
+
+def sync(project: Path | str = ".") -> Result:
+    """Install the project's dependencies with uv sync."""
+    root = _project_root(project)
+    _require_uv()
+    start = time.perf_counter()
+    proc = uv.sync_captured(cwd=root)
+    timings = {"sync": time.perf_counter() - start}
+    lock = root / "uv.lock"
+    return Result(root, proc.returncode, proc.stdout, timings, artifacts=(lock,) if lock.is_file() else ())
+
+
+def _project_root(project: Path | str) -> Path:
+    return find_pyproject(Path(project)).parent
+
+
+def _require_uv() -> None:
+    """Turn uv.ensure_uv's exit into an exception callers can handle."""
+    try:
+        uv.ensure_uv()
+    except SystemExit as exc:
+        raise RuntimeError(str(exc.code)) from None
+
+
+def _pyright(root: Path, mode: str) -> tuple[int, str, list[Diagnostic]]:
+    """Run pyright with JSON output and parse its diagnostics, via the artifact cache."""
+    cache = artifact_cache(root)
+    key = input_key(
+        "pyright-json",
+        root,
+        ["pyproject.toml", "pyrightconfig.json", "uv.lock", ".python-version", "src", "tests"],
+        {"mode": mode},
+    )
+    cached = cache.get_json(key) if cache is not None else None
+    if cached is not None:
+        return cached["returncode"], cached["output"], _parse_pyright(cached["output"])
+    _require_uv()
+    # uv and pyright write notes to stderr; only stdout holds the JSON report.
+    proc = uv.run_captured(["pyright", f"--level={mode}", "--outputjson"], cwd=root, merge_stderr=False)
+    diagnostics = _parse_pyright(proc.stdout, proc.stderr)
+    if cache is not None:
+        cache.put_json(key, {"returncode": proc.returncode, "output": proc.stdout})
+    return proc.returncode, proc.stdout, diagnostics
+
+
+def _parse_pyright(output: str, stderr: str = "") -> list[Diagnostic]:
+    """Convert pyright's ``--outputjson`` report into diagnostics (1-based positions).
+
+    Raises RuntimeError, with *stderr* for context, if *output* isn't a report.
+    """
+    try:
+        report = json.loads(output)
+    except ValueError:
+        raise RuntimeError(f"pyright did not produce a JSON report:\n{stderr or output}") from None
+    if not isinstance(report, dict):
+        raise RuntimeError(f"pyright did not produce a JSON report:\n{stderr or output}")
+    return [
+        Diagnostic(
+            Path(d["file"]),
+            d["range"]["start"]["line"] + 1,
+            d["range"]["start"]["character"] + 1,
+            d["severity"],
+            d["message"],
+            d.get("rule", ""),
+        )
+        for d in report.get("generalDiagnostics", [])
+    ]
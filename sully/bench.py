@@ -0,0 +1,167 @@
+"""Run benchmarks in the project environment and fit the empirical complexity of scaling benchmarks."""
+
+import json
+import math
+from collections.abc import Callable
+from pathlib import Path
+from typing import NamedTuple
+
+from sully import uv
+from sully.runners import runner_env
+
+# Candidate complexity classes, from best to worst.
+COMPLEXITIES: dict[str, Callable[[float], float]] = {
+    "O(1)": lambda n: 1.0,
+    "O(log n)": lambda n: math.log2(n),
+    "O(n)": lambda n: n,
+    "O(n log n)": lambda n: n * math.log2(n),
+    "O(n^2)": lambda n: n**2,
+    "O(n^3)": lambda n: n**3,
+}
+_RANK = {name: i for i, name in enumerate(COMPLEXITIES)}
+# Polynomial degree of each class; non-strict comparisons ignore log factors,
+# which are hard to tell from cache effects over a few decades of n.
+_DEGREE = {"O(1)": 0, "O(log n)": 0, "O(n)": 1, "O(n log n)": 1, "O(n^2)": 2, "O(n^3)": 3}
+
+# A simpler class wins unless a more complex one fits clearly better, so noise
+# doesn't turn a clean O(n) into O(n log n).
+_PREFER_SIMPLER = (1.25, 0.05)
+
+# Peak allocations below this many bytes are interpreter noise, not data.
+MEMORY_FLOOR = 1024
+
+# Fewer measured sizes than this cannot tell the classes apart.
+MIN_SIZES = 4
+
+
+class Fit(NamedTuple):
+    """Best-fitting complexity class for one series: ``value ≈ constant + coefficient * f(n)``."""
+
+    complexity: str
+    coefficient: float
+    error: float  # root-mean-square relative error of the fit
+
+
+class ScalingResult(NamedTuple):
+    """Fitted time and peak-memory complexity of one scaling benchmark."""
+
+    name: str
+    sizes: list[int]
+    time: Fit
+    memory: Fit
+
+
+def run_benchmarks(
+    root: Path,
+    bench_dir: Path,
+    *,
+    scaling: bool = False,
+    keyword: str | None = None,
+    **sizes: float,
+) -> dict:
+    """Run the sully_bench runner in the project environment and return its raw report.
+
+    *sizes* are passed through as runner options (``min_n``, ``max_n``, ``factor``,
+    ``min_time``, ``max_seconds``).
+    """
+    args = ["python", "-m", "sully_bench", str(bench_dir)]
+    if scaling:
+        args.append("--scaling")
+    if keyword:
+        args += ["-k", keyword]
+    for option, value in sizes.items():
+        args += [f"--{option.replace('_', '-')}", str(value)]
+    proc = uv.run_captured(args, cwd=root, env=runner_env())
+    lines = proc.stdout.strip().splitlines()
+    if proc.returncode != 0 or not lines:
+        raise RuntimeError(f"Benchmark run failed:\n{proc.stdout}")
+    return json.loads(lines[-1])
+
+
+def fit_complexity(sizes: list[int], values: list[float], *, floor: float = 1e-12) -> Fit:
+    """Fit *values* measured at *sizes* against every class in :data:`COMPLEXITIES`.
+
+    Values below *floor* are raised to it, so a series that stays under it fits O(1).
+    """
+    ys = [max(v, floor) for v in values]
+    fits: list[Fit] = []
+    for name, f in COMPLEXITIES.items():
+        xs = [f(n) for n in sizes]
+        coefficient, constant = _least_squares(xs, ys)
+        error = math.sqrt(sum(((constant + coefficient * x) / y - 1) ** 2 for x, y in zip(xs, ys)) / len(ys))
+        fits.append(Fit(name, coefficient, error))
+
+    best = min(fits, key=lambda fit: fit.error)
+    factor, slack = _PREFER_SIMPLER
+    for fit in fits:  # simplest first
+        if fit.error <= best.error * factor + slack:
+            return fit
+    return best
+
+
+def _least_squares(xs: list[float], ys: list[float]) -> tuple[float, float]:
+    """Return ``(slope, intercept)`` minimising squared relative error, with both clamped at zero."""
+    # Weighting each point by 1 / y**2 stops the largest size dominating the fit.
+    w = [1 / y**2 for y in ys]
+    sw = sum(w)
+    sx = sum(wi * x for wi, x in zip(w, xs))
+    sy = sum(wi * y for wi, y in zip(w, ys))
+    sxx = sum(wi * x * x for wi, x in zip(w, xs))
+    sxy = sum(wi * x * y for wi, x, y in zip(w, xs, ys))
+    denom = sw * sxx - sx * sx
+    slope = (sw * sxy - sx * sy) / denom if denom > 1e-12 * sw * sxx else 0.0
+    if slope <= 0:
+        return 0.0, sy / sw
+    intercept = (sy - slope * sx) / sw
+    if intercept < 0:
+        return sxy / sxx, 0.0
+    return slope, intercept
+
+
+def scaling_results(report: dict) -> tuple[list[ScalingResult], list[str]]:
+    """Fit every scaling benchmark in a runner *report*; also return those with too few sizes."""
+    results: list[ScalingResult] = []
+    too_few: list[str] = []
+    for name, measured in sorted(report.get("scaling", {}).items()):
+        sizes = measured["sizes"]
+        if len(sizes) < MIN_SIZES:
+            too_few.append(name)
+            continue
+        time_fit = fit_complexity(sizes, measured["seconds"])
+        memory_fit = fit_complexity(sizes, measured["peak"], floor=MEMORY_FLOOR)
+        results.append(ScalingResult(name, sizes, time_fit, memory_fit))
+    return results, too_few
+
+
+def load_baseline(path: Path) -> dict[str, dict[str, str]]:
+    """Return ``{benchmark: {"time": class, "memory": class}}`` from *path*, or {} if missing."""
+    if not path.is_file():
+        return {}
+    return json.loads(path.read_text())
+
+
+def save_baseline(path: Path, results: list[ScalingResult]) -> None:
+    """Write the fitted classes in *results* to *path*, keeping other benchmarks' entries."""
+    baseline = load_baseline(path)
+    for r in results:
+        baseline[r.name] = {"time": r.time.complexity, "memory": r.memory.complexity}
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+
+
+def regressions(
+    results: list[ScalingResult], baseline: dict[str, dict[str, str]], *, strict: bool = False
+) -> list[str]:
+    """Return a message for every time or memory class worse than in *baseline*.
+
+    Unless *strict*, only a higher polynomial degree counts: O(n) -> O(n log n) passes.
+    """
+    order = _RANK if strict else _DEGREE
+    problems: list[str] = []
+    for r in results:
+        expected = baseline.get(r.name, {})
+        for kind, fit in (("time", r.time), ("memory", r.memory)):
+            before = expected.get(kind)
+            if before in order and order[fit.complexity] > order[before]:
+                problems.append(f"{r.name}: {kind} scales as {fit.complexity}, baseline {before}")
+    return problems
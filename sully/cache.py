@@ -0,0 +1,202 @@
+"""Content-addressed artifact cache shared between machines.
+
+Artifacts (pyright results, built docs, wheels, …) are stored under the
+SHA-256 of everything that produced them. Backends are layered: reads try
+each in order and back-fill the earlier (usually local) ones on a hit;
+writes go to all of them. The HTTP backend speaks a minimal protocol —
+``GET <url>/<key>`` returns the blob or 404, ``PUT <url>/<key>`` stores it.
+"""
+
+import hashlib
+import http.client
+import io
+import json
+import os
+import shutil
+import tarfile
+import tempfile
+import urllib.error
+import urllib.request
+import zlib
+from pathlib import Path, PurePosixPath
+from typing import Protocol
+
+from sully.config import get_cache_config
+from sully.index import project_files
+
+# A malformed URL raises ValueError, a garbled response http.client.HTTPException; both are misses.
+_HTTP_ERRORS = (urllib.error.URLError, http.client.HTTPException, OSError, ValueError)
+
+# Bump to invalidate every stored artifact after an incompatible change.
+CACHE_VERSION = "1"
+
+
+class Backend(Protocol):
+    """Blob storage keyed by hex digest."""
+
+    def get(self, key: str) -> bytes | None: ...
+
+    def put(self, key: str, data: bytes) -> None: ...
+
+
+class LocalBackend:
+    """A directory of blobs, safe to share over NFS (writes are atomic renames)."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / key[2:]
+
+    def get(self, key: str) -> bytes | None:
+        try:
+            return self._path(key).read_bytes()
+        except OSError:
+            return None
+
+    def put(self, key: str, data: bytes) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+
+
+class HttpBackend:
+    """A remote cache server; network failures are treated as misses, never as errors."""
+
+    def __init__(self, url: str, token: str | None = None, timeout: float = 10.0) -> None:
+        self.url = url.rstrip("/")
+        self.token = token
+        self.timeout = timeout
+
+    def _request(self, key: str, method: str, data: bytes | None = None) -> urllib.request.Request:
+        request = urllib.request.Request(f"{self.url}/{key}", data=data, method=method)
+        if self.token:
+            request.add_header("Authorization", f"Bearer {self.token}")
+        return request
+
+    def get(self, key: str) -> bytes | None:
+        try:
+            with urllib.request.urlopen(self._request(key, "GET"), timeout=self.timeout) as response:
+                return response.read()
+        except _HTTP_ERRORS:
+            return None
+
+    def put(self, key: str, data: bytes) -> None:
+        try:
+            urllib.request.urlopen(self._request(key, "PUT", data), timeout=self.timeout).close()
+        except _HTTP_ERRORS:
+            pass
+
+
+class ArtifactCache:
+    """Layered content-addressed cache over one or more backends."""
+
+    def __init__(self, backends: list[Backend], *, push: bool = True) -> None:
+        self.backends = backends
+        self.push = push
+
+    def get(self, key: str) -> bytes | None:
+        for index, backend in enumerate(self.backends):
+            data = backend.get(key)
+            if data is not None:
+                for earlier in self.backends[:index]:
+                    earlier.put(key, data)
+                return data
+        return None
+
+    def put(self, key: str, data: bytes) -> None:
+        for index, backend in enumerate(self.backends):
+            # Remote backends (after the first) are only written when pushing.
+            if index == 0 or self.push:
+                backend.put(key, data)
+
+    def get_json(self, key: str) -> dict | None:
+        """Return the JSON object stored under *key*; a missing or corrupt blob is a miss."""
+        data = self.get(key)
+        if data is None:
+            return None
+        try:
+            value = json.loads(data)
+        except ValueError:  # includes UnicodeDecodeError
+            return None
+        return value if isinstance(value, dict) else None
+
+    def put_json(self, key: str, value: dict) -> None:
+        self.put(key, json.dumps(value).encode())
+
+
+def artifact_cache(start: Path | None = None) -> ArtifactCache | None:
+    """Return the project's configured cache, or None when caching is disabled."""
+    cfg = get_cache_config(start)
+    if not cfg["enabled"]:
+        return None
+    backends: list[Backend] = [LocalBackend(Path(cfg["dir"]).expanduser())]
+    if cfg["url"]:
+        backends.append(HttpBackend(cfg["url"], token=os.environ.get("SULLY_CACHE_TOKEN")))
+    return ArtifactCache(backends, push=cfg["push"])
+
+
+def input_key(kind: str, root: Path, paths: list[str], extra: dict | None = None) -> str:
+    """Hash *kind*, the contents of every file under *paths* (relative to *root*) and *extra*.
+
+    File hashes come from the project index, so unchanged files aren't read again.
+    """
+    digest = hashlib.sha256()
+    digest.update(json.dumps([CACHE_VERSION, kind, extra or {}], sort_keys=True).encode())
+    for entry in project_files(root, paths):
+        digest.update(entry.path.encode() + b"\0")
+        digest.update(bytes.fromhex(entry.sha256))
+    return digest.hexdigest()
+
+
+def pack_dir(path: Path) -> bytes:
+    """Return *path*'s contents as a gzipped tarball."""
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as tar:
+        for child in sorted(path.iterdir()):
+            tar.add(child, arcname=child.name)
+    return buffer.getvalue()
+
+
+def unpack_dir(data: bytes, dest: Path) -> bool:
+    """Replace *dest* with the contents of a tarball produced by :func:`pack_dir`.
+
+    The blob is extracted into a sibling directory that replaces *dest* only
+    once extraction succeeded. Blobs may come from a remote cache: a corrupt
+    or truncated one, or one with members that would land outside *dest*,
+    leaves *dest* untouched and returns False, to be treated as a miss.
+    """
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(prefix=f".{dest.name}-", dir=dest.parent))
+    try:
+        with tarfile.open(fileobj=io.BytesIO(data), mode="r:gz") as tar:
+            if hasattr(tarfile, "data_filter"):
+                tar.extractall(staging, filter="data")
+            else:  # Python < 3.11.4 has no extraction filters
+                _check_members(tar)
+                tar.extractall(staging)
+    except (tarfile.TarError, EOFError, zlib.error, OSError):
+        shutil.rmtree(staging, ignore_errors=True)
+        return False
+    aside = staging.with_name(staging.name + "-old")
+    if dest.exists():
+        dest.rename(aside)
+    staging.rename(dest)
+    shutil.rmtree(aside, ignore_errors=True)
+    return True
+
+
+def _check_members(tar: tarfile.TarFile) -> None:
+    """Reject absolute or ``..`` paths and link targets, and anything but files, directories and links."""
+
+    def unsafe(name: str) -> bool:
+        path = PurePosixPath(name)
+        return path.is_absolute() or ".." in path.parts
+
+    for member in tar.getmembers():
+        if not (member.isfile() or member.isdir() or member.issym() or member.islnk()):
+            raise tarfile.TarError(f"Refusing to extract special file {member.name!r} from a cached artifact")
+        if unsafe(member.name) or ((member.issym() or member.islnk()) and unsafe(member.linkname)):
+            raise tarfile.TarError(f"Refusing to extract {member.name!r} outside the destination")
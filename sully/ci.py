@@ -0,0 +1,102 @@
+"""Render the GitHub Actions workflow that `sully init` and `sully ci generate` write.
+
+check, doc and every test shard run as separate parallel jobs. Each job
+restores uv's package cache (via setup-uv, keyed by uv.lock) and sully's own
+gate caches (keyed by uv.lock and the commit, falling back to the latest
+entry for the same lock). The deploy job publishes the docs artifact the doc
+job already built instead of syncing and rebuilding.
+"""
+
+_HEADER = """\
+name: CI
+
+on:
+  push:
+    branches: [main]
+  pull_request:
+
+concurrency:
+  group: ci-${{ github.ref }}
+  cancel-in-progress: true
+
+env:
+  # Turn on sully's content-addressed artifact cache and keep it inside the workspace.
+  SULLY_CACHE: "1"
+  SULLY_CACHE_DIR: ${{ github.workspace }}/.sully-cache
+
+jobs:
+"""
+
+_SETUP = """\
+    steps:
+      - uses: actions/checkout@v4
+      - uses: astral-sh/setup-uv@v4
+        with:
+          enable-cache: true
+          cache-dependency-glob: uv.lock
+      - uses: actions/cache@v4
+        with:
+          path: |
+            .sully-cache
+            .sully/cache
+            .sully/fixtures
+            .sully/stubs
+          key: sully-{job}-${{{{ runner.os }}}}-${{{{ hashFiles('uv.lock') }}}}-${{{{ github.sha }}}}
+          restore-keys: |
+            sully-{job}-${{{{ runner.os }}}}-${{{{ hashFiles('uv.lock') }}}}-
+      - run: uv python install {python}
+      - run: uv sync --frozen
+"""
+
+_DEPLOY = """\
+  deploy-docs:
+    if: github.ref == 'refs/heads/main' && github.event_name == 'push'
+    needs: [check, test, doc]
+    runs-on: ubuntu-latest
+    permissions:
+      pages: write
+      id-token: write
+    environment:
+      name: github-pages
+      url: ${{ steps.deploy.outputs.page_url }}
+    steps:
+      # Publishes the artifact uploaded by the doc job; nothing is rebuilt here.
+      - id: deploy
+        uses: actions/deploy-pages@v4
+"""
+
+
+def render_workflow(python_version: str, *, shards: int = 1, docs: str = "docs") -> str:
+    """Return ci.yml for a project on *python_version* with tests split into *shards* jobs."""
+    if shards < 1:
+        raise ValueError("shards must be at least 1")
+
+    def job(name: str, *lines: str, matrix: str = "", cache: str = "") -> str:
+        head = f"  {name}:\n    runs-on: ubuntu-latest\n{matrix}"
+        setup = _SETUP.format(job=cache or name, python=python_version)
+        return head + setup + "".join(f"      {line}\n" for line in lines)
+
+    matrix = (
+        "    strategy:\n"
+        "      fail-fast: false\n"
+        "      matrix:\n"
+        f"        shard: [{', '.join(str(i) for i in range(1, shards + 1))}]\n"
+    )
+    jobs = [
+        job("check", "- run: uv run sully check"),
+        job(
+            "test",
+            f"- run: uv run sully test --shard ${{{{ matrix.shard }}}}/{shards}",
+            matrix=matrix,
+            cache="test-${{ matrix.shard }}",
+        ),
+        job(
+            "doc",
+            "- run: uv run sully doc",
+            "- uses: actions/upload-pages-artifact@v3",
+            "  with:",
+            f"    path: {docs}/",
+        ),
+        _DEPLOY,
+    ]
+    return _HEADER + "\n".join(jobs)
@@ -3,7 +3,10 @@
 import click
 
 from sully import __version__
-from sully.commands import init, add, remove, sync, check, run, test, doc
+from sully.commands import (
+    init, add, remove, sync, check, run, test, doc, lazify, build, bundle, workspace, do, cache, deps, ci, load,
+    bench, fuzz, stubs,
+)
 
 
 @click.group()
@@ -20,3 +23,15 @@ cli.add_command(check.check)
 cli.add_command(run.run)
 cli.add_command(test.test)
 cli.add_command(doc.doc)
+cli.add_command(lazify.lazify)
+cli.add_command(build.build)
+cli.add_command(bundle.bundle)
+cli.add_command(workspace.workspace)
+cli.add_command(do.do)
+cli.add_command(cache.cache)
+cli.add_command(deps.deps)
+cli.add_command(ci.ci)
+cli.add_command(load.load)
+cli.add_command(bench.bench)
+cli.add_command(fuzz.fuzz)
+cli.add_command(stubs.stubs)
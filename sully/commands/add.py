@@ -3,12 +3,21 @@
 import click
 
 from sully import uv
+from sully.commands.deps import apply_and_report
+from sully.deps import Edit
+from sully.wheels import find_links
 
 
 @click.command()
 @click.argument("packages", nargs=-1, required=True)
 @click.option("--dev", is_flag=True, help="Add as a dev dependency.")
-@click.option("--group", default=None, help="Add to a named dependency group.")
-def add(packages: tuple[str, ...], dev: bool, group: str | None) -> None:
+@click.option("--group", multiple=True, help="Add to a named dependency group (repeatable).")
+def add(packages: tuple[str, ...], dev: bool, group: tuple[str, ...]) -> None:
     """Add one or more dependencies via uv."""
-    uv.add(list(packages), dev=dev, group=group)
+    groups = [*(["dev"] if dev else []), *group]
+    if len(groups) > 1:
+        # Several groups at once: edit pyproject.toml directly and resolve once, then
+        # record `>=` bounds from the lock so the result matches what `uv add` writes.
+        apply_and_report([Edit("add", pkg, g) for g in groups for pkg in packages], bound=True)
+        return
+    uv.add(list(packages), dev=dev, group=group[0] if group else None, find_links=find_links())
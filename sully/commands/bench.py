@@ -0,0 +1,260 @@
+"""sully bench — run benchmarks, optionally generate benchmark stubs."""
+
+import ast
+import sys
+from pathlib import Path
+
+import click
+
+from sully import uv
+from sully.bench import ScalingResult, load_baseline, regressions, run_benchmarks, save_baseline, scaling_results
+from sully.commands.test import public_modules
+from sully.config import find_pyproject, get_bench_config
+
+
+@click.command()
+@click.option("--generate", is_flag=True, help="Generate benchmark stubs for public functions.")
+@click.option("--scaling", is_flag=True, help="Fit the time and memory complexity of benchmarks that take n.")
+@click.option("--update-baseline", is_flag=True, help="Record the fitted complexity classes as the new baseline.")
+@click.option("-k", "keyword", default=None, help="Only run benchmarks whose file:name contains this.")
+def bench(generate: bool, scaling: bool, update_baseline: bool, keyword: str | None) -> None:
+    """Run benchmarks in benchmarks/; --scaling fails if a complexity class gets worse."""
+    root = find_pyproject().parent
+    cfg = get_bench_config(root)
+    bench_dir = root / cfg["dir"]
+    if generate:
+        _generate_stubs(root / "src", bench_dir)
+        return
+
+    uv.ensure_uv()
+    if not bench_dir.is_dir():
+        raise click.ClickException(f"No {cfg['dir']}/ directory found.")
+    scaling = scaling or update_baseline
+
+    try:
+        report = run_benchmarks(
+            root,
+            bench_dir,
+            scaling=scaling,
+            keyword=keyword,
+            n=cfg["n"],
+            min_n=cfg["min-n"],
+            max_n=cfg["max-n"],
+            factor=cfg["factor"],
+            min_time=cfg["min-time"],
+            max_seconds=cfg["max-seconds"],
+        )
+    except RuntimeError as exc:
+        raise click.ClickException(str(exc)) from exc
+
+    failed = bool(report["errors"])
+    for name, seconds in sorted((n, r["seconds"]) for n, r in report["fixed"].items()):
+        click.echo(f"{name}  {_duration(seconds)}")
+    for name, reason in sorted(report.get("skipped", {}).items()):
+        click.echo(click.style(f"{name}  skipped ({reason})", fg="yellow"))
+    for name, error in sorted(report["errors"].items()):
+        click.echo(click.style(f"{name} raised:", fg="red"))
+        click.echo(error.rstrip())
+
+    if scaling:
+        results, too_few = scaling_results(report)
+        baseline_path = root / cfg["baseline"]
+        baseline = load_baseline(baseline_path)
+        _print_scaling(results, baseline)
+        for name in too_few:
+            click.echo(click.style(f"{name}: too few sizes finished within max-seconds to fit", fg="yellow"))
+        if update_baseline:
+            save_baseline(baseline_path, results)
+            click.echo(f"Baseline written to {cfg['baseline']}.")
+        else:
+            problems = regressions(results, baseline, strict=cfg["strict"])
+            for problem in problems:
+                click.echo(click.style(f"  complexity regression: {problem}", fg="red"))
+            failed = failed or bool(problems)
+    if failed:
+        sys.exit(1)
+
+
+def _print_scaling(results: list[ScalingResult], baseline: dict[str, dict[str, str]]) -> None:
+    """Print fitted time and memory classes next to the baseline."""
+    if not results:
+        return
+    width = max(len("benchmark"), *(len(r.name) for r in results))
+    click.echo(f"{'benchmark':<{width}}  {'sizes':>13}  {'time':<10}  {'memory':<10}  baseline")
+    for r in results:
+        before = baseline.get(r.name)
+        known = f"{before['time']} / {before['memory']}" if before else "-"
+        sizes = f"{r.sizes[0]}..{r.sizes[-1]}"
+        click.echo(f"{r.name:<{width}}  {sizes:>13}  {r.time.complexity:<10}  {r.memory.complexity:<10}  {known}")
+
+
+def _duration(seconds: float) -> str:
+    """Format a per-call time with a readable unit."""
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("µs", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+# Element expressions (in terms of the loop index ``i``) for collection items.
+_ITEMS = {"int": "i", "float": "float(i)", "str": "str(i)", "bytes": "str(i).encode()", "bool": "i % 2 == 0"}
+# Scalar expressions of size ``n``.
+_SCALARS = {"int": "n", "float": "float(n)", "str": '"a" * n', "bytes": 'b"a" * n', "bool": "True"}
+_LISTS = {"list", "List", "Sequence", "MutableSequence", "Iterable", "Collection"}
+_SETS = {"set", "Set", "AbstractSet", "MutableSet"}
+_DICTS = {"dict", "Dict", "Mapping", "MutableMapping"}
+
+
+def _name(node: ast.expr) -> str | None:
+    """Return the bare name of ``int``, ``list``, ``typing.List`` and the like."""
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return None
+
+
+def _args(node: ast.Subscript) -> list[ast.expr]:
+    return list(node.slice.elts) if isinstance(node.slice, ast.Tuple) else [node.slice]
+
+
+def _strip_optional(node: ast.expr) -> ast.expr:
+    """Return ``X`` for ``X | None`` and ``Optional[X]``."""
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.BitOr):
+        if isinstance(node.right, ast.Constant) and node.right.value is None:
+            return _strip_optional(node.left)
+        if isinstance(node.left, ast.Constant) and node.left.value is None:
+            return _strip_optional(node.right)
+    if isinstance(node, ast.Subscript) and _name(node.value) == "Optional":
+        return _strip_optional(node.slice)
+    return node
+
+
+def _item(node: ast.expr) -> str | None:
+    """Return an expression for the ``i``-th element of type *node*, or None if unknown."""
+    node = _strip_optional(node)
+    if isinstance(node, ast.Subscript) and _name(node.value) in ("tuple", "Tuple"):
+        return _tuple([_item(a) for a in _args(node)])
+    return _ITEMS.get(_name(node) or "")
+
+
+def _tuple(parts: list[str | None]) -> str | None:
+    """Return a tuple display of *parts*, or None if any part is unknown."""
+    known = [p for p in parts if p is not None]
+    if not parts or len(known) != len(parts):
+        return None
+    return f"({', '.join(known)}{',' if len(known) == 1 else ''})"
+
+
+def _value(node: ast.expr) -> str | None:
+    """Return an expression building a value of type *node* and size ``n``, or None if unknown."""
+    node = _strip_optional(node)
+    if not isinstance(node, ast.Subscript):
+        return _SCALARS.get(_name(node) or "")
+    kind, args = _name(node.value), _args(node)
+    if kind in _DICTS and len(args) == 2:
+        key, value = _item(args[0]), _item(args[1])
+        return f"{{{key}: {value} for i in range(n)}}" if key and value else None
+    if kind in ("tuple", "Tuple"):
+        if len(args) == 2 and isinstance(args[1], ast.Constant) and args[1].value is Ellipsis:
+            item = _item(args[0])
+            return f"tuple({item} for i in range(n))" if item else None
+        return _tuple([_value(a) for a in args])
+    item = _item(args[0]) if len(args) == 1 else None
+    if item is None:
+        return None
+    if kind in _LISTS:
+        return f"[{item} for i in range(n)]"
+    if kind in _SETS:
+        return f"{{{item} for i in range(n)}}"
+    if kind in ("frozenset", "FrozenSet"):
+        return f"frozenset({item} for i in range(n))"
+    return None
+
+
+def _stub(fn: ast.FunctionDef | ast.AsyncFunctionDef) -> str:
+    """Return a bench_* stub for *fn*: sized by ``n`` when it takes arguments."""
+    args = fn.args
+    positional = [*args.posonlyargs, *args.args]
+    required = positional[: len(positional) - len(args.defaults)]
+    keyword = [a for a, d in zip(args.kwonlyargs, args.kw_defaults) if d is None]
+    if not required and not keyword:
+        return f"def bench_{fn.name}() -> None:\n    {fn.name}()\n"
+
+    setup: list[str] = []
+    unknown: list[str] = []
+    for arg in [*required, *keyword]:
+        value = _value(arg.annotation) if arg.annotation is not None else None
+        if value is None:
+            annotation = f": {ast.unparse(arg.annotation)}" if arg.annotation is not None else ""
+            unknown.append(f"`{arg.arg}{annotation}`")
+        else:
+            setup.append(f"    {arg.arg} = {value}")
+    head = f"def bench_{fn.name}(n: int) -> Callable[[], object]:\n"
+    if unknown:
+        return head + f"    # TODO: build {', '.join(unknown)} of size n\n    raise NotImplementedError\n"
+    call = ", ".join([*(a.arg for a in required), *(f"{a.arg}={a.arg}" for a in keyword)])
+    return head + "\n".join(setup) + f"\n    return lambda: {fn.name}({call})\n"
+
+
+def _generate_stubs(src: Path, bench_dir: Path) -> None:
+    """Write bench_* stubs for public functions under *src*, adding to existing files without clobbering."""
+    if not src.is_dir():
+        raise click.ClickException("No src/ directory found.")
+    bench_dir.mkdir(exist_ok=True)
+
+    generated = 0
+    for module, funcs in public_modules(src):
+        tree = ast.parse((src / Path(*module.split("."))).with_suffix(".py").read_text())
+        defs = {
+            node.name: node
+            for node in tree.body
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name in funcs
+        }
+        bench_path = bench_dir / f"bench_{module.replace('.', '_')}.py"
+        existing = bench_path.read_text() if bench_path.exists() else ""
+        have = {node.name for node in ast.parse(existing).body if isinstance(node, ast.FunctionDef)}
+        # Async functions can't be timed by calling them; leave those to hand-written benchmarks.
+        missing = [f for f in funcs if f"bench_{f}" not in have and isinstance(defs.get(f), ast.FunctionDef)]
+        if not missing:
+            if existing:
+                click.echo(f"  skip {bench_path.name} (up to date)")
+            continue
+
+        stubs = "\n\n".join(_stub(defs[f]) for f in missing)
+        if existing:
+            text = _add_imports(existing, module, missing) + "\n\n" + stubs
+            click.echo(f"  updated {bench_path.name} (+{len(missing)})")
+        else:
+            text = (
+                f'"""Benchmarks for {module}."""\n\n'
+                "from collections.abc import Callable\n\n"
+                f"from {module} import {', '.join(missing)}\n\n\n" + stubs
+            )
+            click.echo(f"  created {bench_path.name}")
+        bench_path.write_text(text)
+        generated += 1
+
+    click.echo(click.style(f"Generated {generated} benchmark file(s).", fg="green"))
+
+
+def _add_imports(source: str, module: str, names: list[str]) -> str:
+    """Return *source* importing Callable (before its imports) and *names* from *module* (after them)."""
+    tree = ast.parse(source)
+    imports = [n for n in tree.body if isinstance(n, (ast.Import, ast.ImportFrom))]
+    imported = {a.asname or a.name for n in imports for a in n.names}
+    wanted = [n for n in names if n not in imported]
+    lines = source.rstrip("\n").split("\n")
+    first = imports[0].lineno - 1 if imports else _docstring_end(tree)
+    last = max(n.end_lineno or 0 for n in imports) if imports else first
+    head = [] if "Callable" in imported else ["from collections.abc import Callable"]
+    tail = [f"from {module} import {', '.join(wanted)}"] if wanted else []
+    return "\n".join(lines[:first] + head + lines[first:last] + tail + lines[last:]) + "\n"
+
+
+def _docstring_end(tree: ast.Module) -> int:
+    """Return the line after the module docstring, or 0."""
+    first = tree.body[0] if tree.body else None
+    if isinstance(first, ast.Expr) and isinstance(first.value, ast.Constant) and isinstance(first.value.value, str):
+        return first.end_lineno or 0
+    return 0
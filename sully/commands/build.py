@@ -0,0 +1,151 @@
+"""sully build — build a wheel, optionally compiling modules with mypyc."""
+
+import re
+import shutil
+import sys
+from pathlib import Path
+
+import click
+import tomlkit
+
+from sully import uv
+from sully.cache import artifact_cache, input_key, pack_dir, unpack_dir
+from sully.config import find_pyproject, get_build_config, load_full
+
+# Never copied into the staging tree.
+_IGNORE_ANYWHERE = shutil.ignore_patterns(".git", ".venv", ".sully", "__pycache__", "*.so", "*.pyd")
+_IGNORE_AT_ROOT = frozenset({"build", "dist", "docs"})
+
+_SETUP_PY = """\
+# Generated by `sully build --compile` — do not edit.
+from mypyc.build import mypycify
+from setuptools import setup
+
+setup(ext_modules=mypycify({modules!r}, opt_level={opt_level!r}))
+"""
+
+
+@click.command()
+@click.option("--compile", "compile_", is_flag=True, help="Compile [tool.sully.build] modules with mypyc.")
+@click.option("--no-verify", is_flag=True, help="Skip running the tests against the compiled wheel.")
+def build(compile_: bool, no_verify: bool) -> None:
+    """Build a wheel into dist/. Use --compile for mypyc C extensions."""
+    cfg = get_build_config()
+    root = find_pyproject().parent
+    out_dir = root / cfg["out-dir"]
+
+    if not compile_:
+        _build_wheel(root, out_dir)
+        click.echo(click.style(f"Wheel written to {cfg['out-dir']}/", fg="green"))
+        return
+
+    targets = compile_targets(root, cfg["compile"])
+    if not targets:
+        raise click.ClickException(
+            "No modules to compile. Set [tool.sully.build] compile = ['src/…/*.py'] in pyproject.toml."
+        )
+
+    stage = root / "build" / "sully"
+    if stage.exists():
+        shutil.rmtree(stage)
+
+    # Probe each module on its own so one failure doesn't sink the rest.
+    probe = stage / "probe"
+    _copy_project(root, probe)
+    compiled: list[str] = []
+    for module in targets:
+        result = uv.run_with(["mypyc", module], with_=["mypy"], cwd=probe, check=False)
+        if result.returncode == 0:
+            click.echo(f"  compiled {module}")
+            compiled.append(module)
+        else:
+            click.echo(click.style(f"  fallback {module} (mypyc failed; shipping pure Python)", fg="yellow"))
+
+    wheel_tree = stage / "wheel"
+    _copy_project(root, wheel_tree)
+    if compiled:
+        write_compile_setup(wheel_tree, compiled, cfg["opt-level"])
+
+    if uv.build(out_dir=out_dir, cwd=wheel_tree).returncode != 0:
+        raise click.ClickException("Build failed.")
+    wheel = _latest_wheel(out_dir)
+    click.echo(click.style(f"Built {wheel.name} ({len(compiled)}/{len(targets)} module(s) compiled).", fg="green"))
+
+    if no_verify or not cfg["verify"]:
+        return
+
+    click.echo("Running tests against the compiled wheel...")
+    result = uv.run_with(["pytest"], with_=[str(wheel), "pytest"], isolated=True, cwd=root, check=False)
+    if result.returncode != 0:
+        click.echo(click.style("Compiled build does not pass the test suite.", fg="red", bold=True))
+        sys.exit(result.returncode)
+    click.echo(click.style("Compiled build passes the test suite.", fg="green"))
+
+
+def _build_wheel(root: Path, out_dir: Path) -> None:
+    """Build the pure-Python wheel, reusing a cached one for identical sources when configured."""
+    cache = artifact_cache()
+    if cache is None:
+        if uv.build(out_dir=out_dir, cwd=root).returncode != 0:
+            raise click.ClickException("Build failed.")
+        return
+
+    key = input_key("wheel", root, ["pyproject.toml", "uv.lock", "README.md", "LICENSE", "src"])
+    staging = root / "build" / "sully" / "wheel-out"
+    cached = cache.get(key)
+    if cached is not None and unpack_dir(cached, staging):
+        click.echo(click.style("(wheel restored from cache)", dim=True))
+    else:
+        shutil.rmtree(staging, ignore_errors=True)
+        if uv.build(out_dir=staging, cwd=root).returncode != 0:
+            raise click.ClickException("Build failed.")
+        cache.put(key, pack_dir(staging))
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for wheel in staging.glob("*.whl"):
+        shutil.copy2(wheel, out_dir / wheel.name)
+
+
+def compile_targets(root: Path, patterns: list[str]) -> list[str]:
+    """Expand [tool.sully.build] compile globs into sorted, root-relative module paths."""
+    found: set[str] = set()
+    for pattern in patterns:
+        for path in root.glob(pattern):
+            if path.suffix == ".py" and path.is_file():
+                found.add(path.relative_to(root).as_posix())
+    return sorted(found)
+
+
+def write_compile_setup(tree: Path, modules: list[str], opt_level: str) -> None:
+    """Switch the staged project in *tree* to a setuptools + mypyc build of *modules*."""
+    (tree / "setup.py").write_text(_SETUP_PY.format(modules=modules, opt_level=opt_level))
+
+    pyproject = tree / "pyproject.toml"
+    doc = tomlkit.loads(pyproject.read_text())
+    build_system = tomlkit.table()
+    build_system["requires"] = ["setuptools>=69", "mypy[mypyc]"]
+    build_system["build-backend"] = "setuptools.build_meta"
+    doc["build-system"] = build_system
+    pyproject.write_text(tomlkit.dumps(doc))
+
+
+def _copy_project(root: Path, dest: Path) -> None:
+    """Copy the project source tree to *dest*, leaving out environments and outputs."""
+
+    def ignore(directory: str, names: list[str]) -> set[str]:
+        skipped = set(_IGNORE_ANYWHERE(directory, names))
+        if Path(directory) == root:
+            skipped |= _IGNORE_AT_ROOT & set(names)
+        return skipped
+
+    shutil.copytree(root, dest, ignore=ignore)
+
+
+def _latest_wheel(out_dir: Path) -> Path:
+    """Return the newest wheel for this project in *out_dir*."""
+    project = load_full().get("project", {})
+    prefix = re.sub(r"[-_.]+", "_", str(project.get("name", ""))).lower() + "-"
+    wheels = [w for w in out_dir.glob("*.whl") if w.name.lower().startswith(prefix)]
+    if not wheels:
+        raise click.ClickException(f"No wheel found in {out_dir}.")
+    return max(wheels, key=lambda w: w.stat().st_mtime)
@@ -0,0 +1,148 @@
+"""sully bundle — package the project and its locked deps as a pre-compiled artifact."""
+
+import os
+import shutil
+import zipapp
+from fnmatch import fnmatch
+from pathlib import Path
+
+import click
+
+from sully import uv
+from sully.config import find_pyproject, get_bundle_config, get_main_script, load_full
+
+# Files that are never needed at runtime. Patterns with a "/" match the
+# bundle-relative path, others match the file or directory name.
+DEFAULT_STRIP = (
+    "__pycache__",
+    "*.pyi",
+    "py.typed",
+    "*.c",
+    "*.h",
+    "*.pyx",
+    "*.pxd",
+    "*.dist-info/RECORD",
+    "*.dist-info/INSTALLER",
+    "*.dist-info/REQUESTED",
+    "*.dist-info/direct_url.json",
+)
+
+_MAIN_PY = """\
+# Generated by `sully bundle`.
+import runpy
+
+runpy.run_module({module!r}, run_name="__main__", alter_sys=True)
+"""
+
+
+@click.command()
+@click.option("--format", "fmt", type=click.Choice(["zip", "dir"]), default=None, help="Artifact format.")
+def bundle(fmt: str | None) -> None:
+    """Bundle the project and locked deps with precompiled bytecode for deployment."""
+    cfg = get_bundle_config()
+    fmt = fmt or cfg["format"]
+    root = find_pyproject().parent
+    name = str(load_full().get("project", {}).get("name", root.name))
+
+    main_script = get_main_script()
+    if not main_script:
+        raise click.ClickException(
+            "No main script configured. Set [tool.sully] main = 'src/…/main.py' in pyproject.toml."
+        )
+
+    stage = root / "build" / "sully" / "bundle"
+    if stage.exists():
+        shutil.rmtree(stage)
+    app = stage / "app"
+    app.mkdir(parents=True)
+
+    click.echo("Installing locked dependencies...")
+    requirements = stage / "requirements.txt"
+    uv.export_requirements(requirements, cwd=root)
+    uv.pip_install_target(requirements, app, cwd=root)
+    shutil.rmtree(app / "bin", ignore_errors=True)
+
+    _copy_sources(root / "src", app)
+    removed = strip_tree(app, [*DEFAULT_STRIP, *cfg["strip"]])
+    (app / "__main__.py").write_text(_MAIN_PY.format(module=entry_module(main_script)))
+
+    if fmt == "zip":
+        native = sorted(p.relative_to(app).as_posix() for p in app.rglob("*") if p.suffix in (".so", ".pyd"))
+        if native:
+            raise click.ClickException(
+                f"{native[0]} is a compiled extension and cannot be imported from a zipapp; use --format dir."
+            )
+
+    click.echo("Precompiling bytecode...")
+    compile_args = ["python", "-m", "compileall", "-q", "-j", "0", "--invalidation-mode", "unchecked-hash"]
+    if fmt == "zip":
+        # zipimport only finds legacy (sibling) .pyc files.
+        compile_args.append("-b")
+    compile_args.extend(["-o", str(cfg["optimize"]), str(app)])
+    if uv.run_cmd(compile_args, cwd=root, check=False).returncode != 0:
+        raise click.ClickException("Bytecode compilation failed.")
+
+    out_dir = root / cfg["output"]
+    out_dir.mkdir(parents=True, exist_ok=True)
+    if fmt == "zip":
+        target = out_dir / f"{name}.pyz"
+        zipapp.create_archive(app, target, interpreter=f"/usr/bin/env {_interpreter(root)}")
+        run_hint = str(target.relative_to(root))
+    else:
+        target = out_dir / name
+        if target.exists():
+            shutil.rmtree(target)
+        shutil.move(app, target)
+        flag = f"-{'O' * cfg['optimize']} " if cfg["optimize"] else ""
+        run_hint = f"{_interpreter(root)} {flag}{target.relative_to(root)}"
+
+    click.echo(f"  stripped {removed} file(s)")
+    click.echo(click.style(f"Bundle written to {target.relative_to(root)}", fg="green"))
+    click.echo(f"  run with: {run_hint}")
+
+
+def entry_module(main_script: str) -> str:
+    """Turn ``src/pkg/main.py`` into the importable module name ``pkg.main``."""
+    path = Path(main_script).with_suffix("")
+    parts = path.parts[1:] if path.parts[:1] == ("src",) else path.parts
+    return ".".join(parts)
+
+
+def strip_tree(root: Path, patterns: list[str]) -> int:
+    """Delete files and directories under *root* matching *patterns*; return the count removed."""
+    removed = 0
+    for directory, dirnames, filenames in os.walk(root):
+        base = Path(directory)
+        for entry in [*dirnames, *filenames]:
+            rel = (base / entry).relative_to(root).as_posix()
+            if not any(fnmatch(rel if "/" in p else entry, p) for p in patterns):
+                continue
+            if entry in dirnames:
+                removed += sum(1 for p in (base / entry).rglob("*") if p.is_file())
+                shutil.rmtree(base / entry)
+                dirnames.remove(entry)
+            else:
+                (base / entry).unlink()
+                removed += 1
+    return removed
+
+
+def _copy_sources(src: Path, app: Path) -> None:
+    """Copy the project's packages and modules from src/ into the bundle."""
+    if not src.is_dir():
+        raise click.ClickException("No src/ directory found.")
+    for child in sorted(src.iterdir()):
+        if child.is_dir():
+            shutil.copytree(child, app / child.name, ignore=shutil.ignore_patterns("__pycache__"))
+        elif child.suffix == ".py":
+            shutil.copy2(child, app / child.name)
+
+
+def _interpreter(root: Path) -> str:
+    """Return ``python3.X`` for the pinned version, since bytecode is version-specific."""
+    pin = root / ".python-version"
+    if pin.is_file():
+        version = pin.read_text().strip().split(".")
+        if len(version) >= 2:
+            return f"python{version[0]}.{version[1]}"
+    return "python3"
@@ -0,0 +1,43 @@
+"""sully cache — manage sully's local caches."""
+
+import sys
+from pathlib import Path
+
+import click
+
+from sully.config import find_pyproject
+from sully.wheels import python_versions, warm, wheel_dir
+
+
+@click.group()
+def cache() -> None:
+    """Manage sully's local caches."""
+
+
+@cache.command("warm")
+@click.option("--python", "pythons", multiple=True, help="Python version to download for (repeatable).")
+@click.option(
+    "--dir",
+    "directory",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=None,
+    help="Wheel directory (default: [tool.sully.cache] wheels, or ~/.cache/sully/wheels).",
+)
+def warm_cmd(pythons: tuple[str, ...], directory: Path | None) -> None:
+    """Download every locked wheel and the dev group for offline installs."""
+    try:
+        root: Path | None = find_pyproject().parent
+    except FileNotFoundError:
+        root = None  # outside a project: warm just the dev group for `sully init`
+
+    dest = directory or wheel_dir(root)
+    versions = python_versions(root, list(pythons))
+    click.echo(f"Downloading wheels for Python {', '.join(versions)} into {dest}...")
+    failures = warm(root, dest, versions)
+
+    count = sum(1 for _ in dest.glob("*.whl"))
+    for failure in failures:
+        click.echo(click.style(f"  {failure}", fg="yellow"))
+    click.echo(click.style(f"{count} wheel(s) in {dest}.", fg="green" if not failures else "yellow"))
+    if failures:
+        sys.exit(1)
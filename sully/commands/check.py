@@ -4,23 +4,118 @@ import sys
 
 import click
 
-from sully import uv
-from sully.config import get_check_config
+from sully import perf, uv
+from sully.cache import artifact_cache, input_key
+from sully.config import find_pyproject, get_check_config, get_perf_config, get_stubs_config
+from sully.diagnostics import report
+from sully.imports import HEAVY_MODULES, find_deferrable_imports
+from sully.index import project_files
+from sully.stubs import STUB_DIR, build, is_fresh, stub_path
 
 
 @click.command()
-def check() -> None:
+@click.option("--imports", is_flag=True, help="Also flag heavy imports only used inside functions.")
+def check(imports: bool) -> None:
     """Run pyright type checking against the project source."""
     cfg = get_check_config()
     mode = cfg["mode"]
 
     if mode == "off":
         click.echo("Type checking is disabled (mode = 'off').")
-        return
-
-    result = uv.run_cmd(["pyright", f"--level={mode}"], check=False)
-    if result.returncode != 0:
-        click.echo(click.style("Type errors found.", fg="red", bold=True))
-        sys.exit(result.returncode)
     else:
+        _refresh_stubs()
+        returncode = run_pyright(mode)
+        if returncode != 0:
+            click.echo(click.style("Type errors found.", fg="red", bold=True))
+            sys.exit(returncode)
         click.echo(click.style("All clear — no type errors.", fg="green", bold=True))
+
+    perf_cfg = get_perf_config()
+    if perf_cfg["enabled"]:
+        _check_perf(perf_cfg)
+
+    if imports:
+        _check_imports(cfg["heavy-imports"])
+
+
+def _refresh_stubs() -> None:
+    """Regenerate the dependency stubs pyright uses if uv.lock or src/'s imports changed since the last build."""
+    root = find_pyproject().parent
+    cfg = get_stubs_config(root)
+    if not cfg["auto"] or stub_path(root) != STUB_DIR or not (root / "uv.lock").is_file():
+        return
+    if is_fresh(root, cfg["exclude"]):
+        return
+    try:
+        report = build(root, cfg["exclude"])
+    except RuntimeError as exc:
+        click.echo(click.style(f"Stubs not regenerated: {exc}", fg="yellow"))
+        return
+    click.echo(click.style(f"Regenerated stubs for {len(report.stubbed)} untyped package(s).", dim=True))
+
+
+def run_pyright(mode: str) -> int:
+    """Run pyright at *mode*, reusing a cached result for identical inputs when configured."""
+    cache = artifact_cache()
+    if cache is None:
+        return uv.run_cmd(["pyright", f"--level={mode}"], check=False).returncode
+
+    root = find_pyproject().parent
+    key = input_key(
+        "pyright",
+        root,
+        ["pyproject.toml", "pyrightconfig.json", "uv.lock", ".python-version", "src", "tests"],
+        {"mode": mode},
+    )
+    cached = cache.get_json(key)
+    if cached is not None:
+        click.echo(cached["output"], nl=False)
+        click.echo(click.style("(pyright result restored from cache)", dim=True))
+        return cached["returncode"]
+
+    result = uv.run_captured(["pyright", f"--level={mode}"], cwd=root)
+    click.echo(result.stdout, nl=False)
+    cache.put_json(key, {"returncode": result.returncode, "output": result.stdout})
+    return result.returncode
+
+
+def _check_perf(cfg: dict) -> None:
+    """Run the AST performance anti-pattern stage over src/; exit non-zero on errors."""
+    root = find_pyproject().parent
+    src = root / "src"
+    if not src.is_dir():
+        return
+
+    entries = project_files(root, ["src"], ".py")
+    diagnostics = perf.scan(
+        [root / e.path for e in entries],
+        root,
+        cfg["severity"],
+        cfg["hot-modules"],
+        cache_file=root / ".sully" / "cache" / "perf.json",
+        digests={str(root / e.path): e.sha256 for e in entries},
+    )
+    if not diagnostics:
+        click.echo(click.style("All clear — no performance anti-patterns.", fg="green", bold=True))
+        return
+    report(diagnostics)
+    if any(d.severity == "error" for d in diagnostics):
+        click.echo(click.style("Performance anti-patterns found.", fg="red", bold=True))
+        sys.exit(1)
+
+
+def _check_imports(extra_heavy: list[str]) -> None:
+    """Report heavy module-level imports that could be deferred into function bodies."""
+    root = find_pyproject().parent
+    if not (root / "src").is_dir():
+        raise click.ClickException("No src/ directory found.")
+
+    heavy = HEAVY_MODULES | frozenset(extra_heavy)
+    # Only files importing a heavy module at all need parsing.
+    files = [root / e.path for e in project_files(root, ["src"], ".py") if heavy.intersection(e.imports)]
+    diagnostics = [d for py_file in files for d in find_deferrable_imports(py_file, heavy)]
+    if diagnostics:
+        report(diagnostics)
+        click.echo(click.style("Deferrable heavy imports found.", fg="red", bold=True))
+        sys.exit(1)
+    click.echo(click.style("All clear — no deferrable heavy imports.", fg="green", bold=True))
@@ -0,0 +1,37 @@
+"""sully ci — generate the project's CI workflow."""
+
+from pathlib import Path
+
+import click
+
+from sully.ci import render_workflow
+from sully.config import find_pyproject, get_ci_config, get_doc_config
+
+
+@click.group()
+def ci() -> None:
+    """Manage the project's CI configuration."""
+
+
+@ci.command("generate")
+@click.option("--shards", type=click.IntRange(min=1), default=None, help="Test shards (default: [tool.sully.ci]).")
+@click.option("--python", "python_version", default=None, help="Python version for CI jobs.")
+@click.option("--force", is_flag=True, help="Overwrite an existing workflow that differs.")
+def generate(shards: int | None, python_version: str | None, force: bool) -> None:
+    """Write .github/workflows/ci.yml with caching, parallel jobs and test sharding."""
+    root = find_pyproject().parent
+    cfg = get_ci_config(root)
+    version = python_version or cfg["python"] or _pinned_python(root)
+    content = render_workflow(version, shards=shards or cfg["shards"], docs=get_doc_config(root)["output"])
+
+    path = root / ".github" / "workflows" / "ci.yml"
+    if path.is_file() and path.read_text() != content and not force:
+        raise click.ClickException(f"{path.relative_to(root)} exists and differs. Use --force to overwrite it.")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+    click.echo(click.style(f"Wrote {path.relative_to(root)}.", fg="green"))
+
+
+def _pinned_python(root: Path) -> str:
+    pin = root / ".python-version"
+    return pin.read_text().strip() if pin.is_file() else "3.12"
@@ -0,0 +1,141 @@
+"""sully deps — inspect and edit project dependencies in bulk."""
+
+import sys
+from pathlib import Path
+
+import click
+import tomlkit
+
+from sully.config import find_pyproject, get_deps_config
+from sully.depcost import CostReport, dependency_costs, over_budget
+from sully.deps import RUNTIME, DependencyError, Edit, apply, apply_edits, declared, load_plan
+from sully.lockfile import read_lock
+from sully.prune import Finding, find_prunable, fixes
+
+
+@click.group()
+def deps() -> None:
+    """Inspect and edit project dependencies."""
+
+
+@deps.command("apply")
+@click.argument("plan", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.option("--dry-run", is_flag=True, help="Show the edits without changing anything.")
+def apply_cmd(plan: Path, dry_run: bool) -> None:
+    """Apply a dependency plan with a single resolve; roll back if it fails."""
+    try:
+        edits = load_plan(plan)
+    except DependencyError as exc:
+        raise click.ClickException(str(exc)) from exc
+    if not edits:
+        click.echo("Plan is empty; nothing to do.")
+        return
+    if dry_run:
+        doc = tomlkit.loads(find_pyproject().read_text())
+        try:
+            changes = apply_edits(doc, edits)
+        except DependencyError as exc:
+            raise click.ClickException(str(exc)) from exc
+        for line in changes:
+            click.echo(f"  {line}")
+        return
+    apply_and_report(edits)
+
+
+def apply_and_report(edits: list[Edit], *, bound: bool = False) -> None:
+    """Apply *edits* transactionally to the current project and print what changed.
+
+    *bound* gives bare added names a ``>=`` bound from the lock (see ``sully.deps.apply``).
+    """
+    try:
+        changes = apply(find_pyproject().parent, edits, bound=bound)
+    except DependencyError as exc:
+        raise click.ClickException(f"{exc} No changes were made.") from exc
+    for line in changes:
+        click.echo(f"  {line}")
+    click.echo(click.style(f"Applied {len(changes)} change(s) with one resolve.", fg="green"))
+
+
+@deps.command("cost")
+@click.option("--group", multiple=True, help="Also cost this dependency group (repeatable).")
+@click.option("--no-import-time", is_flag=True, help="Skip measuring import times (much faster).")
+def cost_cmd(group: tuple[str, ...], no_import_time: bool) -> None:
+    """Report each direct dependency's transitive packages, size and import time."""
+    root = find_pyproject().parent
+    lock = root / "uv.lock"
+    if not lock.is_file():
+        raise click.ClickException("No uv.lock found. Run `sully sync` first.")
+
+    direct = declared(tomlkit.loads((root / "pyproject.toml").read_text()), [RUNTIME, *group])
+    if not direct:
+        click.echo("No dependencies declared.")
+        return
+    try:
+        report = dependency_costs(root, read_lock(lock), direct, import_time=not no_import_time)
+    except RuntimeError as exc:
+        raise click.ClickException(str(exc)) from exc
+
+    _print_costs(report)
+    problems = over_budget(report, get_deps_config(root))
+    for problem in problems:
+        click.echo(click.style(f"  over budget: {problem}", fg="red"))
+    if problems:
+        sys.exit(1)
+
+
+def _print_costs(report: CostReport) -> None:
+    """Print an aligned table of dependency costs and the combined footprint."""
+    width = max(len("package"), *(len(c.name) for c in report.costs))
+    click.echo(f"{'package':<{width}}  {'deps':>4}  {'size MB':>8}  {'only MB':>8}  {'files':>6}  {'import ms':>9}")
+    for c in report.costs:
+        ms = f"{c.import_seconds * 1000:.0f}" if c.import_seconds is not None else "-"
+        click.echo(
+            f"{c.name:<{width}}  {len(c.transitive):>4}  {c.size / 2**20:>8.1f}  "
+            f"{c.exclusive_size / 2**20:>8.1f}  {c.files:>6}  {ms:>9}"
+        )
+    click.echo(f"{report.total_packages} packages, {report.total_size / 2**20:.1f} MB installed in total")
+
+
+_KIND_LABELS = {
+    "unused": "Declared but never imported",
+    "test-only": "Runtime dependencies only imported by tests",
+    "undeclared": "Imported but not declared",
+}
+
+
+@deps.command("prune")
+@click.option("--fix", is_flag=True, help="Remove, move and add dependencies to match the imports.")
+def prune_cmd(fix: bool) -> None:
+    """Find unused, test-only and undeclared dependencies from an import scan."""
+    root = find_pyproject().parent
+    try:
+        findings = find_prunable(root, get_deps_config(root)["keep"])
+    except RuntimeError as exc:
+        raise click.ClickException(str(exc)) from exc
+    if not findings:
+        click.echo(click.style("All clear — declared dependencies match the imports.", fg="green", bold=True))
+        return
+
+    _print_findings(findings)
+    if not fix:
+        click.echo("Run `sully deps prune --fix` to apply these changes.")
+        sys.exit(1)
+    edits = fixes(findings)
+    if edits:
+        apply_and_report(edits)
+    unresolved = [f.name for f in findings if f.kind == "undeclared" and not f.requirement]
+    if unresolved:
+        click.echo(click.style(f"Not installed, add manually: {', '.join(unresolved)}", fg="yellow"))
+        sys.exit(1)
+
+
+def _print_findings(findings: list[Finding]) -> None:
+    """Print findings grouped by kind."""
+    for kind, label in _KIND_LABELS.items():
+        matching = [f for f in findings if f.kind == kind]
+        if not matching:
+            continue
+        click.echo(click.style(f"{label}:", bold=True))
+        for f in matching:
+            note = "" if f.requirement or kind != "undeclared" else " (no installed distribution provides it)"
+            click.echo(f"  {f.name} ({f.group}){note}")
@@ -0,0 +1,53 @@
+"""sully do — run tasks from [tool.sully.tasks] as a parallel, incremental DAG."""
+
+import sys
+import threading
+
+import click
+
+from sully.config import find_pyproject, get_tasks_config
+from sully.tasks import TaskResult, critical_path, load_tasks, plan, run_graph
+
+_STATE_FILE = ".sully/tasks.json"
+
+
+@click.command()
+@click.argument("targets", nargs=-1, required=True)
+@click.option("-j", "--jobs", type=int, default=None, help="Tasks to run at once (default: CPU count).")
+@click.option("--force", is_flag=True, help="Run every task even if its inputs and outputs are unchanged.")
+def do(targets: tuple[str, ...], jobs: int | None, force: bool) -> None:
+    """Run TARGETS and the tasks they depend on, skipping those already up to date."""
+    root = find_pyproject().parent
+    tasks = load_tasks(get_tasks_config())
+    try:
+        order = plan(tasks, list(targets))
+    except ValueError as exc:
+        raise click.ClickException(str(exc)) from exc
+
+    lock = threading.Lock()
+
+    def print_section(result: TaskResult) -> None:
+        with lock:
+            if result.status == "skipped":
+                click.echo(click.style(f"── {result.task.name}: up to date", fg="cyan"))
+            elif result.status == "blocked":
+                click.echo(click.style(f"── {result.task.name}: skipped (dependency failed)", fg="yellow"))
+            else:
+                colour = "green" if result.status == "ran" else "red"
+                header = f"── {result.task.name} ({result.seconds:.1f}s) "
+                click.echo(click.style(header.ljust(60, "─"), fg=colour, bold=True))
+                if result.output.strip():
+                    click.echo(result.output.rstrip())
+
+    results = run_graph(root, order, jobs=jobs, force=force, state_file=root / _STATE_FILE, on_done=print_section)
+
+    chain, total = critical_path(order, results)
+    ran = sum(1 for r in results.values() if r.status == "ran")
+    skipped = sum(1 for r in results.values() if r.status == "skipped")
+    failed = [r.task.name for r in results.values() if r.status == "failed"]
+    click.echo(f"{ran} ran, {skipped} up to date, {len(failed)} failed")
+    if chain and total > 0:
+        click.echo(f"Critical path ({total:.1f}s): {' → '.join(chain)}")
+    if failed:
+        click.echo(click.style(f"Failed: {', '.join(failed)}", fg="red", bold=True))
+        sys.exit(1)
@@ -3,12 +3,26 @@
 import click
 
 from sully import uv
-from sully.config import get_doc_config
+from sully.cache import artifact_cache, input_key, pack_dir, unpack_dir
+from sully.config import find_pyproject, get_doc_config
 
 
 def run_pdoc(output: str) -> int:
-    """Run pdoc and return the exit code."""
+    """Run pdoc and return the exit code, restoring cached docs for identical sources."""
+    cache = artifact_cache()
+    if cache is None:
+        return uv.run_cmd(["pdoc", f"--output-directory={output}", "src/"], check=False).returncode
+
+    root = find_pyproject().parent
+    key = input_key("pdoc", root, ["pyproject.toml", "uv.lock", "src"], {"output": output})
+    cached = cache.get(key)
+    if cached is not None and unpack_dir(cached, root / output):
+        click.echo(click.style("(docs restored from cache)", dim=True))
+        return 0
+
     result = uv.run_cmd(["pdoc", f"--output-directory={output}", "src/"], check=False)
+    if result.returncode == 0 and (root / output).is_dir():
+        cache.put(key, pack_dir(root / output))
     return result.returncode
 
 
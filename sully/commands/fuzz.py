@@ -0,0 +1,102 @@
+"""sully fuzz — search for inputs that make public functions pathologically slow."""
+
+import sys
+
+import click
+
+from sully import uv
+from sully.config import find_pyproject, get_bench_config, get_fuzz_config
+from sully.fuzz import FuzzResult, discover_targets, run_fuzz, write_benchmarks
+
+
+@click.command()
+@click.argument("targets", nargs=-1)
+@click.option("--perf", is_flag=True, help="Search for slow inputs (the only fuzzing mode so far).")
+@click.option("--budget", type=float, default=None, help="Seconds of search per function.")
+@click.option("--max-size", type=int, default=None, help="Largest input size (string/collection length).")
+@click.option("--seed", type=int, default=None, help="Random seed; the same seed repeats the same search.")
+@click.option("--metric", type=click.Choice(["time", "memory"]), default=None, help="What counts as expensive.")
+@click.option("--no-save", is_flag=True, help="Don't write the slowest cases to benchmarks/.")
+def fuzz(
+    targets: tuple[str, ...],
+    perf: bool,
+    budget: float | None,
+    max_size: int | None,
+    seed: int | None,
+    metric: str | None,
+    no_save: bool,
+) -> None:
+    """Generate inputs from type annotations and search for the slowest; TARGETS are module:function."""
+    if not perf:
+        raise click.UsageError("Pass --perf to search for slow inputs.")
+    uv.ensure_uv()
+    root = find_pyproject().parent
+    cfg = get_fuzz_config(root)
+    metric = metric or cfg["metric"]
+
+    names = list(targets) or cfg["targets"]
+    if not names:
+        src = root / "src"
+        if not src.is_dir():
+            raise click.ClickException("No src/ directory found.")
+        names = discover_targets(src)
+    if not names:
+        click.echo("No public functions to fuzz.")
+        return
+
+    click.echo(f"Fuzzing {len(names)} function(s) for {metric}...")
+    try:
+        results, skipped = run_fuzz(
+            root,
+            names,
+            budget=budget if budget is not None else cfg["budget"],
+            max_size=max_size if max_size is not None else cfg["max-size"],
+            seed=seed if seed is not None else cfg["seed"],
+            metric=metric,
+            keep=cfg["keep"],
+        )
+    except RuntimeError as exc:
+        raise click.ClickException(str(exc)) from exc
+
+    for target, reason in sorted(skipped.items()):
+        click.echo(click.style(f"  skip {target}: {reason}", fg="yellow"))
+    bench_dir = root / get_bench_config(root)["dir"]
+    failed = False
+    for result in sorted(results, key=lambda r: r.slowdown or 0.0, reverse=True):
+        problem = _problem(result, cfg["max-slowdown"])
+        failed = failed or problem is not None
+        _print_result(result, metric, problem)
+        if not no_save:
+            path = write_benchmarks(bench_dir, result, metric=metric)
+            if path is not None:
+                click.echo(f"    saved {path.relative_to(root)}")
+    if failed:
+        sys.exit(1)
+
+
+def _problem(result: FuzzResult, max_slowdown: float | None) -> str | None:
+    """Return why *result* fails the run, if it does."""
+    if result.timeouts:
+        return f"{result.timeouts} input(s) ran past the per-call limit"
+    if max_slowdown is not None and result.slowdown is not None and result.slowdown > max_slowdown:
+        return f"worst input is {result.slowdown:.0f}x a typical one (max-slowdown {max_slowdown:g})"
+    return None
+
+
+def _print_result(result: FuzzResult, metric: str, problem: str | None) -> None:
+    """Print the worst case for one function."""
+    if not result.cases:
+        click.echo(f"  {result.target}: every generated input raised ({result.errors} tried)")
+        return
+    worst = result.cases[0]
+    cost = f"{worst.cost * 1000:.2f} ms" if metric == "time" else f"{worst.cost / 1024:.0f} KiB"
+    ratio = f", {result.slowdown:.0f}x typical" if result.slowdown is not None else ""
+    line = f"  {result.target}: worst {cost}{ratio} at size {worst.size} ({result.evaluations} inputs)"
+    click.echo(click.style(line, fg="red") if problem else line)
+    if problem:
+        click.echo(click.style(f"    {problem}", fg="red"))
+    click.echo(f"    args={_shorten(worst.args)} kwargs={_shorten(worst.kwargs)}")
+
+
+def _shorten(text: str, limit: int = 100) -> str:
+    return text if len(text) <= limit else text[: limit - 3] + "..."
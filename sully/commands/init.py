@@ -1,23 +1,72 @@
 """sully init — scaffold a new typed Python project."""
 
 import json
+import shutil
 from pathlib import Path
 
 import click
+import tomlkit
 
 from sully import uv
+from sully.ci import render_workflow
+from sully.commands.lazify import write_lazy_package
+from sully.config import DEV_GROUP
+from sully.stubs import STUB_DIR
+from sully.templates import find_template, materialise, seed_template
+from sully.wheels import find_links
 
 
 @click.command()
-@click.argument("name")
+@click.argument("name", required=False)
 @click.option("--python", "python_version", default="3.12", help="Python version to pin.")
-def init(name: str, python_version: str) -> None:
+@click.option(
+    "--many",
+    "spec",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help="Create every project listed in a TOML spec file.",
+)
+@click.option("--no-template", is_flag=True, help="Resolve and sync from scratch instead of the template cache.")
+def init(name: str | None, python_version: str, spec: Path | None, no_template: bool) -> None:
     """Create a new typed Python project."""
-    root = Path.cwd() / name
-
-    if root.exists():
-        raise click.ClickException(f"Directory '{name}' already exists.")
+    if spec is not None and name:
+        raise click.UsageError("Pass either NAME or --many, not both.")
+    if spec is not None:
+        projects = _load_spec(spec, python_version)
+    elif name:
+        projects = [(name, python_version)]
+    else:
+        raise click.UsageError("Missing argument 'NAME'.")
+
+    # Check every target up front so a batch never stops halfway.
+    for project_name, _ in projects:
+        if (Path.cwd() / project_name).exists():
+            raise click.ClickException(f"Directory '{project_name}' already exists.")
 
+    uv.ensure_uv()
+    for project_name, project_python in projects:
+        create_project(project_name, project_python, use_template=not no_template)
+
+
+def _load_spec(spec: Path, default_python: str) -> list[tuple[str, str]]:
+    """Read ``[[project]]`` entries (name, optional python) from a --many spec file."""
+    doc = tomlkit.loads(spec.read_text())
+    default_python = str(doc.get("python", default_python))
+    projects: list[tuple[str, str]] = []
+    for entry in doc.get("project", []):
+        if "name" not in entry:
+            raise click.ClickException(f"{spec}: every [[project]] needs a name.")
+        projects.append((str(entry["name"]), str(entry.get("python", default_python))))
+    if not projects:
+        raise click.ClickException(f"{spec}: no [[project]] entries found.")
+    names = [n for n, _ in projects]
+    if len(set(names)) != len(names):
+        raise click.ClickException(f"{spec}: duplicate project names.")
+    return projects
+
+
+def create_project(name: str, python_version: str, *, use_template: bool = True) -> None:
+    """Scaffold *name* in the current directory and set up its environment."""
+    root = Path.cwd() / name
     pkg = name.replace("-", "_")
 
     # -- directory skeleton --------------------------------------------------
@@ -35,7 +84,7 @@ requires-python = ">={python_version}"
 dependencies = []
 
 [dependency-groups]
-dev = ["pyright", "pytest", "pdoc"]
+dev = {json.dumps(DEV_GROUP)}
 
 [tool.sully]
 main = "src/{pkg}/main.py"
@@ -57,6 +106,7 @@ doc-before-run = true
                 "include": ["src"],
                 "typeCheckingMode": "strict",
                 "pythonVersion": python_version,
+                "stubPath": STUB_DIR,
             },
             indent=2,
         )
@@ -64,10 +114,6 @@ doc-before-run = true
     )
 
     # -- source files --------------------------------------------------------
-    (root / "src" / pkg / "__init__.py").write_text(
-        f'"""Top-level package for {name}."""\n'
-    )
-
     (root / "src" / pkg / "main.py").write_text(
         f'''\
 """{name} — entry point."""
@@ -90,6 +136,9 @@ if __name__ == "__main__":
 
     (root / "src" / pkg / "py.typed").write_text("")
 
+    # Lazy PEP 562 __init__.py (+ .pyi) so importing the package stays cheap.
+    write_lazy_package(root / "src" / pkg, docstring=f"Top-level package for {name}.")
+
     # -- tests ---------------------------------------------------------------
     (root / "tests" / "test_main.py").write_text(
         f"""\
@@ -118,6 +167,8 @@ docs/
 .pytest_cache/
 .mypy_cache/
 .ruff_cache/
+.sully/
+.sully-cache/
 .DS_Store
 """
     )
@@ -125,58 +176,29 @@ docs/
     # -- CI workflow ----------------------------------------------------------
     workflows = root / ".github" / "workflows"
     workflows.mkdir(parents=True)
-    (workflows / "ci.yml").write_text(
-        f"""\
-name: CI
-
-on:
-  push:
-    branches: [main]
-  pull_request:
-
-jobs:
-  check:
-    runs-on: ubuntu-latest
-    steps:
-      - uses: actions/checkout@v4
-      - uses: astral-sh/setup-uv@v4
-      - run: uv python install {python_version}
-      - run: uv sync
-      - run: uv run sully check
-      - run: uv run sully test
-      - run: uv run sully doc
-
-  deploy-docs:
-    if: github.ref == 'refs/heads/main'
-    needs: check
-    runs-on: ubuntu-latest
-    permissions:
-      pages: write
-      id-token: write
-    environment:
-      name: github-pages
-      url: ${{{{ steps.deploy.outputs.page_url }}}}
-    steps:
-      - uses: actions/checkout@v4
-      - uses: astral-sh/setup-uv@v4
-      - run: uv python install {python_version}
-      - run: uv sync
-      - run: uv run sully doc
-      - uses: actions/upload-pages-artifact@v3
-        with:
-          path: docs/
-      - id: deploy
-        uses: actions/deploy-pages@v4
-"""
-    )
+    (workflows / "ci.yml").write_text(render_workflow(python_version))
 
     # -- README --------------------------------------------------------------
     (root / "README.md").write_text(f"# {name}\n\nA sully project — typed, tested, documented from the start.\n")
 
     # -- uv setup ------------------------------------------------------------
-    uv.ensure_uv()
+    # With a cached template the environment is hard-linked in place and the
+    # sync only verifies it; otherwise the first sync seeds the template.
     uv.pin_python(python_version, cwd=root)
-    uv.sync(cwd=root)
+    template = find_template(python_version, DEV_GROUP) if use_template else None
+    if template is not None:
+        try:
+            materialise(template, root, name)
+        except OSError:  # re-seeded under us: sync from scratch instead
+            shutil.rmtree(root / ".venv", ignore_errors=True)
+            (root / "uv.lock").unlink(missing_ok=True)
+            template = None
+    uv.sync(cwd=root, find_links=find_links(root))
+    if use_template and template is None:
+        try:
+            seed_template(root, name, python_version, DEV_GROUP)
+        except OSError:  # the template is an optimisation; the project is already complete
+            pass
 
     click.echo(click.style(f"Created project '{name}'.", fg="green", bold=True))
     click.echo(f"  cd {name} && sully check")
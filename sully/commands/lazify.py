@@ -0,0 +1,54 @@
+"""sully lazify — rewrite package __init__ files as PEP 562 lazy loaders."""
+
+from pathlib import Path
+
+import click
+
+from sully.config import find_pyproject
+from sully.index import project_files
+from sully.imports import (
+    init_docstring,
+    is_replaceable_init,
+    package_layout,
+    render_lazy_init,
+    render_lazy_stub,
+)
+
+
+@click.command()
+@click.argument("packages", nargs=-1, type=click.Path(exists=True, file_okay=False, path_type=Path))
+@click.option("--force", is_flag=True, help="Overwrite __init__.py files that contain custom code.")
+def lazify(packages: tuple[Path, ...], force: bool) -> None:
+    """Generate lazy __init__.py/.pyi pairs for packages (default: every package under src/)."""
+    targets = list(packages) or _discover_packages()
+    if not targets:
+        raise click.ClickException("No packages found under src/.")
+
+    written = 0
+    for package in targets:
+        if write_lazy_package(package, force=force):
+            click.echo(f"  lazified {package}")
+            written += 1
+        else:
+            click.echo(f"  skip {package} (custom __init__.py; use --force)")
+
+    click.echo(click.style(f"Lazified {written} package(s).", fg="green"))
+
+
+def write_lazy_package(package: Path, *, force: bool = False, docstring: str | None = None) -> bool:
+    """Write the lazy ``__init__.py`` and ``__init__.pyi`` for *package*; return False if skipped."""
+    init = package / "__init__.py"
+    submodules, exports = package_layout(package)
+    if not force and not is_replaceable_init(init, submodules, exports):
+        return False
+
+    doc = docstring or init_docstring(init, f"Package {package.name}.")
+    init.write_text(render_lazy_init(doc, submodules, exports))
+    (package / "__init__.pyi").write_text(render_lazy_stub(submodules, exports))
+    return True
+
+
+def _discover_packages() -> list[Path]:
+    """Return every directory under src/ that contains an ``__init__.py``."""
+    root = find_pyproject().parent
+    return [(root / e.path).parent for e in project_files(root, ["src"], "/__init__.py")]
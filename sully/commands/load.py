@@ -0,0 +1,78 @@
+"""sully load — drive a project callable under concurrent load and enforce SLOs."""
+
+import json
+import sys
+
+import click
+
+from sully import uv
+from sully.config import find_pyproject, get_load_config
+from sully.load import LoadReport, run_load, slo_violations
+
+
+@click.command()
+@click.argument("target", required=False)
+@click.option(
+    "--mode",
+    type=click.Choice(["auto", "thread", "process", "async"]),
+    default=None,
+    help="How to generate load; auto picks async for coroutine functions, else threads.",
+)
+@click.option("-c", "--concurrency", type=int, default=None, help="Workers (threads, processes or tasks).")
+@click.option("--rate", type=float, default=None, help="Target calls per second; default: as fast as possible.")
+@click.option("--duration", type=float, default=None, help="Seconds to measure for.")
+@click.option("--warmup", type=float, default=None, help="Seconds to run before measuring.")
+@click.option("--json", "as_json", is_flag=True, help="Print the report as JSON.")
+def load(
+    target: str | None,
+    mode: str | None,
+    concurrency: int | None,
+    rate: float | None,
+    duration: float | None,
+    warmup: float | None,
+    as_json: bool,
+) -> None:
+    """Load-test TARGET (module:callable) and report throughput and latency percentiles."""
+    uv.ensure_uv()
+    root = find_pyproject().parent
+    cfg = get_load_config(root)
+    target = target or cfg["target"]
+    if not target:
+        raise click.ClickException("No target given. Pass module:callable or set [tool.sully.load] target.")
+    concurrency = concurrency or cfg["concurrency"]
+    if concurrency < 1:
+        raise click.BadParameter("must be at least 1", param_hint="--concurrency")
+
+    try:
+        report = run_load(
+            root,
+            target,
+            mode=mode or cfg["mode"],
+            concurrency=concurrency,
+            rate=rate if rate is not None else cfg["rate"],
+            duration=duration if duration is not None else cfg["duration"],
+            warmup=warmup if warmup is not None else cfg["warmup"],
+        )
+    except RuntimeError as exc:
+        raise click.ClickException(str(exc)) from exc
+
+    problems = slo_violations(report, cfg["slo"])
+    if as_json:
+        click.echo(json.dumps({**report._asdict(), "error_rate": report.error_rate, "slo_violations": problems}))
+    else:
+        _print_report(target, report)
+        for problem in problems:
+            click.echo(click.style(f"  SLO missed: {problem}", fg="red"))
+        if cfg["slo"] and not problems:
+            click.echo(click.style("All SLOs met.", fg="green"))
+    if problems:
+        sys.exit(1)
+
+
+def _print_report(target: str, report: LoadReport) -> None:
+    """Print throughput, errors and the latency percentiles."""
+    click.echo(f"{target} ({report.mode}): {report.requests} calls in {report.seconds:g}s")
+    click.echo(f"  throughput  {report.throughput:,.1f}/s")
+    click.echo(f"  errors      {report.errors} ({report.error_rate:.2%})")
+    stats = "  ".join(f"{name} {report.latency_ms[name]:.2f}" for name in ("p50", "p90", "p99", "p999", "max"))
+    click.echo(f"  latency ms  {stats}  mean {report.latency_ms['mean']:.2f}")
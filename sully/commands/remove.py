@@ -3,10 +3,18 @@
 import click
 
 from sully import uv
+from sully.commands.deps import apply_and_report
+from sully.deps import Edit
 
 
 @click.command()
 @click.argument("packages", nargs=-1, required=True)
-def remove(packages: tuple[str, ...]) -> None:
+@click.option("--dev", is_flag=True, help="Remove from the dev dependency group.")
+@click.option("--group", multiple=True, help="Remove from a named dependency group (repeatable).")
+def remove(packages: tuple[str, ...], dev: bool, group: tuple[str, ...]) -> None:
     """Remove one or more dependencies via uv."""
+    groups = [*(["dev"] if dev else []), *group]
+    if groups:
+        apply_and_report([Edit("remove", pkg, g) for g in groups for pkg in packages])
+        return
     uv.remove(list(packages))
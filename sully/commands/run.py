@@ -6,14 +6,26 @@ import click
 
 from sully import uv
 from sully.commands.doc import run_pdoc
-from sully.config import get_check_config, get_doc_config, get_main_script
+from sully.config import (
+    find_pyproject,
+    get_check_config,
+    get_doc_config,
+    get_loop_config,
+    get_main_script,
+    get_runtime_types_config,
+)
+from sully.runners import runner_env
 
 
 @click.command()
 @click.option("--no-check", is_flag=True, help="Skip the type-check gate.")
 @click.option("--no-doc", is_flag=True, help="Skip the doc-generation gate.")
-def run(no_check: bool, no_doc: bool) -> None:
+@click.option("--loop-monitor", is_flag=True, help="Report asyncio callbacks and task steps that block the loop.")
+@click.option("--runtime-types", is_flag=True, help="Check a sample of calls into src/ against their annotations.")
+def run(no_check: bool, no_doc: bool, loop_monitor: bool, runtime_types: bool) -> None:
     """Type-check, generate docs, then run the project's main script."""
+    if loop_monitor and runtime_types:
+        raise click.UsageError("--loop-monitor and --runtime-types can't be combined.")
     cfg = get_check_config()
 
     # Type-check gate
@@ -45,5 +57,25 @@ def run(no_check: bool, no_doc: bool) -> None:
         )
 
     click.echo(f"Running {main_script}...")
-    result = uv.run_script(main_script)
+    if loop_monitor:
+        loop_cfg = get_loop_config()
+        args = ["python", "-m", "sully_loop", f"--threshold-ms={loop_cfg['threshold-ms']}", f"--top={loop_cfg['top']}"]
+        result = uv.run_cmd([*args, main_script], check=False, env=runner_env())
+    elif runtime_types:
+        result = uv.run_cmd([*runtime_types_args(), main_script], check=False, env=runner_env())
+    else:
+        result = uv.run_script(main_script)
     sys.exit(result.returncode)
+
+
+def runtime_types_args() -> list[str]:
+    """Return the sully_types runner command, without the script, for the configured sampling."""
+    cfg = get_runtime_types_config()
+    src = find_pyproject().parent / "src"
+    if not src.is_dir():
+        raise click.ClickException("No src/ directory found.")
+    args = ["python", "-m", "sully_types", f"--src={src}", f"--first={cfg['first']}", f"--sample={cfg['sample']}"]
+    args.append(f"--top={cfg['top']}")
+    if cfg["fail"]:
+        args.append("--fail")
+    return args
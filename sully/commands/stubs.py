@@ -0,0 +1,51 @@
+"""sully stubs — generate trimmed stubs for untyped dependencies."""
+
+import click
+
+from sully.config import find_pyproject, get_stubs_config
+from sully.stubs import STUB_DIR, StubReport, build, is_fresh, pyright_config, register, stub_path
+
+
+@click.group()
+def stubs() -> None:
+    """Manage generated stubs for untyped dependencies."""
+
+
+@stubs.command("build")
+@click.option("--force", is_flag=True, help="Rebuild even if uv.lock and src/'s imports are unchanged.")
+def build_cmd(force: bool) -> None:
+    """Write .pyi stubs for the untyped packages src/ imports and register them with pyright."""
+    root = find_pyproject().parent
+    if not (root / "uv.lock").is_file():
+        raise click.ClickException("No uv.lock found. Run `sully sync` first.")
+    config = pyright_config(root)
+    if config is None:
+        raise click.ClickException(
+            f"No pyright configuration found. Add pyrightconfig.json or [tool.pyright] with stubPath = '{STUB_DIR}'."
+        )
+    if not register(root):
+        where = config.name if config.name == "pyrightconfig.json" else "[tool.pyright]"
+        raise click.ClickException(
+            f"{where} already sets stubPath to '{stub_path(root)}'; set it to '{STUB_DIR}' to use generated stubs."
+        )
+
+    exclude = get_stubs_config(root)["exclude"]
+    if not force and is_fresh(root, exclude):
+        click.echo("Stubs are up to date.")
+        return
+    try:
+        report = build(root, exclude)
+    except RuntimeError as exc:
+        raise click.ClickException(str(exc)) from exc
+    print_report(report)
+
+
+def print_report(report: StubReport) -> None:
+    """Print what a stub build did for each imported package."""
+    for module, detail in sorted(report.stubbed.items()):
+        click.echo(f"  stubbed {module} ({detail})")
+    for module, reason in sorted(report.typed.items()):
+        click.echo(click.style(f"  skip {module} ({reason})", dim=True))
+    for module in report.missing:
+        click.echo(click.style(f"  missing {module} (not installed in the project environment)", fg="yellow"))
+    click.echo(click.style(f"Stubs written to {STUB_DIR} for {len(report.stubbed)} package(s).", fg="green"))
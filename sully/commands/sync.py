@@ -3,10 +3,11 @@
 import click
 
 from sully import uv
+from sully.wheels import find_links
 
 
 @click.command()
 def sync() -> None:
     """Install all dependencies via uv sync."""
-    uv.sync()
+    uv.sync(find_links=find_links())
     click.echo(click.style("Dependencies synced.", fg="green"))
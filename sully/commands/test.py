@@ -1,28 +1,129 @@
 """sully test — run pytest, optionally generate test stubs."""
 
-import ast
 import textwrap
 from pathlib import Path
 
 import click
 
 from sully import uv
-from sully.config import find_pyproject
+from sully.config import (
+    find_pyproject,
+    get_ci_config,
+    get_loop_config,
+    get_test_async_config,
+    get_test_fixture_cache_config,
+    get_test_memory_config,
+)
+from sully.index import project_files
+from sully.pytest_plugins import plugin_env
 
 
 @click.command()
 @click.option("--generate", is_flag=True, help="Generate test stubs for public functions.")
+@click.option("--memory", is_flag=True, help="Track per-test peak memory and enforce budgets.")
+@click.option("--shard", default=None, metavar="K/N", help="Run only shard K of N, balanced by recorded durations.")
+@click.option("--record-durations", is_flag=True, help="Record test durations for balancing shards.")
+@click.option("--loop-monitor", is_flag=True, help="Report event-loop stalls and enforce the loop budget.")
+@click.option(
+    "--async-concurrency",
+    type=click.IntRange(min=1),
+    default=None,
+    metavar="N",
+    help="Run async tests marked concurrent N at a time on one event loop.",
+)
+@click.option("--no-fixture-cache", is_flag=True, help="Build cached_fixture values without using the cache.")
 @click.argument("extra_args", nargs=-1, type=click.UNPROCESSED)
-def test(generate: bool, extra_args: tuple[str, ...]) -> None:
+def test(
+    generate: bool,
+    memory: bool,
+    shard: str | None,
+    record_durations: bool,
+    loop_monitor: bool,
+    async_concurrency: int | None,
+    no_fixture_cache: bool,
+    extra_args: tuple[str, ...],
+) -> None:
     """Run pytest. Use --generate to create test stubs."""
     if generate:
         _generate_stubs()
         return
 
-    result = uv.run_cmd(["pytest", *extra_args], check=False)
+    # The plugins are always importable: test code may use sully_fixtures.cached_fixture.
+    args: list[str] = []
+    env = {**plugin_env(), **fixture_cache_env(enabled=not no_fixture_cache)}
+    if memory:
+        args.extend(memory_args())
+    if shard or record_durations:
+        args.extend(shard_args(shard, record=record_durations))
+    if loop_monitor:
+        args.extend(loop_args())
+    if async_concurrency is not None:
+        args.extend(async_args(async_concurrency))
+
+    result = uv.run_cmd(["pytest", *args, *extra_args], check=False, env=env)
     raise SystemExit(result.returncode)
 
 
+def fixture_cache_env(start: Path | None = None, *, enabled: bool = True) -> dict[str, str]:
+    """Return environment settings for the sully_fixtures cache."""
+    cfg = get_test_fixture_cache_config(start)
+    if not enabled or not cfg["enabled"]:
+        return {"SULLY_FIXTURE_CACHE": "off"}
+    return {
+        "SULLY_FIXTURE_CACHE": str(find_pyproject(start).parent / cfg["dir"]),
+        "SULLY_FIXTURE_CACHE_MAX_MB": str(cfg["max-mb"]),
+        "SULLY_FIXTURE_CACHE_MAX_AGE_DAYS": str(cfg["max-age-days"]),
+    }
+
+
+def memory_args(start: Path | None = None) -> list[str]:
+    """Return pytest arguments enabling the sully_memory plugin with configured budgets."""
+    cfg = get_test_memory_config(start)
+    args = ["-p", "sully_memory", "--sully-memory", f"--sully-memory-top={cfg['top']}"]
+    if cfg["budget-mb"] is not None:
+        args.append(f"--sully-memory-budget={cfg['budget-mb']}")
+    for marker, mb in cfg["markers"].items():
+        args.append(f"--sully-memory-marker={marker}={mb}")
+    return args
+
+
+def shard_args(shard: str | None, *, record: bool = False, start: Path | None = None) -> list[str]:
+    """Return pytest arguments enabling the sully_shard plugin."""
+    if shard is not None:
+        index, _, total = shard.partition("/")
+        if not (index.isdigit() and total.isdigit() and 1 <= int(index) <= int(total)):
+            raise click.BadParameter(f"expected K/N with 1 <= K <= N, got {shard!r}", param_hint="--shard")
+    durations = find_pyproject(start).parent / get_ci_config(start)["durations"]
+    args = ["-p", "sully_shard", f"--sully-durations={durations}"]
+    if shard is not None:
+        args.append(f"--sully-shard={shard}")
+    if record:
+        args.append("--sully-record-durations")
+    return args
+
+
+def loop_args(start: Path | None = None) -> list[str]:
+    """Return pytest arguments enabling the sully_stall plugin with the configured threshold and budget."""
+    cfg = get_loop_config(start)
+    args = ["-p", "sully_stall", "--sully-loop", f"--sully-loop-threshold={cfg['threshold-ms']}"]
+    args.append(f"--sully-loop-top={cfg['top']}")
+    if cfg["budget-ms"] is not None:
+        args.append(f"--sully-loop-budget={cfg['budget-ms']}")
+    return args
+
+
+def async_args(concurrency: int, start: Path | None = None) -> list[str]:
+    """Return pytest arguments enabling the sully_async plugin."""
+    cfg = get_test_async_config(start)
+    return [
+        "-p",
+        "sully_async",
+        f"--sully-async-concurrency={concurrency}",
+        f"--sully-async-timeout={cfg['timeout']}",
+        f"--sully-async-marker={cfg['marker']}",
+    ]
+
+
 def _generate_stubs() -> None:
     """Parse src/ for public functions and write test stubs into tests/."""
     project_root = find_pyproject().parent
@@ -34,17 +135,8 @@ def _generate_stubs() -> None:
         raise click.ClickException("No src/ directory found.")
 
     generated = 0
-    for py_file in sorted(src.rglob("*.py")):
-        if py_file.name.startswith("_"):
-            continue
-
-        funcs = _public_functions(py_file)
-        if not funcs:
-            continue
-
-        rel = py_file.relative_to(src).with_suffix("")
-        module = ".".join(rel.parts)
-        test_name = "test_" + "_".join(rel.parts) + ".py"
+    for module, funcs in public_modules(src):
+        test_name = "test_" + module.replace(".", "_") + ".py"
         test_path = tests / test_name
 
         if test_path.exists():
@@ -66,14 +158,15 @@ def _generate_stubs() -> None:
     click.echo(click.style(f"Generated {generated} test file(s).", fg="green"))
 
 
-def _public_functions(path: Path) -> list[str]:
-    """Return names of public, module-level functions in *path*."""
-    try:
-        tree = ast.parse(path.read_text())
-    except SyntaxError:
-        return []
-    return [
-        node.name
-        for node in ast.iter_child_nodes(tree)
-        if isinstance(node, ast.FunctionDef) and not node.name.startswith("_")
-    ]
+def public_modules(src: Path) -> list[tuple[str, list[str]]]:
+    """Return ``(dotted module, public function names)`` for each public module under *src*.
+
+    Read from the project index, so only files changed since the last scan are parsed.
+    """
+    found: list[tuple[str, list[str]]] = []
+    for entry in project_files(src.parent, [src.name], ".py"):
+        if entry.path.rpartition("/")[2].startswith("_") or not entry.functions:
+            continue
+        module = ".".join(Path(entry.path).relative_to(src.name).with_suffix("").parts)
+        found.append((module, list(entry.functions)))
+    return found
@@ -0,0 +1,74 @@
+"""sully workspace — run a sully command across every uv workspace member."""
+
+import sys
+import threading
+
+import click
+
+from sully.config import get_workspace_config
+from sully.workspace import MemberResult, changed_members, find_workspace_root, members, run_in_members
+
+WORKSPACE_COMMANDS = ("check", "test", "doc", "bench")
+
+
+@click.command(context_settings={"ignore_unknown_options": True})
+@click.argument("command", type=click.Choice(WORKSPACE_COMMANDS))
+@click.option("--only", multiple=True, help="Only run in this member (repeatable).")
+@click.option("--changed", is_flag=True, help="Only run in members with changes since --base.")
+@click.option("--base", default="HEAD", show_default=True, help="Git ref that --changed compares against.")
+@click.option("-j", "--jobs", type=int, default=None, help="Members to run at once (default: CPU count).")
+@click.argument("extra_args", nargs=-1, type=click.UNPROCESSED)
+def workspace(
+    command: str,
+    only: tuple[str, ...],
+    changed: bool,
+    base: str,
+    jobs: int | None,
+    extra_args: tuple[str, ...],
+) -> None:
+    """Run check, test, doc or bench in every workspace member concurrently."""
+    try:
+        root = find_workspace_root()
+    except FileNotFoundError as exc:
+        raise click.ClickException(str(exc)) from exc
+
+    targets = members(root)
+    if only:
+        unknown = set(only) - {m.name for m in targets}
+        if unknown:
+            raise click.ClickException(f"Unknown workspace member(s): {', '.join(sorted(unknown))}")
+        targets = [m for m in targets if m.name in only]
+    if changed:
+        try:
+            targets = changed_members(root, targets, base)
+        except RuntimeError as exc:
+            raise click.ClickException(str(exc)) from exc
+    if not targets:
+        click.echo("No workspace members to run.")
+        return
+
+    jobs = jobs or get_workspace_config(root)["jobs"]
+    lock = threading.Lock()
+
+    def print_section(result: MemberResult) -> None:
+        colour = "green" if result.returncode == 0 else "red"
+        with lock:
+            click.echo(click.style(f"── {result.member.name} ({command}) ".ljust(60, "─"), fg=colour, bold=True))
+            click.echo(result.output.rstrip())
+            click.echo()
+
+    results = run_in_members([command, *extra_args], targets, jobs=jobs, on_done=print_section)
+    _print_summary(results)
+    if any(r.returncode != 0 for r in results):
+        sys.exit(1)
+
+
+def _print_summary(results: list[MemberResult]) -> None:
+    """Print an aligned member / status / time table."""
+    width = max(len("member"), *(len(r.member.name) for r in results))
+    click.echo(f"{'member':<{width}}  status  time")
+    for r in results:
+        status = click.style("ok    ", fg="green") if r.returncode == 0 else click.style("FAILED", fg="red")
+        click.echo(f"{r.member.name:<{width}}  {status}  {r.seconds:.1f}s")
+    failed = sum(1 for r in results if r.returncode != 0)
+    click.echo(f"{len(results) - failed} passed, {failed} failed")
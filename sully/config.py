@@ -1,9 +1,18 @@
 """Parse [tool.sully] from pyproject.toml."""
 
+import os
+import time
 from pathlib import Path
 
+import click
 import tomlkit
 
+# Dev dependency group every sully project starts with.
+DEV_GROUP = ["pyright", "pytest", "pdoc"]
+
+# pyproject.toml path -> ((size, mtime_ns), parsed [tool.sully] table), see load().
+_LOADED: dict[Path, tuple[tuple[int, int], dict]] = {}
+
 
 def find_pyproject(start: Path | None = None) -> Path:
     """Walk up from *start* (default: cwd) to find pyproject.toml."""
@@ -19,11 +28,33 @@ def find_pyproject(start: Path | None = None) -> Path:
     raise FileNotFoundError("No pyproject.toml found in any parent directory.")
 
 
+def user_cache_dir() -> Path:
+    """Return sully's per-user cache directory (``$SULLY_CACHE_DIR`` or the XDG cache)."""
+    override = os.environ.get("SULLY_CACHE_DIR")
+    if override:
+        return Path(override)
+    xdg = os.environ.get("XDG_CACHE_HOME")
+    return (Path(xdg) if xdg else Path.home() / ".cache") / "sully"
+
+
 def load(start: Path | None = None) -> dict:
-    """Return the [tool.sully] table, or {} if absent."""
+    """Return the [tool.sully] table, or {} if absent.
+
+    The parsed table is reused while pyproject.toml's size and mtime are
+    unchanged, so reading several config sections parses the file once.
+    Files modified in the last two seconds are always re-read, since a
+    rewrite within the same mtime tick would otherwise go unnoticed.
+    """
     path = find_pyproject(start)
+    st = path.stat()
+    cached = _LOADED.get(path)
+    if cached is not None and cached[0] == (st.st_size, st.st_mtime_ns):
+        return cached[1]
     doc = tomlkit.loads(path.read_text())
-    return doc.get("tool", {}).get("sully", {})
+    table = doc.get("tool", {}).get("sully", {})
+    if st.st_mtime_ns < time.time_ns() - 2_000_000_000:
+        _LOADED[path] = ((st.st_size, st.st_mtime_ns), table)
+    return table
 
 
 def load_full(start: Path | None = None) -> tomlkit.TOMLDocument:
@@ -32,6 +63,13 @@ def load_full(start: Path | None = None) -> tomlkit.TOMLDocument:
     return tomlkit.loads(path.read_text())
 
 
+def _require_choice(table: str, key: str, value: object, allowed: tuple) -> None:
+    """Raise a ClickException unless *value* is one of *allowed* for ``[tool.sully.<table>] <key>``."""
+    if value not in allowed:
+        choices = ", ".join(repr(a) if isinstance(a, str) else str(a) for a in allowed)
+        raise click.ClickException(f"[tool.sully.{table}] {key} must be one of {choices}; got {value!r}.")
+
+
 def get_main_script(start: Path | None = None) -> str | None:
     """Return the configured main script path, or None."""
     cfg = load(start)
@@ -45,6 +83,35 @@ def get_check_config(start: Path | None = None) -> dict:
     return {
         "mode": check.get("mode", "strict"),
         "check-before-run": check.get("check-before-run", True),
+        "heavy-imports": list(check.get("heavy-imports", [])),
+    }
+
+
+def get_stubs_config(start: Path | None = None) -> dict:
+    """Return [tool.sully.stubs] config with defaults (exclude lists top-level modules to leave to pyright)."""
+    cfg = load(start)
+    stubs = cfg.get("stubs", {})
+    return {
+        "auto": bool(stubs.get("auto", True)),
+        "exclude": [str(m) for m in stubs.get("exclude", [])],
+    }
+
+
+def get_perf_config(start: Path | None = None) -> dict:
+    """Return [tool.sully.check.perf] config with defaults.
+
+    Rule keys (e.g. ``reportRegexInLoop = "warning"``) override the default
+    severity, as in pyrightconfig.json.
+    """
+    cfg = load(start)
+    perf = cfg.get("check", {}).get("perf", {})
+    severity = {k: str(v) for k, v in perf.items() if k.startswith("report")}
+    for rule, level in severity.items():
+        _require_choice("check.perf", rule, level, ("error", "warning", "information", "none"))
+    return {
+        "enabled": perf.get("enabled", True),
+        "hot-modules": list(perf.get("hot-modules", [])),
+        "severity": severity,
     }
 
 
@@ -56,3 +123,203 @@ def get_doc_config(start: Path | None = None) -> dict:
         "output": doc.get("output", "docs"),
         "doc-before-run": doc.get("doc-before-run", True),
     }
+
+
+def get_build_config(start: Path | None = None) -> dict:
+    """Return [tool.sully.build] config with defaults."""
+    cfg = load(start)
+    build = cfg.get("build", {})
+    return {
+        "compile": list(build.get("compile", [])),
+        "opt-level": str(build.get("opt-level", "3")),
+        "out-dir": build.get("out-dir", "dist"),
+        "verify": build.get("verify", True),
+    }
+
+
+def get_bundle_config(start: Path | None = None) -> dict:
+    """Return [tool.sully.bundle] config with defaults."""
+    cfg = load(start)
+    bundle = cfg.get("bundle", {})
+    fmt = bundle.get("format", "zip")
+    optimize = bundle.get("optimize", 0)
+    _require_choice("bundle", "format", fmt, ("zip", "dir"))
+    _require_choice("bundle", "optimize", optimize, (0, 1, 2))
+    return {
+        "format": fmt,
+        "output": bundle.get("output", "dist"),
+        "optimize": int(optimize),
+        "strip": list(bundle.get("strip", [])),
+    }
+
+
+def get_test_memory_config(start: Path | None = None) -> dict:
+    """Return [tool.sully.test.memory] config with defaults (budgets in MB)."""
+    cfg = load(start)
+    memory = cfg.get("test", {}).get("memory", {})
+    return {
+        "budget-mb": memory.get("budget-mb"),
+        "markers": {str(k): float(v) for k, v in memory.get("markers", {}).items()},
+        "top": memory.get("top", 10),
+    }
+
+
+def get_test_async_config(start: Path | None = None) -> dict:
+    """Return [tool.sully.test.async] config with defaults (timeout in seconds per test)."""
+    cfg = load(start)
+    async_cfg = cfg.get("test", {}).get("async", {})
+    return {
+        "timeout": float(async_cfg.get("timeout", 60.0)),
+        "marker": async_cfg.get("marker", "concurrent"),
+    }
+
+
+def get_test_fixture_cache_config(start: Path | None = None) -> dict:
+    """Return [tool.sully.test.fixture-cache] config with defaults (dir is relative to the project root)."""
+    cfg = load(start)
+    fixture_cache = cfg.get("test", {}).get("fixture-cache", {})
+    return {
+        "enabled": bool(fixture_cache.get("enabled", True)),
+        "dir": fixture_cache.get("dir", ".sully/fixtures"),
+        "max-mb": float(fixture_cache.get("max-mb", 2048)),
+        "max-age-days": float(fixture_cache.get("max-age-days", 30)),
+    }
+
+
+def get_workspace_config(start: Path | None = None) -> dict:
+    """Return [tool.sully.workspace] config with defaults."""
+    cfg = load(start)
+    workspace = cfg.get("workspace", {})
+    return {
+        "jobs": workspace.get("jobs"),
+    }
+
+
+def get_cache_config(start: Path | None = None) -> dict:
+    """Return [tool.sully.cache] config with defaults.
+
+    ``SULLY_CACHE_URL`` overrides ``url`` so CI can point at a shared server
+    without editing pyproject.toml; ``SULLY_CACHE=1`` enables the local cache.
+    """
+    cfg = load(start)
+    cache = cfg.get("cache", {})
+    url = os.environ.get("SULLY_CACHE_URL") or cache.get("url")
+    return {
+        "enabled": bool(cache.get("enabled", bool(url) or os.environ.get("SULLY_CACHE") == "1")),
+        "dir": cache.get("dir", str(user_cache_dir() / "artifacts")),
+        "url": url,
+        "push": cache.get("push", True),
+        "wheels": cache.get("wheels", str(user_cache_dir() / "wheels")),
+        "pythons": [str(v) for v in cache.get("pythons", [])],
+    }
+
+
+def get_tasks_config(start: Path | None = None) -> dict:
+    """Return [tool.sully.tasks] as ``{name: {cmd, inputs, outputs, deps}}`` with defaults."""
+    cfg = load(start)
+    return {
+        name: {
+            "cmd": spec.get("cmd"),
+            "inputs": list(spec.get("inputs", [])),
+            "outputs": list(spec.get("outputs", [])),
+            "deps": list(spec.get("deps", [])),
+        }
+        for name, spec in cfg.get("tasks", {}).items()
+    }
+
+
+def get_deps_config(start: Path | None = None) -> dict:
+    """Return [tool.sully.deps] config with defaults (None means an unlimited budget)."""
+    cfg = load(start)
+    deps = cfg.get("deps", {})
+    return {
+        "max-size-mb": deps.get("max-size-mb"),
+        "max-total-mb": deps.get("max-total-mb"),
+        "max-import-ms": deps.get("max-import-ms"),
+        "max-transitive": deps.get("max-transitive"),
+        "keep": [str(n) for n in deps.get("keep", [])],
+    }
+
+
+def get_ci_config(start: Path | None = None) -> dict:
+    """Return [tool.sully.ci] config with defaults."""
+    cfg = load(start)
+    ci = cfg.get("ci", {})
+    return {
+        "shards": int(ci.get("shards", 1)),
+        "python": ci.get("python"),
+        "durations": ci.get("durations", ".test-durations.json"),
+    }
+
+
+def get_load_config(start: Path | None = None) -> dict:
+    """Return [tool.sully.load] config with defaults.
+
+    ``slo`` holds the thresholds to enforce, e.g. ``{"p99-ms": 50, "min-rps": 1000}``.
+    """
+    cfg = load(start)
+    load_cfg = cfg.get("load", {})
+    return {
+        "target": load_cfg.get("target"),
+        "mode": load_cfg.get("mode", "auto"),
+        "concurrency": int(load_cfg.get("concurrency", 1)),
+        "rate": load_cfg.get("rate"),
+        "duration": float(load_cfg.get("duration", 10.0)),
+        "warmup": float(load_cfg.get("warmup", 1.0)),
+        "slo": {str(k): float(v) for k, v in load_cfg.get("slo", {}).items()},
+    }
+
+
+def get_bench_config(start: Path | None = None) -> dict:
+    """Return [tool.sully.bench] config with defaults."""
+    cfg = load(start)
+    bench = cfg.get("bench", {})
+    return {
+        "dir": bench.get("dir", "benchmarks"),
+        "baseline": bench.get("baseline", "benchmarks/scaling.json"),
+        "n": int(bench.get("n", 1000)),
+        "min-n": int(bench.get("min-n", 16)),
+        "max-n": int(bench.get("max-n", 65536)),
+        "factor": float(bench.get("factor", 2.0)),
+        "min-time": float(bench.get("min-time", 0.01)),
+        "max-seconds": float(bench.get("max-seconds", 0.2)),
+        "strict": bool(bench.get("strict", False)),
+    }
+
+
+def get_fuzz_config(start: Path | None = None) -> dict:
+    """Return [tool.sully.fuzz] config with defaults (budget is seconds per function)."""
+    cfg = load(start)
+    fuzz = cfg.get("fuzz", {})
+    return {
+        "targets": [str(t) for t in fuzz.get("targets", [])],
+        "budget": float(fuzz.get("budget", 5.0)),
+        "max-size": int(fuzz.get("max-size", 1000)),
+        "seed": int(fuzz.get("seed", 0)),
+        "metric": fuzz.get("metric", "time"),
+        "keep": int(fuzz.get("keep", 3)),
+        "max-slowdown": fuzz.get("max-slowdown"),
+    }
+
+
+def get_loop_config(start: Path | None = None) -> dict:
+    """Return [tool.sully.loop] config with defaults (times in ms; None means no budget)."""
+    cfg = load(start)
+    loop = cfg.get("loop", {})
+    return {
+        "threshold-ms": float(loop.get("threshold-ms", 100.0)),
+        "budget-ms": loop.get("budget-ms"),
+        "top": int(loop.get("top", 10)),
+    }
+
+
+def get_runtime_types_config(start: Path | None = None) -> dict:
+    """Return [tool.sully.runtime-types] config with defaults (check the first calls, then 1 in sample)."""
+    cfg = load(start)
+    runtime = cfg.get("runtime-types", {})
+    return {
+        "first": int(runtime.get("first", 10)),
+        "sample": int(runtime.get("sample", 100)),
+        "top": int(runtime.get("top", 20)),
+        "fail": bool(runtime.get("fail", False)),
+    }
@@ -0,0 +1,142 @@
+"""Measure what each direct dependency costs: transitive packages, disk and import time."""
+
+import json
+from pathlib import Path
+from typing import NamedTuple
+
+from sully import uv
+from sully.lockfile import LockedPackage, closure
+
+# Runs inside the project environment. Reads a JSON list of distribution names
+# (and a flag for timing imports) from argv and prints one JSON object.
+_PROBE = r"""
+import json, subprocess, sys
+from importlib import metadata
+
+names, timed = json.loads(sys.argv[1]), sys.argv[2] == "1"
+TIMER = "import time; t = time.perf_counter(); import {0}; print(time.perf_counter() - t)"
+out = {}
+for name in names:
+    try:
+        dist = metadata.distribution(name)
+    except metadata.PackageNotFoundError:
+        continue
+    size = files = 0
+    modules = set()
+    for f in dist.files or []:
+        path = dist.locate_file(f)
+        if path.is_file():
+            size += path.stat().st_size
+            files += 1
+        top = f.parts[0] if f.parts else ""
+        if ".." in f.parts or top.endswith((".dist-info", ".data")) or top == "__pycache__":
+            continue
+        if len(f.parts) > 1 and f.parts[1] == "__init__.py":
+            modules.add(top)
+        elif len(f.parts) == 1 and top.endswith(".py"):
+            modules.add(top[:-3])
+    top_level = dist.read_text("top_level.txt")
+    if top_level:
+        modules = {m for m in top_level.split() if m and not m.startswith("_")} or modules
+    seconds = None
+    if timed and modules:
+        # Fresh interpreter per package, so earlier imports never make later ones look cheap.
+        seconds = 0.0
+        for module in sorted(modules):
+            proc = subprocess.run([sys.executable, "-c", TIMER.format(module)], capture_output=True, text=True)
+            if proc.returncode == 0:
+                seconds += float(proc.stdout.strip().splitlines()[-1])
+    out[name] = {"size": size, "files": files, "modules": sorted(modules), "import": seconds}
+print(json.dumps(out))
+"""
+
+
+class DependencyCost(NamedTuple):
+    """Cost of one direct dependency, including everything it pulls in."""
+
+    name: str
+    version: str
+    transitive: tuple[str, ...]  # packages pulled in besides *name* itself
+    size: int  # bytes on disk for the whole closure
+    files: int
+    exclusive_size: int  # bytes that only this dependency pulls in
+    import_seconds: float | None
+
+
+class CostReport(NamedTuple):
+    """Costs for every direct dependency, most expensive first, plus the combined footprint."""
+
+    costs: list[DependencyCost]
+    total_size: int  # bytes for the union of all closures (shared packages counted once)
+    total_packages: int
+
+
+def measure(root: Path, names: list[str], *, import_time: bool = True) -> dict[str, dict]:
+    """Return installed size, file count, modules and import time per distribution in the project env."""
+    args = [json.dumps(sorted(names)), "1" if import_time else "0"]
+    proc = uv.run_captured(["python", "-c", _PROBE, *args], cwd=root)
+    if proc.returncode != 0:
+        raise RuntimeError(f"Could not inspect the project environment:\n{proc.stdout}")
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def dependency_costs(
+    root: Path,
+    packages: dict[str, LockedPackage],
+    direct: dict[str, tuple[str, ...]],
+    *,
+    import_time: bool = True,
+) -> CostReport:
+    """Cost every *direct* dependency (name -> requested extras)."""
+    closures = {name: closure(packages, name, extras) for name, extras in direct.items()}
+    everything = set().union(*closures.values()) if closures else set()
+    installed = measure(root, sorted(everything), import_time=import_time)
+
+    def size(names: set[str]) -> int:
+        return sum(installed.get(n, {}).get("size", 0) for n in names)
+
+    costs: list[DependencyCost] = []
+    for name, members in closures.items():
+        others = set().union(*(c for n, c in closures.items() if n != name))
+        own = installed.get(name, {})
+        costs.append(
+            DependencyCost(
+                name,
+                packages[name].version if name in packages else "",
+                tuple(sorted(members - {name})),
+                size(members),
+                sum(installed.get(n, {}).get("files", 0) for n in members),
+                size(members - others),
+                own.get("import"),
+            )
+        )
+    costs.sort(key=lambda c: (c.size, c.import_seconds or 0.0), reverse=True)
+    return CostReport(costs, size(everything), len(everything))
+
+
+def over_budget(report: CostReport, budgets: dict) -> list[str]:
+    """Return a message for every budget in [tool.sully.deps] that *report* exceeds."""
+    problems: list[str] = []
+    for cost in report.costs:
+        if budgets["max-size-mb"] is not None and cost.size > budgets["max-size-mb"] * 1024 * 1024:
+            problems.append(f"{cost.name}: {_mb(cost.size)} MB installed exceeds {budgets['max-size-mb']} MB")
+        if budgets["max-transitive"] is not None and len(cost.transitive) > budgets["max-transitive"]:
+            problems.append(
+                f"{cost.name}: pulls in {len(cost.transitive)} packages, more than {budgets['max-transitive']}"
+            )
+        if (
+            budgets["max-import-ms"] is not None
+            and cost.import_seconds is not None
+            and cost.import_seconds * 1000 > budgets["max-import-ms"]
+        ):
+            problems.append(
+                f"{cost.name}: imports in {cost.import_seconds * 1000:.0f} ms, over {budgets['max-import-ms']} ms"
+            )
+    total = report.total_size
+    if budgets["max-total-mb"] is not None and total > budgets["max-total-mb"] * 1024 * 1024:
+        problems.append(f"all dependencies: {_mb(total)} MB installed exceeds {budgets['max-total-mb']} MB")
+    return problems
+
+
+def _mb(size: int) -> str:
+    return f"{size / (1024 * 1024):.1f}"
@@ -0,0 +1,200 @@
+"""Batched dependency edits: change pyproject.toml once, lock once, sync once.
+
+Edits are applied to the parsed document with tomlkit (so formatting and
+comments survive), then a single ``uv lock`` resolves them all. If the
+resolve or the sync fails, pyproject.toml and uv.lock are restored byte for
+byte and the environment is re-synced to match.
+"""
+
+import re
+import subprocess
+from pathlib import Path
+from typing import NamedTuple
+
+import tomlkit
+from tomlkit.items import Array
+
+from sully import uv
+from sully.lockfile import LockedPackage, read_lock
+from sully.wheels import find_links
+
+# The group name used for [project] dependencies in plans and results.
+RUNTIME = "runtime"
+
+
+class Edit(NamedTuple):
+    """Add or remove one requirement in one group (``RUNTIME`` for [project] dependencies)."""
+
+    action: str  # "add" or "remove"
+    requirement: str
+    group: str
+
+
+class DependencyError(Exception):
+    """A batch of edits could not be applied; the project was left unchanged."""
+
+
+def requirement_name(requirement: str) -> str:
+    """Return the normalised (PEP 503) distribution name of a PEP 508 requirement."""
+    match = re.match(r"\s*([A-Za-z0-9][A-Za-z0-9._-]*)", requirement)
+    if match is None:
+        raise DependencyError(f"Invalid requirement: {requirement!r}")
+    return re.sub(r"[-_.]+", "-", match.group(1)).lower()
+
+
+def requirement_extras(requirement: str) -> tuple[str, ...]:
+    """Return the extras requested by a PEP 508 requirement, e.g. ``("socks",)`` for ``requests[socks]``."""
+    match = re.match(r"\s*[A-Za-z0-9][A-Za-z0-9._-]*\s*\[([^\]]*)\]", requirement)
+    if match is None:
+        return ()
+    return tuple(e.strip().lower() for e in match.group(1).split(",") if e.strip())
+
+
+def group_names(doc: tomlkit.TOMLDocument) -> list[str]:
+    """Return ``RUNTIME`` followed by every [dependency-groups] name."""
+    return [RUNTIME, *doc.get("dependency-groups", {})]
+
+
+def group_requirements(doc: tomlkit.TOMLDocument, group: str) -> list[str]:
+    """Return the requirement strings in *group*, skipping ``{include-group = ...}`` entries."""
+    return [str(entry) for entry in _find_group(doc, group) or [] if isinstance(entry, str)]
+
+
+def declared(doc: tomlkit.TOMLDocument, groups: list[str]) -> dict[str, tuple[str, ...]]:
+    """Return ``{name: extras}`` for every requirement in *groups* (``RUNTIME`` or dependency groups)."""
+    return {
+        requirement_name(req): requirement_extras(req) for group in groups for req in group_requirements(doc, group)
+    }
+
+
+def load_plan(path: Path) -> list[Edit]:
+    """Read a plan file with ``[add]`` and ``[remove]`` tables mapping group names to requirement lists."""
+    plan = tomlkit.loads(path.read_text())
+    unknown = set(plan) - {"add", "remove"}
+    if unknown:
+        raise DependencyError(f"Unknown plan section(s): {', '.join(sorted(unknown))}")
+    edits: list[Edit] = []
+    for action in ("remove", "add"):
+        for group, requirements in plan.get(action, {}).items():
+            edits.extend(Edit(action, str(req), str(group)) for req in requirements)
+    return edits
+
+
+def apply_edits(doc: tomlkit.TOMLDocument, edits: list[Edit]) -> list[str]:
+    """Apply *edits* to a parsed pyproject.toml in place; return a line describing each change."""
+    changes: list[str] = []
+    for edit in edits:
+        name = requirement_name(edit.requirement)
+        if edit.action == "remove":
+            entries = _find_group(doc, edit.group)
+            matches = _matching(entries, name) if entries is not None else []
+            if entries is None or not matches:
+                raise DependencyError(f"'{name}' is not a dependency in group '{edit.group}'.")
+            for index in reversed(matches):
+                del entries[index]
+            changes.append(f"- {name} ({edit.group})")
+            continue
+
+        entries = _ensure_group(doc, edit.group)
+        matches = _matching(entries, name)
+        if matches:
+            changes.append(f"~ {entries[matches[0]]} -> {edit.requirement} ({edit.group})")
+            entries[matches[0]] = edit.requirement
+        else:
+            entries.append(edit.requirement)
+            changes.append(f"+ {edit.requirement} ({edit.group})")
+    return changes
+
+
+def lower_bounds(edits: list[Edit], locked: dict[str, LockedPackage]) -> list[Edit]:
+    """Give each bare added requirement a ``>=`` bound at its locked version, as ``uv add`` does."""
+    bounded: list[Edit] = []
+    for edit in edits:
+        package = locked.get(requirement_name(edit.requirement))
+        if edit.action == "add" and package is not None and package.version and _is_bare(edit.requirement):
+            edit = edit._replace(requirement=f"{edit.requirement.strip()}>={package.version}")
+        bounded.append(edit)
+    return bounded
+
+
+def _is_bare(requirement: str) -> bool:
+    """True for a name (with optional extras) and no version, URL or marker."""
+    return re.fullmatch(r"\s*[A-Za-z0-9][A-Za-z0-9._-]*\s*(\[[^\]]*\])?\s*", requirement) is not None
+
+
+def _matching(entries: Array, name: str) -> list[int]:
+    return [i for i, entry in enumerate(entries) if requirement_name(str(entry)) == name]
+
+
+def _find_group(doc: tomlkit.TOMLDocument, group: str) -> Array | None:
+    if group == RUNTIME:
+        return doc.get("project", {}).get("dependencies")
+    return doc.get("dependency-groups", {}).get(group)
+
+
+def _ensure_group(doc: tomlkit.TOMLDocument, group: str) -> Array:
+    entries = _find_group(doc, group)
+    if entries is not None:
+        return entries
+    entries = tomlkit.array()
+    if group == RUNTIME:
+        doc.setdefault("project", tomlkit.table())["dependencies"] = entries
+    else:
+        doc.setdefault("dependency-groups", tomlkit.table())[group] = entries
+    return entries
+
+
+def apply(root: Path, edits: list[Edit], *, bound: bool = False) -> list[str]:
+    """Apply *edits* to the project at *root* with one lock and one sync, or change nothing.
+
+    With *bound*, bare added names are rewritten to ``name>=<locked version>``
+    after the resolve and the lock is refreshed to record them.
+    Raises DependencyError (after restoring pyproject.toml, uv.lock and the
+    environment) if an edit is invalid or uv cannot resolve or install the result.
+    """
+    pyproject = root / "pyproject.toml"
+    lockfile = root / "uv.lock"
+    saved_pyproject = pyproject.read_bytes()
+    saved_lock = lockfile.read_bytes() if lockfile.is_file() else None
+
+    doc = tomlkit.loads(saved_pyproject.decode())
+    changes = apply_edits(doc, edits)
+    pyproject.write_text(tomlkit.dumps(doc))
+
+    links = find_links(root)
+    locked = False
+    try:
+        try:
+            uv.lock(cwd=root, find_links=links)
+        except subprocess.CalledProcessError as exc:
+            raise DependencyError("uv could not resolve the new dependency set.") from exc
+        locked = True
+        if bound and lockfile.is_file():
+            bounded = lower_bounds(edits, read_lock(lockfile))
+            if bounded != edits:
+                doc = tomlkit.loads(saved_pyproject.decode())
+                changes = apply_edits(doc, bounded)
+                pyproject.write_text(tomlkit.dumps(doc))
+                try:
+                    # The locked versions satisfy the new bounds, so this only records them.
+                    uv.lock(cwd=root, find_links=links)
+                except subprocess.CalledProcessError as exc:
+                    raise DependencyError("uv could not resolve the new dependency set.") from exc
+        try:
+            uv.sync(cwd=root, find_links=links)
+        except subprocess.CalledProcessError as exc:
+            raise DependencyError("uv could not install the new dependency set.") from exc
+    except BaseException:
+        pyproject.write_bytes(saved_pyproject)
+        if saved_lock is not None:
+            lockfile.write_bytes(saved_lock)
+        else:
+            lockfile.unlink(missing_ok=True)
+        if locked:
+            # The environment may be half-updated; bring it back in line with the restored lock.
+            try:
+                uv.sync(cwd=root, find_links=links)
+            except subprocess.CalledProcessError:
+                pass
+        raise
+    return changes
@@ -0,0 +1,39 @@
+"""Findings from sully's own static checks, printed in pyright's format."""
+
+from pathlib import Path
+from typing import NamedTuple
+
+import click
+
+SEVERITIES = ("error", "warning", "information")
+
+
+class Diagnostic(NamedTuple):
+    """A single finding at a source location."""
+
+    path: Path
+    line: int
+    col: int
+    severity: str
+    message: str
+    rule: str
+
+    def format(self) -> str:
+        """Render as ``path:line:col - severity: message (rule)``, like pyright."""
+        return f"  {self.path}:{self.line}:{self.col} - {self.severity}: {self.message} ({self.rule})"
+
+
+def report(diagnostics: list[Diagnostic]) -> None:
+    """Print *diagnostics* grouped by file, followed by a pyright-style summary."""
+    current: Path | None = None
+    for diag in sorted(diagnostics):
+        if diag.path != current:
+            current = diag.path
+            click.echo(str(current))
+        colour = {"error": "red", "warning": "yellow"}.get(diag.severity)
+        click.echo(click.style(diag.format(), fg=colour) if colour else diag.format())
+
+    counts = {sev: sum(1 for d in diagnostics if d.severity == sev) for sev in SEVERITIES}
+    click.echo(
+        f"{counts['error']} errors, {counts['warning']} warnings, {counts['information']} informations"
+    )
@@ -0,0 +1,119 @@
+"""Run the sully_fuzz runner on public functions and save the slowest inputs as benchmarks."""
+
+import json
+from pathlib import Path
+from typing import NamedTuple
+
+from sully import uv
+from sully.commands.test import public_modules
+from sully.runners import runner_env
+
+
+class FuzzCase(NamedTuple):
+    """One input found by the search; *args* and *kwargs* are Python expressions (``repr``)."""
+
+    args: str
+    kwargs: str
+    cost: float  # seconds, or peak bytes with the memory metric
+    size: int
+    timeout: bool  # the call was cut off at the per-call cap, so *cost* is a lower bound
+
+
+class FuzzResult(NamedTuple):
+    """The worst inputs found for one function."""
+
+    target: str  # module:function
+    cases: list[FuzzCase]  # most expensive first
+    typical: float | None  # median cost of random inputs
+    evaluations: int
+    errors: int
+    timeouts: int
+
+    @property
+    def slowdown(self) -> float | None:
+        """How many times costlier the worst case is than a typical input."""
+        if not self.cases or not self.typical:
+            return None
+        return self.cases[0].cost / self.typical
+
+
+def discover_targets(src: Path) -> list[str]:
+    """Return ``module:function`` for every public function under *src*."""
+    return [f"{module}:{fn}" for module, funcs in public_modules(src) for fn in funcs]
+
+
+def run_fuzz(
+    root: Path,
+    targets: list[str],
+    *,
+    budget: float,
+    max_size: int,
+    seed: int = 0,
+    metric: str = "time",
+    keep: int = 3,
+) -> tuple[list[FuzzResult], dict[str, str]]:
+    """Search each target inside the project environment; also return skipped targets and why."""
+    args = ["python", "-m", "sully_fuzz", *targets, "--budget", str(budget), "--max-size", str(max_size)]
+    args += ["--seed", str(seed), "--metric", metric, "--keep", str(keep)]
+    proc = uv.run_captured(args, cwd=root, env=runner_env())
+    lines = proc.stdout.strip().splitlines()
+    if proc.returncode != 0 or not lines:
+        raise RuntimeError(f"Fuzzing failed:\n{proc.stdout}")
+    data = json.loads(lines[-1])
+    results = [
+        FuzzResult(
+            target,
+            [FuzzCase(c["args"], c["kwargs"], c["cost"], c["size"], c["timeout"]) for c in entry["cases"]],
+            entry["typical"],
+            entry["evaluations"],
+            entry["errors"],
+            entry["timeouts"],
+        )
+        for target, entry in data["functions"].items()
+    ]
+    return results, data["skipped"]
+
+
+def benchmark_path(bench_dir: Path, target: str) -> Path:
+    """Return the benchmark file that holds *target*'s fuzz cases."""
+    module, _, fn = target.partition(":")
+    return bench_dir / f"fuzz_{module.replace('.', '_')}_{fn}.py"
+
+
+def write_benchmarks(bench_dir: Path, result: FuzzResult, *, metric: str = "time") -> Path | None:
+    """Write *result*'s cases as ``bench_*`` functions that ``sully bench`` runs; None if there are none.
+
+    A case that was cut off may never return, so it is written as a ``hang_*``
+    function instead, which ``sully bench`` doesn't collect. The file belongs
+    to ``sully fuzz`` and is replaced on every run; hand-written benchmarks live
+    in other files and are never touched.
+    """
+    if not result.cases:
+        return None
+    module, _, fn = result.target.partition(":")
+    lines = [
+        f'"""Slowest inputs for {result.target} found by `sully fuzz --perf`; rewritten on every run."""',
+        "",
+        f"from {module} import {fn}",
+        "",
+    ]
+    for i, case in enumerate(result.cases, 1):
+        lines += [f"CASE_{i}_ARGS = {case.args}", f"CASE_{i}_KWARGS = {case.kwargs}"]
+    for i, case in enumerate(result.cases, 1):
+        cost = f"{case.cost:.3g} s" if metric == "time" else f"{case.cost / 1024:.0f} KiB peak"
+        if case.timeout:
+            prefix = "hang"
+            note = " (cut off; the call took at least this long). Not run by `sully bench`; rename once fixed"
+        else:
+            prefix, note = "bench", ""
+        lines += [
+            "",
+            "",
+            f"def {prefix}_{fn}_case_{i}() -> None:",
+            f'    """Input size {case.size}: {cost}{note}."""',
+            f"    {fn}(*CASE_{i}_ARGS, **CASE_{i}_KWARGS)",
+        ]
+    path = benchmark_path(bench_dir, result.target)
+    bench_dir.mkdir(parents=True, exist_ok=True)
+    path.write_text("\n".join(lines) + "\n")
+    return path
@@ -0,0 +1,315 @@
+"""Import-time hygiene: deferrable heavy imports and PEP 562 lazy packages."""
+
+import ast
+import json
+import re
+from pathlib import Path
+
+from sully.diagnostics import Diagnostic
+
+# Modules whose import alone costs tens to hundreds of milliseconds.
+HEAVY_MODULES = frozenset(
+    {
+        "boto3",
+        "cv2",
+        "matplotlib",
+        "networkx",
+        "numpy",
+        "pandas",
+        "PIL",
+        "polars",
+        "pyarrow",
+        "requests",
+        "scipy",
+        "seaborn",
+        "sklearn",
+        "sqlalchemy",
+        "sympy",
+        "tensorflow",
+        "torch",
+        "transformers",
+    }
+)
+
+LAZY_MARKER = "# Generated by `sully lazify` — re-run it after adding submodules."
+
+
+# ---------------------------------------------------------------------------
+# Deferrable import linting
+# ---------------------------------------------------------------------------
+
+
+class _UsageVisitor(ast.NodeVisitor):
+    """Record whether each tracked name is used at import time or only in function bodies."""
+
+    def __init__(self, names: set[str]) -> None:
+        self.names = names
+        self.eager: set[str] = set()
+        self.deferred: set[str] = set()
+        self._depth = 0
+
+    def _visit_function(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> None:
+        # Decorators, defaults and annotations are evaluated when the def runs.
+        for decorator in node.decorator_list:
+            self.visit(decorator)
+        self.visit(node.args)
+        if node.returns is not None:
+            self.visit(node.returns)
+        self._depth += 1
+        for stmt in node.body:
+            self.visit(stmt)
+        self._depth -= 1
+
+    visit_FunctionDef = _visit_function
+    visit_AsyncFunctionDef = _visit_function
+
+    def visit_Lambda(self, node: ast.Lambda) -> None:
+        self.visit(node.args)
+        self._depth += 1
+        self.visit(node.body)
+        self._depth -= 1
+
+    def visit_Name(self, node: ast.Name) -> None:
+        if node.id in self.names:
+            (self.deferred if self._depth else self.eager).add(node.id)
+
+
+def _heavy_bindings(tree: ast.Module, heavy: frozenset[str]) -> dict[str, ast.Import | ast.ImportFrom]:
+    """Map names bound by top-level imports of heavy modules to their import node."""
+    bound: dict[str, ast.Import | ast.ImportFrom] = {}
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.name.split(".")[0] in heavy:
+                    bound[alias.asname or alias.name.split(".")[0]] = node
+        elif isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+            if node.module.split(".")[0] in heavy:
+                for alias in node.names:
+                    if alias.name != "*":
+                        bound[alias.asname or alias.name] = node
+    return bound
+
+
+def find_deferrable_imports(path: Path, heavy: frozenset[str] = HEAVY_MODULES) -> list[Diagnostic]:
+    """Flag module-level imports of *heavy* modules that are only used inside functions."""
+    try:
+        tree = ast.parse(path.read_text(), filename=str(path))
+    except SyntaxError:
+        return []
+
+    bound = _heavy_bindings(tree, heavy)
+    if not bound:
+        return []
+
+    visitor = _UsageVisitor(set(bound))
+    for node in tree.body:
+        if node not in bound.values():
+            visitor.visit(node)
+
+    return [
+        Diagnostic(
+            path,
+            bound[name].lineno,
+            bound[name].col_offset + 1,
+            "warning",
+            f'"{name}" is a heavy import only used inside functions; import it where it is used',
+            "reportDeferrableImport",
+        )
+        for name in sorted(visitor.deferred - visitor.eager, key=lambda n: bound[n].lineno)
+    ]
+
+
+def imported_modules(path: Path) -> set[str]:
+    """Return the top-level names of every absolute import in *path*, wherever it appears."""
+    try:
+        tree = ast.parse(path.read_text(), filename=str(path))
+    except SyntaxError:
+        return set()
+    return tree_imports(tree)
+
+
+def tree_imports(tree: ast.Module) -> set[str]:
+    """Return the top-level names of every absolute import in a parsed module."""
+    found: set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            found.update(alias.name.partition(".")[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            found.add(node.module.partition(".")[0])
+    return found
+
+
+# ---------------------------------------------------------------------------
+# Lazy package __init__ generation
+# ---------------------------------------------------------------------------
+
+
+def public_names(path: Path) -> list[str]:
+    """Return the public names defined in *path*, honouring a literal ``__all__``."""
+    try:
+        tree = ast.parse(path.read_text())
+    except SyntaxError:
+        return []
+    return tree_public_names(tree)
+
+
+def tree_public_names(tree: ast.Module) -> list[str]:
+    """Return the public names defined in a parsed module, honouring a literal ``__all__``."""
+    names: list[str] = []
+    for node in tree.body:
+        if isinstance(node, ast.Assign | ast.AnnAssign):
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            if any(isinstance(t, ast.Name) and t.id == "__all__" for t in targets):
+                try:
+                    declared = ast.literal_eval(node.value) if node.value else []
+                except ValueError:
+                    declared = []
+                return [n for n in declared if isinstance(n, str)]
+            names.extend(t.id for t in targets if isinstance(t, ast.Name))
+        elif isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef):
+            names.append(node.name)
+    return list(dict.fromkeys(n for n in names if not n.startswith("_")))
+
+
+def package_layout(package: Path) -> tuple[list[str], dict[str, str]]:
+    """Return the public submodules of *package* and a name → submodule export map."""
+    submodules: list[str] = []
+    for child in sorted(package.iterdir()):
+        if child.name.startswith("_"):
+            continue
+        if child.suffix == ".py":
+            submodules.append(child.stem)
+        elif child.is_dir() and (child / "__init__.py").is_file():
+            submodules.append(child.name)
+
+    exports: dict[str, str] = {}
+    for sub in submodules:
+        source = package / f"{sub}.py"
+        if not source.is_file():
+            source = package / sub / "__init__.py"
+        for name in public_names(source):
+            if name not in submodules and name not in exports:
+                exports[name] = sub
+    return submodules, exports
+
+
+def render_lazy_init(docstring: str, submodules: list[str], exports: dict[str, str]) -> str:
+    """Render a PEP 562 ``__init__.py`` that imports *submodules* and *exports* on first access."""
+    all_names = sorted({*submodules, *exports})
+    return f'''\
+"""{_docstring_body(docstring)}"""
+
+{LAZY_MARKER}
+
+import importlib
+
+__all__ = {json.dumps(all_names)}
+
+_SUBMODULES: frozenset[str] = frozenset({json.dumps(sorted(submodules))})
+_EXPORTS: dict[str, str] = {json.dumps(dict(sorted(exports.items())))}
+
+
+def __getattr__(name: str) -> object:
+    """Import submodules and re-exported names on first access (PEP 562)."""
+    if name in _SUBMODULES:
+        value: object = importlib.import_module(f"{{__name__}}.{{name}}")
+    elif name in _EXPORTS:
+        value = getattr(importlib.import_module(f"{{__name__}}.{{_EXPORTS[name]}}"), name)
+    else:
+        raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List lazily available attributes alongside the module's globals."""
+    return sorted({{*globals(), *__all__}})
+'''
+
+
+def _docstring_body(text: str) -> str:
+    """Escape *text* so it reads back unchanged between triple double quotes."""
+    body = text.replace("\\", "\\\\")
+    # Only a run of three quotes, or quotes right before the closing ones, can end the literal early.
+    return re.sub(r'"{3,}|"+$', lambda m: m.group().replace('"', '\\"'), body)
+
+
+def render_lazy_stub(submodules: list[str], exports: dict[str, str]) -> str:
+    """Render the ``__init__.pyi`` that gives type checkers the eager view of a lazy package."""
+    lines = [f"{LAZY_MARKER}", ""]
+    lines += [f"from . import {sub} as {sub}" for sub in sorted(submodules)]
+    lines += [f"from .{sub} import {name} as {name}" for name, sub in sorted(exports.items())]
+    lines += ["", f"__all__ = {json.dumps(sorted({*submodules, *exports}))}", ""]
+    return "\n".join(lines)
+
+
+def is_replaceable_init(path: Path, submodules: list[str], exports: dict[str, str]) -> bool:
+    """Return True if *path* was generated, or is just what the lazy ``__init__`` would provide.
+
+    That is a docstring, ``__all__`` and imports the generated map reproduces
+    exactly: ``from . import sub`` for a submodule and ``from .sub import name``
+    where *exports* maps ``name`` to ``sub`` (or the same spelled absolutely).
+    Aliases, star imports, other absolute imports and anything conditional are
+    the author's own and block a rewrite.
+    """
+    if not path.is_file():
+        return True
+    source = path.read_text()
+    if LAZY_MARKER in source:
+        return True
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return False
+    package = _dotted_package(path.parent)
+    for index, node in enumerate(tree.body):
+        if index == 0 and isinstance(node, ast.Expr) and isinstance(node.value, ast.Constant):
+            continue
+        if isinstance(node, ast.ImportFrom) and _reproduced(node, package, submodules, exports):
+            continue
+        if isinstance(node, ast.Assign) and all(
+            isinstance(t, ast.Name) and t.id == "__all__" for t in node.targets
+        ):
+            continue
+        return False
+    return True
+
+
+def _reproduced(node: ast.ImportFrom, package: str, submodules: list[str], exports: dict[str, str]) -> bool:
+    """True if every name *node* binds is bound the same way by the lazy ``__getattr__``."""
+    module = node.module
+    if node.level == 0:
+        if module == "__future__":
+            return True
+        if module is None or (module != package and not module.startswith(f"{package}.")):
+            return False
+        module = module[len(package) + 1 :] or None
+    elif node.level != 1:
+        return False
+    if any(a.asname not in (None, a.name) or a.name == "*" for a in node.names):
+        return False
+    if module is None:
+        return all(a.name in submodules for a in node.names)
+    return all(exports.get(a.name) == module for a in node.names)
+
+
+def _dotted_package(package: Path) -> str:
+    """Return the dotted name of *package*, following parent directories that are packages too."""
+    parts = [package.name]
+    parent = package.parent
+    while (parent / "__init__.py").is_file():
+        parts.insert(0, parent.name)
+        parent = parent.parent
+    return ".".join(parts)
+
+
+def init_docstring(path: Path, default: str) -> str:
+    """Return the module docstring of *path*, or *default* if it has none."""
+    if path.is_file():
+        try:
+            doc = ast.get_docstring(ast.parse(path.read_text()))
+        except SyntaxError:
+            doc = None
+        if doc:
+            return doc
+    return default
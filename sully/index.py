@@ -0,0 +1,204 @@
+"""Persistent index of project files, shared by the commands that scan the tree.
+
+``.sully/index.json`` records every file under the paths commands ask for:
+size, mtime and SHA-256, plus, for Python files, the module name, imported
+top-level modules, public names and public functions. A refresh lists a
+directory again only if its mtime changed, and reads a file again only if its
+size or mtime did. Everything else, hashes and parsed summaries included, is
+answered from the index.
+
+Files are still stat-ed on every refresh: writing a file in place doesn't
+change its directory's mtime. Anything modified within two seconds of when it
+was indexed is checked again next time, because a second write in the same
+mtime tick would otherwise go unnoticed.
+"""
+
+import ast
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+from sully.imports import tree_imports, tree_public_names
+
+INDEX_FILE = ".sully/index.json"
+# Bump when entries change shape so old indexes are rebuilt.
+INDEX_VERSION = "2"
+
+# Never indexed when walking a directory, at any depth.
+SKIP_DIRS = frozenset({".git", ".venv", ".sully", "__pycache__", "node_modules"})
+# Build output, skipped only at the project root: src/pkg/build/ is source.
+ROOT_SKIP_DIRS = frozenset({"build", "dist"})
+
+_RACY_NS = 2_000_000_000
+
+
+class FileEntry(NamedTuple):
+    """One indexed file."""
+
+    path: str  # relative to the project root, with forward slashes
+    size: int
+    mtime_ns: int
+    sha256: str
+    module: str | None = None  # dotted module name, for Python files under src/
+    imports: tuple[str, ...] = ()  # top-level modules of every absolute import
+    public: tuple[str, ...] = ()  # public module-level names, honouring __all__
+    functions: tuple[str, ...] = ()  # public module-level functions
+
+
+class ProjectIndex:
+    """The file index of the project at *root*, loaded from ``.sully/index.json`` if present."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self._path = root / INDEX_FILE
+        try:
+            data = json.loads(self._path.read_text())
+        except (OSError, ValueError):
+            data = {}
+        if data.get("version") != INDEX_VERSION:
+            data = {}
+        self._files = {rel: _entry(rel, fields) for rel, fields in data.get("files", {}).items()}
+        self._dirs: dict[str, list] = data.get("dirs", {})  # rel -> [mtime_ns, file names, dir names]
+        self._unsettled: set[str] = set(data.get("unsettled", []))
+        self._dirty = False
+
+    def files(self, paths: list[str], suffix: str = "") -> list[FileEntry]:
+        """Refresh and return the entries for every file under *paths*, sorted by path.
+
+        *paths* are files or directories relative to the root; missing ones are
+        skipped. Only files whose name ends with *suffix* are returned.
+        """
+        found: dict[str, FileEntry] = {}
+        for rel in paths:
+            rel = Path(rel).as_posix()
+            target = self.root / rel
+            if target.is_dir():
+                self._walk(rel, found)
+            elif target.is_file():
+                entry = self._file(rel)
+                if entry is not None:
+                    found[rel] = entry
+            else:
+                self._forget(rel)
+        try:
+            self.save()
+        except OSError:  # a read-only checkout still gets fresh answers, just without reuse
+            pass
+        return [found[rel] for rel in sorted(found) if rel.endswith(suffix)]
+
+    def save(self) -> None:
+        """Write the index back if anything changed, atomically."""
+        if not self._dirty:
+            return
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "version": INDEX_VERSION,
+            "files": {rel: list(entry[1:]) for rel, entry in sorted(self._files.items())},
+            "dirs": dict(sorted(self._dirs.items())),
+            "unsettled": sorted(self._unsettled),
+        }
+        fd, tmp = tempfile.mkstemp(prefix=".index-", dir=self._path.parent)
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp, self._path)
+        self._dirty = False
+
+    def _walk(self, rel: str, found: dict[str, FileEntry]) -> None:
+        try:
+            mtime = (self.root / rel).stat().st_mtime_ns
+        except OSError:
+            return
+        listing = self._dirs.get(rel)
+        if listing is None or listing[0] != mtime or rel in self._unsettled:
+            skip = SKIP_DIRS | ROOT_SKIP_DIRS if rel == "." else SKIP_DIRS
+            files: list[str] = []
+            dirs: list[str] = []
+            with os.scandir(self.root / rel) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in skip:
+                            dirs.append(entry.name)
+                    elif entry.is_file():
+                        files.append(entry.name)
+            if listing is not None:
+                for name in set(listing[1]) - set(files) | set(listing[2]) - set(dirs):
+                    self._forget(_join(rel, name))
+            listing = self._dirs[rel] = [mtime, sorted(files), sorted(dirs)]
+            self._settle(rel, mtime)
+        for name in listing[1]:
+            entry = self._file(_join(rel, name))
+            if entry is not None:
+                found[entry.path] = entry
+        for name in listing[2]:
+            self._walk(_join(rel, name), found)
+
+    def _file(self, rel: str) -> FileEntry | None:
+        try:
+            st = (self.root / rel).stat()
+            old = self._files.get(rel)
+            if old is not None and (old.size, old.mtime_ns) == (st.st_size, st.st_mtime_ns):
+                if rel not in self._unsettled:
+                    return old
+            data = (self.root / rel).read_bytes()
+        except OSError:
+            self._forget(rel)
+            return None
+        digest = hashlib.sha256(data).hexdigest()
+        if old is not None and old.sha256 == digest:
+            entry = old._replace(size=st.st_size, mtime_ns=st.st_mtime_ns)
+        else:
+            entry = FileEntry(rel, st.st_size, st.st_mtime_ns, digest, *_summarise(rel, data))
+        self._files[rel] = entry
+        self._settle(rel, st.st_mtime_ns)
+        return entry
+
+    def _settle(self, rel: str, mtime_ns: int) -> None:
+        self._dirty = True
+        if mtime_ns >= time.time_ns() - _RACY_NS:
+            self._unsettled.add(rel)
+        else:
+            self._unsettled.discard(rel)
+
+    def _forget(self, rel: str) -> None:
+        prefix = rel + "/"
+        for table in (self._files, self._dirs):
+            for key in [k for k in table if k == rel or k.startswith(prefix)]:
+                del table[key]
+                self._dirty = True
+        self._unsettled = {k for k in self._unsettled if k != rel and not k.startswith(prefix)}
+
+
+def project_files(root: Path, paths: list[str], suffix: str = "") -> list[FileEntry]:
+    """Return the refreshed index entries for every file under *paths* in the project at *root*."""
+    return ProjectIndex(root).files(paths, suffix)
+
+
+def _join(rel: str, name: str) -> str:
+    return name if rel == "." else f"{rel}/{name}"
+
+
+def _entry(rel: str, fields: list) -> FileEntry:
+    size, mtime_ns, sha256, module, imports, public, functions = fields
+    return FileEntry(rel, size, mtime_ns, sha256, module, tuple(imports), tuple(public), tuple(functions))
+
+
+def _summarise(rel: str, data: bytes) -> tuple[str | None, tuple[str, ...], tuple[str, ...], tuple[str, ...]]:
+    """Return the module name, imports, public names and public functions of a Python file."""
+    if not rel.endswith(".py"):
+        return None, (), (), ()
+    module = None
+    if rel.startswith("src/"):
+        parts = rel[len("src/") : -len(".py")].split("/")
+        if parts[-1] == "__init__":
+            parts.pop()
+        module = ".".join(parts) or None
+    try:
+        tree = ast.parse(data, filename=rel)
+    except (SyntaxError, ValueError):
+        return module, (), (), ()
+    functions = [n.name for n in tree.body if isinstance(n, ast.FunctionDef) and not n.name.startswith("_")]
+    return module, tuple(sorted(tree_imports(tree))), tuple(tree_public_names(tree)), tuple(functions)
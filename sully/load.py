@@ -0,0 +1,64 @@
+"""Run the sully_load runner in the project environment and check its results against SLOs."""
+
+import json
+from pathlib import Path
+from typing import NamedTuple
+
+from sully import uv
+from sully.runners import runner_env
+
+# SLO keys in [tool.sully.load.slo] that cap a latency statistic (in milliseconds).
+LATENCY_SLOS = {"p50-ms": "p50", "p90-ms": "p90", "p99-ms": "p99", "p999-ms": "p999", "max-ms": "max"}
+
+
+class LoadReport(NamedTuple):
+    """Outcome of one load run; latencies are in milliseconds."""
+
+    mode: str
+    requests: int
+    errors: int
+    seconds: float
+    throughput: float  # calls started per second, failed ones included
+    latency_ms: dict[str, float]  # p50, p90, p99, p999, max and mean
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.requests if self.requests else 0.0
+
+
+def run_load(
+    root: Path,
+    target: str,
+    *,
+    mode: str = "auto",
+    concurrency: int = 1,
+    rate: float | None = None,
+    duration: float = 10.0,
+    warmup: float = 0.0,
+) -> LoadReport:
+    """Drive *target* (``module:callable``) inside the project environment and return the report."""
+    args = ["python", "-m", "sully_load", target, "--mode", mode, "--concurrency", str(concurrency)]
+    args += ["--duration", str(duration), "--warmup", str(warmup)]
+    if rate is not None:
+        args += ["--rate", str(rate)]
+    proc = uv.run_captured(args, cwd=root, env=runner_env())
+    lines = proc.stdout.strip().splitlines()
+    if proc.returncode != 0 or not lines:
+        raise RuntimeError(f"Load run failed:\n{proc.stdout}")
+    data = json.loads(lines[-1])
+    return LoadReport(
+        data["mode"], data["requests"], data["errors"], data["seconds"], data["throughput"], data["latency_ms"]
+    )
+
+
+def slo_violations(report: LoadReport, slo: dict[str, float]) -> list[str]:
+    """Return a message for every threshold in *slo* that *report* misses."""
+    problems: list[str] = []
+    for key, stat in LATENCY_SLOS.items():
+        if key in slo and report.latency_ms[stat] > slo[key]:
+            problems.append(f"{stat} latency {report.latency_ms[stat]:.2f} ms exceeds {slo[key]:g} ms")
+    if "min-rps" in slo and report.throughput < slo["min-rps"]:
+        problems.append(f"throughput {report.throughput:.0f}/s is below {slo['min-rps']:g}/s")
+    if "max-error-rate" in slo and report.error_rate > slo["max-error-rate"]:
+        problems.append(f"error rate {report.error_rate:.2%} exceeds {slo['max-error-rate']:.2%}")
+    return problems
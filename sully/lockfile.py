@@ -0,0 +1,58 @@
+"""Read uv.lock and walk its dependency graph."""
+
+import tomllib
+from pathlib import Path
+from typing import NamedTuple
+
+
+class LockedPackage(NamedTuple):
+    """One ``[[package]]`` entry; dependencies are ``(name, extras)`` pairs."""
+
+    name: str
+    version: str
+    dependencies: list[tuple[str, tuple[str, ...]]]
+    optional: dict[str, list[tuple[str, tuple[str, ...]]]]
+
+
+def read_lock(path: Path) -> dict[str, LockedPackage]:
+    """Parse *path* (uv.lock) into packages keyed by normalised name.
+
+    Uses tomllib rather than tomlkit: lock files are large and never edited here.
+    """
+    data = tomllib.loads(path.read_text())
+    packages: dict[str, LockedPackage] = {}
+    for entry in data.get("package", []):
+        packages[entry["name"]] = LockedPackage(
+            entry["name"],
+            str(entry.get("version", "")),
+            _edges(entry.get("dependencies", [])),
+            {extra: _edges(deps) for extra, deps in entry.get("optional-dependencies", {}).items()},
+        )
+    return packages
+
+
+def _edges(deps: list[dict]) -> list[tuple[str, tuple[str, ...]]]:
+    return [(d["name"], tuple(d.get("extra", []))) for d in deps]
+
+
+def closure(packages: dict[str, LockedPackage], name: str, extras: tuple[str, ...] = ()) -> set[str]:
+    """Return *name* and everything it (with *extras*) transitively depends on.
+
+    Environment markers are ignored, so this is the closure across all platforms.
+    """
+    seen: set[str] = set()
+    visited: set[tuple[str, str]] = set()
+    stack: list[tuple[str, tuple[str, ...]]] = [(name, extras)]
+    while stack:
+        current, wanted = stack.pop()
+        package = packages.get(current)
+        if package is None:
+            continue
+        if current not in seen:
+            seen.add(current)
+            stack.extend(package.dependencies)
+        for extra in wanted:
+            if (current, extra) not in visited:
+                visited.add((current, extra))
+                stack.extend(package.optional.get(extra, []))
+    return seen
@@ -0,0 +1,335 @@
+"""AST-based detection of common performance anti-patterns."""
+
+import ast
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from fnmatch import fnmatch
+from pathlib import Path
+
+from sully.diagnostics import Diagnostic
+
+# Rule name → default severity ("error", "warning", "information" or "none").
+RULES: dict[str, str] = {
+    "reportRegexInLoop": "warning",
+    "reportStringConcatInLoop": "warning",
+    "reportListFrontMutation": "warning",
+    "reportListMembershipInLoop": "warning",
+    "reportSortedForMinMax": "warning",
+    "reportDataclassWithoutSlots": "warning",
+}
+
+# Bump when the analyser changes so stale cache entries are discarded.
+ANALYSER_VERSION = "2"
+
+# Below this many uncached files a process pool costs more than it saves.
+_PARALLEL_THRESHOLD = 8
+
+_RE_FUNCS = frozenset({"compile", "match", "search", "fullmatch", "findall", "finditer", "sub", "subn", "split"})
+
+Finding = tuple[int, int, str, str]  # (line, col, rule, message)
+
+
+class _PerfVisitor(ast.NodeVisitor):
+    """Collect findings for a single module."""
+
+    def __init__(self) -> None:
+        self.findings: list[Finding] = []
+        self._loop_depth = 0
+        # Per-scope record of names known to hold a "list", "str" or "dict".
+        self._kinds: list[dict[str, str]] = [{}]
+
+    def _add(self, node: ast.expr | ast.stmt, rule: str, message: str) -> None:
+        self.findings.append((node.lineno, node.col_offset + 1, rule, message))
+
+    # -- scopes and loops ----------------------------------------------------
+
+    def _visit_function(self, node: ast.FunctionDef | ast.AsyncFunctionDef | ast.Lambda) -> None:
+        # A function defined inside a loop does not run per iteration.
+        depth, self._loop_depth = self._loop_depth, 0
+        self._kinds.append({})
+        self.generic_visit(node)
+        self._kinds.pop()
+        self._loop_depth = depth
+
+    visit_FunctionDef = _visit_function
+    visit_AsyncFunctionDef = _visit_function
+    visit_Lambda = _visit_function
+
+    def _visit_loop(self, node: ast.For | ast.AsyncFor | ast.While) -> None:
+        if isinstance(node, ast.While):
+            self.visit(node.test)
+        else:
+            self.visit(node.target)
+            self.visit(node.iter)
+        self._loop_depth += 1
+        for stmt in node.body:
+            self.visit(stmt)
+        self._loop_depth -= 1
+        for stmt in node.orelse:
+            self.visit(stmt)
+
+    visit_For = _visit_loop
+    visit_AsyncFor = _visit_loop
+    visit_While = _visit_loop
+
+    def _visit_comprehension(self, node: ast.ListComp | ast.SetComp | ast.GeneratorExp | ast.DictComp) -> None:
+        # The first iterable is evaluated once; everything else runs per item.
+        self.visit(node.generators[0].iter)
+        self._loop_depth += 1
+        for index, gen in enumerate(node.generators):
+            self.visit(gen.target)
+            if index:
+                self.visit(gen.iter)
+            for cond in gen.ifs:
+                self.visit(cond)
+        if isinstance(node, ast.DictComp):
+            self.visit(node.key)
+            self.visit(node.value)
+        else:
+            self.visit(node.elt)
+        self._loop_depth -= 1
+
+    visit_ListComp = _visit_comprehension
+    visit_SetComp = _visit_comprehension
+    visit_GeneratorExp = _visit_comprehension
+    visit_DictComp = _visit_comprehension
+
+    # -- name kinds ----------------------------------------------------------
+
+    def _record(self, target: ast.expr, kind: str | None) -> None:
+        if isinstance(target, ast.Name):
+            if kind is None:
+                self._kinds[-1].pop(target.id, None)
+            else:
+                self._kinds[-1][target.id] = kind
+
+    def _kind(self, node: ast.expr) -> str | None:
+        if isinstance(node, ast.Name):
+            return self._kinds[-1].get(node.id)
+        return None
+
+    def visit_Assign(self, node: ast.Assign) -> None:
+        self.generic_visit(node)
+        for target in node.targets:
+            self._record(target, _value_kind(node.value))
+
+    def visit_AnnAssign(self, node: ast.AnnAssign) -> None:
+        self.generic_visit(node)
+        kind = _annotation_kind(node.annotation)
+        if kind is None and node.value is not None:
+            kind = _value_kind(node.value)
+        self._record(node.target, kind)
+
+    # -- rules ---------------------------------------------------------------
+
+    def visit_AugAssign(self, node: ast.AugAssign) -> None:
+        self.generic_visit(node)
+        if self._loop_depth and isinstance(node.op, ast.Add):
+            if self._kind(node.target) == "str" or _value_kind(node.value) == "str":
+                self._add(
+                    node,
+                    "reportStringConcatInLoop",
+                    "String built with += inside a loop; collect parts in a list and use str.join",
+                )
+
+    def visit_Compare(self, node: ast.Compare) -> None:
+        self.generic_visit(node)
+        if not self._loop_depth:
+            return
+        for op, comparator in zip(node.ops, node.comparators):
+            if isinstance(op, ast.In | ast.NotIn) and self._kind(comparator) == "list":
+                self._add(
+                    node,
+                    "reportListMembershipInLoop",
+                    f'Membership test against list "{ast.unparse(comparator)}" inside a loop; use a set',
+                )
+
+    def visit_Call(self, node: ast.Call) -> None:
+        self.generic_visit(node)
+        func = node.func
+        if not isinstance(func, ast.Attribute):
+            return
+        # A receiver known to be something other than a list (e.g. a dict keyed by 0) is fine.
+        if func.attr in ("pop", "insert") and node.args and _is_zero(node.args[0]):
+            arity = (func.attr, len(node.args)) in (("pop", 1), ("insert", 2))
+            if arity and self._kind(func.value) in (None, "list"):
+                self._add(
+                    node,
+                    "reportListFrontMutation",
+                    f"list.{func.attr}(0) is O(n); use collections.deque",
+                )
+        if (
+            self._loop_depth
+            and isinstance(func.value, ast.Name)
+            and func.value.id == "re"
+            and func.attr in _RE_FUNCS
+            and bool(node.args)
+            and _is_str(node.args[0])
+        ):
+            self._add(
+                node,
+                "reportRegexInLoop",
+                f"re.{func.attr}() with a constant pattern inside a loop; compile it once at module level",
+            )
+
+    def visit_Subscript(self, node: ast.Subscript) -> None:
+        self.generic_visit(node)
+        value = node.value
+        if (
+            isinstance(value, ast.Call)
+            and isinstance(value.func, ast.Name)
+            and value.func.id == "sorted"
+            and isinstance(node.slice, ast.Constant | ast.UnaryOp)
+            and ast.unparse(node.slice) in ("0", "-1")
+        ):
+            self._add(node, "reportSortedForMinMax", "sorted(...)[0] / [-1] is O(n log n); use min() or max()")
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        for decorator in node.decorator_list:
+            if _is_dataclass(decorator) and not _has_slots(decorator):
+                self._add(
+                    node,
+                    "reportDataclassWithoutSlots",
+                    f'Dataclass "{node.name}" in a hot module without slots=True',
+                )
+        self._kinds.append({})
+        self.generic_visit(node)
+        self._kinds.pop()
+
+
+def _value_kind(node: ast.expr) -> str | None:
+    if isinstance(node, ast.List | ast.ListComp):
+        return "list"
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in ("list", "sorted"):
+        return "list"
+    if isinstance(node, ast.JoinedStr) or _is_str(node):
+        return "str"
+    if isinstance(node, ast.Dict | ast.DictComp):
+        return "dict"
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in ("dict", "defaultdict"):
+        return "dict"
+    return None
+
+
+def _annotation_kind(node: ast.expr) -> str | None:
+    base = node.value if isinstance(node, ast.Subscript) else node
+    if isinstance(base, ast.Name) and base.id in ("list", "List"):
+        return "list"
+    if isinstance(base, ast.Name) and base.id == "str":
+        return "str"
+    if isinstance(base, ast.Name) and base.id in ("dict", "Dict"):
+        return "dict"
+    return None
+
+
+def _is_str(node: ast.expr) -> bool:
+    return isinstance(node, ast.Constant) and isinstance(node.value, str)
+
+
+def _is_zero(node: ast.expr) -> bool:
+    return isinstance(node, ast.Constant) and node.value == 0 and not isinstance(node.value, bool)
+
+
+def _is_dataclass(node: ast.expr) -> bool:
+    target = node.func if isinstance(node, ast.Call) else node
+    return (isinstance(target, ast.Name) and target.id == "dataclass") or (
+        isinstance(target, ast.Attribute) and target.attr == "dataclass"
+    )
+
+
+def _has_slots(node: ast.expr) -> bool:
+    if not isinstance(node, ast.Call):
+        return False
+    return any(
+        kw.arg == "slots" and isinstance(kw.value, ast.Constant) and kw.value.value is True
+        for kw in node.keywords
+    )
+
+
+def analyse_source(source: str) -> list[Finding]:
+    """Return raw findings for a module's *source*; unparsable sources yield none."""
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return []
+    visitor = _PerfVisitor()
+    visitor.visit(tree)
+    return sorted(visitor.findings)
+
+
+def _analyse_file(path: str) -> tuple[str, str, list[Finding]]:
+    """Worker entry point: return (path, content hash, findings)."""
+    data = Path(path).read_bytes()
+    digest = hashlib.sha256(data).hexdigest()
+    return path, digest, analyse_source(data.decode("utf-8", errors="replace"))
+
+
+def _load_cache(cache_file: Path) -> dict:
+    try:
+        cache = json.loads(cache_file.read_text())
+    except (OSError, ValueError):
+        return {}
+    if cache.get("version") != ANALYSER_VERSION:
+        return {}
+    return cache.get("files", {})
+
+
+def scan(
+    files: list[Path],
+    root: Path,
+    severities: dict[str, str],
+    hot_modules: list[str],
+    cache_file: Path | None = None,
+    digests: dict[str, str] | None = None,
+) -> list[Diagnostic]:
+    """Analyse *files* in parallel, reusing cached results for unchanged files.
+
+    *digests* maps paths to known SHA-256 hex digests (from the project index),
+    so cached files don't have to be read to be validated.
+    """
+    cached = _load_cache(cache_file) if cache_file else {}
+    digests = digests or {}
+    results: dict[str, tuple[str, list[Finding]]] = {}
+    pending: list[str] = []
+
+    for path in files:
+        key = str(path)
+        entry = cached.get(key)
+        if entry is not None and entry["hash"] == (digests.get(key) or hashlib.sha256(path.read_bytes()).hexdigest()):
+            results[key] = (entry["hash"], [tuple(f) for f in entry["findings"]])
+        else:
+            pending.append(key)
+
+    if len(pending) >= _PARALLEL_THRESHOLD:
+        with ProcessPoolExecutor(max_workers=min(len(pending), os.cpu_count() or 1)) as pool:
+            for key, digest, findings in pool.map(_analyse_file, pending, chunksize=4):
+                results[key] = (digest, findings)
+    else:
+        for key in pending:
+            _, digest, findings = _analyse_file(key)
+            results[key] = (digest, findings)
+
+    if cache_file is not None:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(
+            json.dumps(
+                {
+                    "version": ANALYSER_VERSION,
+                    "files": {k: {"hash": h, "findings": f} for k, (h, f) in results.items()},
+                }
+            )
+        )
+
+    diagnostics: list[Diagnostic] = []
+    for key, (_, findings) in results.items():
+        path = Path(key)
+        rel = path.relative_to(root).as_posix() if path.is_relative_to(root) else key
+        hot = any(fnmatch(rel, pattern) for pattern in hot_modules)
+        for line, col, rule, message in findings:
+            severity = severities.get(rule, RULES.get(rule, "none"))
+            if severity == "none" or (rule == "reportDataclassWithoutSlots" and not hot):
+                continue
+            diagnostics.append(Diagnostic(path, line, col, severity, message, rule))
+    return diagnostics
@@ -0,0 +1,117 @@
+"""Compare what the code imports with what pyproject.toml declares.
+
+Imports are read from the project index (:mod:`sully.index`) for src/ and tests/
+and mapped to distributions with ``importlib.metadata.packages_distributions()``
+run inside the project environment, so ``import yaml`` is matched to PyYAML.
+"""
+
+import json
+import sys
+from pathlib import Path
+from typing import NamedTuple
+
+import tomlkit
+
+from sully import uv
+from sully.config import DEV_GROUP
+from sully.deps import RUNTIME, Edit, group_names, group_requirements, requirement_name
+from sully.index import project_files
+
+# Runs inside the project environment; prints module -> distributions and the
+# distributions that are tools (console scripts or pytest plugins) rather than imports.
+_PROBE = r"""
+import json
+from importlib import metadata
+
+tools = sorted({
+    ep.dist.name for group in ("console_scripts", "pytest11")
+    for ep in metadata.entry_points(group=group) if ep.dist is not None
+})
+print(json.dumps({"modules": metadata.packages_distributions(), "tools": tools}))
+"""
+
+
+class Finding(NamedTuple):
+    """One mismatch between imports and declared dependencies."""
+
+    kind: str  # "unused", "test-only" or "undeclared"
+    name: str  # distribution name, or the module name if no installed distribution provides it
+    group: str  # the group it is declared in, or the group it should be added to
+    requirement: str  # the declared requirement, the distribution to add, or "" if unknown
+
+
+def scan_imports(root: Path) -> tuple[set[str], set[str]]:
+    """Return third-party top-level modules imported by src/ and by tests/ (excluding first-party)."""
+    src, tests = root / "src", root / "tests"
+    local = {p.stem for d in (src, tests) if d.is_dir() for p in d.iterdir() if p.suffix == ".py" or p.is_dir()}
+    local |= {"conftest"}
+
+    def scan(directory: Path) -> set[str]:
+        found = {m for entry in project_files(root, [directory.name], ".py") for m in entry.imports}
+        return {m for m in found if m not in sys.stdlib_module_names and m not in local and m != "__future__"}
+
+    return scan(src), scan(tests)
+
+
+def environment_modules(root: Path) -> tuple[dict[str, set[str]], set[str]]:
+    """Return ``{module: {distribution, ...}}`` and the set of tool distributions in the project env."""
+    proc = uv.run_captured(["python", "-c", _PROBE], cwd=root)
+    if proc.returncode != 0:
+        raise RuntimeError(f"Could not inspect the project environment:\n{proc.stdout}")
+    data = json.loads(proc.stdout.strip().splitlines()[-1])
+    modules = {module: {requirement_name(d) for d in dists} for module, dists in data["modules"].items()}
+    return modules, {requirement_name(d) for d in data["tools"]}
+
+
+def find_prunable(root: Path, keep: list[str]) -> list[Finding]:
+    """Return unused, test-only and undeclared dependencies for the project at *root*.
+
+    Distributions in *keep*, sully's own dev tools, and anything exposing console
+    scripts or pytest plugins are never reported as unused.
+    """
+    doc = tomlkit.loads((root / "pyproject.toml").read_text())
+    src_imports, test_imports = scan_imports(root)
+    modules, tools = environment_modules(root)
+
+    def providers(module: str) -> set[str]:
+        return modules.get(module, {module.lower().replace("_", "-")})
+
+    used_in_src = {d for m in src_imports for d in providers(m)}
+    used_in_tests = {d for m in test_imports for d in providers(m)}
+    exempt = {requirement_name(n) for n in [*keep, *DEV_GROUP]} | tools
+
+    findings: list[Finding] = []
+    declared_in: dict[str, set[str]] = {}
+    for group in group_names(doc):
+        for requirement in group_requirements(doc, group):
+            name = requirement_name(requirement)
+            declared_in.setdefault(name, set()).add(group)
+            if name in used_in_src or name in exempt:
+                continue
+            if group == RUNTIME and name in used_in_tests:
+                findings.append(Finding("test-only", name, group, requirement))
+            elif name not in used_in_tests:
+                findings.append(Finding("unused", name, group, requirement))
+
+    for imports, group in ((src_imports, RUNTIME), (test_imports - src_imports, "dev")):
+        for module in sorted(imports):
+            dists = providers(module)
+            covered = [d for d in dists if d in declared_in and (group != RUNTIME or RUNTIME in declared_in[d])]
+            if not covered:
+                # Not installed at all: the distribution name can't be known (``yaml`` is PyYAML).
+                name = sorted(dists)[0] if module in modules else module
+                findings.append(Finding("undeclared", name, group, name if module in modules else ""))
+    return findings
+
+
+def fixes(findings: list[Finding]) -> list[Edit]:
+    """Return the edits that resolve *findings*; undeclared modules with no known distribution are skipped."""
+    edits: list[Edit] = []
+    for f in findings:
+        if f.kind == "unused":
+            edits.append(Edit("remove", f.requirement, f.group))
+        elif f.kind == "test-only":
+            edits.extend([Edit("remove", f.requirement, RUNTIME), Edit("add", f.requirement, "dev")])
+        elif f.requirement:
+            edits.append(Edit("add", f.requirement, f.group))
+    return edits
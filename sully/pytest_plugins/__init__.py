@@ -0,0 +1,20 @@
+"""pytest plugins that sully loads into the project's own test run.
+
+Modules here depend only on the standard library and pytest, so they are made
+importable in the project environment by putting this directory on PYTHONPATH
+and loading them by top-level name with ``-p``. The runners in
+:mod:`sully.runners` go on PYTHONPATH too, so a plugin can share their code.
+"""
+
+import os
+from pathlib import Path
+
+from sully.runners import RUNNER_DIR
+
+PLUGIN_DIR = Path(__file__).parent
+
+
+def plugin_env() -> dict[str, str]:
+    """Return environment overrides that make the plugins (and the runners they use) importable."""
+    existing = os.environ.get("PYTHONPATH")
+    return {"PYTHONPATH": os.pathsep.join([str(PLUGIN_DIR), str(RUNNER_DIR), *([existing] if existing else [])])}
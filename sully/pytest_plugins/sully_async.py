@@ -0,0 +1,244 @@
+"""pytest plugin: run marked async tests concurrently on one event loop (``sully test --async-concurrency N``).
+
+Async tests carrying the marker (``concurrent`` by default) that share a module
+or class run as one batch: their fixtures are set up one after another, the
+test coroutines run as tasks on a fresh event loop with at most N at a time
+and a per-test timeout, then the fixtures are torn down in order. A failing or
+timed-out test is reported on its own and doesn't cancel its neighbours.
+Everything else runs serially through pytest's normal protocol.
+
+The test coroutine is awaited directly rather than through ``pytest_runtest_call``,
+so plugins hooking that phase (and pytest-asyncio's loop) don't apply to batched
+tests; their fixtures should not be bound to another event loop.
+
+Batching reaches into pytest's private runner and fixture state, so the plugin
+checks for it up front and refuses to run on an unsupported pytest.
+"""
+
+import asyncio
+import inspect
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Any
+
+import _pytest.fixtures
+import _pytest.python
+import _pytest.runner
+import pytest
+
+_STASH_KEY = pytest.StashKey["_AsyncState"]()
+_SUPPORTED_PYTEST = ">=8.0,<10"
+
+
+@dataclass
+class _AsyncState:
+    concurrency: int
+    timeout: float | None  # seconds
+    marker: str
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("sully-async")
+    group.addoption(
+        "--sully-async-concurrency", type=int, default=None, help="Run marked async tests N at a time on one loop."
+    )
+    group.addoption("--sully-async-timeout", type=float, default=None, help="Per-test timeout in seconds.")
+    group.addoption("--sully-async-marker", default="concurrent", help="Marker for concurrency-safe async tests.")
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    marker = config.getoption("--sully-async-marker")
+    config.addinivalue_line("markers", f"{marker}: async test that may run concurrently with others (sully test)")
+    concurrency = config.getoption("--sully-async-concurrency")
+    # pytest-xdist workers drive their own test loop.
+    if concurrency is None or hasattr(config, "workerinput"):
+        return
+    if concurrency < 1:
+        raise pytest.UsageError("--sully-async-concurrency must be at least 1")
+    missing = _missing_internals()
+    if missing:
+        raise pytest.UsageError(
+            f"--sully-async-concurrency needs pytest{_SUPPORTED_PYTEST}; pytest {pytest.__version__} "
+            f"lacks {', '.join(missing)}"
+        )
+    config.stash[_STASH_KEY] = _AsyncState(concurrency, config.getoption("--sully-async-timeout"), marker)
+
+
+def _missing_internals() -> list[str]:
+    """Name the private pytest pieces batching uses that this pytest doesn't have.
+
+    Most are instance attributes, so look for them among the names the
+    initialising code assigns rather than on the classes.
+    """
+    wanted = [
+        ("_pytest.runner.call_and_report", hasattr(_pytest.runner, "call_and_report")),
+        ("Session._setupstate", "_setupstate" in _names(getattr(_pytest.runner, "pytest_sessionstart", None))),
+        ("SetupState.stack", "stack" in _names(getattr(_pytest.runner, "SetupState", None))),
+        ("Function._request", "_request" in _names(getattr(_pytest.python.Function, "_initrequest", None))),
+        ("FixtureRequest._fixture_defs", "_fixture_defs" in _names(getattr(_pytest.fixtures, "FixtureRequest", None))),
+        ("FixtureDef._finalizers", "_finalizers" in _names(getattr(_pytest.fixtures, "FixtureDef", None))),
+    ]
+    return [name for name, present in wanted if not present]
+
+
+def _names(obj: object) -> tuple[str, ...]:
+    """Attribute names referenced by a function, or by a class's ``__init__``."""
+    func = obj.__init__ if isinstance(obj, type) else obj  # type: ignore[misc]
+    code = getattr(func, "__code__", None)
+    return code.co_names if code is not None else ()
+
+
+def _concurrent(item: pytest.Item, state: _AsyncState) -> bool:
+    return (
+        isinstance(item, pytest.Function)
+        and item.get_closest_marker(state.marker) is not None
+        and inspect.iscoroutinefunction(item.obj)
+    )
+
+
+def _units(items: list[pytest.Item], state: _AsyncState) -> Iterator[list[pytest.Item]]:
+    """Yield single items to run serially and batches of concurrent items sharing a parent.
+
+    A batch runs where its first member was collected.
+    """
+    batches: dict[object, list[pytest.Item]] = {}
+    for item in items:
+        if _concurrent(item, state):
+            batches.setdefault(item.parent, []).append(item)
+    for item in items:
+        if not _concurrent(item, state):
+            yield [item]
+        elif item.parent in batches:
+            yield batches.pop(item.parent)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtestloop(session: pytest.Session) -> bool | None:
+    state = session.config.stash.get(_STASH_KEY, None)
+    if state is None:
+        return None
+    if session.testsfailed and not session.config.option.continue_on_collection_errors:
+        errors = session.testsfailed
+        raise session.Interrupted(f"{errors} error{'s' if errors != 1 else ''} during collection")
+    if session.config.option.collectonly:
+        return True
+
+    units = list(_units(session.items, state))
+    for i, unit in enumerate(units):
+        nextitem = units[i + 1][0] if i + 1 < len(units) else None
+        if len(unit) == 1 and not _concurrent(unit[0], state):
+            unit[0].config.hook.pytest_runtest_protocol(item=unit[0], nextitem=nextitem)
+        else:
+            _run_batch(session, unit, nextitem, state)
+        if session.shouldfail:
+            raise session.Failed(session.shouldfail)
+        if session.shouldstop:
+            raise session.Interrupted(session.shouldstop)
+    return True
+
+
+def _run_batch(
+    session: pytest.Session, items: list[pytest.Item], nextitem: pytest.Item | None, state: _AsyncState
+) -> None:
+    """Set up every item, await the test coroutines concurrently, then tear down and report in order."""
+    setupstate = session._setupstate
+    reports: dict[pytest.Item, list[pytest.TestReport]] = {}
+    held: dict[pytest.Item, _Held] = {}
+    for item in items:
+        reports[item] = [_pytest.runner.call_and_report(item, "setup", log=False)]
+        held[item] = _detach(item, setupstate)
+
+    ready = [item for item in items if reports[item][0].passed]
+    outcomes = asyncio.run(_run_tests(ready, state))
+    for item in ready:
+        reports[item].append(_call_report(item, *outcomes[item]))
+
+    for i, item in enumerate(items):
+        _attach(item, setupstate, held[item])
+        following = items[i + 1] if i + 1 < len(items) else nextitem
+        if session.shouldfail or session.shouldstop:
+            following = None
+        try:
+            reports[item].append(_pytest.runner.call_and_report(item, "teardown", log=False, nextitem=following))
+        finally:
+            item._request = False  # type: ignore[attr-defined]
+            item.funcargs = None  # type: ignore[attr-defined]
+
+    for item in items:
+        item.ihook.pytest_runtest_logstart(nodeid=item.nodeid, location=item.location)
+        for report in reports[item]:
+            item.ihook.pytest_runtest_logreport(report=report)
+        item.ihook.pytest_runtest_logfinish(nodeid=item.nodeid, location=item.location)
+
+
+@dataclass
+class _Held:
+    """An item's share of pytest's setup state, set aside while its siblings are set up."""
+
+    stack_entry: Any
+    fixtures: list[tuple[Any, Any, list[Any]]]  # (fixturedef, cached_result, finalizers)
+
+
+def _detach(item: pytest.Item, setupstate: Any) -> _Held:
+    """Take *item*'s finalizers and function-scoped fixture values out of pytest's state.
+
+    pytest keeps one item set up at a time: the setup stack must hold only the
+    next item's collectors, and each fixture definition caches one value and
+    its teardown. Detaching lets a sibling be set up with fresh fixtures.
+    """
+    entry = setupstate.stack.pop(item, None)
+    fixtures = []
+    for fixturedef in item._request._fixture_defs.values():  # type: ignore[attr-defined]
+        if fixturedef.scope == "function" and fixturedef.cached_result is not None:
+            fixtures.append((fixturedef, fixturedef.cached_result, list(fixturedef._finalizers)))
+            fixturedef.cached_result = None
+            fixturedef._finalizers.clear()
+    return _Held(entry, fixtures)
+
+
+def _attach(item: pytest.Item, setupstate: Any, held: _Held) -> None:
+    """Restore what :func:`_detach` took, so *item* can be torn down normally."""
+    if held.stack_entry is not None:
+        setupstate.stack[item] = held.stack_entry
+    for fixturedef, cached_result, finalizers in held.fixtures:
+        fixturedef.cached_result = cached_result
+        fixturedef._finalizers[:] = finalizers
+
+
+async def _run_tests(
+    items: list[pytest.Item], state: _AsyncState
+) -> dict[pytest.Item, tuple[float, float, BaseException | None]]:
+    """Await each item's test coroutine, at most ``state.concurrency`` at once; return (start, duration, error)."""
+    limit = asyncio.Semaphore(state.concurrency)
+    outcomes: dict[pytest.Item, tuple[float, float, BaseException | None]] = {}
+
+    async def run(item: pytest.Function) -> None:
+        async with limit:
+            start, began = time.time(), time.perf_counter()
+            error: BaseException | None = None
+            try:
+                kwargs = {name: item.funcargs[name] for name in item._fixtureinfo.argnames}
+                await asyncio.wait_for(item.obj(**kwargs), state.timeout)
+            except asyncio.TimeoutError:
+                error = pytest.fail.Exception(f"Timed out after {state.timeout:g} s", pytrace=False)
+            except (KeyboardInterrupt, pytest.exit.Exception):
+                raise
+            except BaseException as exc:  # test outcomes (skip, xfail) are BaseExceptions too
+                error = exc
+            outcomes[item] = (start, time.perf_counter() - began, error)
+
+    await asyncio.gather(*(run(item) for item in items))  # type: ignore[arg-type]
+    return outcomes
+
+
+def _call_report(item: pytest.Item, start: float, duration: float, error: BaseException | None) -> pytest.TestReport:
+    """Build the call-phase report for an outcome recorded by :func:`_run_tests`."""
+
+    def outcome() -> None:
+        if error is not None:
+            raise error
+
+    call = pytest.CallInfo.from_call(outcome, "call")
+    call.start, call.stop, call.duration = start, start + duration, duration
+    return item.ihook.pytest_runtest_makereport(item=item, call=call)
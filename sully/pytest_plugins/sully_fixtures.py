@@ -0,0 +1,364 @@
+"""Session fixtures cached across test runs (``from sully_fixtures import cached_fixture``).
+
+``sully test`` puts this module on PYTHONPATH. A fixture decorated with
+:func:`cached_fixture` is built once and pickled to ``.sully/fixtures/``. Later
+runs load it back instead of rebuilding it, as long as its fingerprint is
+unchanged. The fingerprint covers:
+
+- the fixture's source and the project code it references;
+- the fixtures it depends on, recursively;
+- the contents of its declared input files.
+
+Large buffers (bytearrays, NumPy arrays) are pickled out of band into a single
+file that is memory-mapped copy-on-write when loaded. Old entries are evicted
+least-recently-used first, by total size and age.
+
+Settings come from the environment ``sully test`` sets: ``SULLY_FIXTURE_CACHE``
+(the directory, or ``off``), ``SULLY_FIXTURE_CACHE_MAX_MB`` and
+``SULLY_FIXTURE_CACHE_MAX_AGE_DAYS``.
+"""
+
+import hashlib
+import inspect
+import json
+import mmap
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import time
+import warnings
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from types import CodeType
+from typing import Any, NamedTuple
+
+import pytest
+
+_STATS_KEY = pytest.StashKey[dict[str, "_Use"]]()
+_ALIGN = 64  # buffer offsets in buffers.bin, so mapped arrays are aligned
+_VENDORED = {"site-packages", "dist-packages", ".venv", "venv"}
+# Values that go into the fingerprint as themselves, along with containers of them.
+_SCALARS = (int, float, complex, str, bytes, bool, type(None))
+
+
+class _Settings(NamedTuple):
+    directory: Path | None  # None when caching is off
+    max_bytes: int
+    max_age: float  # seconds
+
+
+class _Use(NamedTuple):
+    outcome: str  # "hit", "miss" or "uncacheable"
+    seconds: float
+    size: int
+
+
+def cached_fixture(
+    fn: Callable[..., Any] | None = None,
+    *,
+    inputs: Iterable[str] = (),
+    scope: str = "session",
+    name: str | None = None,
+) -> Any:
+    """Declare a fixture whose value is cached on disk across runs.
+
+    *inputs* are glob patterns, relative to the pytest rootdir, for data files
+    the fixture reads; changing any of them rebuilds it. The fixture's own
+    dependencies are only set up when it has to be rebuilt. Generator fixtures
+    aren't supported: their teardown couldn't run on a cache hit.
+    """
+
+    def decorate(fn: Callable[..., Any]) -> Any:
+        if inspect.isgeneratorfunction(fn) or inspect.iscoroutinefunction(fn) or inspect.isasyncgenfunction(fn):
+            raise TypeError(f"cached_fixture can't cache {fn.__qualname__}: return a value instead of yielding")
+        deps = list(inspect.signature(fn).parameters)
+        patterns = list(inputs)
+
+        def fixture(request: pytest.FixtureRequest) -> Any:
+            return _cached(request, fn, deps, patterns)
+
+        fixture.__name__, fixture.__qualname__ = fn.__name__, fn.__qualname__
+        fixture.__module__, fixture.__doc__ = fn.__module__, fn.__doc__
+        fixture._sully_cached = (fn, deps, patterns)  # type: ignore[attr-defined]
+        return pytest.fixture(scope=scope, name=name or fn.__name__)(fixture)  # type: ignore[call-overload]
+
+    return decorate(fn) if fn is not None else decorate
+
+
+def _settings() -> _Settings:
+    directory = os.environ.get("SULLY_FIXTURE_CACHE", ".sully/fixtures")
+    return _Settings(
+        None if directory == "off" else Path(directory),
+        int(float(os.environ.get("SULLY_FIXTURE_CACHE_MAX_MB", 2048)) * 1024 * 1024),
+        float(os.environ.get("SULLY_FIXTURE_CACHE_MAX_AGE_DAYS", 30)) * 86400,
+    )
+
+
+def _cached(request: pytest.FixtureRequest, fn: Callable[..., Any], deps: list[str], inputs: list[str]) -> Any:
+    config = request.config
+    if not config.pluginmanager.is_registered(sys.modules[__name__]):
+        config.pluginmanager.register(sys.modules[__name__], "sully_fixtures")
+    stats = config.stash.setdefault(_STATS_KEY, {})
+    settings = _settings()
+
+    def build() -> Any:
+        return fn(**{d: request if d == "request" else request.getfixturevalue(d) for d in deps})
+
+    if settings.directory is None:
+        return build()
+
+    root = config.rootpath
+    directory = settings.directory if settings.directory.is_absolute() else root / settings.directory
+    h = hashlib.sha256(sys.version.encode())
+    _hash_spec(fn, deps, inputs, request, root, h, set())
+    entry = directory / f"{request.fixturename}-{h.hexdigest()[:24]}"
+
+    start = time.perf_counter()
+    if (entry / "meta.json").is_file():
+        try:
+            value = load(entry)
+        except Exception:  # a corrupt or incompatible entry is rebuilt
+            shutil.rmtree(entry, ignore_errors=True)
+        else:
+            os.utime(entry / "meta.json")
+            stats[request.fixturename] = _Use("hit", time.perf_counter() - start, _size(entry))
+            return value
+
+    value = build()
+    built = time.perf_counter() - start
+    try:
+        size = store(entry, value)
+    except (pickle.PicklingError, TypeError, AttributeError) as exc:
+        warnings.warn(f"{request.fixturename} was not cached: {exc}", stacklevel=2)
+        stats[request.fixturename] = _Use("uncacheable", built, 0)
+        return value
+    evict(directory, max_bytes=settings.max_bytes, max_age=settings.max_age, keep=entry)
+    stats[request.fixturename] = _Use("miss", built, size)
+    return value
+
+
+def store(entry: Path, value: Any) -> int:
+    """Pickle *value* into the *entry* directory; return its size in bytes.
+
+    Contiguous buffers go out of band into ``buffers.bin``, each aligned to 64 bytes.
+    """
+    raws: list[memoryview] = []
+
+    def out_of_band(buffer: pickle.PickleBuffer) -> bool:
+        try:
+            raw = buffer.raw()
+        except BufferError:  # not contiguous: pickle it in band
+            return True
+        if not raw.nbytes:
+            return True
+        raws.append(raw)
+        return False
+
+    data = pickle.dumps(value, protocol=5, buffer_callback=out_of_band)
+    entry.parent.mkdir(parents=True, exist_ok=True)
+    tmp = Path(tempfile.mkdtemp(prefix=".tmp-", dir=entry.parent))
+    try:
+        offsets: list[tuple[int, int]] = []
+        with open(tmp / "buffers.bin", "wb") as f:
+            for raw in raws:
+                f.write(b"\0" * (-f.tell() % _ALIGN))
+                offsets.append((f.tell(), raw.nbytes))
+                f.write(raw)
+        (tmp / "data.pkl").write_bytes(data)
+        (tmp / "meta.json").write_text(json.dumps({"buffers": offsets, "created": time.time()}))
+        size = _size(tmp)
+        try:
+            tmp.rename(entry)
+        except OSError:  # another worker stored it first
+            shutil.rmtree(tmp, ignore_errors=True)
+    except BaseException:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+    return size
+
+
+def load(entry: Path) -> Any:
+    """Unpickle the value in *entry*, memory-mapping its out-of-band buffers."""
+    meta = json.loads((entry / "meta.json").read_text())
+    buffers: list[memoryview] = []
+    if meta["buffers"]:
+        with open(entry / "buffers.bin", "rb") as f:
+            # Copy-on-write: the loaded value may be mutated without touching the cache.
+            view = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY))
+        buffers = [view[offset : offset + length] for offset, length in meta["buffers"]]
+    return pickle.loads((entry / "data.pkl").read_bytes(), buffers=buffers)
+
+
+def evict(directory: Path, *, max_bytes: int, max_age: float, keep: Path | None = None) -> list[Path]:
+    """Remove entries unused for *max_age* seconds, then least recently used ones past *max_bytes*."""
+    now = time.time()
+    entries: list[tuple[float, int, Path]] = []
+    for entry in directory.iterdir():
+        meta = entry / "meta.json"
+        if entry.name.startswith(".tmp-"):
+            if now - entry.stat().st_mtime > 3600:  # left behind by a crashed run
+                shutil.rmtree(entry, ignore_errors=True)
+        elif meta.is_file():
+            entries.append((meta.stat().st_mtime, _size(entry), entry))
+
+    removed: list[Path] = []
+    total = 0
+    for used, size, entry in sorted(entries, reverse=True):
+        if entry != keep and (now - used > max_age or total + size > max_bytes):
+            shutil.rmtree(entry, ignore_errors=True)
+            removed.append(entry)
+        else:
+            total += size
+    return removed
+
+
+def _size(entry: Path) -> int:
+    return sum(f.stat().st_size for f in entry.iterdir())
+
+
+def _hash_spec(
+    fn: Callable[..., Any],
+    deps: list[str],
+    inputs: list[str],
+    request: pytest.FixtureRequest,
+    root: Path,
+    h: "hashlib._Hash",
+    seen: set[int],
+) -> None:
+    """Feed a fixture's code, input files and dependency fixtures into *h*."""
+    _hash_code(fn, root, h, seen, force=True)
+    for pattern in inputs:
+        h.update(pattern.encode())
+        for path in sorted(root.glob(pattern)):
+            if path.is_file():
+                h.update(str(path.relative_to(root)).encode())
+                with open(path, "rb") as f:
+                    h.update(hashlib.file_digest(f, "sha256").digest())
+    for dep in deps:
+        if dep == "request":
+            continue
+        h.update(dep.encode())
+        try:
+            fixturedefs = request._fixturemanager.getfixturedefs(dep, request.node)  # type: ignore[attr-defined]
+        except (AttributeError, TypeError):  # pytest internals moved; fall back to the name alone
+            fixturedefs = None
+        if fixturedefs:
+            func = fixturedefs[-1].func
+            spec = getattr(func, "_sully_cached", None)
+            if spec is not None:
+                _hash_spec(*spec, request, root, h, seen)
+            elif id(func) not in seen:
+                _hash_spec(func, list(fixturedefs[-1].argnames), [], request, root, h, seen)
+
+
+def _hash_code(obj: Any, root: Path, h: "hashlib._Hash", seen: set[int], *, force: bool = False) -> None:
+    """Feed the source of *obj*, and of the project code and constants it uses, into *h*.
+
+    Code outside the project (the standard library, installed packages) is
+    skipped; upgrading those doesn't invalidate the cache.
+    """
+    value = _canonical(obj, set())
+    if value is not None:
+        h.update(value.encode())
+        return
+    if id(obj) in seen:
+        return
+    seen.add(id(obj))
+    if inspect.ismodule(obj):
+        file = getattr(obj, "__file__", None)
+        if file and _in_project(file, root):
+            h.update(Path(file).read_bytes())
+        return
+    if not (inspect.isfunction(obj) or inspect.isclass(obj)):
+        return
+    try:
+        file = inspect.getsourcefile(obj)
+        source = inspect.getsource(obj)
+    except (OSError, TypeError):
+        if inspect.isfunction(obj):
+            h.update(obj.__code__.co_code)
+        return
+    if not force and not (file and _in_project(file, root)):
+        return
+    h.update(source.encode())
+    functions = [obj] if inspect.isfunction(obj) else [v for v in vars(obj).values() if inspect.isfunction(v)]
+    for function in functions:
+        for name in sorted(_global_names(function.__code__)):  # sets iterate in per-process hash order
+            if name in function.__globals__:
+                h.update(name.encode())
+                value = function.__globals__[name]
+                if _opaque(value):
+                    # An object we can't fingerprint by value: use its defining module's source instead.
+                    _hash_module_source(function.__globals__, root, h, seen)
+                else:
+                    _hash_code(value, root, h, seen)
+
+
+def _canonical(value: Any, active: set[int]) -> str | None:
+    """Return a process-independent rendering of plain data, or None if *value* isn't plain data.
+
+    Set elements are sorted, since their ``repr`` order depends on PYTHONHASHSEED.
+    """
+    if isinstance(value, _SCALARS):
+        return repr(value)
+    if not isinstance(value, (tuple, list, set, frozenset, dict)) or id(value) in active:
+        return None
+    active.add(id(value))
+    try:
+        if isinstance(value, dict):
+            items = [(_canonical(k, active), _canonical(v, active)) for k, v in value.items()]
+            if any(k is None or v is None for k, v in items):
+                return None
+            return "{" + ", ".join(f"{k}: {v}" for k, v in items) + "}"
+        parts = [part for part in (_canonical(item, active) for item in value) if part is not None]
+        if len(parts) != len(value):
+            return None
+        if isinstance(value, (set, frozenset)):
+            parts.sort()
+        return f"{type(value).__name__}({', '.join(parts)})"
+    finally:
+        active.discard(id(value))
+
+
+def _opaque(value: Any) -> bool:
+    """True if *value* is neither plain data nor code or a module that _hash_code follows."""
+    if _canonical(value, set()) is not None:
+        return False
+    return not (inspect.ismodule(value) or inspect.isfunction(value) or inspect.isclass(value))
+
+
+def _hash_module_source(namespace: dict[str, Any], root: Path, h: "hashlib._Hash", seen: set[int]) -> None:
+    """Feed the source file of the module owning *namespace* into *h*, once."""
+    if id(namespace) in seen:
+        return
+    seen.add(id(namespace))
+    file = namespace.get("__file__")
+    if file and _in_project(file, root):
+        h.update(Path(file).read_bytes())
+
+
+def _global_names(code: CodeType) -> set[str]:
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            names |= _global_names(const)
+    return names
+
+
+def _in_project(file: str, root: Path) -> bool:
+    path = Path(file).resolve()
+    return path.is_relative_to(root.resolve()) and not _VENDORED.intersection(path.parts)
+
+
+def pytest_terminal_summary(terminalreporter: pytest.TerminalReporter, config: pytest.Config) -> None:
+    stats = config.stash.get(_STATS_KEY, None)
+    if not stats:
+        return
+    tr = terminalreporter
+    tr.section("sully fixture cache")
+    for fixture, use in sorted(stats.items()):
+        size = f", {use.size / 1024 / 1024:.1f} MB" if use.size else ""
+        verb = {"hit": "loaded", "miss": "built and stored", "uncacheable": "built (not picklable)"}[use.outcome]
+        tr.write_line(f"{use.outcome:>11}  {fixture}: {verb} in {use.seconds:.2f} s{size}")
@@ -0,0 +1,149 @@
+"""pytest plugin: per-test peak allocation tracking with budgets (``sully test --memory``)."""
+
+import sys
+import tracemalloc
+from collections.abc import Generator
+from dataclasses import dataclass, field
+from typing import Any
+
+import pytest
+
+_MB = 1024 * 1024
+_STASH_KEY = pytest.StashKey["_MemoryState"]()
+
+
+@dataclass
+class _MemoryState:
+    budget: float | None
+    marker_budgets: dict[str, float]
+    top: int
+    peaks: dict[str, int] = field(default_factory=dict)
+    sites: dict[str, list[str]] = field(default_factory=dict)
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("sully-memory")
+    group.addoption("--sully-memory", action="store_true", help="Track per-test peak allocations.")
+    group.addoption("--sully-memory-budget", type=float, default=None, help="Per-test budget in MB.")
+    group.addoption(
+        "--sully-memory-marker",
+        action="append",
+        default=[],
+        metavar="MARKER=MB",
+        help="Budget for tests carrying MARKER (repeatable).",
+    )
+    group.addoption("--sully-memory-top", type=int, default=10, help="Number of tests to report.")
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    if not config.getoption("--sully-memory"):
+        return
+    marker_budgets: dict[str, float] = {}
+    for spec in config.getoption("--sully-memory-marker"):
+        name, _, mb = spec.partition("=")
+        marker_budgets[name] = float(mb)
+    config.stash[_STASH_KEY] = _MemoryState(
+        budget=config.getoption("--sully-memory-budget"),
+        marker_budgets=marker_budgets,
+        top=config.getoption("--sully-memory-top"),
+    )
+    tracemalloc.start(10)
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    if _STASH_KEY in config.stash and tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+
+def _budget_for(item: pytest.Item, state: _MemoryState) -> float | None:
+    """The largest matching marker budget wins; otherwise the default budget."""
+    matching = [mb for name, mb in state.marker_budgets.items() if item.get_closest_marker(name)]
+    return max(matching) if matching else state.budget
+
+
+def _top_sites(snapshot: tracemalloc.Snapshot, limit: int = 3) -> list[str]:
+    """The biggest allocation sites still alive in *snapshot*.
+
+    Traces are cleared before each test, so these are allocations the test made
+    and kept until it returned. Temporaries freed before the end aren't listed,
+    even if they made up the peak.
+    """
+    snapshot = snapshot.filter_traces(
+        (
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen *>"),
+            tracemalloc.Filter(False, "*/_pytest/*"),
+            tracemalloc.Filter(False, "*/pluggy/*"),
+            tracemalloc.Filter(False, __file__),
+        )
+    )
+    return [
+        f"{stat.traceback[0].filename}:{stat.traceback[0].lineno} ({stat.size / 1024:.1f} KiB)"
+        for stat in snapshot.statistics("lineno")[:limit]
+    ]
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item: pytest.Item) -> Generator[None, Any, None]:
+    state = item.config.stash.get(_STASH_KEY, None)
+    if state is None:
+        yield
+        return
+    tracemalloc.clear_traces()
+    tracemalloc.reset_peak()
+    yield
+    _, peak = tracemalloc.get_traced_memory()
+    state.peaks[item.nodeid] = peak
+    state.sites[item.nodeid] = _top_sites(tracemalloc.take_snapshot())
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item: pytest.Item, call: pytest.CallInfo[None]) -> Generator[None, Any, None]:
+    outcome = yield
+    state = item.config.stash.get(_STASH_KEY, None)
+    report: pytest.TestReport = outcome.get_result()
+    if state is None or report.when != "call" or not report.passed:
+        return
+    budget = _budget_for(item, state)
+    peak = state.peaks.get(item.nodeid, 0)
+    if budget is not None and peak > budget * _MB:
+        report.outcome = "failed"
+        report.longrepr = (
+            f"Memory budget exceeded: peak {peak / _MB:.2f} MB > budget {budget:.2f} MB\n"
+            + _retained(state.sites.get(item.nodeid, []))
+        )
+
+
+def _retained(sites: list[str]) -> str:
+    if not sites:
+        return "No allocations from the test were still alive at its end; the peak came from temporaries."
+    return "Still allocated when the test returned (temporaries aren't listed):\n" + "\n".join(
+        f"  {site}" for site in sites
+    )
+
+
+def _peak_rss_mb() -> float | None:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux and bytes on macOS.
+    return rss / _MB if sys.platform == "darwin" else rss / 1024
+
+
+def pytest_terminal_summary(terminalreporter: pytest.TerminalReporter, config: pytest.Config) -> None:
+    state = config.stash.get(_STASH_KEY, None)
+    if state is None:
+        return
+    tr = terminalreporter
+    tr.section("sully memory")
+    ranked = sorted(state.peaks.items(), key=lambda kv: kv[1], reverse=True)[: state.top]
+    for nodeid, peak in ranked:
+        tr.write_line(f"{peak / _MB:10.2f} MB  {nodeid}")
+        for site in state.sites.get(nodeid, [])[:1]:
+            tr.write_line(f"{'':15}still allocated at end: {site}")
+    worker = getattr(config, "workerinput", {}).get("workerid", "main")
+    rss = _peak_rss_mb()
+    if rss is not None:
+        tr.write_line(f"peak RSS ({worker}): {rss:.1f} MB")
@@ -0,0 +1,88 @@
+"""pytest plugin: duration-balanced test sharding (``sully test --shard K/N``)."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+
+class _Recorder:
+    """Sum setup, call and teardown time per test and merge it into the durations file."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.durations: dict[str, float] = {}
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        self.durations[report.nodeid] = self.durations.get(report.nodeid, 0.0) + report.duration
+
+    def pytest_sessionfinish(self) -> None:
+        if not self.durations:
+            return
+        merged = {**_load_durations(str(self.path)), **{k: round(v, 4) for k, v in self.durations.items()}}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(merged, indent=1, sort_keys=True) + "\n")
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("sully-shard")
+    group.addoption("--sully-shard", default=None, metavar="K/N", help="Only run shard K of N (1-based).")
+    group.addoption("--sully-durations", default=None, help="JSON file of recorded test durations.")
+    group.addoption(
+        "--sully-record-durations",
+        action="store_true",
+        help="Merge this run's test durations into --sully-durations.",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    if config.getoption("--sully-record-durations"):
+        path = config.getoption("--sully-durations")
+        if not path:
+            raise pytest.UsageError("--sully-record-durations needs --sully-durations")
+        config.pluginmanager.register(_Recorder(Path(path)), "sully-shard-recorder")
+
+
+def _load_durations(path: str | None) -> dict[str, float]:
+    if not path:
+        return {}
+    try:
+        return {str(k): float(v) for k, v in json.loads(Path(path).read_text()).items()}
+    except (OSError, ValueError):
+        return {}
+
+
+def assign_shards(nodeids: list[str], durations: dict[str, float], count: int) -> list[int]:
+    """Return a shard index (0-based) per nodeid, balancing recorded durations.
+
+    Longest tests are placed first, each on the currently lightest shard. Tests
+    without a recorded duration are assumed to take the mean of the known ones.
+    """
+    known = [durations[n] for n in nodeids if n in durations]
+    default = sum(known) / len(known) if known else 1.0
+    weights = {n: durations.get(n, default) for n in nodeids}
+    loads = [0.0] * count
+    shard_of: dict[str, int] = {}
+    for nodeid in sorted(nodeids, key=lambda n: (-weights[n], n)):
+        shard = min(range(count), key=lambda s: (loads[s], s))
+        shard_of[nodeid] = shard
+        loads[shard] += weights[nodeid]
+    return [shard_of[n] for n in nodeids]
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    spec = config.getoption("--sully-shard")
+    if not spec:
+        return
+    index, _, total = spec.partition("/")
+    shard, count = int(index) - 1, int(total)
+    if not 0 <= shard < count:
+        raise pytest.UsageError(f"--sully-shard must be K/N with 1 <= K <= N, got {spec!r}")
+
+    durations = _load_durations(config.getoption("--sully-durations"))
+    shards = assign_shards([item.nodeid for item in items], durations, count)
+    selected = [item for item, s in zip(items, shards) if s == shard]
+    deselected = [item for item, s in zip(items, shards) if s != shard]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+    items[:] = selected
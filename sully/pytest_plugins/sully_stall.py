@@ -0,0 +1,90 @@
+"""pytest plugin: event-loop stall detection with a per-test budget (``sully test --loop-monitor``)."""
+
+from collections.abc import Generator
+from dataclasses import dataclass, field
+from typing import Any
+
+import pytest
+from sully_loop import LoopMonitor, Stall, format_stall
+
+_STASH_KEY = pytest.StashKey["_StallState"]()
+
+
+@dataclass
+class _StallState:
+    monitor: LoopMonitor
+    budget: float | None  # seconds
+    top: int
+    worst: dict[str, Stall] = field(default_factory=dict)
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("sully-loop")
+    group.addoption("--sully-loop", action="store_true", help="Time every asyncio callback and task step.")
+    group.addoption("--sully-loop-threshold", type=float, default=100.0, help="Report steps over this many ms.")
+    group.addoption(
+        "--sully-loop-budget", type=float, default=None, help="Fail tests that block the loop longer (ms)."
+    )
+    group.addoption("--sully-loop-top", type=int, default=10, help="Number of functions to report.")
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    if not config.getoption("--sully-loop"):
+        return
+    threshold = config.getoption("--sully-loop-threshold") / 1000
+    budget = config.getoption("--sully-loop-budget")
+    budget = budget / 1000 if budget is not None else None
+    # Steps under the threshold aren't recorded, so a tighter budget lowers it.
+    monitor = LoopMonitor(min(threshold, budget) if budget is not None else threshold)
+    config.stash[_STASH_KEY] = _StallState(monitor=monitor, budget=budget, top=config.getoption("--sully-loop-top"))
+    monitor.install()
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    state = config.stash.get(_STASH_KEY, None)
+    if state is not None:
+        state.monitor.uninstall()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item: pytest.Item) -> Generator[None, Any, None]:
+    state = item.config.stash.get(_STASH_KEY, None)
+    if state is None:
+        yield
+        return
+    seen = len(state.monitor.stalls)
+    yield
+    stalls = state.monitor.stalls[seen:]
+    if stalls:
+        state.worst[item.nodeid] = max(stalls, key=lambda s: s.seconds)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item: pytest.Item, call: pytest.CallInfo[None]) -> Generator[None, Any, None]:
+    outcome = yield
+    state = item.config.stash.get(_STASH_KEY, None)
+    report: pytest.TestReport = outcome.get_result()
+    if state is None or state.budget is None or report.when != "call" or not report.passed:
+        return
+    worst = state.worst.get(item.nodeid)
+    if worst is not None and worst.seconds > state.budget:
+        report.outcome = "failed"
+        report.longrepr = "\n".join(
+            [f"Event loop blocked longer than the {state.budget * 1000:g} ms budget:", *format_stall(worst)]
+        )
+
+
+def pytest_terminal_summary(terminalreporter: pytest.TerminalReporter, config: pytest.Config) -> None:
+    state = config.stash.get(_STASH_KEY, None)
+    if state is None:
+        return
+    tr = terminalreporter
+    tr.section("sully loop")
+    for line in state.monitor.report(state.top):
+        tr.write_line(line)
+    ranked = sorted(state.worst.items(), key=lambda kv: kv[1].seconds, reverse=True)[: state.top]
+    if ranked:
+        tr.write_line("")
+        tr.write_line("longest stall per test:")
+    for nodeid, stall in ranked:
+        tr.write_line(f"{stall.seconds * 1000:10.1f} ms  {nodeid}")
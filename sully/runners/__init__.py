@@ -0,0 +1,18 @@
+"""Standalone scripts that sully runs inside the project environment.
+
+Like :mod:`sully.pytest_plugins`, modules here depend only on the standard
+library: they are made importable by putting this directory on PYTHONPATH and
+are started with ``uv run python -m <name>``, so they can import the project's
+own code without sully being installed into its environment.
+"""
+
+import os
+from pathlib import Path
+
+RUNNER_DIR = Path(__file__).parent
+
+
+def runner_env() -> dict[str, str]:
+    """Return environment overrides that make the runners importable."""
+    existing = os.environ.get("PYTHONPATH")
+    return {"PYTHONPATH": os.pathsep.join([str(RUNNER_DIR), *([existing] if existing else [])])}
@@ -0,0 +1,138 @@
+"""Discover and time the project's benchmarks, printing raw measurements as JSON.
+
+Usage: ``python -m sully_bench benchmarks/ [--scaling] [-k substring]``.
+
+Benchmarks are module-level functions named ``bench_*`` in ``benchmarks/*.py``.
+A benchmark without parameters is timed as is. A benchmark taking ``n`` is a
+scaling benchmark: ``bench_x(n)`` does the setup for input size *n* and returns
+the zero-argument callable to measure, so only that callable's time and peak
+memory count. Without ``--scaling`` it is timed once, at size ``--n``. A
+benchmark that raises NotImplementedError (an unfinished stub) is skipped.
+"""
+
+import argparse
+import gc
+import importlib.util
+import inspect
+import json
+import sys
+import time
+import tracemalloc
+import traceback
+from collections.abc import Callable
+from pathlib import Path
+
+
+def discover(bench_dir: Path, keyword: str | None = None) -> dict[str, Callable]:
+    """Return ``{"file:function": function}`` for every benchmark in *bench_dir*."""
+    sys.path.insert(0, str(bench_dir))
+    found: dict[str, Callable] = {}
+    for path in sorted(bench_dir.glob("*.py")):
+        if path.name.startswith("_"):
+            continue
+        spec = importlib.util.spec_from_file_location(f"_sully_bench_{path.stem}", path)
+        assert spec is not None and spec.loader is not None
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        for name, fn in inspect.getmembers(module, inspect.isfunction):
+            bench_id = f"{path.stem}:{name}"
+            if name.startswith("bench_") and fn.__module__ == module.__name__ and (not keyword or keyword in bench_id):
+                found[bench_id] = fn
+    return found
+
+
+def is_scaling(fn: Callable) -> bool:
+    return "n" in inspect.signature(fn).parameters
+
+
+def time_call(fn: Callable, *, min_time: float, repeat: int = 3) -> float:
+    """Return the best per-call time of *fn* over *repeat* runs of at least *min_time* seconds each."""
+
+    def run(calls: int) -> float:
+        start = time.perf_counter()
+        for _ in range(calls):
+            fn()
+        return time.perf_counter() - start
+
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        calls = 1
+        while (elapsed := run(calls)) < min_time:
+            calls *= 2
+        return min([elapsed, *(run(calls) for _ in range(repeat - 1))]) / calls
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+def peak_memory(fn: Callable) -> int:
+    """Return the peak bytes allocated by one call of *fn*."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        fn()
+        return max(tracemalloc.get_traced_memory()[1] - base, 0)
+    finally:
+        tracemalloc.stop()
+
+
+def scale(
+    setup: Callable, sizes: list[int], *, min_time: float, max_seconds: float
+) -> dict[str, list[float] | list[int]]:
+    """Measure *setup(n)*'s callable at each size, stopping once one call exceeds *max_seconds*."""
+    measured: dict[str, list] = {"sizes": [], "seconds": [], "peak": []}
+    for n in sizes:
+        fn = setup(n)
+        seconds = time_call(fn, min_time=min_time)
+        measured["sizes"].append(n)
+        measured["seconds"].append(seconds)
+        measured["peak"].append(peak_memory(fn))
+        if seconds > max_seconds:
+            break
+    return measured
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="sully_bench")
+    parser.add_argument("bench_dir", type=Path)
+    parser.add_argument("--scaling", action="store_true")
+    parser.add_argument("-k", dest="keyword", default=None)
+    parser.add_argument("--n", type=int, default=1000)
+    parser.add_argument("--min-n", type=int, default=16)
+    parser.add_argument("--max-n", type=int, default=65536)
+    parser.add_argument("--factor", type=float, default=2.0)
+    parser.add_argument("--min-time", type=float, default=0.01)
+    parser.add_argument("--max-seconds", type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    sizes: list[int] = []
+    n = float(args.min_n)
+    while n <= args.max_n:
+        if not sizes or int(n) != sizes[-1]:
+            sizes.append(int(n))
+        n *= args.factor
+
+    report: dict[str, dict] = {"fixed": {}, "scaling": {}, "errors": {}, "skipped": {}}
+    for bench_id, fn in discover(args.bench_dir, args.keyword).items():
+        try:
+            if not is_scaling(fn):
+                report["fixed"][bench_id] = {"seconds": time_call(fn, min_time=args.min_time)}
+            elif args.scaling:
+                report["scaling"][bench_id] = scale(
+                    fn, sizes, min_time=args.min_time, max_seconds=args.max_seconds
+                )
+            else:
+                report["fixed"][f"{bench_id}[n={args.n}]"] = {"seconds": time_call(fn(args.n), min_time=args.min_time)}
+        except NotImplementedError as exc:
+            report["skipped"][bench_id] = str(exc) or "not implemented"
+        except Exception:
+            report["errors"][bench_id] = traceback.format_exc()
+    sys.stdout.flush()
+    print(json.dumps(report))
+
+
+if __name__ == "__main__":
+    main()
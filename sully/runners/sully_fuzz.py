@@ -0,0 +1,509 @@
+"""Search for inputs that make project functions slow, printing the worst cases as JSON.
+
+Usage: ``python -m sully_fuzz pkg.mod:func ... --budget 5 --max-size 1000 --seed 0``.
+
+Inputs are generated from each function's type annotations, then a guided
+search mutates the most expensive inputs found so far, keeping mutants that
+cost more. Every input is capped at *max-size* (total length of strings and
+collections, magnitude of numbers), so the search finds slow *shapes* of input
+rather than merely big ones. Inputs that raise are ignored. Cases are reported
+as ``repr`` of the arguments, which round-trips through ``ast.literal_eval``.
+"""
+
+import argparse
+import enum
+import gc
+import importlib
+import inspect
+import json
+import random
+import signal
+import string
+import sys
+import time
+import tracemalloc
+import types
+import typing
+from collections.abc import Callable
+from typing import Any
+
+ALPHABETS = ["ab", string.ascii_lowercase, string.printable, "aA0 ,.;:/\\\n\t(){}[]<>'\"", "é漢​\U0001f600"]
+
+
+class Unsupported(Exception):
+    """An annotation the fuzzer cannot generate values for."""
+
+
+class CallTimeout(BaseException):
+    """Raised inside a call that ran past the per-call cap; not an Exception, so the code under test can't catch it."""
+
+
+def size_of(value: Any) -> int:
+    """Return the size an input counts against *max-size*."""
+    if isinstance(value, (str, bytes)):
+        return len(value)
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return len(value) + sum(size_of(v) for v in value)
+    if isinstance(value, dict):
+        return len(value) + sum(size_of(k) + size_of(v) for k, v in value.items())
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return min(int(abs(value)), sys.maxsize)
+    return 1
+
+
+class Strategy:
+    """Generates and mutates values of one type."""
+
+    def generate(self, rng: random.Random, size: int) -> Any:
+        raise NotImplementedError
+
+    def mutate(self, rng: random.Random, value: Any, size: int) -> Any:
+        return self.generate(rng, size)
+
+    def accepts(self, value: Any) -> bool:
+        return True
+
+
+class Const(Strategy):
+    def __init__(self, *choices: Any) -> None:
+        self.choices = choices
+
+    def generate(self, rng: random.Random, size: int) -> Any:
+        return rng.choice(self.choices)
+
+    def accepts(self, value: Any) -> bool:
+        return any(value is c or (type(value) is type(c) and value == c) for c in self.choices)
+
+
+class Int(Strategy):
+    def generate(self, rng: random.Random, size: int) -> int:
+        return rng.choice([0, 1, -1, size, -size, rng.randint(-size, size), rng.randint(0, min(size, 16))])
+
+    def mutate(self, rng: random.Random, value: int, size: int) -> int:
+        op = rng.randrange(6)
+        result = [value + 1, value - 1, value * 2, value // 2, -value, self.generate(rng, size)][op]
+        return max(-size, min(size, result))
+
+    def accepts(self, value: Any) -> bool:
+        return isinstance(value, int) and not isinstance(value, bool)
+
+
+class Float(Strategy):
+    def generate(self, rng: random.Random, size: int) -> float:
+        return rng.choice([0.0, 1.0, -1.0, 1e-300, float(size), rng.uniform(-size, size)])
+
+    def mutate(self, rng: random.Random, value: float, size: int) -> float:
+        result = rng.choice([value * 2, value / 2, -value, value + rng.uniform(-1, 1), self.generate(rng, size)])
+        return max(-float(size), min(float(size), result))
+
+    def accepts(self, value: Any) -> bool:
+        return isinstance(value, float)
+
+
+class Text(Strategy):
+    """str or bytes: random text, with mutations that create the repetition slow paths feed on."""
+
+    def __init__(self, kind: type) -> None:
+        self.kind = kind
+
+    def _pack(self, text: str) -> Any:
+        return text if self.kind is str else text.encode("utf-8", "ignore")
+
+    def _unpack(self, value: Any) -> str:
+        return value if self.kind is str else value.decode("utf-8", "ignore")
+
+    def generate(self, rng: random.Random, size: int) -> Any:
+        alphabet = rng.choice(ALPHABETS if self.kind is str else ALPHABETS[:4])
+        return self._pack("".join(rng.choice(alphabet) for _ in range(rng.randint(0, size))))
+
+    def mutate(self, rng: random.Random, value: Any, size: int) -> Any:
+        text = self._unpack(value)
+        i = rng.randint(0, len(text))
+        j = rng.randint(i, len(text))
+        op = rng.randrange(7)
+        if op == 0 and j > i:  # repeat a slice
+            text = text[:j] + text[i:j] * rng.randint(2, 8) + text[j:]
+        elif op == 1:  # insert a run of one character
+            text = text[:i] + rng.choice(rng.choice(ALPHABETS)) * rng.randint(1, max(size // 4, 1)) + text[i:]
+        elif op == 2 and text:  # replace one character
+            text = text[:i] + rng.choice(rng.choice(ALPHABETS)) + text[i + 1 :]
+        elif op == 3:
+            text = text[:i] + text[j:]
+        elif op == 4:
+            text = text + text
+        elif op == 5:
+            text = text[::-1]
+        else:
+            text = self._unpack(self.generate(rng, size))
+        return self._pack(text[:size])
+
+    def accepts(self, value: Any) -> bool:
+        return isinstance(value, self.kind)
+
+
+class Collection(Strategy):
+    """list, set, frozenset and homogeneous tuples of one element strategy."""
+
+    def __init__(self, kind: type, item: Strategy) -> None:
+        self.kind = kind
+        self.item = item
+
+    def _items(self, rng: random.Random, count: int, size: int) -> list[Any]:
+        per_item = max(size // max(count, 1) - 1, 1)
+        return [self.item.generate(rng, per_item) for _ in range(count)]
+
+    def generate(self, rng: random.Random, size: int) -> Any:
+        return self.kind(self._items(rng, rng.randint(0, max(size // 2, 1)), size))
+
+    def mutate(self, rng: random.Random, value: Any, size: int) -> Any:
+        items = list(value)
+        op = rng.randrange(7)
+        if op == 0 and items:  # mutate one element
+            k = rng.randrange(len(items))
+            items[k] = self.item.mutate(rng, items[k], max(size // len(items), 1))
+        elif op == 1 and items:  # many copies of one element
+            items += [rng.choice(items)] * rng.randint(1, max(len(items), 1))
+        elif op == 2:
+            try:
+                items.sort()
+            except TypeError:
+                pass
+        elif op == 3:
+            items.reverse()
+        elif op == 4 and items:
+            del items[rng.randrange(len(items)) :]
+        elif op == 5:
+            items += self._items(rng, rng.randint(1, 8), size // 4)
+        else:
+            return self.generate(rng, size)
+        return self.kind(items)
+
+    def accepts(self, value: Any) -> bool:
+        return isinstance(value, self.kind)
+
+
+class Record(Strategy):
+    """Fixed-shape tuples such as ``tuple[int, str]``."""
+
+    def __init__(self, items: list[Strategy]) -> None:
+        self.items = items
+
+    def generate(self, rng: random.Random, size: int) -> tuple:
+        share = max(size // max(len(self.items), 1), 1)
+        return tuple(s.generate(rng, share) for s in self.items)
+
+    def mutate(self, rng: random.Random, value: tuple, size: int) -> tuple:
+        if not value:
+            return value
+        k = rng.randrange(len(value))
+        share = max(size // len(value), 1)
+        return value[:k] + (self.items[k].mutate(rng, value[k], share),) + value[k + 1 :]
+
+    def accepts(self, value: Any) -> bool:
+        return isinstance(value, tuple) and len(value) == len(self.items)
+
+
+class Mapping(Strategy):
+    def __init__(self, key: Strategy, value: Strategy) -> None:
+        self.pairs = Collection(list, Record([key, value]))
+
+    def generate(self, rng: random.Random, size: int) -> dict:
+        return dict(self.pairs.generate(rng, size))
+
+    def mutate(self, rng: random.Random, value: dict, size: int) -> dict:
+        return dict(self.pairs.mutate(rng, list(value.items()), size))
+
+    def accepts(self, value: Any) -> bool:
+        return isinstance(value, dict)
+
+
+class OneOf(Strategy):
+    def __init__(self, options: list[Strategy]) -> None:
+        self.options = options
+
+    def generate(self, rng: random.Random, size: int) -> Any:
+        return rng.choice(self.options).generate(rng, size)
+
+    def mutate(self, rng: random.Random, value: Any, size: int) -> Any:
+        matching = [s for s in self.options if s.accepts(value)]
+        if matching and rng.random() < 0.9:
+            return matching[0].mutate(rng, value, size)
+        return self.generate(rng, size)
+
+    def accepts(self, value: Any) -> bool:
+        return any(s.accepts(value) for s in self.options)
+
+
+def strategy_for(annotation: Any) -> Strategy:
+    """Return a strategy for values of *annotation*; raise :class:`Unsupported` otherwise."""
+    from collections import abc
+
+    if annotation in (list, set, frozenset, tuple, dict):
+        raise Unsupported(f"bare {annotation.__name__} needs item types")
+    if annotation is type(None) or annotation is None:
+        return Const(None)
+    if annotation is bool:
+        return Const(True, False)
+    if annotation is int:
+        return Int()
+    if annotation is float:
+        return OneOf([Float(), Int()])
+    if annotation in (str, bytes):
+        return Text(annotation)
+    if isinstance(annotation, type) and issubclass(annotation, enum.Enum):
+        raise Unsupported(f"enum {annotation.__name__} has no literal repr")
+
+    origin, args = typing.get_origin(annotation), typing.get_args(annotation)
+    if origin is typing.Literal:
+        return Const(*args)
+    if origin in (typing.Union, types.UnionType):
+        return OneOf([strategy_for(a) for a in args])
+    if origin in (list, set, frozenset, abc.Sequence, abc.MutableSequence, abc.Iterable, abc.Collection, abc.Set):
+        if not args:
+            raise Unsupported(f"{annotation!r} needs an item type")
+        kind = origin if origin in (list, set, frozenset) else (frozenset if origin is abc.Set else list)
+        return Collection(kind, strategy_for(args[0]))
+    if origin is tuple:
+        if len(args) == 2 and args[1] is Ellipsis:
+            return Collection(tuple, strategy_for(args[0]))
+        return Record([strategy_for(a) for a in args])
+    if origin in (dict, abc.Mapping, abc.MutableMapping) and len(args) == 2:
+        return Mapping(strategy_for(args[0]), strategy_for(args[1]))
+    raise Unsupported(f"cannot generate {annotation!r}")
+
+
+class Signature:
+    """Strategies for a function's required parameters, split into positional and keyword."""
+
+    def __init__(self, fn: Callable) -> None:
+        hints = typing.get_type_hints(fn)
+        self.positional: list[Strategy] = []
+        self.keyword: dict[str, Strategy] = {}
+        for param in inspect.signature(fn).parameters.values():
+            if param.default is not param.empty or param.kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD):
+                continue
+            if param.name not in hints:
+                raise Unsupported(f"parameter {param.name!r} is not annotated")
+            strategy = strategy_for(hints[param.name])
+            if param.kind is param.KEYWORD_ONLY:
+                self.keyword[param.name] = strategy
+            else:
+                self.positional.append(strategy)
+        self.strategy = Record([*self.positional, *self.keyword.values()])
+
+    def split(self, values: tuple) -> tuple[tuple, dict]:
+        count = len(self.positional)
+        return values[:count], dict(zip(self.keyword, values[count:]))
+
+
+def _alarm(signum: int, frame: Any) -> None:
+    raise CallTimeout
+
+
+def measure(fn: Callable, args: tuple, kwargs: dict, *, metric: str, cap: float) -> float | None:
+    """Return the cost of one call (seconds or peak bytes), *cap* on timeout, or None if it raised."""
+    timed = hasattr(signal, "setitimer")
+    gc.collect()
+    if metric == "memory":
+        tracemalloc.start()
+    if timed:
+        signal.setitimer(signal.ITIMER_REAL, cap)
+    start = time.perf_counter()
+    try:
+        fn(*args, **kwargs)
+        cost: float | None = time.perf_counter() - start
+    except CallTimeout:
+        cost = cap if metric == "time" else None
+    except Exception:
+        cost = None
+    finally:
+        if timed:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+        if metric == "memory":
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+    if metric == "memory" and cost is not None:
+        cost = float(peak)
+    return cost
+
+
+def search(
+    fn: Callable,
+    sig: Signature,
+    *,
+    budget: float,
+    max_size: int,
+    rng: random.Random,
+    metric: str,
+    keep: int,
+    on_call: Callable[[dict], None] = lambda case: None,
+    on_keep: Callable[[dict], None] = lambda entry: None,
+) -> dict:
+    """Run the guided search on *fn* for *budget* seconds and return its report entry.
+
+    *on_call* receives each new input (as a case without a cost) just before it is tried.
+    *on_keep* receives the report entry so far whenever an input enters the top *keep*
+    and once the typical cost is known.
+    """
+    deadline = time.monotonic() + budget
+    cap = call_cap(budget)
+    population: list[tuple[float, tuple]] = []  # most expensive first
+    seen: set[str] = set()
+    counts = {"evaluations": 0, "errors": 0, "timeouts": 0}
+    typical: list[float] = []
+
+    def entry() -> dict:
+        cases = [
+            {**case(sig, values), "cost": cost, "timeout": metric == "time" and cost >= cap}
+            for cost, values in population[:keep]
+        ]
+        return {"cases": cases, "typical": typical[len(typical) // 2] if typical else None, **counts}
+
+    def evaluate(values: tuple) -> float | None:
+        key = repr(values)
+        if key in seen or size_of(values) > max_size:
+            return None
+        seen.add(key)
+        args, kwargs = sig.split(values)
+        on_call(case(sig, values))
+        cost = measure(fn, args, kwargs, metric=metric, cap=cap)
+        counts["evaluations"] += 1
+        if cost is None:
+            counts["errors"] += 1
+            return None
+        if metric == "time" and cost >= cap:
+            counts["timeouts"] += 1
+        elif metric == "time" and cost < 1e-3:
+            # Fast calls are noisy; keep the best of three.
+            for _ in range(2):
+                cost = min(cost, measure(fn, args, kwargs, metric=metric, cap=cap) or cost)
+        population.append((cost, values))
+        population.sort(key=lambda item: item[0], reverse=True)
+        del population[16:]
+        if any(kept is values for _, kept in population[:keep]):
+            on_keep(entry())
+        return cost
+
+    # Random inputs first; their median is what a "typical" call costs.
+    seeds = [evaluate(sig.strategy.generate(rng, rng.randint(1, max_size))) for _ in range(16)]
+    typical.extend(sorted(c for c in seeds if c is not None))
+    on_keep(entry())
+    while time.monotonic() < deadline and population:
+        if rng.random() < 0.1:
+            evaluate(sig.strategy.generate(rng, rng.randint(1, max_size)))
+            continue
+        # Tournament of two, biased toward the most expensive inputs so far.
+        parent = population[min(rng.randrange(len(population)), rng.randrange(len(population)))][1]
+        child = parent
+        for _ in range(rng.randint(1, 3)):
+            child = sig.strategy.mutate(rng, child, max_size)
+        evaluate(child)
+    return entry()
+
+
+def call_cap(budget: float) -> float:
+    """Return how long one call may run before it is interrupted and counted as a timeout."""
+    return max(budget / 4, 0.01)
+
+
+def case(sig: Signature, values: tuple) -> dict:
+    """Return the reproducible description of one input."""
+    args, kwargs = sig.split(values)
+    return {"args": repr(args), "kwargs": repr(kwargs), "size": size_of(values)}
+
+
+def _worker(conn: Any, target: str, options: dict) -> None:
+    """Search one target in a child process, announcing every input before calling it.
+
+    The best cases so far are sent as they are found, so they survive the worker being killed.
+    """
+    if hasattr(signal, "SIGALRM"):
+        signal.signal(signal.SIGALRM, _alarm)
+    module_name, _, name = target.partition(":")
+    try:
+        sig = Signature(fn := getattr(importlib.import_module(module_name), name))
+    except Unsupported as exc:
+        conn.send(("skip", str(exc)))
+        return
+    except Exception as exc:
+        conn.send(("skip", f"{type(exc).__name__}: {exc}"))
+        return
+    # Seed per target so adding a function doesn't change what the others find.
+    rng = random.Random(f"{options['seed']}:{target}")
+    entry = search(
+        fn,
+        sig,
+        budget=options["budget"],
+        max_size=options["max_size"],
+        rng=rng,
+        metric=options["metric"],
+        keep=options["keep"],
+        on_call=lambda c: conn.send(("call", c)),
+        on_keep=lambda e: conn.send(("kept", e)),
+    )
+    conn.send(("done", entry))
+
+
+def supervise(target: str, options: dict) -> tuple[str, Any]:
+    """Run :func:`_worker` for *target*; a worker stuck in one call is killed and that input reported.
+
+    Signals can't interrupt C code that never returns to the interpreter (a
+    backtracking regex, for one), so a separate process is the only reliable guard.
+    The hung input is reported ahead of the cases the worker kept before it stuck.
+    """
+    import multiprocessing
+
+    methods = multiprocessing.get_all_start_methods()
+    ctx = multiprocessing.get_context("fork" if "fork" in methods else "spawn")
+    receiver, sender = ctx.Pipe(duplex=False)
+    proc = ctx.Process(target=_worker, args=(sender, target, options), daemon=True)
+    proc.start()
+    sender.close()
+    hang_after = max(call_cap(options["budget"]) * 4, 2.0)
+    last, calls = None, 0
+    kept: dict = {"cases": [], "typical": None, "errors": 0, "timeouts": 0}
+    try:
+        while True:
+            # Only a call can hang: importing the target may legitimately take a while.
+            if not receiver.poll(hang_after if last is not None else None):
+                proc.kill()
+                hung = {**last, "cost": hang_after, "timeout": True}
+                cases = [hung, *kept["cases"][: options["keep"] - 1]]
+                return "done", {**kept, "cases": cases, "evaluations": calls, "timeouts": kept["timeouts"] + 1}
+            try:
+                kind, payload = receiver.recv()
+            except EOFError:
+                proc.join(1)
+                during = f" while calling with {last['args']}" if last else ""
+                return "skip", f"worker exited with code {proc.exitcode}{during}"
+            if kind == "call":
+                last, calls = payload, calls + 1
+            elif kind == "kept":
+                kept = payload
+            else:
+                return kind, payload
+    finally:
+        proc.join(1)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="sully_fuzz")
+    parser.add_argument("targets", nargs="+")
+    parser.add_argument("--budget", type=float, default=5.0, help="Seconds of search per function.")
+    parser.add_argument("--max-size", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--metric", choices=["time", "memory"], default="time")
+    parser.add_argument("--keep", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    options = {k: getattr(args, k) for k in ("budget", "max_size", "seed", "metric", "keep")}
+    report: dict[str, dict] = {"functions": {}, "skipped": {}}
+    for target in args.targets:
+        kind, payload = supervise(target, options)
+        report["functions" if kind == "done" else "skipped"][target] = payload
+    sys.stdout.flush()
+    print(json.dumps(report))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,306 @@
+"""Drive a project callable under load and print latency statistics as JSON.
+
+Usage: ``python -m sully_load module:callable --mode thread --concurrency 8
+--duration 10 [--rate 500] [--warmup 1]``. The last line of output is a JSON
+object (see :func:`main`).
+
+Without ``--rate`` the load is closed-loop: *concurrency* workers call the
+target back to back. With ``--rate`` it is open-loop: calls are scheduled at a
+fixed rate and latency is measured from the scheduled start, so a stalled
+target is charged for the queueing it causes (no coordinated omission).
+"""
+
+import argparse
+import asyncio
+import importlib
+import inspect
+import json
+import sys
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+
+PERCENTILES = {"p50": 50.0, "p90": 90.0, "p99": 99.0, "p999": 99.9}
+
+
+class Histogram:
+    """HDR-style log-linear histogram of integer microsecond latencies.
+
+    Each power of two is split into 2 ** (precision - 1) equal buckets, so a
+    reported value is within 2 ** (1 - precision) of the recorded one (under
+    1% with the default precision) at any magnitude.
+    """
+
+    def __init__(self, precision: int = 8) -> None:
+        self.precision = precision
+        self.counts: dict[int, int] = {}
+        self.total = 0
+        self.sum = 0
+        self.max = 0
+
+    def _bucket(self, value: int) -> int:
+        shift = max(value.bit_length() - self.precision, 0)
+        return (value >> shift) << shift
+
+    def _width(self, bucket: int) -> int:
+        return 1 << max(bucket.bit_length() - self.precision, 0)
+
+    def record(self, value: int, count: int = 1) -> None:
+        value = max(int(value), 0)
+        bucket = self._bucket(value)
+        self.counts[bucket] = self.counts.get(bucket, 0) + count
+        self.total += count
+        self.sum += value * count
+        self.max = max(self.max, value)
+
+    def merge(self, other: "Histogram") -> None:
+        for bucket, count in other.counts.items():
+            self.counts[bucket] = self.counts.get(bucket, 0) + count
+        self.total += other.total
+        self.sum += other.sum
+        self.max = max(self.max, other.max)
+
+    def percentile(self, percent: float) -> int:
+        """Return the highest value equivalent to the *percent* percentile (0 when empty)."""
+        if not self.total:
+            return 0
+        rank = max(1, -(-self.total * percent // 100))
+        seen = 0
+        for bucket in sorted(self.counts):
+            seen += self.counts[bucket]
+            if seen >= rank:
+                return min(bucket + self._width(bucket) - 1, self.max)
+        return self.max
+
+    def mean(self) -> float:
+        return self.sum / self.total if self.total else 0.0
+
+    def to_json(self) -> dict:
+        return {"precision": self.precision, "counts": sorted(self.counts.items()), "sum": self.sum, "max": self.max}
+
+    @classmethod
+    def from_json(cls, data: dict) -> "Histogram":
+        hist = cls(data["precision"])
+        for bucket, count in data["counts"]:
+            hist.counts[bucket] = hist.counts.get(bucket, 0) + count
+            hist.total += count
+        hist.sum, hist.max = data["sum"], data["max"]
+        return hist
+
+
+def resolve(target: str) -> Callable:
+    """Import ``module:attr.path`` and return the object it names."""
+    module_name, _, attr = target.partition(":")
+    if not attr:
+        raise SystemExit(f"target must look like module:callable, got {target!r}")
+    obj = importlib.import_module(module_name)
+    for part in attr.split("."):
+        obj = getattr(obj, part)
+    if not callable(obj):
+        raise SystemExit(f"{target} is not callable")
+    return obj
+
+
+def _micros(seconds: float) -> int:
+    return int(seconds * 1_000_000)
+
+
+class _Schedule:
+    """Hands out call start times: as soon as possible, or every 1 / *rate* seconds."""
+
+    def __init__(self, start: float, rate: float | None) -> None:
+        self.start = start
+        self.interval = 1.0 / rate if rate else 0.0
+        self.issued = 0
+        self.lock = threading.Lock()
+
+    def next(self) -> float:
+        if not self.interval:
+            return time.perf_counter()
+        with self.lock:
+            slot = self.issued
+            self.issued += 1
+        return self.start + slot * self.interval
+
+
+def _sync_worker(
+    fn: Callable, schedule: _Schedule, record_from: float, until: float, hist: Histogram, errors: list[int]
+) -> None:
+    while True:
+        due = schedule.next()
+        if due >= until:
+            return
+        delay = due - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        try:
+            fn()
+        except Exception:
+            if due >= record_from:
+                errors[0] += 1
+            continue
+        if due >= record_from:
+            hist.record(_micros(time.perf_counter() - due))
+
+
+def run_threads(
+    fn: Callable, concurrency: int, rate: float | None, warmup: float, duration: float
+) -> tuple[Histogram, int]:
+    """Call *fn* from *concurrency* threads; return the merged histogram and error count."""
+    start = time.perf_counter()
+    schedule = _Schedule(start, rate)
+    hists = [Histogram() for _ in range(concurrency)]
+    errors = [[0] for _ in range(concurrency)]
+    threads = [
+        threading.Thread(
+            target=_sync_worker,
+            args=(fn, schedule, start + warmup, start + warmup + duration, hists[i], errors[i]),
+            daemon=True,
+        )
+        for i in range(concurrency)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    merged = Histogram()
+    for hist in hists:
+        merged.merge(hist)
+    return merged, sum(e[0] for e in errors)
+
+
+def _process_worker(
+    target: str, rate: float | None, warmup: float, duration: float, start: float, phase: float
+) -> tuple[dict, int]:
+    fn = resolve(target)
+    # *start* is wall-clock time because perf_counter() is not comparable across processes.
+    begin = start + time.perf_counter() - time.time()
+    schedule = _Schedule(begin + phase, rate)
+    hist, errors = Histogram(), [0]
+    _sync_worker(fn, schedule, begin + warmup, begin + warmup + duration, hist, errors)
+    return hist.to_json(), errors[0]
+
+
+def run_processes(
+    target: str, concurrency: int, rate: float | None, warmup: float, duration: float
+) -> tuple[Histogram, int]:
+    """Call the target from *concurrency* processes, each taking an equal share of *rate*."""
+    share = rate / concurrency if rate else None
+    with ProcessPoolExecutor(concurrency) as pool:
+        # Start slightly in the future so every worker has imported the target first.
+        start = time.time() + 0.5
+        # Stagger the workers' schedules so together they issue calls evenly, not in bursts.
+        phases = [i / rate if rate else 0.0 for i in range(concurrency)]
+        futures = [pool.submit(_process_worker, target, share, warmup, duration, start, p) for p in phases]
+        results = [f.result() for f in futures]
+    merged, errors = Histogram(), 0
+    for data, errs in results:
+        merged.merge(Histogram.from_json(data))
+        errors += errs
+    return merged, errors
+
+
+async def _run_async(
+    fn: Callable, concurrency: int, rate: float | None, warmup: float, duration: float
+) -> tuple[Histogram, int]:
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    record_from, until = start + warmup, start + warmup + duration
+    hist, errors = Histogram(), [0]
+
+    async def call(due: float) -> None:
+        try:
+            await fn()
+        except Exception:
+            if due >= record_from:
+                errors[0] += 1
+            return
+        if due >= record_from:
+            hist.record(_micros(loop.time() - due))
+
+    if not rate:
+
+        async def worker() -> None:
+            while (due := loop.time()) < until:
+                await call(due)
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return hist, errors[0]
+
+    # Open loop: at most *concurrency* calls in flight; late slots queue on the semaphore
+    # and are still measured from their scheduled start.
+    slots = asyncio.Semaphore(concurrency)
+    pending: set[asyncio.Task] = set()
+
+    async def bounded(due: float) -> None:
+        async with slots:
+            await call(due)
+
+    slot = 0
+    while (due := start + slot / rate) < until:
+        delay = due - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        task = asyncio.create_task(bounded(due))
+        pending.add(task)
+        task.add_done_callback(pending.discard)
+        slot += 1
+    if pending:
+        await asyncio.gather(*pending)
+    return hist, errors[0]
+
+
+def run_async(
+    fn: Callable, concurrency: int, rate: float | None, warmup: float, duration: float
+) -> tuple[Histogram, int]:
+    """Await *fn* from *concurrency* tasks on one event loop."""
+    return asyncio.run(_run_async(fn, concurrency, rate, warmup, duration))
+
+
+def summary(hist: Histogram, errors: int, seconds: float) -> dict:
+    """Return the JSON report for a finished run (latencies in milliseconds)."""
+    requests = hist.total + errors
+    latency = {name: hist.percentile(p) / 1000 for name, p in PERCENTILES.items()}
+    latency["max"] = hist.max / 1000
+    latency["mean"] = round(hist.mean() / 1000, 3)
+    return {
+        "requests": requests,
+        "errors": errors,
+        "seconds": seconds,
+        "throughput": requests / seconds if seconds else 0.0,
+        "latency_ms": latency,
+        "histogram": hist.to_json(),
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="sully_load")
+    parser.add_argument("target")
+    parser.add_argument("--mode", choices=["auto", "thread", "process", "async"], default="auto")
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--rate", type=float, default=None)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--warmup", type=float, default=0.0)
+    args = parser.parse_args(argv)
+
+    fn = resolve(args.target)
+    is_async = inspect.iscoroutinefunction(fn)
+    mode = args.mode if args.mode != "auto" else ("async" if is_async else "thread")
+    if is_async != (mode == "async"):
+        raise SystemExit(f"--mode {mode} needs {'a sync' if is_async else 'an async'} callable")
+
+    if mode == "thread":
+        hist, errors = run_threads(fn, args.concurrency, args.rate, args.warmup, args.duration)
+    elif mode == "process":
+        hist, errors = run_processes(args.target, args.concurrency, args.rate, args.warmup, args.duration)
+    else:
+        hist, errors = run_async(fn, args.concurrency, args.rate, args.warmup, args.duration)
+    report = summary(hist, errors, args.duration)
+    report["mode"] = mode
+    sys.stdout.flush()
+    print(json.dumps(report))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+"""Event-loop stall detector: time every asyncio callback and task step, report the slow ones.
+
+``python -m sully_loop [--threshold-ms MS] [--top N] script.py [args...]`` runs
+*script* as ``__main__`` with the monitor installed and prints the report to
+stderr when it exits (``sully run --loop-monitor``). The sully_stall pytest
+plugin uses :class:`LoopMonitor` directly.
+
+Each ``asyncio.Handle._run`` is one plain callback or one step of a task up to
+its next ``await``; nothing else can run on the loop meanwhile, so a slow step
+is a stall. A watchdog thread samples the loop thread's stack while a step is
+still running past the threshold, which shows where the loop was blocked
+rather than only which coroutine it was in.
+"""
+
+import argparse
+import asyncio
+import asyncio.events
+import functools
+import itertools
+import os
+import runpy
+import sys
+import threading
+import time
+import traceback
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, NamedTuple
+
+_ASYNCIO_DIR = os.path.dirname(asyncio.__file__)
+
+
+class Stall(NamedTuple):
+    """One callback or task step that held the loop for at least the threshold."""
+
+    seconds: float
+    function: str  # coroutine or callback, with its definition site
+    task: str | None  # task name, for task steps
+    stack: list[str] | None  # "file:line in name", outermost first; None if the step ended before a sample
+
+
+@dataclass
+class FunctionStats:
+    """Slow steps attributed to one coroutine or callback."""
+
+    count: int = 0
+    total: float = 0.0
+    worst: Stall | None = None
+
+
+class LoopMonitor:
+    """Times every step on every asyncio loop in the process while installed.
+
+    Use as a context manager, or call :meth:`install` and :meth:`uninstall`.
+    """
+
+    def __init__(self, threshold: float) -> None:
+        self.threshold = threshold  # seconds
+        self.stalls: list[Stall] = []
+        self.stats: dict[str, FunctionStats] = {}
+        self._running: dict[int, tuple[float, int]] = {}  # thread id -> (start, step)
+        self._samples: dict[int, list[str]] = {}  # step -> stack sampled by the watchdog
+        self._steps = itertools.count()
+        self._original: Callable[[asyncio.Handle], None] | None = None
+        self._stop = threading.Event()
+        self._watchdog: threading.Thread | None = None
+
+    def install(self) -> None:
+        if self._original is not None:
+            return
+        original = self._original = asyncio.events.Handle._run
+
+        def _run(handle: asyncio.Handle) -> None:
+            self._timed(original, handle)
+
+        asyncio.events.Handle._run = _run  # type: ignore[method-assign]
+        self._stop.clear()
+        self._watchdog = threading.Thread(target=self._watch, name="sully-loop-watchdog", daemon=True)
+        self._watchdog.start()
+
+    def uninstall(self) -> None:
+        if self._original is None:
+            return
+        asyncio.events.Handle._run = self._original  # type: ignore[method-assign]
+        self._original = None
+        self._stop.set()
+        if self._watchdog is not None:
+            self._watchdog.join()
+
+    def __enter__(self) -> "LoopMonitor":
+        self.install()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.uninstall()
+
+    def _timed(self, original: Callable[[asyncio.Handle], None], handle: asyncio.Handle) -> None:
+        thread = threading.get_ident()
+        step = next(self._steps)
+        start = time.perf_counter()
+        self._running[thread] = (start, step)
+        try:
+            original(handle)
+        finally:
+            elapsed = time.perf_counter() - start
+            self._running.pop(thread, None)
+            stack = self._samples.pop(step, None)
+            if elapsed >= self.threshold:
+                self._record(handle, elapsed, stack)
+
+    def _record(self, handle: asyncio.Handle, seconds: float, stack: list[str] | None) -> None:
+        function, task = describe(handle)
+        stall = Stall(seconds, function, task, stack)
+        self.stalls.append(stall)
+        stats = self.stats.setdefault(function, FunctionStats())
+        stats.count += 1
+        stats.total += seconds
+        if stats.worst is None or seconds > stats.worst.seconds:
+            stats.worst = stall
+
+    def _watch(self) -> None:
+        """Sample the stack of every loop thread whose current step has run past the threshold."""
+        interval = max(self.threshold / 2, 0.001)
+        while not self._stop.wait(interval):
+            now = time.perf_counter()
+            late = [(t, s) for t, (start, s) in list(self._running.items()) if now - start >= self.threshold]
+            late = [(t, s) for t, s in late if s not in self._samples]
+            if not late:
+                continue
+            frames = sys._current_frames()
+            for thread, step in late:
+                frame = frames.get(thread)
+                if frame is not None and self._running.get(thread, (0, None))[1] == step:
+                    self._samples[step] = _user_stack(frame)
+
+    def report(self, top: int = 10) -> list[str]:
+        """Return a text report: slow steps per function, then the worst stall's stack for each."""
+        if not self.stalls:
+            return [f"no loop steps over {self.threshold * 1000:g} ms"]
+        ranked = sorted(self.stats.items(), key=lambda kv: kv[1].total, reverse=True)[:top]
+        lines = [
+            f"{len(self.stalls)} loop step(s) over {self.threshold * 1000:g} ms",
+            f"{'count':>6}  {'total ms':>9}  {'max ms':>8}  function",
+        ]
+        for function, stats in ranked:
+            worst = stats.worst.seconds if stats.worst else 0.0
+            lines.append(f"{stats.count:>6}  {stats.total * 1000:>9.1f}  {worst * 1000:>8.1f}  {function}")
+        for function, stats in ranked:
+            if stats.worst is not None:
+                lines += ["", *format_stall(stats.worst)]
+        return lines
+
+
+def describe(handle: asyncio.Handle) -> tuple[str, str | None]:
+    """Return the coroutine or callback *handle* runs, and the task name for task steps."""
+    callback: Any = handle._callback  # type: ignore[attr-defined]
+    owner = getattr(callback, "__self__", None)
+    if isinstance(owner, asyncio.Task):
+        coro: Any = owner.get_coro()
+        code = getattr(coro, "cr_code", None) or getattr(coro, "gi_code", None)
+        name = getattr(coro, "__qualname__", repr(coro))
+        return _located(name, code), owner.get_name()
+    while isinstance(callback, functools.partial):
+        callback = callback.func
+    name = getattr(callback, "__qualname__", None) or repr(callback)
+    code = getattr(getattr(callback, "__func__", callback), "__code__", None)
+    return _located(name, code), None
+
+
+def format_stall(stall: Stall) -> list[str]:
+    """Return the lines describing one stall and where the loop was blocked."""
+    task = f" [task {stall.task}]" if stall.task else ""
+    lines = [f"{stall.seconds * 1000:.1f} ms in {stall.function}{task}"]
+    if stall.stack is None:
+        lines.append("    (the step finished before its stack was sampled)")
+    elif not stall.stack:
+        lines.append("    (blocked outside Python code, in a builtin or extension)")
+    else:
+        lines += [f"    {frame}" for frame in stall.stack]
+    return lines
+
+
+def _located(name: str, code: Any) -> str:
+    if code is None:
+        return name
+    return f"{name} ({_short(code.co_filename)}:{code.co_firstlineno})"
+
+
+def _short(filename: str) -> str:
+    try:
+        relative = os.path.relpath(filename)
+    except ValueError:  # another drive on Windows
+        return filename
+    return filename if relative.startswith("..") else relative
+
+
+def _user_stack(frame: Any) -> list[str]:
+    """Format *frame*'s stack from the step's own code down, without the monitor and asyncio frames."""
+    frames = traceback.extract_stack(frame)
+    ours = [i for i, f in enumerate(frames) if f.filename == __file__]
+    if ours:
+        frames = frames[ours[-1] + 1 :]
+    return [
+        f"{_short(f.filename)}:{f.lineno} in {f.name}"
+        for f in frames
+        if os.path.dirname(f.filename) != _ASYNCIO_DIR
+    ]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="sully_loop")
+    parser.add_argument("--threshold-ms", type=float, default=100.0)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("script")
+    parser.add_argument("args", nargs=argparse.REMAINDER)
+    opts = parser.parse_args(argv)
+
+    sys.argv = [opts.script, *opts.args]
+    sys.path.insert(0, str(Path(opts.script).resolve().parent))
+    monitor = LoopMonitor(opts.threshold_ms / 1000)
+    code: int | str | None = 0
+    try:
+        with monitor:
+            runpy.run_path(opts.script, run_name="__main__")
+    except SystemExit as exc:
+        code = exc.code
+    finally:
+        print("\n".join(["", "sully loop monitor", *monitor.report(opts.top)]), file=sys.stderr)
+    if isinstance(code, str):
+        print(code, file=sys.stderr)
+        return 1
+    return code or 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
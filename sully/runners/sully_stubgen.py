@@ -0,0 +1,180 @@
+"""Write trimmed ``.pyi`` stubs for untyped third-party modules, printing a JSON summary.
+
+Usage: ``python -m sully_stubgen OUT_DIR API_JSON``, where API_JSON maps module
+names (``"pandas"``, ``"pandas.io.sql"``) to the attribute names the project
+uses from them.
+
+A top-level package is skipped if it ships its own types (``py.typed`` or
+``.pyi`` files) or has a ``<name>-stubs`` package installed. For the others,
+each used module is imported and only the used names are written out:
+
+- functions keep their parameter names and kinds, with every type ``Any``;
+- classes list their public attributes as ``Any`` plus the operators they define;
+- anything else becomes ``name: Any``.
+
+Every stub ends with a module-level ``__getattr__``, so a name the scan missed
+is still ``Any`` rather than an error. pyright then reads a few lines per
+package instead of inferring types from the package's source.
+"""
+
+import importlib
+import importlib.util
+import inspect
+import json
+import sys
+from importlib import metadata
+from pathlib import Path
+from typing import Any
+
+# Dunder methods pyright looks up on the class rather than through __getattr__.
+_OPERATORS = {
+    f"__{name}__"
+    for name in (
+        "call len iter next aiter anext contains getitem setitem delitem enter exit aenter aexit await bool "
+        "int float complex index neg pos abs invert lt le gt ge"
+    ).split()
+}
+_OPERATORS |= {
+    f"__{prefix}{name}__"
+    for name in "add sub mul matmul truediv floordiv mod pow lshift rshift and or xor".split()
+    for prefix in ("", "r", "i")
+}
+_MISSING = object()
+
+
+def typed_reason(top: str) -> str | None:
+    """Return why *top* needs no generated stub, ``"not installed"``, or None if it needs one."""
+    for entry in sys.path:
+        if entry and (Path(entry) / f"{top}-stubs").is_dir():
+            return "stubs installed"
+    try:
+        spec = importlib.util.find_spec(top)
+    except (ImportError, ValueError):
+        spec = None
+    if spec is None:
+        return "not installed"
+    for location in spec.submodule_search_locations or []:
+        if (Path(location) / "py.typed").is_file():
+            return "ships py.typed"
+    if spec.origin and spec.has_location and Path(spec.origin).with_suffix(".pyi").is_file():
+        return "ships .pyi"
+    return None
+
+
+def render_params(fn: Any, *, method: bool = False) -> str:
+    """Return *fn*'s parameter list with every annotation ``Any``, or ``*args, **kwargs`` if unknown."""
+    try:
+        params = list(inspect.signature(fn).parameters.values())
+    except (TypeError, ValueError):
+        params = []
+        parts = ["*args: Any", "**kwargs: Any"]
+    else:
+        parts = []
+        for i, p in enumerate(params):
+            text = f"{p.name}: Any" + (" = ..." if p.default is not p.empty else "")
+            if p.kind is p.VAR_POSITIONAL:
+                text = f"*{p.name}: Any"
+            elif p.kind is p.VAR_KEYWORD:
+                text = f"**{p.name}: Any"
+            elif p.kind is p.KEYWORD_ONLY and not any(q.kind in (q.VAR_POSITIONAL, q.KEYWORD_ONLY) for q in params[:i]):
+                parts.append("*")
+            parts.append(text)
+            if p.kind is p.POSITIONAL_ONLY and (i + 1 == len(params) or params[i + 1].kind is not p.POSITIONAL_ONLY):
+                parts.append("/")
+    if method:
+        parts.insert(0, "self")
+    return ", ".join(parts)
+
+
+def render_class(name: str, cls: type) -> list[str]:
+    """Return stub lines for class *name*: its constructor, public attributes as ``Any`` and its operators."""
+    lines = [f"class {name}:", f"    def __init__({render_params(cls, method=True)}) -> None: ..."]
+    for attr in sorted(dir(cls)):
+        if attr in _OPERATORS and getattr(cls, attr, None) is not getattr(object, attr, None):
+            lines.append(f"    def {attr}(self, *args: Any, **kwargs: Any) -> Any: ...")
+        elif not attr.startswith("_") and attr.isidentifier():
+            lines.append(f"    {attr}: Any")
+    lines.append("    def __getattr__(self, name: str) -> Any: ...")
+    return lines
+
+
+def render_module(module_name: str, names: list[str], header: str) -> tuple[str, set[str], int]:
+    """Return the stub for *module_name*, the submodules it re-exports and how many names it spells out."""
+    imports = [header, "from typing import Any"]
+    lines: list[str] = []
+    submodules: set[str] = set()
+    count = 0
+    try:
+        module = importlib.import_module(module_name)
+    except Exception:  # a broken optional extra: fall back to __getattr__ alone
+        module = None
+    for name in sorted(set(names)):
+        value = getattr(module, name, _MISSING) if module is not None else _MISSING
+        if value is _MISSING or not name.isidentifier():
+            continue
+        count += 1
+        if inspect.ismodule(value) and value.__name__ == f"{module_name}.{name}":
+            imports.append(f"from . import {name} as {name}")
+            submodules.add(value.__name__)
+        elif inspect.isclass(value):
+            lines.extend(["", *render_class(name, value), ""])
+        elif inspect.isroutine(value):
+            prefix = "async def" if inspect.iscoroutinefunction(value) else "def"
+            lines.append(f"{prefix} {name}({render_params(value)}) -> Any: ...")
+        else:
+            lines.append(f"{name}: Any")
+    lines.extend(["", "def __getattr__(name: str) -> Any: ..."])
+    return "\n".join([*imports, "", *lines]) + "\n", submodules, count
+
+
+def generate(out: Path, api: dict[str, list[str]]) -> dict[str, Any]:
+    """Write stubs for the untyped packages in *api* under *out*; return what was done per package."""
+    dists = metadata.packages_distributions()
+    summary: dict[str, Any] = {"stubbed": {}, "typed": {}, "missing": []}
+    for top in sorted({module.partition(".")[0] for module in api}):
+        reason = typed_reason(top)
+        if reason == "not installed":
+            summary["missing"].append(top)
+            continue
+        if reason is not None:
+            summary["typed"][top] = reason
+            continue
+        dist = (dists.get(top) or [top])[0]
+        try:
+            version = f"{dist} {metadata.version(dist)}"
+        except metadata.PackageNotFoundError:
+            version = dist
+        header = f"# Generated by `sully stubs build` from {version}. Only the names src/ uses are spelled out."
+
+        pending = {m: list(names) for m, names in api.items() if m == top or m.startswith(f"{top}.")}
+        # Parent packages need stubs too, or pyright can't reach the submodule.
+        for module in list(pending):
+            parts = module.split(".")
+            for i in range(1, len(parts)):
+                pending.setdefault(".".join(parts[:i]), [])
+        written = names = 0
+        while pending:
+            module, used = pending.popitem()
+            text, submodules, count = render_module(module, used, header)
+            for submodule in submodules:
+                if not (out / Path(*submodule.split(".")) / "__init__.pyi").exists():
+                    pending.setdefault(submodule, [])
+            path = out / Path(*module.split(".")) / "__init__.pyi"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(text)
+            written += 1
+            names += count
+        summary["stubbed"][top] = {"distribution": version, "modules": written, "names": names}
+    return summary
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = argv if argv is not None else sys.argv[1:]
+    out, api = Path(args[0]), json.loads(args[1])
+    summary = generate(out, api)
+    print(json.dumps(summary))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
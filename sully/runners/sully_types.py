@@ -0,0 +1,376 @@
+"""Sampled runtime type checks for project code: argument and return values against annotations.
+
+``python -m sully_types --src DIR [--first K] [--sample N] [--fail] script.py [args...]``
+installs an import hook, runs *script* as ``__main__`` and prints the
+violations to stderr when it exits (``sully run --runtime-types``).
+
+Every module imported from under ``--src`` has its annotated functions and
+methods wrapped after it executes. A wrapper checks the first K calls of its
+function and then 1 in N; the other calls pay only for a counter, so the
+overhead is bounded by the sampling rate. Checkers are built once per
+signature from the resolved annotations. Containers are checked by their
+first element, so a check never costs more than a few ``isinstance`` calls
+per argument.
+"""
+
+import argparse
+import asyncio
+import collections.abc
+import functools
+import importlib.abc
+import importlib.machinery
+import inspect
+import runpy
+import sys
+import types
+import typing
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+Check = Callable[[object], bool]
+
+_ASYNCIO_DIR = str(Path(asyncio.__file__).parent)
+
+_SEQUENCES = (list, set, frozenset, collections.abc.Sequence, collections.abc.MutableSequence)
+_SEQUENCES += (collections.abc.Set, collections.abc.MutableSet, collections.abc.Collection)
+_MAPPINGS = (dict, collections.abc.Mapping, collections.abc.MutableMapping)
+# PEP 484's numeric tower: an int is acceptable where a float is expected.
+_WIDER = {float: (int, float), complex: (int, float, complex)}
+
+
+def checker(tp: Any) -> Check | None:
+    """Return a predicate for values of type *tp*, or None if it can't (or needn't) be checked."""
+    if tp is Any or tp is object or isinstance(tp, (typing.TypeVar, typing.ParamSpec, str)):
+        return None
+    if tp is None or tp is type(None):
+        return lambda v: v is None
+    if isinstance(tp, typing.NewType):
+        return checker(tp.__supertype__)
+    origin, args = typing.get_origin(tp), typing.get_args(tp)
+    if origin is typing.Annotated:
+        return checker(args[0])
+    if origin in (typing.Union, types.UnionType):
+        options = [checker(a) for a in args]
+        if any(c is None for c in options):
+            return None
+        return lambda v: any(c(v) for c in options)  # type: ignore[misc]
+    if origin is typing.Literal:
+        return lambda v: any(v == a and type(v) is type(a) for a in args)
+    if origin is tuple:
+        if len(args) == 2 and args[1] is Ellipsis:
+            item = checker(args[0])
+            return lambda v: isinstance(v, tuple) and (item is None or not v or item(v[0]))
+        items = [checker(a) for a in args]
+        if args == ((),):  # tuple[()]
+            items = []
+        if not args:
+            return lambda v: isinstance(v, tuple)
+        return lambda v: (
+            isinstance(v, tuple) and len(v) == len(items) and all(c is None or c(x) for c, x in zip(items, v))
+        )
+    if origin in _MAPPINGS:
+        key, value = (checker(args[0]), checker(args[1])) if len(args) == 2 else (None, None)
+        return lambda v: isinstance(v, origin) and (not v or _first_item(v, key, value))  # type: ignore[arg-type]
+    if origin in _SEQUENCES:
+        item = checker(args[0]) if args else None
+        return lambda v: (
+            isinstance(v, origin) and (item is None or not v or item(next(iter(v))))  # type: ignore[arg-type]
+        )
+    if origin is collections.abc.Callable:
+        return callable
+    if origin is type:
+        return lambda v: isinstance(v, type)
+    if origin is not None:  # Iterator[int] and other generics: only the class (iterating would consume)
+        return _isinstance(origin)
+    if typing.is_typeddict(tp):  # TypedDicts refuse isinstance(); their instances are plain dicts
+        return lambda v: isinstance(v, dict)
+    if isinstance(tp, type):
+        return _isinstance(tp)
+    return None
+
+
+def _isinstance(tp: type) -> Check | None:
+    if getattr(tp, "_is_protocol", False) and not getattr(tp, "_is_runtime_protocol", False):
+        return None
+    accepted = _WIDER.get(tp, tp)
+    return lambda v: isinstance(v, accepted)
+
+
+def _first_item(mapping: Any, key: Check | None, value: Check | None) -> bool:
+    k, v = next(iter(mapping.items()))
+    return (key is None or key(k)) and (value is None or value(v))
+
+
+def type_name(tp: Any) -> str:
+    if tp is None or tp is type(None):
+        return "None"
+    if isinstance(tp, type) and not typing.get_args(tp):
+        return tp.__qualname__
+    return repr(tp).replace("typing.", "").replace("collections.abc.", "")
+
+
+@dataclass
+class Violation:
+    """Every sampled call of one function that passed (or returned) one wrong type."""
+
+    function: str
+    what: str  # parameter name, or "return"
+    expected: str
+    got: str
+    count: int = 0
+    sites: list[str] = field(default_factory=list)  # first few call sites
+
+
+@dataclass
+class Report:
+    checked: int = 0
+    calls: int = 0
+    violations: dict[tuple[str, str, str, str], Violation] = field(default_factory=dict)
+
+    def record(self, function: str, what: str, expected: str, got: str, site: str) -> None:
+        key = (function, what, expected, got)
+        violation = self.violations.setdefault(key, Violation(function, what, expected, got))
+        violation.count += 1
+        if len(violation.sites) < 3 and site not in violation.sites:
+            violation.sites.append(site)
+
+    def lines(self, top: int = 20) -> list[str]:
+        found = sorted(self.violations.values(), key=lambda v: v.count, reverse=True)
+        lines = [f"{len(found)} runtime type violation(s); {self.checked} of {self.calls} call(s) checked"]
+        for v in found[:top]:
+            what = "return value" if v.what == "return" else f"argument {v.what!r}"
+            lines.append(f"{v.count:>6}  {v.function}: {what} expected {v.expected}, got {v.got}")
+            lines.append(f"{'':8}called from {', '.join(v.sites)}")
+        if len(found) > top:
+            lines.append(f"  ... and {len(found) - top} more")
+        return lines
+
+
+REPORT = Report()
+
+
+class _Signature:
+    """Checkers for one function, resolved on its first checked call (forward references need the module)."""
+
+    def __init__(self, fn: Callable[..., Any]) -> None:
+        self.fn = fn
+        self.name = f"{fn.__module__}.{fn.__qualname__}"
+        self.resolved = False
+        self.signature: inspect.Signature | None = None
+        self.params: list[tuple[str, str, Check]] = []
+        self.result: tuple[str, Check] | None = None
+
+    def resolve(self) -> None:
+        self.resolved = True
+        try:
+            hints = typing.get_type_hints(self.fn, include_extras=True)
+            self.signature = inspect.signature(self.fn)
+        except Exception:  # unresolvable forward reference, or not introspectable
+            return
+        for name, param in self.signature.parameters.items():
+            check = checker(hints[name]) if name in hints else None
+            if check is None:
+                continue
+            if param.kind is param.VAR_POSITIONAL:
+                check = _each(check, tuple)
+            elif param.kind is param.VAR_KEYWORD:
+                check = _each(check, dict)
+            self.params.append((name, type_name(hints[name]), check))
+        if "return" in hints and not inspect.isgeneratorfunction(self.fn):
+            check = checker(hints["return"])
+            if check is not None:
+                self.result = (type_name(hints["return"]), check)
+
+    def check_args(self, args: tuple[Any, ...], kwargs: dict[str, Any], site: str) -> None:
+        if not self.resolved:
+            self.resolve()
+        if not self.params or self.signature is None:
+            return
+        try:
+            bound = self.signature.bind(*args, **kwargs).arguments
+        except TypeError:  # the call itself is wrong; let the function raise
+            return
+        for name, expected, check in self.params:
+            if name in bound and not _passes(check, bound[name]):
+                REPORT.record(self.name, name, expected, _got(bound[name]), site)
+
+    def check_result(self, value: Any, site: str) -> None:
+        if self.result is not None and not _passes(self.result[1], value):
+            REPORT.record(self.name, "return", self.result[0], _got(value), site)
+
+
+def _passes(check: Check, value: Any) -> bool:
+    """Run *check*, treating a checker that raises as a pass so it can never change program behaviour."""
+    try:
+        return check(value)
+    except Exception:
+        return True
+
+
+def _each(check: Check, container: type) -> Check:
+    """Check the first of a ``*args`` tuple or ``**kwargs`` dict."""
+    if container is dict:
+        return lambda v: not v or check(next(iter(v.values())))
+    return lambda v: not v or check(v[0])
+
+
+def _got(value: Any) -> str:
+    """Name *value*'s type, with the first element's type for containers (``list[int]``)."""
+    if value is None:
+        return "None"
+    name = type(value).__qualname__
+    if isinstance(value, (list, set, frozenset, tuple)) and value:
+        return f"{name}[{_got(next(iter(value)))}{', ...' if isinstance(value, tuple) and len(value) > 1 else ''}]"
+    if isinstance(value, dict) and value:
+        key, item = next(iter(value.items()))
+        return f"{name}[{_got(key)}, {_got(item)}]"
+    return name
+
+
+def _site(depth: int) -> str:
+    frame = sys._getframe(depth)
+    if frame.f_code.co_filename.startswith(_ASYNCIO_DIR):  # a task's first step
+        return "the event loop"
+    return f"{_short(frame.f_code.co_filename)}:{frame.f_lineno}"
+
+
+def _short(filename: str) -> str:
+    try:
+        return str(Path(filename).resolve().relative_to(Path.cwd()))
+    except ValueError:
+        return filename
+
+
+def wrap(fn: Callable[..., Any], first: int, sample: int) -> Callable[..., Any]:
+    """Return *fn* checking its first *first* calls, then every *sample*-th."""
+    sig = _Signature(fn)
+    calls = 0
+
+    def sampled() -> bool:
+        nonlocal calls
+        calls += 1
+        return calls <= first or calls % sample == 0
+
+    if inspect.iscoroutinefunction(fn):
+
+        @functools.wraps(fn)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            REPORT.calls += 1
+            if not sampled():
+                return await fn(*args, **kwargs)
+            REPORT.checked += 1
+            site = _site(2)
+            sig.check_args(args, kwargs, site)
+            result = await fn(*args, **kwargs)
+            sig.check_result(result, site)
+            return result
+
+        return async_wrapper
+
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        REPORT.calls += 1
+        if not sampled():
+            return fn(*args, **kwargs)
+        REPORT.checked += 1
+        site = _site(2)
+        sig.check_args(args, kwargs, site)
+        result = fn(*args, **kwargs)
+        sig.check_result(result, site)
+        return result
+
+    return wrapper
+
+
+def instrument(module: types.ModuleType, first: int, sample: int) -> int:
+    """Wrap the annotated functions and methods defined in *module*; return how many were wrapped."""
+
+    def own(fn: object) -> bool:
+        return inspect.isfunction(fn) and fn.__module__ == module.__name__ and bool(fn.__annotations__)
+
+    def instrument_namespace(owner: Any, prefix: str) -> int:
+        count = 0
+        for name, attr in list(vars(owner).items()):
+            if isinstance(attr, (staticmethod, classmethod)) and own(attr.__func__):
+                setattr(owner, name, type(attr)(wrap(attr.__func__, first, sample)))
+                count += 1
+            elif own(attr):
+                setattr(owner, name, wrap(attr, first, sample))
+                count += 1
+            elif isinstance(attr, type) and attr.__module__ == module.__name__ and attr.__qualname__ == prefix + name:
+                count += instrument_namespace(attr, attr.__qualname__ + ".")
+        return count
+
+    return instrument_namespace(module, "")
+
+
+class _Loader(importlib.abc.Loader):
+    def __init__(self, loader: importlib.abc.Loader, first: int, sample: int) -> None:
+        self.loader = loader
+        self.first = first
+        self.sample = sample
+
+    def create_module(self, spec: importlib.machinery.ModuleSpec) -> types.ModuleType | None:
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module: types.ModuleType) -> None:
+        self.loader.exec_module(module)
+        instrument(module, self.first, self.sample)
+
+    def __getattr__(self, name: str) -> Any:  # get_source, get_code, is_package, ...
+        return getattr(self.loader, name)
+
+
+class Finder(importlib.abc.MetaPathFinder):
+    """Import hook wrapping modules whose source lives under *src*."""
+
+    def __init__(self, src: Path, first: int, sample: int) -> None:
+        self.src = src.resolve()
+        self.first = first
+        self.sample = sample
+
+    def find_spec(
+        self, fullname: str, path: Sequence[str] | None, target: types.ModuleType | None = None
+    ) -> importlib.machinery.ModuleSpec | None:
+        spec = importlib.machinery.PathFinder.find_spec(fullname, path)
+        if spec is None or spec.origin is None or spec.loader is None or not spec.origin.endswith(".py"):
+            return None
+        if not Path(spec.origin).resolve().is_relative_to(self.src):
+            return None
+        spec.loader = _Loader(spec.loader, self.first, self.sample)  # type: ignore[arg-type]
+        return spec
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="sully_types")
+    parser.add_argument("--src", required=True)
+    parser.add_argument("--first", type=int, default=10, help="Check every one of a function's first K calls.")
+    parser.add_argument("--sample", type=int, default=100, help="After that, check 1 in N calls.")
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--fail", action="store_true", help="Exit 1 on violations if the script succeeded.")
+    parser.add_argument("script")
+    parser.add_argument("args", nargs=argparse.REMAINDER)
+    opts = parser.parse_args(argv)
+
+    sys.argv = [opts.script, *opts.args]
+    sys.path.insert(0, str(Path(opts.script).resolve().parent))
+    sys.meta_path.insert(0, Finder(Path(opts.src), opts.first, max(opts.sample, 1)))
+    code: int | str | None = 0
+    try:
+        runpy.run_path(opts.script, run_name="__main__")
+    except SystemExit as exc:
+        code = exc.code
+    finally:
+        print("\n".join(["", "sully runtime types", *REPORT.lines(opts.top)]), file=sys.stderr)
+    if isinstance(code, str):
+        print(code, file=sys.stderr)
+        return 1
+    if not code and opts.fail and REPORT.violations:
+        return 1
+    return code or 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,192 @@
+"""Trimmed stubs for untyped dependencies, so pyright doesn't infer types from their source.
+
+``sully stubs build`` scans src/ for the third-party modules and names it uses,
+then runs the ``sully_stubgen`` runner in the project environment to write
+``.pyi`` files for those names into ``.sully/stubs``. pyright finds them
+through ``stubPath`` in pyrightconfig.json or ``[tool.pyright]``. The stubs are keyed on uv.lock
+and the scanned imports; ``sully check`` rebuilds them when either changes.
+"""
+
+import ast
+import hashlib
+import json
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+from typing import NamedTuple
+
+import tomlkit
+
+from sully import uv
+from sully.index import project_files
+from sully.runners import runner_env
+
+STUB_DIR = ".sully/stubs"
+_KEY_FILE = ".key"
+_FORMAT = "1"  # bump when the generated stubs change shape
+
+
+class StubReport(NamedTuple):
+    """What one build did for each top-level third-party module src/ imports."""
+
+    stubbed: dict[str, str]  # module -> "<distribution> <version>: N module(s), M name(s)"
+    typed: dict[str, str]  # module -> why no stub was needed
+    missing: list[str]  # imported but not installed in the project environment
+
+
+def used_api(src: Path) -> dict[str, list[str]]:
+    """Return ``{module: [names]}`` for the third-party modules imported under *src*.
+
+    Names come from ``from m import name`` and from attribute access on a
+    module bound by ``import m`` (``pd.read_csv`` adds ``read_csv`` to pandas).
+    Files are found through the project index; only those importing a
+    third-party module are parsed, and each parse is cached by content hash.
+    """
+    if not src.is_dir():
+        return {}
+    root = src.parent
+    local = {p.stem for p in src.iterdir() if p.suffix == ".py" or p.is_dir()}
+
+    def third_party(module: str) -> bool:
+        top = module.partition(".")[0]
+        return top not in sys.stdlib_module_names and top not in local and top != "__future__"
+
+    cache_file = root / ".sully" / "cache" / "stubs-api.json"
+    try:
+        cached = json.loads(cache_file.read_text())
+    except (OSError, ValueError):
+        cached = {}
+    per_file: dict[str, list] = {}  # path -> [sha256, {module: [names]}]
+    for entry in project_files(root, [src.name], ".py"):
+        if not any(third_party(m) for m in entry.imports):
+            continue
+        hit = cached.get(entry.path)
+        per_file[entry.path] = hit if hit and hit[0] == entry.sha256 else [entry.sha256, _file_api(root / entry.path)]
+    if per_file != cached:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(json.dumps(per_file))
+
+    api: dict[str, set[str]] = {}
+    for _, modules in per_file.values():
+        for module, names in modules.items():
+            if third_party(module):
+                api.setdefault(module, set()).update(names)
+    return {module: sorted(names) for module, names in sorted(api.items())}
+
+
+def _file_api(path: Path) -> dict[str, list[str]]:
+    """Return ``{module: [names]}`` for every absolute import in *path*."""
+    try:
+        tree = ast.parse(path.read_bytes(), filename=str(path))
+    except (SyntaxError, ValueError):
+        return {}
+    api: dict[str, set[str]] = {}
+    bound: dict[str, str] = {}  # local name -> module it refers to
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                api.setdefault(alias.name, set())
+                if alias.asname:
+                    bound[alias.asname] = alias.name
+                else:
+                    bound[alias.name.partition(".")[0]] = alias.name.partition(".")[0]
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            api.setdefault(node.module, set()).update(a.name for a in node.names if a.name != "*")
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name) and node.value.id in bound:
+            api.setdefault(bound[node.value.id], set()).add(node.attr)
+    return {module: sorted(names) for module, names in api.items()}
+
+
+def _key(root: Path, api: dict[str, list[str]]) -> str:
+    lock = root / "uv.lock"
+    h = hashlib.sha256(_FORMAT.encode())
+    h.update(lock.read_bytes() if lock.is_file() else b"")
+    h.update(json.dumps(api, sort_keys=True).encode())
+    return h.hexdigest()
+
+
+def _api(root: Path, exclude: list[str]) -> dict[str, list[str]]:
+    skip = set(exclude)
+    return {m: names for m, names in used_api(root / "src").items() if m.partition(".")[0] not in skip}
+
+
+def is_fresh(root: Path, exclude: list[str]) -> bool:
+    """True if the stubs in ``.sully/stubs`` match uv.lock and what src/ imports."""
+    key_file = root / STUB_DIR / _KEY_FILE
+    return key_file.is_file() and key_file.read_text() == _key(root, _api(root, exclude))
+
+
+def build(root: Path, exclude: list[str]) -> StubReport:
+    """Regenerate ``.sully/stubs`` for the project at *root*, replacing the old stubs in one step.
+
+    Top-level modules in *exclude* are left to pyright, e.g. packages whose
+    stubs it bundles. Raises RuntimeError if the project environment can't run
+    the generator.
+    """
+    api = _api(root, exclude)
+    out = root / STUB_DIR
+    out.parent.mkdir(parents=True, exist_ok=True)
+    tmp = Path(tempfile.mkdtemp(prefix=".stubs-", dir=out.parent))
+    try:
+        proc = uv.run_captured(["python", "-m", "sully_stubgen", str(tmp), json.dumps(api)], cwd=root, env=runner_env())
+        if proc.returncode != 0:
+            raise RuntimeError(f"Could not generate stubs:\n{proc.stdout}")
+        summary = json.loads(proc.stdout.strip().splitlines()[-1])
+        (tmp / _KEY_FILE).write_text(_key(root, api))
+        shutil.rmtree(out, ignore_errors=True)
+        tmp.rename(out)
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    stubbed = {
+        module: f"{s['distribution']}: {s['modules']} module(s), {s['names']} name(s)"
+        for module, s in summary["stubbed"].items()
+    }
+    return StubReport(stubbed, summary["typed"], summary["missing"])
+
+
+def pyright_config(root: Path) -> Path | None:
+    """Return the file pyright reads settings from: pyrightconfig.json, else pyproject.toml with [tool.pyright]."""
+    config = root / "pyrightconfig.json"
+    if config.is_file():
+        return config
+    pyproject = root / "pyproject.toml"
+    if pyproject.is_file() and "pyright" in tomlkit.loads(pyproject.read_text()).get("tool", {}):
+        return pyproject
+    return None
+
+
+def stub_path(root: Path) -> str | None:
+    """Return the ``stubPath`` set in *root*'s pyright configuration, if any."""
+    config = pyright_config(root)
+    if config is None:
+        return None
+    if config.name == "pyrightconfig.json":
+        return json.loads(config.read_text()).get("stubPath")
+    return tomlkit.loads(config.read_text()).get("tool", {}).get("pyright", {}).get("stubPath")
+
+
+def register(root: Path) -> bool:
+    """Point pyright's ``stubPath`` at ``.sully/stubs``; False if it already points elsewhere.
+
+    The setting goes into whichever file pyright reads, since adding a
+    pyrightconfig.json would shadow ``[tool.pyright]``. Raises FileNotFoundError
+    if the project has no pyright configuration at all.
+    """
+    config = pyright_config(root)
+    if config is None:
+        raise FileNotFoundError("No pyrightconfig.json or [tool.pyright] found.")
+    current = stub_path(root)
+    if current not in (None, STUB_DIR):
+        return False
+    if current is None:
+        if config.name == "pyrightconfig.json":
+            data = json.loads(config.read_text())
+            data["stubPath"] = STUB_DIR
+            config.write_text(json.dumps(data, indent=2) + "\n")
+        else:
+            doc = tomlkit.loads(config.read_text())
+            doc["tool"]["pyright"]["stubPath"] = STUB_DIR
+            config.write_text(tomlkit.dumps(doc))
+    return True
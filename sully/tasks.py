@@ -0,0 +1,196 @@
+"""Declarative task graph from [tool.sully.tasks]: planning, up-to-date checks and scheduling."""
+
+import hashlib
+import json
+import os
+import shlex
+import subprocess
+import sys
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import NamedTuple
+
+from sully.index import project_files
+
+
+class Task(NamedTuple):
+    """A node in the task graph. A task without a command only groups its deps."""
+
+    name: str
+    cmd: list[str] | None
+    inputs: list[str]
+    outputs: list[str]
+    deps: list[str]
+
+
+class TaskResult(NamedTuple):
+    """What happened to one task in a run."""
+
+    task: Task
+    status: str  # "ran", "skipped" (up to date), "failed" or "blocked" (a dep failed)
+    returncode: int
+    output: str
+    seconds: float
+
+
+_SOURCES = ["src/**/*.py", "src/**/*.pyi", "pyproject.toml", "uv.lock"]
+
+# sully's own gates, usable as deps or targets; a [tool.sully.tasks] entry of the same name overrides one.
+BUILTIN_TASKS: dict[str, Task] = {
+    "check": Task(
+        "check", [sys.executable, "-m", "sully", "check"], [*_SOURCES, "tests/**/*.py", "pyrightconfig.json"], [], []
+    ),
+    "test": Task("test", [sys.executable, "-m", "sully", "test"], [*_SOURCES, "tests/**/*"], [], []),
+    "doc": Task("doc", [sys.executable, "-m", "sully", "doc"], _SOURCES, ["docs/**/*"], []),
+}
+
+
+def load_tasks(table: dict) -> dict[str, Task]:
+    """Merge task specs from :func:`sully.config.get_tasks_config` over the built-in tasks."""
+    tasks = dict(BUILTIN_TASKS)
+    for name, spec in table.items():
+        raw = spec.get("cmd")
+        cmd = shlex.split(raw) if isinstance(raw, str) else ([str(a) for a in raw] if raw else None)
+        tasks[name] = Task(
+            name,
+            cmd,
+            [str(p) for p in spec["inputs"]],
+            [str(p) for p in spec["outputs"]],
+            [str(d) for d in spec["deps"]],
+        )
+    return tasks
+
+
+def plan(tasks: dict[str, Task], targets: list[str]) -> list[Task]:
+    """Return *targets* and their transitive deps in dependency order; reject cycles and unknown names."""
+    order: list[Task] = []
+    state: dict[str, str] = {}
+
+    def visit(name: str, chain: list[str]) -> None:
+        if name not in tasks:
+            via = f" (required by '{chain[-1]}')" if chain else ""
+            raise ValueError(f"Unknown task '{name}'{via}.")
+        if state.get(name) == "done":
+            return
+        if state.get(name) == "visiting":
+            raise ValueError("Task cycle: " + " -> ".join([*chain[chain.index(name):], name]))
+        state[name] = "visiting"
+        for dep in tasks[name].deps:
+            visit(dep, [*chain, name])
+        state[name] = "done"
+        order.append(tasks[name])
+
+    for target in targets:
+        visit(target, [])
+    return order
+
+
+def fingerprint(root: Path, task: Task) -> str | None:
+    """Hash a task's command, inputs and outputs; None if it declares no inputs (always runs)."""
+    if not task.inputs:
+        return None
+    digest = hashlib.sha256(json.dumps(task.cmd).encode())
+    for label, patterns in (("in", task.inputs), ("out", task.outputs)):
+        digest.update(label.encode())
+        files = [path.relative_to(root).as_posix() for path in _glob_files(root, patterns)]
+        for entry in project_files(root, files):
+            digest.update(entry.path.encode() + b"\0")
+            digest.update(bytes.fromhex(entry.sha256))
+    return digest.hexdigest()
+
+
+def _glob_files(root: Path, patterns: list[str]) -> list[Path]:
+    files: set[Path] = set()
+    for pattern in patterns:
+        files.update(p for p in root.glob(pattern) if p.is_file() and "__pycache__" not in p.parts)
+    return sorted(files)
+
+
+def run_graph(
+    root: Path,
+    order: list[Task],
+    *,
+    jobs: int | None = None,
+    force: bool = False,
+    state_file: Path | None = None,
+    on_done: Callable[[TaskResult], None] | None = None,
+) -> dict[str, TaskResult]:
+    """Run *order* with as many tasks in flight as dependencies and *jobs* allow.
+
+    Up-to-date tasks are skipped using fingerprints stored in *state_file*. After a
+    failure, no new tasks start; tasks depending on a failed one are "blocked".
+    """
+    state: dict[str, str] = {}
+    if state_file is not None and state_file.is_file():
+        state = json.loads(state_file.read_text())
+    lock = threading.Lock()
+    results: dict[str, TaskResult] = {}
+    pending = list(order)
+    running: dict[Future[TaskResult], Task] = {}
+
+    def execute(task: Task) -> TaskResult:
+        start = time.perf_counter()
+        before = fingerprint(root, task)
+        if not force and before is not None and state.get(task.name) == before:
+            return TaskResult(task, "skipped", 0, "", 0.0)
+        if task.cmd is None:
+            return TaskResult(task, "ran", 0, "", 0.0)
+        try:
+            proc = subprocess.run(task.cmd, cwd=root, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+        except OSError as exc:  # missing or non-executable command; 127 as a shell would report it
+            return TaskResult(task, "failed", 127, f"{exc}\n", time.perf_counter() - start)
+        seconds = time.perf_counter() - start
+        if proc.returncode != 0:
+            return TaskResult(task, "failed", proc.returncode, proc.stdout, seconds)
+        after = fingerprint(root, task)
+        if after is not None:
+            with lock:
+                state[task.name] = after
+        return TaskResult(task, "ran", 0, proc.stdout, seconds)
+
+    def finish(result: TaskResult) -> None:
+        results[result.task.name] = result
+        if on_done is not None:
+            on_done(result)
+
+    with ThreadPoolExecutor(max_workers=jobs or os.cpu_count() or 1) as pool:
+        while pending or running:
+            failed = any(r.status in ("failed", "blocked") for r in results.values())
+            for task in list(pending):
+                dep_results = [results.get(d) for d in task.deps]
+                if any(r is not None and r.status in ("failed", "blocked") for r in dep_results):
+                    pending.remove(task)
+                    finish(TaskResult(task, "blocked", 1, "", 0.0))
+                elif not failed and all(r is not None for r in dep_results):
+                    pending.remove(task)
+                    running[pool.submit(execute, task)] = task
+            if not running:
+                # Nothing in flight and nothing startable: everything left is blocked.
+                for task in pending:
+                    finish(TaskResult(task, "blocked", 1, "", 0.0))
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                del running[future]
+                finish(future.result())
+
+    if state_file is not None:
+        state_file.parent.mkdir(parents=True, exist_ok=True)
+        state_file.write_text(json.dumps(state, indent=2, sort_keys=True))
+    return results
+
+
+def critical_path(order: list[Task], results: dict[str, TaskResult]) -> tuple[list[str], float]:
+    """Return the chain of tasks with the largest total duration, and that duration."""
+    best: dict[str, tuple[float, list[str]]] = {}
+    for task in order:  # dependency order, so deps are always resolved first
+        own = results[task.name].seconds if task.name in results else 0.0
+        base = max((best[d] for d in task.deps if d in best), key=lambda b: b[0], default=(0.0, []))
+        best[task.name] = (base[0] + own, [*base[1], task.name])
+    if not best:
+        return [], 0.0
+    total, chain = max(best.values(), key=lambda b: b[0])
+    return chain, total
@@ -0,0 +1,136 @@
+"""Cache of pre-synced project environments that `sully init` hard-links from.
+
+The first ``sully init`` for a given Python version and dev group syncs as
+usual and then seeds the cache with its ``.venv`` and ``uv.lock``. Later
+projects are materialised by hard-linking that environment (copying only when
+linking is impossible), so the ``uv sync`` that follows has nothing to install.
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import time
+from pathlib import Path
+
+from sully.config import user_cache_dir
+
+# Bump when the scaffold changes in a way that invalidates cached environments.
+TEMPLATE_VERSION = "1"
+
+# Templates older than this are re-seeded so dev tools don't go stale.
+MAX_AGE_SECONDS = 7 * 24 * 3600
+
+_STAMP = "template.json"
+_SCRIPT_DIRS = ("bin", "Scripts")
+
+
+def template_dir(python_version: str, dev: list[str]) -> Path:
+    """Return the cache directory for a Python version and dev dependency set."""
+    digest = hashlib.sha256(json.dumps([TEMPLATE_VERSION, sorted(dev)]).encode()).hexdigest()[:12]
+    return user_cache_dir() / "templates" / f"py{python_version}-{digest}"
+
+
+def find_template(python_version: str, dev: list[str]) -> Path | None:
+    """Return a fresh, complete template for these settings, or None."""
+    tdir = template_dir(python_version, dev)
+    try:
+        stamp = json.loads((tdir / _STAMP).read_text())
+    except (OSError, ValueError):
+        return None
+    if time.time() - stamp.get("created", 0) > MAX_AGE_SECONDS:
+        return None
+    if not (tdir / ".venv").is_dir() or not (tdir / "uv.lock").is_file():
+        return None
+    return tdir
+
+
+def seed_template(project: Path, name: str, python_version: str, dev: list[str]) -> Path | None:
+    """Save *project*'s synced environment as the template; return None if it has none.
+
+    A fresh template seeded meanwhile by a concurrent init is kept as is.
+    """
+    if not (project / ".venv").is_dir() or not (project / "uv.lock").is_file():
+        return None
+    existing = find_template(python_version, dev)
+    if existing is not None:
+        return existing
+
+    tdir = template_dir(python_version, dev)
+    staging = tdir.with_name(tdir.name + f".tmp{os.getpid()}")
+    shutil.rmtree(staging, ignore_errors=True)
+    staging.mkdir(parents=True)
+    link_tree(project / ".venv", staging / ".venv", str(project / ".venv"), str(tdir / ".venv"))
+    shutil.copy2(project / "uv.lock", staging / "uv.lock")
+    (staging / _STAMP).write_text(
+        json.dumps({"name": name, "python": python_version, "dev": dev, "created": time.time()})
+    )
+
+    # Move the old template aside, then rename the staged one in. That's two
+    # steps: a concurrent init can briefly find no template, but never a
+    # half-deleted one. If another seeder wins the second rename, keep theirs.
+    aside = tdir.with_name(tdir.name + f".old{os.getpid()}")
+    try:
+        tdir.rename(aside)
+    except FileNotFoundError:
+        pass
+    try:
+        staging.rename(tdir)
+    except OSError:
+        shutil.rmtree(staging, ignore_errors=True)
+        return find_template(python_version, dev)
+    finally:
+        shutil.rmtree(aside, ignore_errors=True)
+    return tdir
+
+
+def materialise(template: Path, project: Path, name: str) -> None:
+    """Hard-link *template*'s environment into *project* and adapt its lock to *name*."""
+    stamp = json.loads((template / _STAMP).read_text())
+    link_tree(template / ".venv", project / ".venv", str(template / ".venv"), str(project / ".venv"))
+
+    lock = (template / "uv.lock").read_text()
+    old, new = _normalise(stamp["name"]), _normalise(name)
+    lock = re.sub(rf'^name = "{re.escape(old)}"$', f'name = "{new}"', lock, flags=re.MULTILINE)
+    (project / "uv.lock").write_text(lock)
+
+
+def link_tree(src: Path, dst: Path, old_prefix: str, new_prefix: str) -> None:
+    """Recreate *src* at *dst* with hard links.
+
+    Scripts that embed *old_prefix* (entry-point shebangs, activate scripts)
+    are rewritten as new files so the link never alters the source tree.
+    """
+    for directory, dirnames, filenames in os.walk(src):
+        base = Path(directory)
+        target = dst / base.relative_to(src)
+        target.mkdir(parents=True, exist_ok=True)
+        in_scripts = base.relative_to(src).parts[:1] in [(d,) for d in _SCRIPT_DIRS]
+
+        for name in [*dirnames, *filenames]:
+            path = base / name
+            if path.is_symlink():
+                (target / name).symlink_to(os.readlink(path))
+                if name in dirnames:
+                    dirnames.remove(name)
+        for name in filenames:
+            path = base / name
+            if path.is_symlink():
+                continue
+            if in_scripts:
+                data = path.read_bytes()
+                if old_prefix.encode() in data:
+                    (target / name).write_bytes(data.replace(old_prefix.encode(), new_prefix.encode()))
+                    shutil.copymode(path, target / name)
+                    continue
+            try:
+                os.link(path, target / name)
+            except OSError:
+                # Cross-device or unsupported filesystem: fall back to a copy.
+                shutil.copy2(path, target / name)
+
+
+def _normalise(name: str) -> str:
+    """Normalise a project name the way uv.lock records it (PEP 503)."""
+    return re.sub(r"[-_.]+", "-", name).lower()
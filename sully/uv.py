@@ -1,5 +1,6 @@
 """Wrapper around uv subprocess calls."""
 
+import os
 import shutil
 import subprocess
 import sys
@@ -18,23 +19,39 @@ def ensure_uv() -> str:
     return uv
 
 
-def _run(args: list[str], *, cwd: Path | None = None, check: bool = True) -> subprocess.CompletedProcess[str]:
+def _run(
+    args: list[str],
+    *,
+    cwd: Path | None = None,
+    check: bool = True,
+    env: dict[str, str] | None = None,
+) -> subprocess.CompletedProcess[str]:
     """Run a uv command, forwarding stdout/stderr to the terminal."""
     uv = ensure_uv()
     return subprocess.run(
         [uv, *args],
         cwd=cwd,
         check=check,
+        env={**os.environ, **env} if env else None,
     )
 
 
-def add(packages: list[str], *, dev: bool = False, group: str | None = None, cwd: Path | None = None) -> None:
-    """Add dependencies via `uv add`."""
+def add(
+    packages: list[str],
+    *,
+    dev: bool = False,
+    group: str | None = None,
+    cwd: Path | None = None,
+    find_links: Path | None = None,
+) -> None:
+    """Add dependencies via `uv add`, also resolving from the local wheel directory *find_links*."""
     args = ["add"]
     if dev:
         args.append("--dev")
     elif group:
         args.extend(["--group", group])
+    if find_links is not None:
+        args.extend(["--find-links", str(find_links)])
     args.extend(packages)
     _run(args, cwd=cwd)
 
@@ -44,9 +61,20 @@ def remove(packages: list[str], *, cwd: Path | None = None) -> None:
     _run(["remove", *packages], cwd=cwd)
 
 
-def sync(*, cwd: Path | None = None) -> None:
-    """Install all dependencies via `uv sync`."""
-    _run(["sync"], cwd=cwd)
+def sync(*, cwd: Path | None = None, find_links: Path | None = None) -> None:
+    """Install all dependencies via `uv sync`, also resolving from *find_links* if given."""
+    args = ["sync"]
+    if find_links is not None:
+        args.extend(["--find-links", str(find_links)])
+    _run(args, cwd=cwd)
+
+
+def lock(*, cwd: Path | None = None, find_links: Path | None = None) -> None:
+    """Resolve dependencies into uv.lock via `uv lock`, without installing anything."""
+    args = ["lock"]
+    if find_links is not None:
+        args.extend(["--find-links", str(find_links)])
+    _run(args, cwd=cwd)
 
 
 def run_script(script: str, *, cwd: Path | None = None) -> subprocess.CompletedProcess[str]:
@@ -54,9 +82,15 @@ def run_script(script: str, *, cwd: Path | None = None) -> subprocess.CompletedP
     return _run(["run", "python", script], cwd=cwd, check=False)
 
 
-def run_cmd(args: list[str], *, cwd: Path | None = None, check: bool = True) -> subprocess.CompletedProcess[str]:
-    """Run an arbitrary command via `uv run <args>`."""
-    return _run(["run", *args], cwd=cwd, check=check)
+def run_cmd(
+    args: list[str],
+    *,
+    cwd: Path | None = None,
+    check: bool = True,
+    env: dict[str, str] | None = None,
+) -> subprocess.CompletedProcess[str]:
+    """Run an arbitrary command via `uv run <args>`, with *env* added to the environment."""
+    return _run(["run", *args], cwd=cwd, check=check, env=env)
 
 
 def pin_python(version: str, *, cwd: Path | None = None) -> None:
@@ -67,3 +101,87 @@ def pin_python(version: str, *, cwd: Path | None = None) -> None:
 def python_install(version: str, *, cwd: Path | None = None) -> None:
     """Install a Python version via `uv python install`."""
     _run(["python", "install", version], cwd=cwd)
+
+
+def run_with(
+    args: list[str],
+    *,
+    with_: list[str],
+    isolated: bool = False,
+    cwd: Path | None = None,
+    check: bool = True,
+) -> subprocess.CompletedProcess[str]:
+    """Run a command via `uv run --with <pkg>...`; *isolated* skips the project environment."""
+    flags = ["run"]
+    if isolated:
+        flags.extend(["--isolated", "--no-project"])
+    for pkg in with_:
+        flags.extend(["--with", pkg])
+    return _run([*flags, *args], cwd=cwd, check=check)
+
+
+def build(*, out_dir: Path, cwd: Path | None = None) -> subprocess.CompletedProcess[str]:
+    """Build a wheel via `uv build --wheel`."""
+    return _run(["build", "--wheel", "--out-dir", str(out_dir)], cwd=cwd, check=False)
+
+
+def export_requirements(output: Path, *, cwd: Path | None = None, all_groups: bool = False) -> None:
+    """Write the locked dependencies to *output* via `uv export` (runtime only unless *all_groups*)."""
+    args = ["export", "--frozen", "--all-groups" if all_groups else "--no-dev", "--no-emit-project"]
+    _run([*args, "--format", "requirements-txt", "--output-file", str(output)], cwd=cwd)
+
+
+def pip_install_target(requirements: Path, target: Path, *, cwd: Path | None = None) -> None:
+    """Install *requirements* into the flat directory *target* via `uv pip install --target`."""
+    _run(["pip", "install", "--target", str(target), "-r", str(requirements)], cwd=cwd)
+
+
+def download_wheels(
+    args: list[str],
+    dest: Path,
+    *,
+    python_version: str,
+    cwd: Path | None = None,
+) -> subprocess.CompletedProcess[str]:
+    """Download binary wheels for *args* (requirements or ``-r file``) into *dest* via `pip download`."""
+    pip = ["python", "-m", "pip", "download", "--only-binary=:all:", "--python-version", python_version]
+    return run_with([*pip, "--dest", str(dest), *args], with_=["pip"], isolated=True, cwd=cwd, check=False)
+
+
+def _capture(
+    args: list[str],
+    *,
+    cwd: Path | None = None,
+    env: dict[str, str] | None = None,
+    merge_stderr: bool = True,
+) -> subprocess.CompletedProcess[str]:
+    """Run a uv command, capturing stdout and stderr as text, together unless *merge_stderr* is False."""
+    uv = ensure_uv()
+    return subprocess.run(
+        [uv, *args],
+        cwd=cwd,
+        check=False,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT if merge_stderr else subprocess.PIPE,
+        text=True,
+        env={**os.environ, **env} if env else None,
+    )
+
+
+def run_captured(
+    args: list[str],
+    *,
+    cwd: Path | None = None,
+    env: dict[str, str] | None = None,
+    merge_stderr: bool = True,
+) -> subprocess.CompletedProcess[str]:
+    """Run `uv run <args>` and capture stdout and stderr together as text.
+
+    Pass ``merge_stderr=False`` to keep stderr out of stdout, e.g. when stdout is machine-readable.
+    """
+    return _capture(["run", *args], cwd=cwd, env=env, merge_stderr=merge_stderr)
+
+
+def sync_captured(*, cwd: Path | None = None) -> subprocess.CompletedProcess[str]:
+    """Run `uv sync` and capture its output instead of streaming it."""
+    return _capture(["sync"], cwd=cwd)
@@ -0,0 +1,66 @@
+"""Local wheel mirror: pre-download locked wheels so installs need no network.
+
+``sully cache warm`` fills the directory; ``sully init``, ``sync`` and ``add``
+pass it to uv as ``--find-links`` whenever it holds any wheels.
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+from sully import uv
+from sully.config import DEV_GROUP, get_cache_config, user_cache_dir
+
+
+def wheel_dir(start: Path | None = None) -> Path:
+    """Return the configured wheel directory, or the default one outside a project."""
+    try:
+        return Path(get_cache_config(start)["wheels"]).expanduser()
+    except FileNotFoundError:
+        return user_cache_dir() / "wheels"
+
+
+def find_links(start: Path | None = None) -> Path | None:
+    """Return the wheel directory if it has been warmed, else None."""
+    directory = wheel_dir(start)
+    return directory if directory.is_dir() and any(directory.glob("*.whl")) else None
+
+
+def python_versions(root: Path | None, requested: list[str]) -> list[str]:
+    """Pick the Python versions to download for: explicit, configured, pinned, then the running one."""
+    if requested:
+        return requested
+    if root is not None:
+        configured = get_cache_config(root)["pythons"]
+        if configured:
+            return configured
+        pin = root / ".python-version"
+        if pin.is_file():
+            return [pin.read_text().strip()]
+    return [f"{sys.version_info.major}.{sys.version_info.minor}"]
+
+
+def warm(root: Path | None, dest: Path, pythons: list[str]) -> list[str]:
+    """Download the project's locked wheels and sully's dev group into *dest*.
+
+    Returns a message for every download that failed (e.g. a package with no
+    wheel for that Python version); the rest of the mirror is still usable.
+    """
+    dest.mkdir(parents=True, exist_ok=True)
+    failures: list[str] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        requirements: Path | None = None
+        if root is not None and (root / "uv.lock").is_file():
+            requirements = Path(tmp) / "requirements.txt"
+            uv.export_requirements(requirements, cwd=root, all_groups=True)
+
+        for version in pythons:
+            # Locked requirements carry hashes, so they are fetched separately from the unpinned dev group.
+            batches = [["-r", str(requirements)]] if requirements is not None else []
+            batches.append(DEV_GROUP)
+            for batch in batches:
+                result = uv.download_wheels(batch, dest, python_version=version, cwd=root)
+                if result.returncode != 0:
+                    what = "uv.lock" if batch[0] == "-r" else ", ".join(batch)
+                    failures.append(f"Python {version}: could not download wheels for {what}")
+    return failures
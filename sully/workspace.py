@@ -0,0 +1,126 @@
+"""Discover uv workspaces and run sully commands across their members."""
+
+import os
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import NamedTuple
+
+import tomlkit
+
+
+class Member(NamedTuple):
+    """A workspace member package."""
+
+    name: str
+    path: Path
+
+
+class MemberResult(NamedTuple):
+    """Outcome of running one command in one member."""
+
+    member: Member
+    returncode: int
+    output: str
+    seconds: float
+
+
+def find_workspace_root(start: Path | None = None) -> Path:
+    """Walk up from *start* (default: cwd) to the pyproject.toml declaring [tool.uv.workspace]."""
+    current = (start or Path.cwd()).resolve()
+    while True:
+        candidate = current / "pyproject.toml"
+        if candidate.is_file() and "workspace" in _uv_table(candidate):
+            return current
+        parent = current.parent
+        if parent == current:
+            break
+        current = parent
+    raise FileNotFoundError("No uv workspace ([tool.uv.workspace]) found in any parent directory.")
+
+
+def _uv_table(pyproject: Path) -> dict:
+    return tomlkit.loads(pyproject.read_text()).get("tool", {}).get("uv", {})
+
+
+def members(root: Path) -> list[Member]:
+    """Return the workspace members of *root*, including the root if it is itself a project."""
+    doc = tomlkit.loads((root / "pyproject.toml").read_text())
+    ws = doc.get("tool", {}).get("uv", {}).get("workspace", {})
+    excluded = {p.resolve() for pattern in ws.get("exclude", []) for p in root.glob(pattern)}
+
+    paths: list[Path] = [root] if "project" in doc else []
+    for pattern in ws.get("members", []):
+        for path in sorted(root.glob(pattern)):
+            path = path.resolve()
+            if path not in excluded and (path / "pyproject.toml").is_file() and path not in paths:
+                paths.append(path)
+
+    found: list[Member] = []
+    for path in paths:
+        project = tomlkit.loads((path / "pyproject.toml").read_text()).get("project", {})
+        found.append(Member(str(project.get("name", path.name)), path))
+    return found
+
+
+def changed_members(root: Path, candidates: list[Member], base: str = "HEAD") -> list[Member]:
+    """Return members with files changed relative to git *base* (including untracked files).
+
+    Raises RuntimeError with git's message if *root* isn't in a git repository or *base* is unknown.
+    """
+
+    def git(*args: str) -> list[str]:
+        try:
+            proc = subprocess.run(["git", *args], cwd=root, capture_output=True, text=True, check=True)
+        except FileNotFoundError as exc:
+            raise RuntimeError("git is not installed; --changed needs it.") from exc
+        except subprocess.CalledProcessError as exc:
+            raise RuntimeError(f"git {args[0]} failed: {exc.stderr.strip()}") from exc
+        return proc.stdout.splitlines()
+
+    top = Path(git("rev-parse", "--show-toplevel")[0]).resolve()
+    lines = [*git("diff", "--name-only", base), *git("ls-files", "--others", "--exclude-standard")]
+    changed = [top / line for line in lines if line]
+
+    # Attribute each file to its most specific member so the root doesn't swallow everything.
+    by_depth = sorted(candidates, key=lambda m: len(m.path.parts), reverse=True)
+    hit: set[Member] = set()
+    for path in changed:
+        for member in by_depth:
+            if path.is_relative_to(member.path):
+                hit.add(member)
+                break
+    return [m for m in candidates if m in hit]
+
+
+def run_in_members(
+    command: list[str],
+    targets: list[Member],
+    *,
+    jobs: int | None = None,
+    on_done: Callable[[MemberResult], None] | None = None,
+) -> list[MemberResult]:
+    """Run ``sully <command>`` in every target concurrently with at most *jobs* at once.
+
+    *on_done* is called from worker threads as each member finishes.
+    """
+
+    def run_one(member: Member) -> MemberResult:
+        start = time.perf_counter()
+        proc = subprocess.run(
+            [sys.executable, "-m", "sully", *command],
+            cwd=member.path,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+        )
+        result = MemberResult(member, proc.returncode, proc.stdout, time.perf_counter() - start)
+        if on_done is not None:
+            on_done(result)
+        return result
+
+    with ThreadPoolExecutor(max_workers=jobs or os.cpu_count() or 1) as pool:
+        return list(pool.map(run_one, targets))
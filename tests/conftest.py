@@ -0,0 +1,15 @@
+"""Shared fixtures for the sully test suite."""
+
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolated_user_cache(tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep every test away from the real ~/.cache/sully and any shared cache server."""
+    cache = tmp_path_factory.mktemp("sully-cache")
+    monkeypatch.setenv("SULLY_CACHE_DIR", str(cache))
+    monkeypatch.delenv("SULLY_CACHE_URL", raising=False)
+    monkeypatch.delenv("SULLY_CACHE", raising=False)
+    return cache
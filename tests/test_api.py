@@ -0,0 +1,143 @@
+"""Tests for sully.api — the in-process, non-exiting API."""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sully import api
+
+_PYRIGHT_JSON = json.dumps(
+    {
+        "generalDiagnostics": [
+            {
+                "file": "/p/src/app/core.py",
+                "severity": "error",
+                "message": 'Type "int" is not assignable to "str"',
+                "range": {"start": {"line": 4, "character": 8}, "end": {"line": 4, "character": 9}},
+                "rule": "reportAssignmentType",
+            }
+        ]
+    }
+)
+
+
+def _project(tmp_path: Path, name: str = "app", sully: str = "") -> Path:
+    root = tmp_path / name
+    (root / "src" / name).mkdir(parents=True)
+    (root / "src" / name / "__init__.py").write_text("")
+    (root / "pyproject.toml").write_text(f'[project]\nname = "{name}"\n\n[tool.sully]\n{sully}')
+    return root
+
+
+def test_check_returns_pyright_and_perf_diagnostics(tmp_path: Path) -> None:
+    root = _project(tmp_path)
+    (root / "src" / "app" / "slow.py").write_text("import re\n\ndef f(xs):\n    for x in xs:\n        re.match('a', x)\n")
+    with patch("sully.api.uv") as mock_uv:
+        mock_uv.run_captured.return_value = MagicMock(returncode=1, stdout=_PYRIGHT_JSON)
+        result = api.check(root)
+
+    assert not result.ok
+    assert result.project == root.resolve()
+    assert mock_uv.run_captured.call_args.args[0] == ["pyright", "--level=strict", "--outputjson"]
+    assert mock_uv.run_captured.call_args.kwargs["cwd"] == root.resolve()
+    assert mock_uv.run_captured.call_args.kwargs["merge_stderr"] is False
+    rules = {d.rule for d in result.diagnostics}
+    assert {"reportAssignmentType", "reportRegexInLoop"} <= rules
+    pyright = next(d for d in result.diagnostics if d.rule == "reportAssignmentType")
+    assert (pyright.line, pyright.col) == (5, 9)
+    assert set(result.timings) == {"pyright", "perf"}
+
+
+def test_check_raises_when_pyright_output_is_not_json(tmp_path: Path) -> None:
+    root = _project(tmp_path)
+    with patch("sully.api.uv") as mock_uv:
+        mock_uv.run_captured.return_value = MagicMock(returncode=1, stdout="", stderr="npm ERR! network\n")
+        with pytest.raises(RuntimeError, match="npm ERR! network"):
+            api.check(root)
+
+
+def test_check_mode_off_skips_pyright(tmp_path: Path) -> None:
+    root = _project(tmp_path, sully='[tool.sully.check]\nmode = "off"\n')
+    with patch("sully.api.uv") as mock_uv:
+        result = api.check(root)
+    assert result.ok
+    mock_uv.run_captured.assert_not_called()
+
+
+def test_check_missing_project(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        api.check(tmp_path)
+
+
+def test_missing_uv_raises(tmp_path: Path) -> None:
+    root = _project(tmp_path)
+    with patch("sully.api.uv") as mock_uv:
+        mock_uv.ensure_uv.side_effect = SystemExit("Error: uv is not installed.")
+        with pytest.raises(RuntimeError, match="uv is not installed"):
+            api.sync(root)
+
+
+def test_test_passes_args_and_reports_artifact(tmp_path: Path) -> None:
+    root = _project(tmp_path)
+
+    def fake_run(args: list[str], *, cwd: Path, env: dict[str, str] | None) -> MagicMock:
+        Path(args[1].removeprefix("--junitxml=")).write_text("<testsuites/>")
+        return MagicMock(returncode=0, stdout="1 passed\n")
+
+    with patch("sully.api.uv") as mock_uv:
+        mock_uv.run_captured.side_effect = fake_run
+        result = api.test(root, ["-x"])
+    assert result.ok
+    assert mock_uv.run_captured.call_args.args[0][-1] == "-x"
+    assert result.artifacts == (root.resolve() / ".sully" / "reports" / "junit.xml",)
+
+
+def test_doc_returns_output_dir(tmp_path: Path) -> None:
+    root = _project(tmp_path)
+
+    def fake_run(args: list[str], *, cwd: Path) -> MagicMock:
+        (cwd / "docs").mkdir()
+        return MagicMock(returncode=0, stdout="")
+
+    with patch("sully.api.uv") as mock_uv:
+        mock_uv.run_captured.side_effect = fake_run
+        result = api.doc(root)
+    assert result.ok
+    assert result.artifacts == (root.resolve() / "docs",)
+
+
+def test_run_stops_at_failed_gate(tmp_path: Path) -> None:
+    root = _project(tmp_path, sully='main = "src/app/main.py"\n')
+    with patch("sully.api.uv") as mock_uv:
+        mock_uv.run_captured.return_value = MagicMock(returncode=1, stdout=_PYRIGHT_JSON)
+        result = api.run(root)
+    assert result.returncode == 1
+    assert len(result.diagnostics) == 1
+    assert "main" not in result.timings
+
+
+def test_run_without_gates(tmp_path: Path) -> None:
+    root = _project(tmp_path, sully='main = "src/app/main.py"\n')
+    with patch("sully.api.uv") as mock_uv:
+        mock_uv.run_captured.return_value = MagicMock(returncode=0, stdout="hello\n")
+        result = api.run(root, no_check=True, no_doc=True)
+    assert result.ok
+    assert result.output == "hello\n"
+    mock_uv.run_captured.assert_called_once_with(["python", "src/app/main.py"], cwd=root.resolve())
+
+
+def test_run_requires_main(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="No main script configured"):
+        api.run(_project(tmp_path))
+
+
+def test_concurrent_calls_keep_projects_apart(tmp_path: Path) -> None:
+    roots = [_project(tmp_path, f"p{i}") for i in range(8)]
+    with patch("sully.api.uv") as mock_uv:
+        mock_uv.sync_captured.side_effect = lambda *, cwd: MagicMock(returncode=0, stdout=cwd.name)
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(api.sync, roots))
+    assert [r.output for r in results] == [f"p{i}" for i in range(8)]
@@ -0,0 +1,128 @@
+"""Tests for sully.bench — complexity fitting and the sully_bench runner."""
+
+import math
+import os
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from sully.bench import (
+    Fit,
+    ScalingResult,
+    fit_complexity,
+    load_baseline,
+    regressions,
+    run_benchmarks,
+    save_baseline,
+    scaling_results,
+)
+
+SIZES = [2**k for k in range(4, 15)]
+
+BENCHES = """\
+def bench_fixed():
+    sum(range(100))
+
+
+def bench_copy(n):
+    xs = list(range(n))
+    return lambda: list(xs)
+
+
+def bench_broken(n):
+    raise ValueError("boom")
+"""
+
+
+def _run_here(args: list[str], *, cwd: Path, env: dict[str, str]) -> subprocess.CompletedProcess[str]:
+    """Stand in for `uv run` by running the runner with this interpreter."""
+    return subprocess.run(
+        [sys.executable, *args[1:]], cwd=cwd, capture_output=True, text=True, env={**os.environ, **env}
+    )
+
+
+CLASSES = {
+    "O(1)": lambda n: 1.0,
+    "O(log n)": lambda n: math.log2(n),
+    "O(n)": lambda n: n,
+    "O(n log n)": lambda n: n * math.log2(n),
+    "O(n^2)": lambda n: n * n,
+    "O(n^3)": lambda n: n**3,
+}
+NOISE = [1.0, 1.04, 0.97, 1.02, 0.99, 1.05, 0.96, 1.01, 1.03, 0.98, 1.0]
+
+
+@pytest.mark.parametrize("complexity", list(CLASSES))
+def test_fit_recovers_class(complexity: str) -> None:
+    f = CLASSES[complexity]
+    assert fit_complexity(SIZES, [3e-9 * f(n) * e for n, e in zip(SIZES, NOISE)]).complexity == complexity
+
+
+@pytest.mark.parametrize("complexity", ["O(1)", "O(n)", "O(n^2)", "O(n^3)"])
+def test_fit_polynomial_degree_survives_call_overhead(complexity: str) -> None:
+    f = CLASSES[complexity]
+    growth = 2e-6 / f(SIZES[-1])  # the n-dependent part is 10x the overhead at the largest n
+    assert fit_complexity(SIZES, [(2e-7 + growth * f(n)) * e for n, e in zip(SIZES, NOISE)]).complexity == complexity
+
+
+def test_fit_memory_floor_treats_tiny_allocations_as_constant() -> None:
+    assert fit_complexity(SIZES, [56.0] * 6 + [88.0] * 5, floor=1024).complexity == "O(1)"
+
+
+def _result(name: str, time: str, memory: str = "O(1)") -> ScalingResult:
+    return ScalingResult(name, SIZES, Fit(time, 1.0, 0.0), Fit(memory, 1.0, 0.0))
+
+
+def test_regressions_compare_against_baseline() -> None:
+    baseline = {"a:bench_x": {"time": "O(n)", "memory": "O(1)"}, "a:bench_y": {"time": "O(n)", "memory": "O(n)"}}
+    results = [_result("a:bench_x", "O(n^2)"), _result("a:bench_y", "O(n log n)", "O(n)"), _result("new", "O(n^3)")]
+    assert regressions(results, baseline) == ["a:bench_x: time scales as O(n^2), baseline O(n)"]
+    assert regressions(results, baseline, strict=True) == [
+        "a:bench_x: time scales as O(n^2), baseline O(n)",
+        "a:bench_y: time scales as O(n log n), baseline O(n)",
+    ]
+
+
+def test_baseline_round_trip_keeps_other_entries(tmp_path: Path) -> None:
+    path = tmp_path / "benchmarks" / "scaling.json"
+    assert load_baseline(path) == {}
+    save_baseline(path, [_result("a", "O(n)"), _result("b", "O(1)")])
+    save_baseline(path, [_result("a", "O(n log n)", "O(n)")])
+    assert load_baseline(path) == {
+        "a": {"time": "O(n log n)", "memory": "O(n)"},
+        "b": {"time": "O(1)", "memory": "O(1)"},
+    }
+
+
+def test_run_benchmarks_measures_and_fits(tmp_path: Path) -> None:
+    bench_dir = tmp_path / "benchmarks"
+    bench_dir.mkdir()
+    (bench_dir / "lists.py").write_text(BENCHES)
+    with patch("sully.bench.uv") as mock_uv:
+        mock_uv.run_captured.side_effect = _run_here
+        report = run_benchmarks(tmp_path, bench_dir, scaling=True, min_n=256, max_n=4096, min_time=0.001)
+
+    assert set(report["fixed"]) == {"lists:bench_fixed"}
+    assert "ValueError: boom" in report["errors"]["lists:bench_broken"]
+    measured = report["scaling"]["lists:bench_copy"]
+    assert measured["sizes"] == [256, 512, 1024, 2048, 4096]
+    assert measured["peak"][-1] > measured["peak"][0] * 8
+
+    results, too_few = scaling_results(report)
+    assert too_few == []
+    assert results[0].memory.complexity == "O(n)"
+
+
+def test_run_benchmarks_times_scaling_at_one_size_by_default(tmp_path: Path) -> None:
+    bench_dir = tmp_path / "benchmarks"
+    bench_dir.mkdir()
+    (bench_dir / "lists.py").write_text(BENCHES + "\n\ndef bench_stub(n):\n    raise NotImplementedError\n")
+    with patch("sully.bench.uv") as mock_uv:
+        mock_uv.run_captured.side_effect = _run_here
+        report = run_benchmarks(tmp_path, bench_dir, keyword="_", n=100, min_time=0.001)
+    assert set(report["fixed"]) == {"lists:bench_fixed", "lists:bench_copy[n=100]"}
+    assert report["scaling"] == {}
+    assert report["skipped"] == {"lists:bench_stub": "not implemented"}
@@ -0,0 +1,185 @@
+"""Tests for sully.cache — content-addressed artifact cache and backends."""
+
+import io
+import tarfile
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+
+import pytest
+
+from sully import cache
+
+
+class _BlobHandler(BaseHTTPRequestHandler):
+    """Minimal stand-in for a shared cache server."""
+
+    store: dict[str, bytes] = {}
+
+    def do_GET(self) -> None:
+        data = self.store.get(self.path)
+        if data is None:
+            self.send_response(404)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_PUT(self) -> None:
+        self.store[self.path] = self.rfile.read(int(self.headers["Content-Length"]))
+        self.send_response(201)
+        self.end_headers()
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def server() -> Iterator[str]:
+    _BlobHandler.store = {}
+    httpd = HTTPServer(("127.0.0.1", 0), _BlobHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}/cache"
+    httpd.shutdown()
+
+
+def test_local_backend_roundtrip(tmp_path: Path) -> None:
+    backend = cache.LocalBackend(tmp_path)
+    assert backend.get("abcdef") is None
+    backend.put("abcdef", b"data")
+    assert backend.get("abcdef") == b"data"
+    assert (tmp_path / "ab" / "cdef").is_file()
+
+
+def test_http_backend_roundtrip(server: str) -> None:
+    backend = cache.HttpBackend(server)
+    assert backend.get("k1") is None
+    backend.put("k1", b"blob")
+    assert backend.get("k1") == b"blob"
+    assert _BlobHandler.store == {"/cache/k1": b"blob"}
+
+
+def test_http_backend_unreachable_is_a_miss() -> None:
+    backend = cache.HttpBackend("http://127.0.0.1:9", timeout=0.5)
+    assert backend.get("k") is None
+    backend.put("k", b"x")  # must not raise
+
+
+def test_http_backend_bad_url_is_a_miss() -> None:
+    backend = cache.HttpBackend("cache.example.com/no-scheme")
+    assert backend.get("k") is None
+    backend.put("k", b"x")  # must not raise
+
+
+def test_layered_cache_backfills_local(tmp_path: Path, server: str) -> None:
+    remote = cache.HttpBackend(server)
+    remote.put("k", b"from-ci")
+    local = cache.LocalBackend(tmp_path)
+    layered = cache.ArtifactCache([local, remote])
+    assert layered.get("k") == b"from-ci"
+    assert local.get("k") == b"from-ci"
+
+
+def test_layered_cache_push_disabled(tmp_path: Path, server: str) -> None:
+    layered = cache.ArtifactCache([cache.LocalBackend(tmp_path), cache.HttpBackend(server)], push=False)
+    layered.put_json("k", {"a": 1})
+    assert layered.get_json("k") == {"a": 1}
+    assert _BlobHandler.store == {}
+
+
+def test_input_key_tracks_contents_and_extra(tmp_path: Path) -> None:
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "a.py").write_text("x = 1\n")
+    (tmp_path / "src" / "__pycache__").mkdir()
+    (tmp_path / "src" / "__pycache__" / "a.pyc").write_bytes(b"1")
+    base = cache.input_key("pyright", tmp_path, ["src", "missing.toml"])
+
+    (tmp_path / "src" / "__pycache__" / "a.pyc").write_bytes(b"2")
+    assert cache.input_key("pyright", tmp_path, ["src", "missing.toml"]) == base
+    assert cache.input_key("pyright", tmp_path, ["src"], {"mode": "basic"}) != base
+    assert cache.input_key("pdoc", tmp_path, ["src"]) != base
+
+    (tmp_path / "src" / "a.py").write_text("x = 2\n")
+    assert cache.input_key("pyright", tmp_path, ["src"]) != base
+
+
+def test_pack_unpack_dir(tmp_path: Path) -> None:
+    src = tmp_path / "docs"
+    (src / "pkg").mkdir(parents=True)
+    (src / "index.html").write_text("<html/>")
+    (src / "pkg" / "mod.html").write_text("mod")
+    dest = tmp_path / "restored"
+    dest.mkdir()
+    (dest / "stale.html").write_text("old")
+
+    assert cache.unpack_dir(cache.pack_dir(src), dest)
+    assert (dest / "index.html").read_text() == "<html/>"
+    assert (dest / "pkg" / "mod.html").read_text() == "mod"
+    assert not (dest / "stale.html").exists()
+
+
+@pytest.mark.parametrize("filtered", [True, False])
+@pytest.mark.parametrize("absolute", [True, False])
+def test_unpack_dir_never_writes_outside_dest(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, filtered: bool, absolute: bool
+) -> None:
+    if not filtered:
+        monkeypatch.delattr(tarfile, "data_filter", raising=False)
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as tar:
+        info = tarfile.TarInfo(str(tmp_path / "escaped.html") if absolute else "../escaped.html")
+        info.size = 4
+        tar.addfile(info, io.BytesIO(b"evil"))
+    dest = tmp_path / "restored"
+    dest.mkdir()
+    (dest / "index.html").write_text("kept")
+
+    unpacked = cache.unpack_dir(buffer.getvalue(), dest)
+    assert not (tmp_path / "escaped.html").exists()
+    if filtered and absolute:  # the data filter strips the leading "/" instead of refusing
+        assert unpacked
+    else:
+        assert not unpacked
+        assert (dest / "index.html").read_text() == "kept"
+    assert [p.name for p in tmp_path.iterdir()] == ["restored"]
+
+
+def test_unpack_dir_treats_a_corrupt_blob_as_a_miss(tmp_path: Path) -> None:
+    src = tmp_path / "docs"
+    src.mkdir()
+    (src / "index.html").write_text("<html/>" * 1000)
+    dest = tmp_path / "restored"
+    dest.mkdir()
+    (dest / "index.html").write_text("kept")
+    blob = cache.pack_dir(src)
+    for bad in (blob[: len(blob) // 2], b"not a tarball"):
+        assert not cache.unpack_dir(bad, dest)
+        assert (dest / "index.html").read_text() == "kept"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["docs", "restored"]
+
+
+def test_get_json_treats_a_corrupt_blob_as_a_miss(tmp_path: Path) -> None:
+    layered = cache.ArtifactCache([cache.LocalBackend(tmp_path)])
+    for blob in (b"<html>502 Bad Gateway</html>", b"\xff\xfe", b"[1, 2]"):
+        layered.put("k", blob)
+        assert layered.get_json("k") is None
+
+
+def test_artifact_cache_disabled_by_default(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    (tmp_path / "pyproject.toml").write_text("[tool.sully]\n")
+    monkeypatch.chdir(tmp_path)
+    assert cache.artifact_cache() is None
+
+
+def test_artifact_cache_enabled_by_url_env(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    (tmp_path / "pyproject.toml").write_text("[tool.sully]\n")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("SULLY_CACHE_URL", "http://cache.internal/sully")
+    layered = cache.artifact_cache()
+    assert layered is not None
+    assert isinstance(layered.backends[0], cache.LocalBackend)
+    assert isinstance(layered.backends[1], cache.HttpBackend)
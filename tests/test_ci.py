@@ -0,0 +1,39 @@
+"""Tests for sully.ci — the generated GitHub Actions workflow."""
+
+import pytest
+
+from sully.ci import render_workflow
+
+
+def test_jobs_run_in_parallel_with_caches() -> None:
+    workflow = render_workflow("3.13")
+    for job in ("check", "test", "doc"):
+        assert f"\n  {job}:\n    runs-on: ubuntu-latest\n" in workflow
+    assert "needs:" not in workflow.split("deploy-docs:")[0]
+    assert workflow.count("enable-cache: true") == 3
+    assert workflow.count("cache-dependency-glob: uv.lock") == 3
+    assert "key: sully-check-${{ runner.os }}-${{ hashFiles('uv.lock') }}-${{ github.sha }}" in workflow
+    assert 'SULLY_CACHE: "1"' in workflow
+    assert "uv python install 3.13" in workflow
+
+
+def test_tests_are_sharded() -> None:
+    workflow = render_workflow("3.12", shards=4)
+    assert "shard: [1, 2, 3, 4]" in workflow
+    assert "uv run sully test --shard ${{ matrix.shard }}/4" in workflow
+    assert "sully-test-${{ matrix.shard }}-" in workflow
+
+
+def test_deploy_reuses_docs_artifact() -> None:
+    workflow = render_workflow("3.12", docs="site")
+    doc_job = workflow.split("\n  doc:\n")[1].split("deploy-docs:")[0]
+    deploy = workflow.split("deploy-docs:")[1]
+    assert "path: site/" in doc_job
+    assert "needs: [check, test, doc]" in deploy
+    assert "actions/deploy-pages@v4" in deploy
+    assert "uv sync" not in deploy and "sully doc" not in deploy
+
+
+def test_rejects_zero_shards() -> None:
+    with pytest.raises(ValueError):
+        render_workflow("3.12", shards=0)
@@ -39,7 +39,10 @@ def test_remove_requires_package() -> None:
 
 def test_all_commands_registered() -> None:
     """Every planned command should be present in the CLI group."""
-    expected = {"init", "add", "remove", "sync", "check", "run", "test", "doc"}
+    expected = {
+        "init", "add", "remove", "sync", "check", "run", "test", "doc",
+        "lazify", "build", "bundle", "workspace", "do", "cache", "deps", "ci", "load", "bench", "fuzz", "stubs",
+    }
     actual = set(cli.commands.keys())
     assert expected == actual
 
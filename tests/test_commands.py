@@ -1,6 +1,10 @@
 """Tests for sully commands — error paths and edge cases."""
 
+import json
 import subprocess
+import sys
+import zipfile
+from collections.abc import Callable
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
@@ -8,6 +12,11 @@ import pytest
 from click.testing import CliRunner
 
 from sully.cli import cli
+from sully.commands.bundle import entry_module
+from sully.fuzz import FuzzCase, FuzzResult
+from sully.load import LoadReport
+from sully.stubs import StubReport
+from sully.workspace import Member, MemberResult
 
 
 # ---------------------------------------------------------------------------
@@ -157,6 +166,58 @@ class TestRun:
             result = runner.invoke(cli, ["run"])
         mock_uv.run_cmd.assert_not_called()
 
+    def test_run_loop_monitor_wraps_script(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """--loop-monitor should run the script under the sully_loop runner."""
+        (tmp_path / "pyproject.toml").write_text(
+            '[tool.sully]\nmain = "main.py"\n\n'
+            '[tool.sully.check]\nmode = "off"\n\n'
+            '[tool.sully.doc]\ndoc-before-run = false\n\n'
+            '[tool.sully.loop]\nthreshold-ms = 25\n'
+        )
+        monkeypatch.chdir(tmp_path)
+        with patch("sully.commands.run.uv") as mock_uv:
+            mock_uv.run_cmd.return_value = MagicMock(returncode=0)
+            result = CliRunner().invoke(cli, ["run", "--loop-monitor"])
+        assert result.exit_code == 0, result.output
+        mock_uv.run_script.assert_not_called()
+        args = mock_uv.run_cmd.call_args[0][0]
+        assert args == ["python", "-m", "sully_loop", "--threshold-ms=25.0", "--top=10", "main.py"]
+        assert "PYTHONPATH" in mock_uv.run_cmd.call_args.kwargs["env"]
+
+    def test_run_runtime_types_wraps_script(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """--runtime-types should run the script under the sully_types runner with the configured sampling."""
+        (tmp_path / "pyproject.toml").write_text(
+            '[tool.sully]\nmain = "src/app/main.py"\n\n'
+            '[tool.sully.check]\nmode = "off"\n\n'
+            '[tool.sully.doc]\ndoc-before-run = false\n\n'
+            '[tool.sully.runtime-types]\nsample = 50\nfail = true\n'
+        )
+        (tmp_path / "src").mkdir()
+        monkeypatch.chdir(tmp_path)
+        with patch("sully.commands.run.uv") as mock_uv:
+            mock_uv.run_cmd.return_value = MagicMock(returncode=0)
+            result = CliRunner().invoke(cli, ["run", "--runtime-types"])
+        assert result.exit_code == 0, result.output
+        args = mock_uv.run_cmd.call_args[0][0]
+        assert args == [
+            "python",
+            "-m",
+            "sully_types",
+            f"--src={tmp_path.resolve() / 'src'}",
+            "--first=10",
+            "--sample=50",
+            "--top=20",
+            "--fail",
+            "src/app/main.py",
+        ]
+
+    def test_run_rejects_two_runners(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        (tmp_path / "pyproject.toml").write_text('[tool.sully]\nmain = "main.py"\n')
+        monkeypatch.chdir(tmp_path)
+        result = CliRunner().invoke(cli, ["run", "--loop-monitor", "--runtime-types"])
+        assert result.exit_code == 2
+        assert "can't be combined" in result.output
+
     def test_run_doc_gate_fails_blocks_execution(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
         """When doc generation fails, the script should NOT run."""
         (tmp_path / "pyproject.toml").write_text(
@@ -412,3 +473,1131 @@ class TestDoc:
         runner = CliRunner()
         result = runner.invoke(cli, ["doc"])
         assert result.exit_code != 0
+
+
+# ---------------------------------------------------------------------------
+# sully check --imports
+# ---------------------------------------------------------------------------
+
+class TestCheckImports:
+    def test_imports_flags_deferrable_import(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        (tmp_path / "pyproject.toml").write_text('[tool.sully.check]\nmode = "off"\n')
+        src = tmp_path / "src" / "pkg"
+        src.mkdir(parents=True)
+        (src / "mod.py").write_text("import pandas\n\ndef f() -> None:\n    pandas.DataFrame()\n")
+        monkeypatch.chdir(tmp_path)
+        runner = CliRunner()
+        result = runner.invoke(cli, ["check", "--imports"])
+        assert result.exit_code != 0
+        assert "mod.py:1:1 - warning" in result.output
+        assert "reportDeferrableImport" in result.output
+
+    def test_imports_respects_configured_heavy_modules(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        (tmp_path / "pyproject.toml").write_text(
+            '[tool.sully.check]\nmode = "off"\nheavy-imports = ["json"]\n'
+        )
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "mod.py").write_text("import json\n\ndef f() -> str:\n    return json.dumps(1)\n")
+        monkeypatch.chdir(tmp_path)
+        runner = CliRunner()
+        result = runner.invoke(cli, ["check", "--imports"])
+        assert result.exit_code != 0
+        assert '"json"' in result.output
+
+    def test_imports_clean(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        (tmp_path / "pyproject.toml").write_text('[tool.sully.check]\nmode = "off"\n')
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "mod.py").write_text("def f() -> None:\n    import pandas\n")
+        monkeypatch.chdir(tmp_path)
+        runner = CliRunner()
+        result = runner.invoke(cli, ["check", "--imports"])
+        assert result.exit_code == 0
+        assert "no deferrable heavy imports" in result.output
+
+
+# ---------------------------------------------------------------------------
+# sully lazify
+# ---------------------------------------------------------------------------
+
+class TestLazify:
+    def test_lazify_rewrites_packages_under_src(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        (tmp_path / "pyproject.toml").write_text("[project]\nname='x'\n")
+        pkg = tmp_path / "src" / "pkg"
+        pkg.mkdir(parents=True)
+        (pkg / "__init__.py").write_text('"""My package."""\nfrom pkg.core import run\n')
+        (pkg / "core.py").write_text("def run() -> None: ...\n")
+        monkeypatch.chdir(tmp_path)
+        runner = CliRunner()
+        result = runner.invoke(cli, ["lazify"])
+
+        assert result.exit_code == 0
+        init = (pkg / "__init__.py").read_text()
+        assert '"""My package."""' in init
+        assert "def __getattr__(name: str) -> object:" in init
+        assert "from .core import run as run" in (pkg / "__init__.pyi").read_text()
+
+    def test_lazify_skips_custom_init(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        (tmp_path / "pyproject.toml").write_text("[project]\nname='x'\n")
+        pkg = tmp_path / "src" / "pkg"
+        pkg.mkdir(parents=True)
+        (pkg / "__init__.py").write_text("SETTING = 1\n")
+        monkeypatch.chdir(tmp_path)
+        runner = CliRunner()
+        result = runner.invoke(cli, ["lazify"])
+
+        assert "use --force" in result.output
+        assert (pkg / "__init__.py").read_text() == "SETTING = 1\n"
+
+    def test_lazify_no_packages(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        (tmp_path / "pyproject.toml").write_text("[project]\nname='x'\n")
+        monkeypatch.chdir(tmp_path)
+        runner = CliRunner()
+        result = runner.invoke(cli, ["lazify"])
+        assert result.exit_code != 0
+        assert "No packages found" in result.output
+
+
+# ---------------------------------------------------------------------------
+# sully check — performance stage
+# ---------------------------------------------------------------------------
+
+_CONCAT_SOURCE = "def f(xs: list[str]) -> str:\n    out = ''\n    for x in xs:\n        out += x\n    return out\n"
+
+
+class TestCheckPerf:
+    def _project(self, tmp_path: Path, config: str, source: str) -> None:
+        (tmp_path / "pyproject.toml").write_text('[tool.sully.check]\nmode = "off"\n\n' + config)
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "mod.py").write_text(source)
+
+    def test_perf_error_fails_check(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        self._project(tmp_path, '[tool.sully.check.perf]\nreportStringConcatInLoop = "error"\n', _CONCAT_SOURCE)
+        monkeypatch.chdir(tmp_path)
+        result = CliRunner().invoke(cli, ["check"])
+        assert result.exit_code != 0
+        assert "mod.py:4:9 - error" in result.output
+        assert "reportStringConcatInLoop" in result.output
+        assert (tmp_path / ".sully" / "cache" / "perf.json").is_file()
+
+    def test_perf_warnings_pass_by_default(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        self._project(tmp_path, "", _CONCAT_SOURCE)
+        monkeypatch.chdir(tmp_path)
+        result = CliRunner().invoke(cli, ["check"])
+        assert result.exit_code == 0
+        assert "warning" in result.output
+        assert "All clear" not in result.output
+
+    def test_list_front_mutation_warns_by_default(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        self._project(tmp_path, "", "def f(q: list[int]) -> int:\n    return q.pop(0)\n")
+        monkeypatch.chdir(tmp_path)
+        result = CliRunner().invoke(cli, ["check"])
+        assert result.exit_code == 0
+        assert "mod.py:2:12 - warning" in result.output
+
+    def test_perf_disabled(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        self._project(
+            tmp_path,
+            "[tool.sully.check.perf]\nenabled = false\n",
+            "def f(q: list[int]) -> int:\n    return q.pop(0)\n",
+        )
+        monkeypatch.chdir(tmp_path)
+        result = CliRunner().invoke(cli, ["check"])
+        assert result.exit_code == 0
+        assert "reportListFrontMutation" not in result.output
+
+
+# ---------------------------------------------------------------------------
+# sully build
+# ---------------------------------------------------------------------------
+
+class TestBuild:
+    def _project(self, tmp_path: Path, build_cfg: str = "") -> Path:
+        (tmp_path / "pyproject.toml").write_text(
+            '[project]\nname = "my-app"\nversion = "0.1.0"\n\n' + build_cfg
+        )
+        pkg = tmp_path / "src" / "my_app"
+        pkg.mkdir(parents=True)
+        (pkg / "__init__.py").write_text("")
+        (pkg / "core.py").write_text("def add(a: int, b: int) -> int:\n    return a + b\n")
+        (pkg / "dyn.py").write_text("def f(x):\n    return x\n")
+        return tmp_path
+
+    def _fake_build(self, out_dir: Path, cwd: Path | None = None) -> MagicMock:
+        out_dir.mkdir(parents=True, exist_ok=True)
+        (out_dir / "my_app-0.1.0-cp312-cp312-linux_x86_64.whl").write_text("")
+        return MagicMock(returncode=0)
+
+    def test_build_plain(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        root = self._project(tmp_path)
+        monkeypatch.chdir(root)
+        with patch("sully.commands.build.uv") as mock_uv:
+            mock_uv.build.return_value = MagicMock(returncode=0)
+            result = CliRunner().invoke(cli, ["build"])
+        assert result.exit_code == 0
+        mock_uv.build.assert_called_once_with(out_dir=root / "dist", cwd=root)
+        mock_uv.run_with.assert_not_called()
+
+    def test_build_compile_requires_modules(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.chdir(self._project(tmp_path))
+        with patch("sully.commands.build.uv"):
+            result = CliRunner().invoke(cli, ["build", "--compile"])
+        assert result.exit_code != 0
+        assert "No modules to compile" in result.output
+
+    def test_build_compile_falls_back_and_verifies(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        root = self._project(tmp_path, '[tool.sully.build]\ncompile = ["src/my_app/*.py"]\n')
+        monkeypatch.chdir(root)
+
+        def run_with(args: list[str], **kwargs: object) -> MagicMock:
+            # mypyc rejects the untyped module; the test run passes.
+            return MagicMock(returncode=1 if args[-1].endswith("dyn.py") else 0)
+
+        with patch("sully.commands.build.uv") as mock_uv:
+            mock_uv.run_with.side_effect = run_with
+            mock_uv.build.side_effect = self._fake_build
+            result = CliRunner().invoke(cli, ["build", "--compile"])
+
+        assert result.exit_code == 0, result.output
+        assert "compiled src/my_app/core.py" in result.output
+        assert "fallback src/my_app/dyn.py" in result.output
+        assert "2/3 module(s) compiled" in result.output
+
+        stage = root / "build" / "sully" / "wheel"
+        setup_py = (stage / "setup.py").read_text()
+        assert "'src/my_app/core.py'" in setup_py
+        assert "dyn.py" not in setup_py
+        assert 'build-backend = "setuptools.build_meta"' in (stage / "pyproject.toml").read_text()
+
+        verify = mock_uv.run_with.call_args_list[-1]
+        assert verify.args[0] == ["pytest"]
+        assert verify.kwargs["isolated"] is True
+        assert verify.kwargs["with_"][0].endswith(".whl")
+
+    def test_build_compile_verify_failure(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        root = self._project(tmp_path, '[tool.sully.build]\ncompile = ["src/my_app/core.py"]\n')
+        monkeypatch.chdir(root)
+        with patch("sully.commands.build.uv") as mock_uv:
+            mock_uv.run_with.side_effect = [MagicMock(returncode=0), MagicMock(returncode=1)]
+            mock_uv.build.side_effect = self._fake_build
+            result = CliRunner().invoke(cli, ["build", "--compile"])
+        assert result.exit_code != 0
+        assert "does not pass the test suite" in result.output
+
+    def test_build_compile_no_verify(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        root = self._project(tmp_path, '[tool.sully.build]\ncompile = ["src/my_app/core.py"]\n')
+        monkeypatch.chdir(root)
+        with patch("sully.commands.build.uv") as mock_uv:
+            mock_uv.run_with.return_value = MagicMock(returncode=0)
+            mock_uv.build.side_effect = self._fake_build
+            result = CliRunner().invoke(cli, ["build", "--compile", "--no-verify"])
+        assert result.exit_code == 0
+        assert mock_uv.run_with.call_count == 1
+
+
+# ---------------------------------------------------------------------------
+# sully bundle
+# ---------------------------------------------------------------------------
+
+class TestBundle:
+    def _project(self, tmp_path: Path) -> Path:
+        (tmp_path / "pyproject.toml").write_text(
+            '[project]\nname = "svc"\nversion = "0.1.0"\n\n[tool.sully]\nmain = "src/svc/main.py"\n'
+        )
+        pkg = tmp_path / "src" / "svc"
+        pkg.mkdir(parents=True)
+        (pkg / "__init__.py").write_text("")
+        (pkg / "py.typed").write_text("")
+        (pkg / "main.py").write_text(
+            "import dep\n\nif __name__ == '__main__':\n    print('hello from', dep.NAME)\n"
+        )
+        return tmp_path
+
+    def _fake_install(self, requirements: Path, target: Path, cwd: Path | None = None) -> None:
+        (target / "dep").mkdir()
+        (target / "dep" / "__init__.py").write_text("NAME = 'dep'\n")
+        (target / "dep" / "__init__.pyi").write_text("NAME: str\n")
+        (target / "dep-1.0.dist-info").mkdir()
+        (target / "dep-1.0.dist-info" / "METADATA").write_text("Name: dep\n")
+        (target / "dep-1.0.dist-info" / "RECORD").write_text("")
+        (target / "bin").mkdir()
+
+    def _real_compileall(self, args: list[str], cwd: Path | None = None, check: bool = True) -> object:
+        return subprocess.run([sys.executable, *args[1:]], cwd=cwd)
+
+    def test_bundle_zipapp_runs(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        root = self._project(tmp_path)
+        monkeypatch.chdir(root)
+        with patch("sully.commands.bundle.uv") as mock_uv:
+            mock_uv.pip_install_target.side_effect = self._fake_install
+            mock_uv.run_cmd.side_effect = self._real_compileall
+            result = CliRunner().invoke(cli, ["bundle"])
+
+        assert result.exit_code == 0, result.output
+        compile_args = mock_uv.run_cmd.call_args[0][0]
+        assert "-b" in compile_args and "unchecked-hash" in compile_args
+
+        pyz = root / "dist" / "svc.pyz"
+        with zipfile.ZipFile(pyz) as zf:
+            names = set(zf.namelist())
+        assert "__main__.py" in names
+        assert "svc/main.pyc" in names
+        assert "dep/__init__.pyi" not in names
+        assert "svc/py.typed" not in names
+        assert "dep-1.0.dist-info/RECORD" not in names
+        assert "dep-1.0.dist-info/METADATA" in names
+        assert not any(n.startswith("bin/") for n in names)
+
+        out = subprocess.run([sys.executable, str(pyz)], capture_output=True, text=True)
+        assert out.stdout.strip() == "hello from dep"
+
+    def test_bundle_dir_format(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        root = self._project(tmp_path)
+        monkeypatch.chdir(root)
+        with patch("sully.commands.bundle.uv") as mock_uv:
+            mock_uv.pip_install_target.side_effect = self._fake_install
+            mock_uv.run_cmd.side_effect = self._real_compileall
+            result = CliRunner().invoke(cli, ["bundle", "--format", "dir"])
+
+        assert result.exit_code == 0, result.output
+        bundle_dir = root / "dist" / "svc"
+        assert list((bundle_dir / "svc" / "__pycache__").glob("main.*.pyc"))
+        out = subprocess.run([sys.executable, str(bundle_dir)], capture_output=True, text=True)
+        assert out.stdout.strip() == "hello from dep"
+
+    def test_bundle_zip_rejects_native_extensions(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        root = self._project(tmp_path)
+        monkeypatch.chdir(root)
+
+        def install(requirements: Path, target: Path, cwd: Path | None = None) -> None:
+            (target / "fast.cpython-312-x86_64-linux-gnu.so").write_text("")
+
+        with patch("sully.commands.bundle.uv") as mock_uv:
+            mock_uv.pip_install_target.side_effect = install
+            result = CliRunner().invoke(cli, ["bundle"])
+        assert result.exit_code != 0
+        assert "--format dir" in result.output
+
+    def test_bundle_requires_main(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        (tmp_path / "pyproject.toml").write_text('[project]\nname = "svc"\n')
+        monkeypatch.chdir(tmp_path)
+        with patch("sully.commands.bundle.uv"):
+            result = CliRunner().invoke(cli, ["bundle"])
+        assert result.exit_code != 0
+        assert "No main script configured" in result.output
+
+    def test_entry_module(self) -> None:
+        assert entry_module("src/svc/main.py") == "svc.main"
+        assert entry_module("app.py") == "app"
+
+
+class TestTestMemory:
+    def test_memory_flag_loads_plugin_with_budgets(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        (tmp_path / "pyproject.toml").write_text(
+            "[tool.sully.test.memory]\nbudget-mb = 50\ntop = 5\n\n"
+            "[tool.sully.test.memory.markers]\nslow = 500\n"
+        )
+        monkeypatch.chdir(tmp_path)
+        with patch("sully.commands.test.uv") as mock_uv:
+            mock_uv.run_cmd.return_value = MagicMock(returncode=0)
+            result = CliRunner().invoke(cli, ["test", "--memory", "--", "-k", "fast"])
+        assert result.exit_code == 0
+        args = mock_uv.run_cmd.call_args[0][0]
+        assert args[:4] == ["pytest", "-p", "sully_memory", "--sully-memory"]
+        assert "--sully-memory-budget=50" in args
+        assert "--sully-memory-marker=slow=500.0" in args
+        assert "--sully-memory-top=5" in args
+        assert args[-2:] == ["-k", "fast"]
+        assert "PYTHONPATH" in mock_uv.run_cmd.call_args.kwargs["env"]
+
+    def test_plain_test_run_has_no_plugin(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        (tmp_path / "pyproject.toml").write_text("[tool.sully]\n")
+        monkeypatch.chdir(tmp_path)
+        with patch("sully.commands.test.uv") as mock_uv:
+            mock_uv.run_cmd.return_value = MagicMock(returncode=0)
+            CliRunner().invoke(cli, ["test"])
+        mock_uv.run_cmd.assert_called_once()
+        assert mock_uv.run_cmd.call_args[0][0] == ["pytest"]
+        env = mock_uv.run_cmd.call_args.kwargs["env"]
+        assert "PYTHONPATH" in env
+        assert env["SULLY_FIXTURE_CACHE"] == str(tmp_path.resolve() / ".sully" / "fixtures")
+        assert env["SULLY_FIXTURE_CACHE_MAX_MB"] == "2048.0"
+
+    def test_no_fixture_cache_turns_it_off(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        (tmp_path / "pyproject.toml").write_text("[tool.sully]\n")
+        monkeypatch.chdir(tmp_path)
+        with patch("sully.commands.test.uv") as mock_uv:
+            mock_uv.run_cmd.return_value = MagicMock(returncode=0)
+            CliRunner().invoke(cli, ["test", "--no-fixture-cache"])
+        assert mock_uv.run_cmd.call_args.kwargs["env"]["SULLY_FIXTURE_CACHE"] == "off"
+
+    def test_shard_loads_plugin_with_durations(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        (tmp_path / "pyproject.toml").write_text('[tool.sully.ci]\ndurations = "ci/durations.json"\n')
+        monkeypatch.chdir(tmp_path)
+        with patch("sully.commands.test.uv") as mock_uv:
+            mock_uv.run_cmd.return_value = MagicMock(returncode=0)
+            result = CliRunner().invoke(cli, ["test", "--shard", "2/3", "--record-durations"])
+        assert result.exit_code == 0, result.output
+        args = mock_uv.run_cmd.call_args[0][0]
+        assert args == [
+            "pytest",
+            "-p",
+            "sully_shard",
+            f"--sully-durations={tmp_path.resolve() / 'ci' / 'durations.json'}",
+            "--sully-shard=2/3",
+            "--sully-record-durations",
+        ]
+        assert "PYTHONPATH" in mock_uv.run_cmd.call_args.kwargs["env"]
+
+    def test_invalid_shard(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        (tmp_path / "pyproject.toml").write_text("[tool.sully]\n")
+        monkeypatch.chdir(tmp_path)
+        result = CliRunner().invoke(cli, ["test", "--shard", "0/2"])
+        assert result.exit_code == 2
+        assert "expected K/N" in result.output
+
+    def test_loop_monitor_loads_plugin_with_budget(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        (tmp_path / "pyproject.toml").write_text("[tool.sully.loop]\nthreshold-ms = 20\nbudget-ms = 200\n")
+        monkeypatch.chdir(tmp_path)
+        with patch("sully.commands.test.uv") as mock_uv:
+            mock_uv.run_cmd.return_value = MagicMock(returncode=0)
+            result = CliRunner().invoke(cli, ["test", "--loop-monitor"])
+        assert result.exit_code == 0, result.output
+        args = mock_uv.run_cmd.call_args[0][0]
+        assert args == [
+            "pytest",
+            "-p",
+            "sully_stall",
+            "--sully-loop",
+            "--sully-loop-threshold=20.0",
+            "--sully-loop-top=10",
+            "--sully-loop-budget=200",
+        ]
+        assert "PYTHONPATH" in mock_uv.run_cmd.call_args.kwargs["env"]
+
+    def test_async_concurrency_loads_plugin(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        (tmp_path / "pyproject.toml").write_text("[tool.sully.test.async]\ntimeout = 5\n")
+        monkeypatch.chdir(tmp_path)
+        with patch("sully.commands.test.uv") as mock_uv:
+            mock_uv.run_cmd.return_value = MagicMock(returncode=0)
+            result = CliRunner().invoke(cli, ["test", "--async-concurrency", "8", "--", "tests/integration"])
+        assert result.exit_code == 0, result.output
+        args = mock_uv.run_cmd.call_args[0][0]
+        assert args == [
+            "pytest",
+            "-p",
+            "sully_async",
+            "--sully-async-concurrency=8",
+            "--sully-async-timeout=5.0",
+            "--sully-async-marker=concurrent",
+            "tests/integration",
+        ]
+        assert "PYTHONPATH" in mock_uv.run_cmd.call_args.kwargs["env"]
+
+    def test_async_concurrency_must_be_positive(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        (tmp_path / "pyproject.toml").write_text("[tool.sully]\n")
+        monkeypatch.chdir(tmp_path)
+        result = CliRunner().invoke(cli, ["test", "--async-concurrency", "0"])
+        assert result.exit_code == 2
+
+
+# ---------------------------------------------------------------------------
+# sully workspace
+# ---------------------------------------------------------------------------
+
+class TestWorkspace:
+    def _workspace(self, tmp_path: Path) -> Path:
+        (tmp_path / "pyproject.toml").write_text('[tool.uv.workspace]\nmembers = ["packages/*"]\n')
+        for name in ("alpha", "beta"):
+            pkg = tmp_path / "packages" / name
+            pkg.mkdir(parents=True)
+            (pkg / "pyproject.toml").write_text(f'[project]\nname = "{name}"\n')
+        return tmp_path
+
+    def _fake_run(self, returncodes: dict[str, int]) -> Callable[..., list[MemberResult]]:
+        def run(
+            command: list[str],
+            targets: list[Member],
+            *,
+            jobs: int | None = None,
+            on_done: Callable[[MemberResult], None],
+        ) -> list[MemberResult]:
+            results = [MemberResult(m, returncodes.get(m.name, 0), f"{m.name} output\n", 0.5) for m in targets]
+            for r in results:
+                on_done(r)
+            return results
+
+        return run
+
+    def test_workspace_runs_all_members(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.chdir(self._workspace(tmp_path) / "packages" / "alpha")
+        with patch("sully.commands.workspace.run_in_members", side_effect=self._fake_run({})) as mock_run:
+            result = CliRunner().invoke(cli, ["workspace", "check"])
+        assert result.exit_code == 0, result.output
+        assert mock_run.call_args[0][0] == ["check"]
+        assert "── alpha (check)" in result.output
+        assert "beta output" in result.output
+        assert "2 passed, 0 failed" in result.output
+
+    def test_workspace_aggregates_failures(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.chdir(self._workspace(tmp_path))
+        with patch("sully.commands.workspace.run_in_members", side_effect=self._fake_run({"beta": 1})):
+            result = CliRunner().invoke(cli, ["workspace", "test"])
+        assert result.exit_code == 1
+        assert "1 passed, 1 failed" in result.output
+        assert "FAILED" in result.output
+
+    def test_workspace_only(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.chdir(self._workspace(tmp_path))
+        with patch("sully.commands.workspace.run_in_members", side_effect=self._fake_run({})) as mock_run:
+            CliRunner().invoke(cli, ["workspace", "doc", "--only", "beta", "-j", "3"])
+        targets = mock_run.call_args[0][1]
+        assert [m.name for m in targets] == ["beta"]
+        assert mock_run.call_args.kwargs["jobs"] == 3
+
+    def test_workspace_unknown_member(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.chdir(self._workspace(tmp_path))
+        result = CliRunner().invoke(cli, ["workspace", "check", "--only", "gamma"])
+        assert result.exit_code != 0
+        assert "Unknown workspace member(s): gamma" in result.output
+
+    def test_workspace_not_found(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.chdir(tmp_path)
+        result = CliRunner().invoke(cli, ["workspace", "check"])
+        assert result.exit_code != 0
+        assert "No uv workspace" in result.output
+
+    def test_workspace_changed_outside_git(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.chdir(self._workspace(tmp_path))
+        monkeypatch.setenv("GIT_CEILING_DIRECTORIES", str(tmp_path.parent))
+        result = CliRunner().invoke(cli, ["workspace", "check", "--changed"])
+        assert result.exit_code == 1
+        assert "git rev-parse failed: fatal: not a git repository" in result.output
+        assert "Traceback" not in result.output
+
+
+# ---------------------------------------------------------------------------
+# artifact cache in check / doc / build
+# ---------------------------------------------------------------------------
+
+class TestArtifactCache:
+    def _project(self, tmp_path: Path) -> Path:
+        (tmp_path / "pyproject.toml").write_text(
+            f'[project]\nname = "app"\n\n[tool.sully.cache]\nenabled = true\ndir = "{tmp_path / "cache"}"\n'
+        )
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "app.py").write_text("x: int = 1\n")
+        return tmp_path
+
+    def test_check_reuses_pyright_result(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.chdir(self._project(tmp_path))
+        with patch("sully.commands.check.uv") as mock_uv:
+            mock_uv.run_captured.return_value = MagicMock(returncode=1, stdout="1 error\n")
+            first = CliRunner().invoke(cli, ["check"])
+            second = CliRunner().invoke(cli, ["check"])
+        assert first.exit_code == 1 and second.exit_code == 1
+        assert mock_uv.run_captured.call_count == 1
+        assert "1 error" in second.output
+        assert "restored from cache" in second.output
+
+        (tmp_path / "src" / "app.py").write_text("x: int = 2\n")
+        with patch("sully.commands.check.uv") as mock_uv:
+            mock_uv.run_captured.return_value = MagicMock(returncode=0, stdout="0 errors\n")
+            third = CliRunner().invoke(cli, ["check"])
+        assert third.exit_code == 0
+        mock_uv.run_captured.assert_called_once()
+
+    def test_doc_restores_cached_docs(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        root = self._project(tmp_path)
+        monkeypatch.chdir(root)
+
+        def fake_pdoc(args: list[str], check: bool = True) -> MagicMock:
+            (root / "docs").mkdir(exist_ok=True)
+            (root / "docs" / "index.html").write_text("built")
+            return MagicMock(returncode=0)
+
+        with patch("sully.commands.doc.uv") as mock_uv:
+            mock_uv.run_cmd.side_effect = fake_pdoc
+            CliRunner().invoke(cli, ["doc"])
+            (root / "docs" / "index.html").unlink()
+            result = CliRunner().invoke(cli, ["doc"])
+        assert result.exit_code == 0
+        assert mock_uv.run_cmd.call_count == 1
+        assert (root / "docs" / "index.html").read_text() == "built"
+
+    def test_build_restores_cached_wheel(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        root = self._project(tmp_path)
+        monkeypatch.chdir(root)
+
+        def fake_build(out_dir: Path, cwd: Path | None = None) -> MagicMock:
+            out_dir.mkdir(parents=True, exist_ok=True)
+            (out_dir / "app-0.1.0-py3-none-any.whl").write_text("wheel")
+            return MagicMock(returncode=0)
+
+        with patch("sully.commands.build.uv") as mock_uv:
+            mock_uv.build.side_effect = fake_build
+            CliRunner().invoke(cli, ["build"])
+            (root / "dist" / "app-0.1.0-py3-none-any.whl").unlink()
+            result = CliRunner().invoke(cli, ["build"])
+        assert result.exit_code == 0
+        assert mock_uv.build.call_count == 1
+        assert (root / "dist" / "app-0.1.0-py3-none-any.whl").read_text() == "wheel"
+
+
+# ---------------------------------------------------------------------------
+# sully do
+# ---------------------------------------------------------------------------
+
+class TestDo:
+    def _project(self, tmp_path: Path, tasks: str) -> Path:
+        (tmp_path / "pyproject.toml").write_text('[project]\nname = "demo"\n\n' + tasks)
+        return tmp_path
+
+    def test_do_runs_dag_and_reports_critical_path(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        py = sys.executable
+        monkeypatch.chdir(
+            self._project(
+                tmp_path,
+                f"[tool.sully.tasks.gen]\ncmd = [\"{py}\", \"-c\", \"open('gen.txt','w').write('ok')\"]\n"
+                'inputs = ["pyproject.toml"]\noutputs = ["gen.txt"]\n\n'
+                f"[tool.sully.tasks.use]\ncmd = [\"{py}\", \"-c\", \"print(open('gen.txt').read())\"]\n"
+                'deps = ["gen"]\n',
+            )
+        )
+        result = CliRunner().invoke(cli, ["do", "use"])
+        assert result.exit_code == 0, result.output
+        assert result.output.index("── gen") < result.output.index("── use")
+        assert "2 ran, 0 up to date, 0 failed" in result.output
+        assert "Critical path" in result.output and "gen → use" in result.output
+        assert (tmp_path / ".sully" / "tasks.json").is_file()
+
+        result = CliRunner().invoke(cli, ["do", "use"])
+        assert "gen: up to date" in result.output
+        assert "1 ran, 1 up to date, 0 failed" in result.output
+
+    def test_do_fails_and_blocks_dependents(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        py = sys.executable
+        monkeypatch.chdir(
+            self._project(
+                tmp_path,
+                f"[tool.sully.tasks.bad]\ncmd = [\"{py}\", \"-c\", \"raise SystemExit(2)\"]\n\n"
+                '[tool.sully.tasks.all]\ndeps = ["bad"]\n',
+            )
+        )
+        result = CliRunner().invoke(cli, ["do", "all"])
+        assert result.exit_code == 1
+        assert "all: skipped (dependency failed)" in result.output
+        assert "Failed: bad" in result.output
+
+    def test_do_unknown_task(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.chdir(self._project(tmp_path, ""))
+        result = CliRunner().invoke(cli, ["do", "nope"])
+        assert result.exit_code != 0
+        assert "Unknown task 'nope'" in result.output
+
+
+# ---------------------------------------------------------------------------
+# sully cache warm
+# ---------------------------------------------------------------------------
+
+class TestCacheWarm:
+    def test_warm_in_project(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        (tmp_path / "pyproject.toml").write_text(
+            f'[project]\nname = "demo"\n\n[tool.sully.cache]\nwheels = "{tmp_path / "w"}"\n'
+        )
+        monkeypatch.chdir(tmp_path)
+
+        def fake_warm(root: Path, dest: Path, pythons: list[str]) -> list[str]:
+            dest.mkdir()
+            (dest / "demo-1.0-py3-none-any.whl").write_bytes(b"")
+            return []
+
+        with patch("sully.commands.cache.warm", side_effect=fake_warm) as mock_warm:
+            result = CliRunner().invoke(cli, ["cache", "warm", "--python", "3.12"])
+        assert result.exit_code == 0, result.output
+        assert mock_warm.call_args.args == (tmp_path.resolve(), tmp_path / "w", ["3.12"])
+        assert "1 wheel(s)" in result.output
+
+    def test_warm_outside_project_reports_failures(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.chdir(tmp_path)
+        failures = ["Python 3.12: could not download wheels for pdoc"]
+        with patch("sully.commands.cache.warm", return_value=failures) as mock_warm:
+            result = CliRunner().invoke(cli, ["cache", "warm", "--dir", str(tmp_path / "w")])
+        assert result.exit_code == 1
+        assert mock_warm.call_args.args[0] is None
+        assert "could not download wheels for pdoc" in result.output
+
+    def test_sync_uses_warmed_wheels(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.chdir(tmp_path)
+        with patch("sully.commands.sync.find_links", return_value=tmp_path), \
+             patch("sully.commands.sync.uv") as mock_uv:
+            CliRunner().invoke(cli, ["sync"])
+        mock_uv.sync.assert_called_once_with(find_links=tmp_path)
+
+
+# ---------------------------------------------------------------------------
+# sully deps apply / multi-group add and remove
+# ---------------------------------------------------------------------------
+
+class TestDepsApply:
+    def _project(self, tmp_path: Path) -> Path:
+        (tmp_path / "pyproject.toml").write_text('[project]\nname = "demo"\ndependencies = ["requests"]\n')
+        return tmp_path
+
+    def test_apply_plan(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.chdir(self._project(tmp_path))
+        (tmp_path / "plan.toml").write_text('[add]\ndev = ["pytest"]\nlint = ["ruff"]\n')
+        with patch("sully.deps.uv") as mock_uv:
+            result = CliRunner().invoke(cli, ["deps", "apply", "plan.toml"])
+        assert result.exit_code == 0, result.output
+        assert "+ ruff (lint)" in result.output
+        assert "Applied 2 change(s) with one resolve." in result.output
+        mock_uv.lock.assert_called_once()
+
+    def test_apply_dry_run_changes_nothing(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.chdir(self._project(tmp_path))
+        (tmp_path / "plan.toml").write_text('[remove]\nruntime = ["requests"]\n')
+        before = (tmp_path / "pyproject.toml").read_text()
+        with patch("sully.deps.uv") as mock_uv:
+            result = CliRunner().invoke(cli, ["deps", "apply", "plan.toml", "--dry-run"])
+        assert "- requests (runtime)" in result.output
+        assert (tmp_path / "pyproject.toml").read_text() == before
+        mock_uv.lock.assert_not_called()
+
+    def test_apply_failure_reports_rollback(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.chdir(self._project(tmp_path))
+        (tmp_path / "plan.toml").write_text('[add]\nruntime = ["nope"]\n')
+        with patch("sully.deps.uv") as mock_uv:
+            mock_uv.lock.side_effect = subprocess.CalledProcessError(1, ["uv", "lock"])
+            result = CliRunner().invoke(cli, ["deps", "apply", "plan.toml"])
+        assert result.exit_code != 0
+        assert "No changes were made." in result.output
+
+    def test_add_to_several_groups_resolves_once(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.chdir(self._project(tmp_path))
+        with patch("sully.deps.uv") as mock_deps_uv, patch("sully.commands.add.uv") as mock_add_uv:
+            result = CliRunner().invoke(cli, ["add", "ruff", "--dev", "--group", "lint"])
+        assert result.exit_code == 0, result.output
+        mock_add_uv.add.assert_not_called()
+        mock_deps_uv.lock.assert_called_once()
+        text = (tmp_path / "pyproject.toml").read_text()
+        assert 'dev = ["ruff"]' in text and 'lint = ["ruff"]' in text
+
+    def test_add_to_several_groups_records_locked_bounds(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.chdir(self._project(tmp_path))
+
+        def fake_lock(*, cwd: Path, find_links: Path | None) -> None:
+            (cwd / "uv.lock").write_text('version = 1\n\n[[package]]\nname = "ruff"\nversion = "0.6.9"\n')
+
+        with patch("sully.deps.uv") as mock_uv:
+            mock_uv.lock.side_effect = fake_lock
+            result = CliRunner().invoke(cli, ["add", "ruff", "--dev", "--group", "lint"])
+        assert result.exit_code == 0, result.output
+        assert "+ ruff>=0.6.9 (lint)" in result.output
+        text = (tmp_path / "pyproject.toml").read_text()
+        assert 'dev = ["ruff>=0.6.9"]' in text and 'lint = ["ruff>=0.6.9"]' in text
+
+    def test_add_single_group_uses_uv_add(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.chdir(self._project(tmp_path))
+        with patch("sully.commands.add.uv") as mock_uv:
+            CliRunner().invoke(cli, ["add", "ruff", "--group", "lint"])
+        mock_uv.add.assert_called_once_with(["ruff"], dev=False, group="lint", find_links=None)
+
+    def test_remove_from_group(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        (tmp_path / "pyproject.toml").write_text('[project]\nname = "demo"\n\n[dependency-groups]\ndev = ["pytest"]\n')
+        monkeypatch.chdir(tmp_path)
+        with patch("sully.deps.uv"):
+            result = CliRunner().invoke(cli, ["remove", "pytest", "--dev"])
+        assert result.exit_code == 0, result.output
+        assert 'dev = []' in (tmp_path / "pyproject.toml").read_text()
+
+
+# ---------------------------------------------------------------------------
+# sully deps cost
+# ---------------------------------------------------------------------------
+
+class TestDepsCost:
+    def _project(self, tmp_path: Path, budgets: str = "") -> Path:
+        (tmp_path / "pyproject.toml").write_text(
+            '[project]\nname = "demo"\ndependencies = ["httpx"]\n\n[tool.sully.deps]\n' + budgets
+        )
+        (tmp_path / "uv.lock").write_text(
+            '[[package]]\nname = "httpx"\nversion = "0.27.0"\ndependencies = [{ name = "anyio" }]\n\n'
+            '[[package]]\nname = "anyio"\nversion = "4.4.0"\n'
+        )
+        return tmp_path
+
+    def _installed(self) -> dict[str, dict]:
+        return {
+            "httpx": {"size": 3 * 2**20, "files": 60, "modules": ["httpx"], "import": 0.12},
+            "anyio": {"size": 2**20, "files": 40, "modules": ["anyio"], "import": 0.05},
+        }
+
+    def test_cost_table(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.chdir(self._project(tmp_path))
+        with patch("sully.depcost.measure", return_value=self._installed()):
+            result = CliRunner().invoke(cli, ["deps", "cost"])
+        assert result.exit_code == 0, result.output
+        row = next(line for line in result.output.splitlines() if line.startswith("httpx"))
+        assert row.split() == ["httpx", "1", "4.0", "4.0", "100", "120"]
+        assert "2 packages, 4.0 MB installed in total" in result.output
+
+    def test_cost_budget_fails(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.chdir(self._project(tmp_path, "max-import-ms = 100\n"))
+        with patch("sully.depcost.measure", return_value=self._installed()):
+            result = CliRunner().invoke(cli, ["deps", "cost"])
+        assert result.exit_code == 1
+        assert "over budget: httpx: imports in 120 ms, over 100 ms" in result.output
+
+    def test_cost_requires_lock(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        (tmp_path / "pyproject.toml").write_text('[project]\nname = "demo"\n')
+        monkeypatch.chdir(tmp_path)
+        result = CliRunner().invoke(cli, ["deps", "cost"])
+        assert result.exit_code != 0
+        assert "No uv.lock found" in result.output
+
+
+# ---------------------------------------------------------------------------
+# sully deps prune
+# ---------------------------------------------------------------------------
+
+class TestDepsPrune:
+    def _project(self, tmp_path: Path) -> Path:
+        (tmp_path / "pyproject.toml").write_text('[project]\nname = "demo"\ndependencies = ["rich", "httpx"]\n')
+        (tmp_path / "src" / "demo").mkdir(parents=True)
+        (tmp_path / "src" / "demo" / "core.py").write_text("import httpx\nimport attrs\n")
+        return tmp_path
+
+    def _env(self) -> tuple[dict[str, set[str]], set[str]]:
+        return {"httpx": {"httpx"}, "rich": {"rich"}, "attrs": {"attrs"}}, set()
+
+    def test_prune_reports_and_fails(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.chdir(self._project(tmp_path))
+        with patch("sully.prune.environment_modules", return_value=self._env()):
+            result = CliRunner().invoke(cli, ["deps", "prune"])
+        assert result.exit_code == 1
+        assert "Declared but never imported:\n  rich (runtime)" in result.output
+        assert "Imported but not declared:\n  attrs (runtime)" in result.output
+
+    def test_prune_fix_applies_one_transaction(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.chdir(self._project(tmp_path))
+        with patch("sully.prune.environment_modules", return_value=self._env()), patch("sully.deps.uv") as mock_uv:
+            result = CliRunner().invoke(cli, ["deps", "prune", "--fix"])
+        assert result.exit_code == 0, result.output
+        mock_uv.lock.assert_called_once()
+        text = (tmp_path / "pyproject.toml").read_text()
+        assert '"rich"' not in text and '"attrs"' in text
+
+    def test_prune_clean(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        (tmp_path / "pyproject.toml").write_text('[project]\nname = "demo"\ndependencies = []\n')
+        monkeypatch.chdir(tmp_path)
+        with patch("sully.prune.environment_modules", return_value=({}, set())):
+            result = CliRunner().invoke(cli, ["deps", "prune"])
+        assert result.exit_code == 0
+        assert "All clear" in result.output
+
+
+# ---------------------------------------------------------------------------
+# sully ci generate
+# ---------------------------------------------------------------------------
+
+class TestCiGenerate:
+    def test_generate_uses_config(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        (tmp_path / "pyproject.toml").write_text('[tool.sully.ci]\nshards = 3\n\n[tool.sully.doc]\noutput = "site"\n')
+        (tmp_path / ".python-version").write_text("3.13\n")
+        monkeypatch.chdir(tmp_path)
+        result = CliRunner().invoke(cli, ["ci", "generate"])
+        assert result.exit_code == 0, result.output
+        workflow = (tmp_path / ".github" / "workflows" / "ci.yml").read_text()
+        assert "shard: [1, 2, 3]" in workflow
+        assert "uv python install 3.13" in workflow
+        assert "path: site/" in workflow
+
+    def test_generate_refuses_to_clobber(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        (tmp_path / "pyproject.toml").write_text("[tool.sully]\n")
+        workflow = tmp_path / ".github" / "workflows" / "ci.yml"
+        workflow.parent.mkdir(parents=True)
+        workflow.write_text("name: hand-written\n")
+        monkeypatch.chdir(tmp_path)
+
+        result = CliRunner().invoke(cli, ["ci", "generate", "--shards", "2"])
+        assert result.exit_code != 0
+        assert "--force" in result.output
+        assert workflow.read_text() == "name: hand-written\n"
+
+        result = CliRunner().invoke(cli, ["ci", "generate", "--shards", "2", "--force"])
+        assert result.exit_code == 0
+        assert "shard: [1, 2]" in workflow.read_text()
+
+
+# ---------------------------------------------------------------------------
+# sully load
+# ---------------------------------------------------------------------------
+
+class TestLoad:
+    LATENCY = {"p50": 1.0, "p90": 2.0, "p99": 9.0, "p999": 12.0, "max": 15.0, "mean": 1.5}
+    REPORT = LoadReport("thread", 500, 0, 5.0, 100.0, LATENCY)
+
+    def test_uses_config_and_flags(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        (tmp_path / "pyproject.toml").write_text('[tool.sully.load]\ntarget = "app:handle"\nconcurrency = 4\n')
+        monkeypatch.chdir(tmp_path)
+        with patch("sully.commands.load.uv"), patch("sully.commands.load.run_load", return_value=self.REPORT) as run:
+            result = CliRunner().invoke(cli, ["load", "--rate", "100", "--duration", "5"])
+        assert result.exit_code == 0, result.output
+        run.assert_called_once_with(
+            tmp_path.resolve(), "app:handle", mode="auto", concurrency=4, rate=100.0, duration=5.0, warmup=1.0
+        )
+        assert "p99 9.00" in result.output
+
+    def test_slo_failure_exits_nonzero(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        (tmp_path / "pyproject.toml").write_text("[tool.sully.load.slo]\np99-ms = 5\n")
+        monkeypatch.chdir(tmp_path)
+        with patch("sully.commands.load.uv"), patch("sully.commands.load.run_load", return_value=self.REPORT):
+            result = CliRunner().invoke(cli, ["load", "app:handle", "--json"])
+        assert result.exit_code == 1
+        assert json.loads(result.output)["slo_violations"] == ["p99 latency 9.00 ms exceeds 5 ms"]
+
+    def test_requires_target(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        (tmp_path / "pyproject.toml").write_text("[tool.sully]\n")
+        monkeypatch.chdir(tmp_path)
+        with patch("sully.commands.load.uv"):
+            result = CliRunner().invoke(cli, ["load"])
+        assert result.exit_code != 0
+        assert "No target given" in result.output
+
+
+# ---------------------------------------------------------------------------
+# sully bench
+# ---------------------------------------------------------------------------
+
+class TestBench:
+    REPORT = {
+        "fixed": {"a:bench_fixed": {"seconds": 0.0025}},
+        "scaling": {
+            "a:bench_sort": {
+                "sizes": [16, 32, 64, 128, 256],
+                "seconds": [16 * 1e-6, 32 * 1e-6, 64 * 1e-6, 128 * 1e-6, 256 * 1e-6],
+                "peak": [0, 0, 0, 0, 0],
+            },
+        },
+        "errors": {},
+    }
+
+    def _project(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+        (tmp_path / "pyproject.toml").write_text("[tool.sully]\n")
+        (tmp_path / "benchmarks").mkdir()
+        monkeypatch.chdir(tmp_path)
+        return tmp_path
+
+    def test_fixed_only_by_default(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        self._project(tmp_path, monkeypatch)
+        report = {**self.REPORT, "scaling": {}}
+        with patch("sully.commands.bench.uv"), patch("sully.commands.bench.run_benchmarks", return_value=report) as run:
+            result = CliRunner().invoke(cli, ["bench"])
+        assert result.exit_code == 0, result.output
+        assert run.call_args.kwargs["scaling"] is False
+        assert "a:bench_fixed  2.50 ms" in result.output
+
+    def test_update_baseline_then_detect_regression(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        root = self._project(tmp_path, monkeypatch)
+        with patch("sully.commands.bench.uv"), patch("sully.commands.bench.run_benchmarks", return_value=self.REPORT):
+            result = CliRunner().invoke(cli, ["bench", "--update-baseline"])
+        assert result.exit_code == 0, result.output
+        baseline = json.loads((root / "benchmarks" / "scaling.json").read_text())
+        assert baseline == {"a:bench_sort": {"time": "O(n)", "memory": "O(1)"}}
+
+        quadratic = json.loads(json.dumps(self.REPORT))
+        quadratic["scaling"]["a:bench_sort"]["seconds"] = [n * n * 1e-9 for n in (16, 32, 64, 128, 256)]
+        with patch("sully.commands.bench.uv"), patch("sully.commands.bench.run_benchmarks", return_value=quadratic):
+            result = CliRunner().invoke(cli, ["bench", "--scaling"])
+        assert result.exit_code == 1
+        assert "a:bench_sort: time scales as O(n^2), baseline O(n)" in result.output
+
+    def test_benchmark_errors_fail(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        self._project(tmp_path, monkeypatch)
+        report = {"fixed": {}, "scaling": {}, "errors": {"a:bench_x": "Traceback...\nValueError: boom\n"}}
+        with patch("sully.commands.bench.uv"), patch("sully.commands.bench.run_benchmarks", return_value=report):
+            result = CliRunner().invoke(cli, ["bench"])
+        assert result.exit_code == 1
+        assert "ValueError: boom" in result.output
+
+    def test_missing_directory(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        (tmp_path / "pyproject.toml").write_text("[tool.sully]\n")
+        monkeypatch.chdir(tmp_path)
+        with patch("sully.commands.bench.uv"):
+            result = CliRunner().invoke(cli, ["bench"])
+        assert result.exit_code != 0
+        assert "No benchmarks/ directory" in result.output
+
+    CORE = (
+        "from collections.abc import Sequence\n\n"
+        "def dedupe(items: list[int]) -> list[int]:\n    return items\n\n"
+        "def join(parts: Sequence[str], *, sep: str, strict: bool = False) -> str:\n    return sep.join(parts)\n\n"
+        "def grid(shape: tuple[int, int] | None) -> int:\n    return 0\n\n"
+        "def load(cfg: Config) -> None: ...\n\n"
+        "def ping() -> None: ...\n\n"
+        "async def fetch(n: int) -> int:\n    return n\n"
+    )
+
+    def test_generate_creates_typed_scaling_stubs(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        (tmp_path / "pyproject.toml").write_text("[project]\nname='x'\n")
+        (tmp_path / "src" / "pkg").mkdir(parents=True)
+        (tmp_path / "src" / "pkg" / "core.py").write_text(self.CORE)
+        monkeypatch.chdir(tmp_path)
+        result = CliRunner().invoke(cli, ["bench", "--generate"])
+
+        assert result.exit_code == 0, result.output
+        content = (tmp_path / "benchmarks" / "bench_pkg_core.py").read_text()
+        assert "from pkg.core import dedupe, join, grid, load, ping\n" in content
+        assert "def bench_dedupe(n: int) -> Callable[[], object]:\n    items = [i for i in range(n)]\n" in content
+        assert '    parts = [str(i) for i in range(n)]\n    sep = "a" * n\n    return lambda: join(parts, sep=sep)\n' in content
+        assert "    shape = (n, n)\n" in content
+        assert "    # TODO: build `cfg: Config` of size n\n    raise NotImplementedError\n" in content
+        assert "def bench_ping() -> None:\n    ping()\n" in content
+        assert "fetch" not in content
+        compile(content, "bench_pkg_core.py", "exec")
+
+    def test_generate_merges_without_clobbering(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        (tmp_path / "pyproject.toml").write_text("[project]\nname='x'\n")
+        (tmp_path / "src" / "pkg").mkdir(parents=True)
+        (tmp_path / "src" / "pkg" / "core.py").write_text(self.CORE)
+        bench_file = tmp_path / "benchmarks" / "bench_pkg_core.py"
+        bench_file.parent.mkdir()
+        hand_written = '"""Mine."""\n\nfrom pkg.core import dedupe\n\n\ndef bench_dedupe(n):\n    return lambda: dedupe([0] * n)\n'
+        bench_file.write_text(hand_written)
+        monkeypatch.chdir(tmp_path)
+
+        result = CliRunner().invoke(cli, ["bench", "--generate"])
+        assert result.exit_code == 0, result.output
+        content = bench_file.read_text()
+        assert content.startswith('"""Mine."""\n\nfrom collections.abc import Callable\nfrom pkg.core import dedupe\n')
+        assert "from pkg.core import join, grid, load, ping\n" in content
+        assert "    return lambda: dedupe([0] * n)\n" in content
+        assert content.count("def bench_dedupe") == 1
+        compile(content, "bench_pkg_core.py", "exec")
+
+        result = CliRunner().invoke(cli, ["bench", "--generate"])
+        assert "up to date" in result.output
+        assert bench_file.read_text() == content
+
+    def test_skipped_stubs_do_not_fail(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        self._project(tmp_path, monkeypatch)
+        report = {"fixed": {}, "scaling": {}, "errors": {}, "skipped": {"a:bench_load": "not implemented"}}
+        with patch("sully.commands.bench.uv"), patch("sully.commands.bench.run_benchmarks", return_value=report):
+            result = CliRunner().invoke(cli, ["bench"])
+        assert result.exit_code == 0
+        assert "a:bench_load  skipped (not implemented)" in result.output
+
+
+# ---------------------------------------------------------------------------
+# sully fuzz
+# ---------------------------------------------------------------------------
+
+class TestFuzz:
+    def _project(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, config: str = "") -> Path:
+        (tmp_path / "pyproject.toml").write_text(f"[tool.sully]\n{config}")
+        (tmp_path / "src" / "pkg").mkdir(parents=True)
+        (tmp_path / "src" / "pkg" / "core.py").write_text("def parse(text: str) -> int:\n    return len(text)\n")
+        monkeypatch.chdir(tmp_path)
+        return tmp_path
+
+    def test_requires_perf(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        self._project(tmp_path, monkeypatch)
+        result = CliRunner().invoke(cli, ["fuzz"])
+        assert result.exit_code == 2
+        assert "--perf" in result.output
+
+    def test_discovers_targets_and_saves_cases(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        root = self._project(tmp_path, monkeypatch)
+        found = FuzzResult("pkg.core:parse", [FuzzCase("('aaaa',)", "{}", 0.002, 4, False)], 0.0001, 50, 0, 0)
+        with patch("sully.commands.fuzz.uv"), patch("sully.commands.fuzz.run_fuzz", return_value=([found], {})) as run:
+            result = CliRunner().invoke(cli, ["fuzz", "--perf", "--budget", "1"])
+        assert result.exit_code == 0, result.output
+        assert run.call_args[0][1] == ["pkg.core:parse"]
+        assert run.call_args.kwargs["budget"] == 1.0
+        assert "20x typical" in result.output
+        assert (root / "benchmarks" / "fuzz_pkg_core_parse.py").is_file()
+
+    def test_timeouts_and_slowdown_fail(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        self._project(tmp_path, monkeypatch, "\n[tool.sully.fuzz]\nmax-slowdown = 10\n")
+        slow = FuzzResult("pkg.core:parse", [FuzzCase("('a',)", "{}", 0.002, 1, False)], 0.0001, 50, 0, 0)
+        with patch("sully.commands.fuzz.uv"), patch("sully.commands.fuzz.run_fuzz", return_value=([slow], {})):
+            result = CliRunner().invoke(cli, ["fuzz", "--perf", "--no-save", "pkg.core:parse"])
+        assert result.exit_code == 1
+        assert "max-slowdown 10" in result.output
+        assert not (tmp_path / "benchmarks").exists()
+
+        hung = slow._replace(cases=[FuzzCase("('a',)", "{}", 2.0, 1, True)], timeouts=1)
+        with patch("sully.commands.fuzz.uv"), patch("sully.commands.fuzz.run_fuzz", return_value=([hung], {})):
+            result = CliRunner().invoke(cli, ["fuzz", "--perf", "--no-save"])
+        assert result.exit_code == 1
+        assert "ran past the per-call limit" in result.output
+
+
+# ---------------------------------------------------------------------------
+# sully stubs
+# ---------------------------------------------------------------------------
+
+class TestStubs:
+    def _project(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, pyright: dict | None = None) -> Path:
+        (tmp_path / "pyproject.toml").write_text('[project]\nname = "app"\n\n[tool.sully.stubs]\nexclude = ["yaml"]\n')
+        (tmp_path / "uv.lock").write_text("version = 1\n")
+        (tmp_path / "pyrightconfig.json").write_text(json.dumps(pyright or {"include": ["src"]}))
+        monkeypatch.chdir(tmp_path)
+        return tmp_path.resolve()
+
+    def test_build_registers_and_reports(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        root = self._project(tmp_path, monkeypatch)
+        report = StubReport({"pandas": "pandas 2.2.0: 3 module(s), 12 name(s)"}, {"attrs": "ships py.typed"}, [])
+        with patch("sully.commands.stubs.build", return_value=report) as build:
+            result = CliRunner().invoke(cli, ["stubs", "build"])
+        assert result.exit_code == 0, result.output
+        build.assert_called_once_with(root, ["yaml"])
+        assert "stubbed pandas (pandas 2.2.0: 3 module(s), 12 name(s))" in result.output
+        assert "skip attrs (ships py.typed)" in result.output
+        assert json.loads((root / "pyrightconfig.json").read_text())["stubPath"] == ".sully/stubs"
+
+    def test_build_skips_fresh_stubs_unless_forced(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        self._project(tmp_path, monkeypatch)
+        with patch("sully.commands.stubs.is_fresh", return_value=True), patch("sully.commands.stubs.build") as build:
+            result = CliRunner().invoke(cli, ["stubs", "build"])
+            assert "up to date" in result.output
+            build.assert_not_called()
+            build.return_value = StubReport({}, {}, [])
+            result = CliRunner().invoke(cli, ["stubs", "build", "--force"])
+        assert result.exit_code == 0, result.output
+        build.assert_called_once()
+
+    def test_build_keeps_a_custom_stub_path(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        self._project(tmp_path, monkeypatch, {"stubPath": "typings"})
+        with patch("sully.commands.stubs.build") as build:
+            result = CliRunner().invoke(cli, ["stubs", "build"])
+        assert result.exit_code == 1
+        assert "already sets stubPath to 'typings'" in result.output
+        build.assert_not_called()
+
+    def test_build_refuses_without_pyright_config(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        root = self._project(tmp_path, monkeypatch)
+        (root / "pyrightconfig.json").unlink()
+        with patch("sully.commands.stubs.build") as build:
+            result = CliRunner().invoke(cli, ["stubs", "build"])
+        assert result.exit_code == 1
+        assert "No pyright configuration found" in result.output
+        assert not (root / "pyrightconfig.json").exists()
+        build.assert_not_called()
+
+    def test_check_rebuilds_stale_stubs(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        root = self._project(tmp_path, monkeypatch, {"stubPath": ".sully/stubs"})
+        (root / "pyproject.toml").write_text('[project]\nname = "app"\n\n[tool.sully.check]\nmode = "strict"\n')
+        with patch("sully.commands.check.uv") as mock_uv, patch("sully.commands.check.build") as build:
+            mock_uv.run_cmd.return_value = MagicMock(returncode=0)
+            build.return_value = StubReport({"pandas": ""}, {}, [])
+            with patch("sully.commands.check.is_fresh", return_value=False):
+                result = CliRunner().invoke(cli, ["check"])
+            assert "Regenerated stubs for 1 untyped package(s)" in result.output
+            with patch("sully.commands.check.is_fresh", return_value=True):
+                CliRunner().invoke(cli, ["check"])
+        assert result.exit_code == 0, result.output
+        build.assert_called_once_with(root, [])
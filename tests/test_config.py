@@ -1,8 +1,10 @@
 """Tests for sully.config — pyproject.toml parsing and error handling."""
 
 import os
+import re
 from pathlib import Path
 
+import click
 import pytest
 
 from sully import config
@@ -133,3 +135,162 @@ def test_find_pyproject_no_pyproject_in_empty_tree(tmp_path: Path) -> None:
     deep.mkdir(parents=True)
     with pytest.raises(FileNotFoundError):
         config.find_pyproject(start=deep)
+
+
+def test_get_perf_config_defaults(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    (tmp_path / "pyproject.toml").write_text("[tool.sully]\n")
+    monkeypatch.chdir(tmp_path)
+    cfg = config.get_perf_config()
+    assert cfg["enabled"] is True
+    assert cfg["hot-modules"] == []
+    assert cfg["severity"] == {}
+
+
+def test_get_perf_config_severity_overrides(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    (tmp_path / "pyproject.toml").write_text(
+        '[tool.sully.check.perf]\nhot-modules = ["src/app/core/*"]\nreportRegexInLoop = "warning"\n'
+    )
+    monkeypatch.chdir(tmp_path)
+    cfg = config.get_perf_config()
+    assert cfg["hot-modules"] == ["src/app/core/*"]
+    assert cfg["severity"] == {"reportRegexInLoop": "warning"}
+
+
+def test_get_perf_config_rejects_unknown_severity(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    (tmp_path / "pyproject.toml").write_text('[tool.sully.check.perf]\nreportRegexInLoop = "eror"\n')
+    monkeypatch.chdir(tmp_path)
+    with pytest.raises(click.ClickException, match="reportRegexInLoop must be one of 'error', .*; got 'eror'"):
+        config.get_perf_config()
+
+
+@pytest.mark.parametrize(("line", "message"), [
+    ("optimize = 3", "optimize must be one of 0, 1, 2; got 3"),
+    ('optimize = "2"', "optimize must be one of 0, 1, 2; got '2'"),
+    ('format = "tar"', "format must be one of 'zip', 'dir'; got 'tar'"),
+])
+def test_get_bundle_config_rejects_bad_values(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, line: str, message: str
+) -> None:
+    (tmp_path / "pyproject.toml").write_text(f"[tool.sully.bundle]\n{line}\n")
+    monkeypatch.chdir(tmp_path)
+    with pytest.raises(click.ClickException, match=re.escape(message)):
+        config.get_bundle_config()
+
+
+def test_get_build_config_defaults(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    (tmp_path / "pyproject.toml").write_text("[tool.sully]\n")
+    monkeypatch.chdir(tmp_path)
+    cfg = config.get_build_config()
+    assert cfg["compile"] == []
+    assert cfg["out-dir"] == "dist"
+    assert cfg["verify"] is True
+
+
+def test_get_tasks_config_defaults(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    (tmp_path / "pyproject.toml").write_text('[tool.sully.tasks.gen]\ncmd = "python gen.py"\n')
+    monkeypatch.chdir(tmp_path)
+    assert config.get_tasks_config() == {"gen": {"cmd": "python gen.py", "inputs": [], "outputs": [], "deps": []}}
+
+
+def test_get_ci_config_defaults(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    (tmp_path / "pyproject.toml").write_text("[tool.sully]\n")
+    monkeypatch.chdir(tmp_path)
+    assert config.get_ci_config() == {"shards": 1, "python": None, "durations": ".test-durations.json"}
+
+
+def test_sully_cache_env_enables_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    (tmp_path / "pyproject.toml").write_text("[tool.sully]\n")
+    monkeypatch.chdir(tmp_path)
+    assert config.get_cache_config()["enabled"] is False
+    monkeypatch.setenv("SULLY_CACHE", "1")
+    assert config.get_cache_config()["enabled"] is True
+
+
+def test_get_load_config(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    (tmp_path / "pyproject.toml").write_text(
+        '[tool.sully.load]\ntarget = "app:handle"\nrate = 500\n\n[tool.sully.load.slo]\np99-ms = 50\n'
+    )
+    monkeypatch.chdir(tmp_path)
+    cfg = config.get_load_config()
+    assert cfg["target"] == "app:handle"
+    assert cfg["mode"] == "auto"
+    assert cfg["rate"] == 500
+    assert cfg["warmup"] == 1.0
+    assert cfg["slo"] == {"p99-ms": 50.0}
+
+
+def test_get_bench_config_defaults(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    (tmp_path / "pyproject.toml").write_text("[tool.sully.bench]\nmax-n = 1024\n")
+    monkeypatch.chdir(tmp_path)
+    cfg = config.get_bench_config()
+    assert cfg["dir"] == "benchmarks"
+    assert cfg["baseline"] == "benchmarks/scaling.json"
+    assert cfg["max-n"] == 1024
+    assert cfg["n"] == 1000
+    assert cfg["strict"] is False
+
+
+def test_get_fuzz_config_defaults(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    (tmp_path / "pyproject.toml").write_text('[tool.sully.fuzz]\ntargets = ["pkg.core:parse"]\nbudget = 2\n')
+    monkeypatch.chdir(tmp_path)
+    cfg = config.get_fuzz_config()
+    assert cfg["targets"] == ["pkg.core:parse"]
+    assert cfg["budget"] == 2.0
+    assert cfg["max-size"] == 1000
+    assert cfg["metric"] == "time"
+    assert cfg["max-slowdown"] is None
+
+
+def test_get_loop_config_defaults(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    (tmp_path / "pyproject.toml").write_text("[tool.sully.loop]\nbudget-ms = 250\n")
+    monkeypatch.chdir(tmp_path)
+    cfg = config.get_loop_config()
+    assert cfg["threshold-ms"] == 100.0
+    assert cfg["budget-ms"] == 250
+    assert cfg["top"] == 10
+
+
+def test_get_test_async_config_defaults(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    (tmp_path / "pyproject.toml").write_text('[tool.sully.test.async]\nmarker = "io"\n')
+    monkeypatch.chdir(tmp_path)
+    cfg = config.get_test_async_config()
+    assert cfg["marker"] == "io"
+    assert cfg["timeout"] == 60.0
+
+
+def test_get_test_fixture_cache_config_defaults(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    (tmp_path / "pyproject.toml").write_text("[tool.sully.test.fixture-cache]\nmax-mb = 512\n")
+    monkeypatch.chdir(tmp_path)
+    cfg = config.get_test_fixture_cache_config()
+    assert cfg["enabled"] is True
+    assert cfg["dir"] == ".sully/fixtures"
+    assert cfg["max-mb"] == 512.0
+    assert cfg["max-age-days"] == 30.0
+
+
+def test_get_runtime_types_config_defaults(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    (tmp_path / "pyproject.toml").write_text("[tool.sully.runtime-types]\nsample = 1000\nfail = true\n")
+    monkeypatch.chdir(tmp_path)
+    cfg = config.get_runtime_types_config()
+    assert cfg["first"] == 10
+    assert cfg["sample"] == 1000
+    assert cfg["fail"] is True
+
+
+def test_get_stubs_config_defaults(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    (tmp_path / "pyproject.toml").write_text('[tool.sully.stubs]\nexclude = ["yaml", "requests"]\n')
+    monkeypatch.chdir(tmp_path)
+    cfg = config.get_stubs_config()
+    assert cfg["auto"] is True
+    assert cfg["exclude"] == ["yaml", "requests"]
+
+
+def test_load_reuses_parsed_pyproject_until_it_changes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text('[tool.sully]\nmain = "a.py"\n')
+    os.utime(pyproject, (1_000_000, 1_000_000))
+    monkeypatch.chdir(tmp_path)
+    assert config.load() is config.load()
+
+    pyproject.write_text('[tool.sully]\nmain = "bb.py"\n')
+    assert config.get_main_script() == "bb.py"
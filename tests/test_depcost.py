@@ -0,0 +1,64 @@
+"""Tests for sully.depcost — per-dependency cost measurement."""
+
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sully.depcost import CostReport, DependencyCost, dependency_costs, measure, over_budget
+from sully.lockfile import LockedPackage
+
+
+def _run_here(args: list[str], *, cwd: Path) -> subprocess.CompletedProcess[str]:
+    """Stand in for `uv run` by running the probe with this interpreter."""
+    return subprocess.run([sys.executable, *args[1:]], cwd=cwd, capture_output=True, text=True)
+
+
+def test_measure_inspects_installed_distributions(tmp_path: Path) -> None:
+    with patch("sully.depcost.uv") as mock_uv:
+        mock_uv.run_captured.side_effect = _run_here
+        found = measure(tmp_path, ["click", "not-installed-anywhere"])
+    assert "not-installed-anywhere" not in found
+    assert found["click"]["size"] > 0 and found["click"]["files"] > 0
+    assert found["click"]["modules"] == ["click"]
+    assert found["click"]["import"] > 0
+
+
+def test_dependency_costs_closure_and_exclusive_size(tmp_path: Path) -> None:
+    packages = {
+        "a": LockedPackage("a", "1.0", [("shared", ()), ("only-a", ())], {}),
+        "b": LockedPackage("b", "2.0", [("shared", ())], {}),
+        "shared": LockedPackage("shared", "1.0", [], {}),
+        "only-a": LockedPackage("only-a", "1.0", [], {}),
+    }
+    sizes = {"a": 100, "b": 10, "shared": 1000, "only-a": 50}
+    installed = {n: {"size": s, "files": 1, "modules": [n], "import": 0.01} for n, s in sizes.items()}
+    with patch("sully.depcost.measure", return_value=installed):
+        report = dependency_costs(tmp_path, packages, {"a": (), "b": ()})
+
+    a, b = report.costs
+    assert (a.name, a.transitive, a.size, a.exclusive_size) == ("a", ("only-a", "shared"), 1150, 150)
+    assert (b.name, b.size, b.exclusive_size) == ("b", 1010, 10)
+    assert (report.total_size, report.total_packages) == (1160, 4)
+
+
+def test_over_budget() -> None:
+    cost = DependencyCost("numpy", "2.0", ("x",) * 3, 40 * 2**20, 900, 40 * 2**20, 0.25)
+    report = CostReport([cost], 40 * 2**20, 4)
+    budgets = {"max-size-mb": 30, "max-total-mb": 100, "max-import-ms": 200, "max-transitive": 2}
+    assert over_budget(report, budgets) == [
+        "numpy: 40.0 MB installed exceeds 30 MB",
+        "numpy: pulls in 3 packages, more than 2",
+        "numpy: imports in 250 ms, over 200 ms",
+    ]
+    unlimited = dict.fromkeys(budgets)
+    assert over_budget(report, unlimited) == []
+
+
+def test_measure_reports_broken_environment(tmp_path: Path) -> None:
+    with patch("sully.depcost.uv") as mock_uv:
+        mock_uv.run_captured.return_value = MagicMock(returncode=2, stdout="No interpreter found\n")
+        with pytest.raises(RuntimeError, match="No interpreter found"):
+            measure(tmp_path, ["x"])
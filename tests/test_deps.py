@@ -0,0 +1,156 @@
+"""Tests for sully.deps — batched, transactional dependency edits."""
+
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import tomlkit
+
+from sully import deps
+from sully.deps import DependencyError, Edit
+from sully.lockfile import LockedPackage
+
+_PYPROJECT = """\
+[project]
+name = "demo"
+dependencies = [
+    "requests>=2.31",  # HTTP client
+]
+
+[dependency-groups]
+dev = ["pytest>=8"]
+"""
+
+
+def test_requirement_name_normalises() -> None:
+    assert deps.requirement_name("Typing_Extensions[x]>=4; python_version<'3.11'") == "typing-extensions"
+    with pytest.raises(DependencyError):
+        deps.requirement_name(">=1.0")
+
+
+def test_apply_edits_preserves_formatting() -> None:
+    doc = tomlkit.loads(_PYPROJECT)
+    changes = deps.apply_edits(
+        doc,
+        [
+            Edit("add", "requests>=2.32", "runtime"),
+            Edit("add", "httpx", "runtime"),
+            Edit("remove", "pytest", "dev"),
+            Edit("add", "ruff", "lint"),
+        ],
+    )
+    assert changes == [
+        "~ requests>=2.31 -> requests>=2.32 (runtime)",
+        "+ httpx (runtime)",
+        "- pytest (dev)",
+        "+ ruff (lint)",
+    ]
+    text = tomlkit.dumps(doc)
+    assert '"requests>=2.32",  # HTTP client' in text
+    assert doc["dependency-groups"]["lint"] == ["ruff"]
+
+
+def test_apply_edits_rejects_missing_removal() -> None:
+    with pytest.raises(DependencyError, match="'flask' is not a dependency in group 'dev'"):
+        deps.apply_edits(tomlkit.loads(_PYPROJECT), [Edit("remove", "flask", "dev")])
+
+
+def test_load_plan(tmp_path: Path) -> None:
+    plan = tmp_path / "plan.toml"
+    plan.write_text('[add]\nruntime = ["httpx>=0.27"]\ndev = ["pytest>=8.2"]\n\n[remove]\nruntime = ["requests"]\n')
+    assert deps.load_plan(plan) == [
+        Edit("remove", "requests", "runtime"),
+        Edit("add", "httpx>=0.27", "runtime"),
+        Edit("add", "pytest>=8.2", "dev"),
+    ]
+    plan.write_text("[upgrade]\nx = []\n")
+    with pytest.raises(DependencyError, match="Unknown plan section"):
+        deps.load_plan(plan)
+
+
+def test_apply_locks_and_syncs_once(tmp_path: Path) -> None:
+    (tmp_path / "pyproject.toml").write_text(_PYPROJECT)
+    with patch("sully.deps.uv") as mock_uv:
+        deps.apply(tmp_path, [Edit("add", "httpx", "runtime"), Edit("add", "ruff", "dev")])
+    mock_uv.lock.assert_called_once()
+    mock_uv.sync.assert_called_once()
+    assert "httpx" in (tmp_path / "pyproject.toml").read_text()
+
+
+def test_apply_rolls_back_failed_resolve(tmp_path: Path) -> None:
+    (tmp_path / "pyproject.toml").write_text(_PYPROJECT)
+    (tmp_path / "uv.lock").write_text("original lock\n")
+    with patch("sully.deps.uv") as mock_uv:
+        mock_uv.lock.side_effect = subprocess.CalledProcessError(1, ["uv", "lock"])
+        with pytest.raises(DependencyError, match="could not resolve"):
+            deps.apply(tmp_path, [Edit("add", "does-not-exist", "runtime")])
+    assert (tmp_path / "pyproject.toml").read_text() == _PYPROJECT
+    assert (tmp_path / "uv.lock").read_text() == "original lock\n"
+    mock_uv.sync.assert_not_called()
+
+
+def test_apply_rolls_back_failed_sync_and_resyncs(tmp_path: Path) -> None:
+    (tmp_path / "pyproject.toml").write_text(_PYPROJECT)
+
+    def fake_lock(*, cwd: Path, find_links: Path | None) -> None:
+        (cwd / "uv.lock").write_text("new lock\n")
+
+    with patch("sully.deps.uv") as mock_uv:
+        mock_uv.lock.side_effect = fake_lock
+        mock_uv.sync.side_effect = [subprocess.CalledProcessError(1, ["uv", "sync"]), None]
+        with pytest.raises(DependencyError, match="could not install"):
+            deps.apply(tmp_path, [Edit("add", "broken", "runtime")])
+    assert (tmp_path / "pyproject.toml").read_text() == _PYPROJECT
+    assert not (tmp_path / "uv.lock").exists()
+    assert mock_uv.sync.call_count == 2
+
+
+_LOCK = """\
+version = 1
+
+[[package]]
+name = "ruff"
+version = "0.6.9"
+
+[[package]]
+name = "httpx"
+version = "0.27.2"
+"""
+
+
+def test_lower_bounds_only_touches_bare_additions() -> None:
+    locked = {name: LockedPackage(name, version, [], {}) for name, version in [("ruff", "0.6.9"), ("httpx", "0.27.2")]}
+    edits = [
+        Edit("add", "ruff", "dev"),
+        Edit("add", "httpx[http2]", "runtime"),
+        Edit("add", "httpx<1", "lint"),
+        Edit("remove", "ruff", "lint"),
+        Edit("add", "unlocked", "dev"),
+    ]
+    assert [e.requirement for e in deps.lower_bounds(edits, locked)] == [
+        "ruff>=0.6.9", "httpx[http2]>=0.27.2", "httpx<1", "ruff", "unlocked",
+    ]
+
+
+def test_apply_bound_writes_locked_versions_and_relocks(tmp_path: Path) -> None:
+    (tmp_path / "pyproject.toml").write_text(_PYPROJECT)
+
+    def fake_lock(*, cwd: Path, find_links: Path | None) -> None:
+        (cwd / "uv.lock").write_text(_LOCK)
+
+    with patch("sully.deps.uv") as mock_uv:
+        mock_uv.lock.side_effect = fake_lock
+        changes = deps.apply(tmp_path, [Edit("add", "ruff", "dev"), Edit("add", "ruff", "lint")], bound=True)
+    assert changes == ["+ ruff>=0.6.9 (dev)", "+ ruff>=0.6.9 (lint)"]
+    doc = tomlkit.loads((tmp_path / "pyproject.toml").read_text())
+    assert list(doc["dependency-groups"]["dev"]) == ["pytest>=8", "ruff>=0.6.9"]
+    assert list(doc["dependency-groups"]["lint"]) == ["ruff>=0.6.9"]
+    assert mock_uv.lock.call_count == 2
+    mock_uv.sync.assert_called_once()
+
+
+def test_declared_collects_groups_and_extras() -> None:
+    doc = tomlkit.loads(_PYPROJECT.replace('"requests>=2.31"', '"requests[socks]>=2.31"'))
+    assert deps.declared(doc, ["runtime"]) == {"requests": ("socks",)}
+    assert deps.declared(doc, ["runtime", "dev"]) == {"requests": ("socks",), "pytest": ()}
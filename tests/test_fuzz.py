@@ -0,0 +1,184 @@
+"""Tests for sully.fuzz and the sully_fuzz runner."""
+
+import enum
+import os
+import random
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from sully.fuzz import FuzzCase, FuzzResult, benchmark_path, discover_targets, run_fuzz, write_benchmarks
+from sully.runners.sully_fuzz import Signature, Unsupported, size_of, strategy_for
+
+SLOW = """\
+import signal
+import time
+
+
+def dedupe(items: list[int]) -> list[int]:
+    out: list[int] = []
+    for x in items:
+        if x not in out:
+            out.append(x)
+    return out
+
+
+def sleepy(text: str) -> int:
+    if text.count("a") > 20:
+        time.sleep(0.02)
+    return len(text)
+
+
+def stubborn(n: int) -> None:
+    if n > 3:
+        signal.signal(signal.SIGALRM, signal.SIG_IGN)
+        time.sleep(60)
+
+
+CALLS = [0]
+
+
+def late(n: int) -> int:
+    CALLS[0] += 1
+    if CALLS[0] > 80:
+        signal.signal(signal.SIGALRM, signal.SIG_IGN)
+        time.sleep(60)
+    return n
+
+
+def untyped(x) -> None:
+    pass
+"""
+
+# Takes longer to import than the supervisor waits on a single call.
+SLOW_IMPORT = """\
+import time
+
+time.sleep(2.5)
+
+
+def ident(n: int) -> int:
+    return n
+"""
+
+
+def _run_here(args: list[str], *, cwd: Path, env: dict[str, str]) -> subprocess.CompletedProcess[str]:
+    """Stand in for `uv run` by running the runner with this interpreter."""
+    pythonpath = os.pathsep.join([env["PYTHONPATH"], str(cwd)])
+    return subprocess.run(
+        [sys.executable, *args[1:]],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": pythonpath},
+    )
+
+
+@pytest.mark.parametrize(
+    ("annotation", "check"),
+    [
+        (int, lambda v: type(v) is int),
+        (str | None, lambda v: v is None or isinstance(v, str)),
+        (list[tuple[int, str]], lambda v: all(isinstance(a, int) and isinstance(b, str) for a, b in v)),
+        (dict[str, list[bytes]], lambda v: all(isinstance(b, bytes) for bs in v.values() for b in bs)),
+        (tuple[float, ...], lambda v: isinstance(v, tuple)),
+        (frozenset[int], lambda v: isinstance(v, frozenset)),
+    ],
+)
+def test_strategies_generate_and_mutate_within_type(annotation: object, check) -> None:
+    rng = random.Random(0)
+    strategy = strategy_for(annotation)
+    value = strategy.generate(rng, 50)
+    for _ in range(200):
+        assert check(value)
+        assert eval(repr(value)) == value  # cases are saved as repr
+        value = strategy.mutate(rng, value, 50)
+
+
+class Colour(enum.Enum):
+    RED = 1
+
+
+@pytest.mark.parametrize("annotation", [list, Colour, object])
+def test_unsupported_annotations(annotation: object) -> None:
+    with pytest.raises(Unsupported):
+        strategy_for(annotation)
+
+
+def test_signature_skips_defaults_and_splits_keyword_only() -> None:
+    def f(a: int, b: str = "x", *, c: bool, d: int = 0) -> None:
+        pass
+
+    sig = Signature(f)
+    args, kwargs = sig.split(sig.strategy.generate(random.Random(1), 10))
+    assert len(args) == 1 and list(kwargs) == ["c"]
+
+
+def test_size_of_counts_nested_lengths() -> None:
+    assert size_of(("abc", [1, 2], {"k": -5})) == 3 + (2 + 3) + (1 + 1 + 5) + 3
+
+
+def test_run_fuzz_finds_slow_inputs_and_hangs(tmp_path: Path) -> None:
+    (tmp_path / "slow.py").write_text(SLOW)
+    (tmp_path / "slow_import.py").write_text(SLOW_IMPORT)
+    targets = ["slow:dedupe", "slow:sleepy", "slow:stubborn", "slow:late", "slow:untyped", "slow_import:ident"]
+    with patch("sully.fuzz.uv") as mock_uv:
+        mock_uv.run_captured.side_effect = _run_here
+        results, skipped = run_fuzz(tmp_path, targets, budget=1.0, max_size=200)
+
+    assert skipped == {"slow:untyped": "parameter 'x' is not annotated"}
+    by_target = {r.target: r for r in results}
+    sleepy = by_target["slow:sleepy"]
+    assert eval(sleepy.cases[0].args)[0].count("a") > 20
+    assert sleepy.slowdown is not None and sleepy.slowdown > 10
+
+    # Ignores SIGALRM, so the supervisor has to kill it and report the input it was stuck on.
+    stubborn = by_target["slow:stubborn"]
+    assert stubborn.timeouts == 1
+    assert stubborn.cases[0].timeout and eval(stubborn.cases[0].args)[0] > 3
+
+    # Hangs mid-search: the cases kept before the kill are reported after the hung one.
+    late = by_target["slow:late"]
+    assert late.timeouts == 1 and late.cases[0].timeout
+    assert len(late.cases) == 3 and not any(c.timeout for c in late.cases[1:])
+    assert late.slowdown is not None
+
+    assert by_target["slow_import:ident"].timeouts == 0
+
+
+def test_discover_targets(tmp_path: Path) -> None:
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "core.py").write_text("def a(): ...\ndef _b(): ...\n")
+    (tmp_path / "pkg" / "_private.py").write_text("def c(): ...\n")
+    assert discover_targets(tmp_path) == ["pkg.core:a"]
+
+
+def test_write_benchmarks_replays_cases(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    (tmp_path / "replayed.py").write_text("CALLS = []\n\ndef f(x: int, *, s: str) -> None:\n    CALLS.append((x, s))\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    result = FuzzResult(
+        "replayed:f",
+        [FuzzCase("(3,)", "{'s': 'aa'}", 0.5, 5, True), FuzzCase("(1,)", "{'s': ''}", 0.1, 1, False)],
+        0.001,
+        10,
+        0,
+        1,
+    )
+    path = write_benchmarks(tmp_path / "benchmarks", result)
+    assert path == benchmark_path(tmp_path / "benchmarks", "replayed:f") == tmp_path / "benchmarks" / "fuzz_replayed_f.py"
+    source = path.read_text()
+    assert "cut off" in source
+
+    namespace: dict = {}
+    exec(compile(source, str(path), "exec"), namespace)
+    # The cut-off case is kept for replay by hand, but not as a benchmark.
+    assert "bench_f_case_1" not in namespace
+    namespace["hang_f_case_1"]()
+    namespace["bench_f_case_2"]()
+    import replayed
+
+    assert replayed.CALLS == [(3, "aa"), (1, "")]
+    assert write_benchmarks(tmp_path / "benchmarks", result._replace(target="replayed:g", cases=[])) is None
@@ -0,0 +1,135 @@
+"""Tests for sully.imports — deferrable import linting and lazy package rendering."""
+
+import ast
+import importlib
+import sys
+from pathlib import Path
+
+import pytest
+
+from sully import imports
+
+
+def _write(path: Path, source: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(source)
+    return path
+
+
+def test_flags_heavy_import_only_used_in_function(tmp_path: Path) -> None:
+    mod = _write(tmp_path / "mod.py", "import numpy as np\n\ndef f() -> None:\n    np.zeros(3)\n")
+    diags = imports.find_deferrable_imports(mod)
+    assert len(diags) == 1
+    assert diags[0].line == 1
+    assert '"np"' in diags[0].message
+    assert diags[0].rule == "reportDeferrableImport"
+
+
+def test_ignores_heavy_import_used_at_module_level(tmp_path: Path) -> None:
+    mod = _write(tmp_path / "mod.py", "import numpy\n\nZERO = numpy.zeros(1)\n\ndef f() -> None:\n    numpy.ones(1)\n")
+    assert imports.find_deferrable_imports(mod) == []
+
+
+def test_signature_annotations_count_as_import_time_use(tmp_path: Path) -> None:
+    mod = _write(tmp_path / "mod.py", "from pandas import DataFrame\n\ndef f(df: DataFrame) -> None:\n    DataFrame()\n")
+    assert imports.find_deferrable_imports(mod) == []
+
+
+def test_ignores_light_imports(tmp_path: Path) -> None:
+    mod = _write(tmp_path / "mod.py", "import json\n\ndef f() -> str:\n    return json.dumps(1)\n")
+    assert imports.find_deferrable_imports(mod) == []
+
+
+def test_custom_heavy_modules(tmp_path: Path) -> None:
+    mod = _write(tmp_path / "mod.py", "import json\n\ndef f() -> str:\n    return json.dumps(1)\n")
+    assert len(imports.find_deferrable_imports(mod, frozenset({"json"}))) == 1
+
+
+def test_public_names_honours_dunder_all(tmp_path: Path) -> None:
+    mod = _write(tmp_path / "mod.py", "__all__ = ['a']\n\ndef a() -> None: ...\ndef b() -> None: ...\n")
+    assert imports.public_names(mod) == ["a"]
+
+
+def test_public_names_collects_defs_and_constants(tmp_path: Path) -> None:
+    mod = _write(tmp_path / "mod.py", "X = 1\n_y = 2\nclass C: ...\ndef f() -> None: ...\ndef _g() -> None: ...\n")
+    assert imports.public_names(mod) == ["X", "C", "f"]
+
+
+def test_package_layout_submodule_names_win(tmp_path: Path) -> None:
+    pkg = tmp_path / "pkg"
+    _write(pkg / "main.py", "def main() -> None: ...\ndef greet() -> str: ...\n")
+    _write(pkg / "_private.py", "def hidden() -> None: ...\n")
+    submodules, exports = imports.package_layout(pkg)
+    assert submodules == ["main"]
+    assert exports == {"greet": "main"}
+
+
+def test_rendered_lazy_init_imports_on_access(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    pkg = tmp_path / "lazypkg"
+    _write(pkg / "core.py", "LOADED = True\n\ndef answer() -> int:\n    return 42\n")
+    submodules, exports = imports.package_layout(pkg)
+    _write(pkg / "__init__.py", imports.render_lazy_init("Lazy.", submodules, exports))
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    module = importlib.import_module("lazypkg")
+    try:
+        assert "lazypkg.core" not in sys.modules
+        assert module.answer() == 42
+        assert "lazypkg.core" in sys.modules
+        assert "answer" in dir(module)
+        with pytest.raises(AttributeError):
+            module.missing
+    finally:
+        for name in [n for n in sys.modules if n.startswith("lazypkg")]:
+            del sys.modules[name]
+
+
+def test_render_lazy_stub_reexports(tmp_path: Path) -> None:
+    stub = imports.render_lazy_stub(["core"], {"answer": "core"})
+    assert "from . import core as core" in stub
+    assert "from .core import answer as answer" in stub
+
+
+def test_is_replaceable_init(tmp_path: Path) -> None:
+    layout = (["core"], {"answer": "core"})
+    assert imports.is_replaceable_init(tmp_path / "missing.py", *layout)
+    eager = _write(tmp_path / "eager.py", '"""Doc."""\nfrom .core import answer\n__all__ = ["answer"]\n')
+    assert imports.is_replaceable_init(eager, *layout)
+    custom = _write(tmp_path / "custom.py", '"""Doc."""\nSETTING = 1\n')
+    assert not imports.is_replaceable_init(custom, *layout)
+
+
+@pytest.mark.parametrize(
+    ("source", "replaceable"),
+    [
+        ("from __future__ import annotations\nfrom . import core\nfrom .core import answer\n", True),
+        ("from pkg import core\nfrom pkg.core import answer\n", True),
+        ("from other.core import answer\n", False),
+        ("from .core import answer as reply\n", False),
+        ("from .core import *\n", False),
+        ("from .core import helper\n", False),
+        ("from ..other import answer\n", False),
+        ("import json\n", False),
+        ("try:\n    from .core import answer\nexcept ImportError:\n    answer = None\n", False),
+    ],
+)
+def test_is_replaceable_init_only_when_the_lazy_map_reproduces_it(
+    tmp_path: Path, source: str, replaceable: bool
+) -> None:
+    init = _write(tmp_path / "pkg" / "__init__.py", source)
+    assert imports.is_replaceable_init(init, ["core"], {"answer": "core"}) is replaceable
+
+
+def test_rendered_lazy_init_keeps_awkward_docstrings() -> None:
+    for doc in ['Uses """triple""" quotes', 'Ends with a quote"', "Has a \\ backslash and \\n escape"]:
+        rendered = imports.render_lazy_init(doc, ["core"], {})
+        assert ast.get_docstring(ast.parse(rendered), clean=False) == doc
+
+
+def test_imported_modules(tmp_path: Path) -> None:
+    path = tmp_path / "mod.py"
+    path.write_text(
+        "import os.path, numpy as np\nfrom . import sibling\nfrom pkg.sub import x\n\n"
+        "def f():\n    import yaml\n"
+    )
+    assert imports.imported_modules(path) == {"os", "numpy", "pkg", "yaml"}
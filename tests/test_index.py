@@ -0,0 +1,113 @@
+"""Tests for sully.index — the persistent project file index."""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+from sully.index import INDEX_FILE, ProjectIndex, project_files
+
+_OLD = time.time() - 3600
+
+
+def _age(*paths: Path) -> None:
+    """Backdate *paths*, all to the same moment, so the index trusts their size and mtime."""
+    for path in paths:
+        os.utime(path, (_OLD, _OLD))
+
+
+def _project(tmp_path: Path) -> Path:
+    pkg = tmp_path / "src" / "pkg"
+    pkg.mkdir(parents=True)
+    (pkg / "__init__.py").write_text("")
+    (pkg / "core.py").write_text(
+        "import json\nimport numpy as np\nfrom yaml import safe_load\n\n"
+        "LIMIT = 3\n\n\ndef parse(x):\n    return x\n\n\nasync def fetch():\n    pass\n\n\nclass Box:\n    pass\n"
+    )
+    (pkg / "data.bin").write_bytes(b"\0\1")
+    (pkg / "__pycache__").mkdir()
+    (pkg / "__pycache__" / "core.cpython-312.pyc").write_bytes(b"x")
+    return tmp_path
+
+
+def test_entries_summarise_python_files(tmp_path: Path) -> None:
+    root = _project(tmp_path)
+    entries = {e.path: e for e in project_files(root, ["src", "missing.toml"])}
+    assert sorted(entries) == ["src/pkg/__init__.py", "src/pkg/core.py", "src/pkg/data.bin"]
+
+    core = entries["src/pkg/core.py"]
+    assert core.module == "pkg.core"
+    assert core.imports == ("json", "numpy", "yaml")
+    assert core.public == ("LIMIT", "parse", "fetch", "Box")
+    assert core.functions == ("parse",)
+    assert core.sha256 == hashlib.sha256((root / "src/pkg/core.py").read_bytes()).hexdigest()
+    assert entries["src/pkg/__init__.py"].module == "pkg"
+    assert entries["src/pkg/data.bin"].module is None
+    assert [e.path for e in project_files(root, ["src"], ".py")] == ["src/pkg/__init__.py", "src/pkg/core.py"]
+    assert json.loads((root / INDEX_FILE).read_text())["version"]
+
+
+def test_build_output_is_skipped_only_at_the_root(tmp_path: Path) -> None:
+    root = _project(tmp_path)
+    (root / "src/pkg/build").mkdir()
+    (root / "src/pkg/build/steps.py").write_text("def run():\n    pass\n")
+    (root / "build/lib").mkdir(parents=True)
+    (root / "build/lib/core.py").write_text("")
+    (root / "pyproject.toml").write_text("")
+    paths = [e.path for e in project_files(root, ["."], ".py")]
+    assert "src/pkg/build/steps.py" in paths
+    assert not any(path.startswith("build/") for path in paths)
+
+
+def test_unchanged_files_and_directories_are_not_read_again(tmp_path: Path) -> None:
+    root = _project(tmp_path)
+    core, pkg = root / "src/pkg/core.py", root / "src/pkg"
+    _age(core, pkg)
+    before = {e.path: e for e in project_files(root, ["src"])}
+
+    # Same size and mtime: the stored hash is trusted without reading the file.
+    stat = core.stat()
+    core.write_text(core.read_text().replace("LIMIT = 3", "LIMIT = 4"))
+    os.utime(core, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert {e.path: e for e in project_files(root, ["src"])}["src/pkg/core.py"] == before["src/pkg/core.py"]
+
+    # An unchanged directory mtime means the stored listing is reused.
+    (pkg / "new.py").write_text("")
+    _age(pkg)
+    assert "src/pkg/new.py" not in {e.path for e in project_files(root, ["src"])}
+
+    # A real modification is picked up.
+    os.utime(pkg)
+    core.write_text("import requests\n")
+    entries = {e.path: e for e in project_files(root, ["src"])}
+    assert "src/pkg/new.py" in entries
+    assert entries["src/pkg/core.py"].imports == ("requests",)
+
+
+def test_recent_writes_are_rechecked(tmp_path: Path) -> None:
+    root = _project(tmp_path)
+    core = root / "src/pkg/core.py"
+    first = ProjectIndex(root).files(["src/pkg/core.py"])[0]
+    stat = core.stat()
+    core.write_text(core.read_text().replace("LIMIT = 3", "LIMIT = 4"))
+    os.utime(core, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    again = ProjectIndex(root).files(["src/pkg/core.py"])[0]
+    assert (again.size, again.mtime_ns) == (first.size, first.mtime_ns)
+    assert again.sha256 != first.sha256
+
+
+def test_deleted_files_and_directories_are_forgotten(tmp_path: Path) -> None:
+    root = _project(tmp_path)
+    project_files(root, ["src"])
+    (root / "src/pkg/core.py").unlink()
+    assert [e.path for e in project_files(root, ["src"], ".py")] == ["src/pkg/__init__.py"]
+    for child in (root / "src/pkg").glob("*"):
+        if child.is_file():
+            child.unlink()
+    (root / "src/pkg/__pycache__/core.cpython-312.pyc").unlink()
+    (root / "src/pkg/__pycache__").rmdir()
+    (root / "src/pkg").rmdir()
+    assert project_files(root, ["src"]) == []
+    stored = json.loads((root / INDEX_FILE).read_text())
+    assert stored["files"] == {} and list(stored["dirs"]) == ["src"]
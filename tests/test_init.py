@@ -67,6 +67,7 @@ def test_init_pyrightconfig_content(tmp_path: Path, monkeypatch: Path) -> None:
     assert data["typeCheckingMode"] == "strict"
     assert data["include"] == ["src"]
     assert data["pythonVersion"] == "3.12"
+    assert data["stubPath"] == ".sully/stubs"
 
 
 def test_init_custom_python_version(tmp_path: Path, monkeypatch: Path) -> None:
@@ -89,7 +90,7 @@ def test_init_calls_uv_pin_and_sync(tmp_path: Path, monkeypatch: Path) -> None:
 
     mock_uv.ensure_uv.assert_called_once()
     mock_uv.pin_python.assert_called_once_with("3.12", cwd=root)
-    mock_uv.sync.assert_called_once_with(cwd=root)
+    mock_uv.sync.assert_called_once_with(cwd=root, find_links=None)
 
 
 def test_init_generated_main_is_typed(tmp_path: Path, monkeypatch: Path) -> None:
@@ -141,6 +142,8 @@ def test_init_ci_workflow_content(tmp_path: Path, monkeypatch: Path) -> None:
     assert "actions/deploy-pages@v4" in content
     assert "astral-sh/setup-uv@v4" in content
     assert "3.12" in content
+    assert "enable-cache: true" in content
+    assert "needs: [check, test, doc]" in content
 
 
 def test_init_hyphenated_name(tmp_path: Path, monkeypatch: Path) -> None:
@@ -154,3 +157,100 @@ def test_init_hyphenated_name(tmp_path: Path, monkeypatch: Path) -> None:
 
     content = (root / "pyproject.toml").read_text()
     assert 'main = "src/my_app/main.py"' in content
+
+
+def test_init_writes_lazy_package_init(tmp_path: Path, monkeypatch: Path) -> None:
+    """The package __init__.py should be a PEP 562 lazy loader with a matching stub."""
+    monkeypatch.chdir(tmp_path)
+    _invoke_init(tmp_path)
+    pkg = tmp_path / "myapp" / "src" / "myapp"
+
+    init = (pkg / "__init__.py").read_text()
+    assert '"""Top-level package for myapp."""' in init
+    assert "def __getattr__(name: str) -> object:" in init
+    stub = (pkg / "__init__.pyi").read_text()
+    assert "from . import main as main" in stub
+    assert "from .main import greet as greet" in stub
+
+
+def test_init_seeds_template_then_links_from_it(tmp_path: Path, monkeypatch: Path) -> None:
+    """The first init seeds the template cache; the next one hard-links its environment."""
+    monkeypatch.chdir(tmp_path)
+
+    def fake_sync(cwd: Path, find_links: Path | None = None) -> None:
+        if not (cwd / ".venv").exists():
+            (cwd / ".venv" / "bin").mkdir(parents=True)
+            (cwd / ".venv" / "bin" / "pytest").write_text(f"#!{cwd}/.venv/bin/python\n")
+            (cwd / "uv.lock").write_text(f'[[package]]\nname = "{cwd.name}"\n')
+
+    runner = CliRunner()
+    with patch("sully.commands.init.uv") as mock_uv:
+        mock_uv.sync.side_effect = fake_sync
+        runner.invoke(cli, ["init", "first"], catch_exceptions=False)
+        result = runner.invoke(cli, ["init", "second"], catch_exceptions=False)
+
+    assert result.exit_code == 0
+    second = tmp_path / "second"
+    assert (second / ".venv" / "bin" / "pytest").read_text() == f"#!{second}/.venv/bin/python\n"
+    assert (second / "uv.lock").read_text() == '[[package]]\nname = "second"\n'
+    assert mock_uv.sync.call_count == 2
+
+
+def test_init_no_template_skips_cache(tmp_path: Path, monkeypatch: Path) -> None:
+    monkeypatch.chdir(tmp_path)
+    with patch("sully.commands.init.seed_template") as mock_seed, \
+         patch("sully.commands.init.find_template") as mock_find:
+        _invoke_init(tmp_path, extra_args=["--no-template"])
+    mock_find.assert_not_called()
+    mock_seed.assert_not_called()
+
+
+def test_init_survives_template_races(tmp_path: Path, monkeypatch: Path) -> None:
+    """A template vanishing mid-link, or a seed failing, still leaves a synced project."""
+    monkeypatch.chdir(tmp_path)
+    with patch("sully.commands.init.find_template", return_value=tmp_path / "gone"), \
+         patch("sully.commands.init.materialise", side_effect=FileNotFoundError("gone")), \
+         patch("sully.commands.init.seed_template", side_effect=OSError("Directory not empty")) as mock_seed:
+        result, root, mock_uv = _invoke_init(tmp_path)
+    assert result.exit_code == 0
+    assert "Created project 'myapp'" in result.output
+    mock_uv.sync.assert_called_once()
+    mock_seed.assert_called_once()
+
+
+def test_init_many_from_spec(tmp_path: Path, monkeypatch: Path) -> None:
+    monkeypatch.chdir(tmp_path)
+    spec = tmp_path / "spec.toml"
+    spec.write_text('python = "3.11"\n\n[[project]]\nname = "svc-a"\n\n[[project]]\nname = "svc-b"\npython = "3.13"\n')
+    runner = CliRunner()
+    with patch("sully.commands.init.uv") as mock_uv:
+        result = runner.invoke(cli, ["init", "--many", str(spec)], catch_exceptions=False)
+
+    assert result.exit_code == 0
+    assert (tmp_path / "svc-a" / "src" / "svc_a" / "main.py").is_file()
+    assert (tmp_path / "svc-b" / "src" / "svc_b" / "main.py").is_file()
+    assert ">=3.13" in (tmp_path / "svc-b" / "pyproject.toml").read_text()
+    pins = [c.args[0] for c in mock_uv.pin_python.call_args_list]
+    assert pins == ["3.11", "3.13"]
+    mock_uv.ensure_uv.assert_called_once()
+
+
+def test_init_many_checks_all_targets_first(tmp_path: Path, monkeypatch: Path) -> None:
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "svc-b").mkdir()
+    spec = tmp_path / "spec.toml"
+    spec.write_text('[[project]]\nname = "svc-a"\n\n[[project]]\nname = "svc-b"\n')
+    runner = CliRunner()
+    with patch("sully.commands.init.uv"):
+        result = runner.invoke(cli, ["init", "--many", str(spec)])
+    assert result.exit_code != 0
+    assert "'svc-b' already exists" in result.output
+    assert not (tmp_path / "svc-a").exists()
+
+
+def test_init_rejects_name_and_many(tmp_path: Path, monkeypatch: Path) -> None:
+    monkeypatch.chdir(tmp_path)
+    spec = tmp_path / "spec.toml"
+    spec.write_text('[[project]]\nname = "svc-a"\n')
+    result = CliRunner().invoke(cli, ["init", "x", "--many", str(spec)])
+    assert result.exit_code != 0
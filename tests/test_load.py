@@ -0,0 +1,116 @@
+"""Tests for sully.load and the sully_load runner."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from sully.load import LoadReport, run_load, slo_violations
+from sully.runners.sully_load import Histogram
+
+APP = """\
+import asyncio
+import time
+
+
+def handle():
+    time.sleep(0.001)
+
+
+async def ahandle():
+    await asyncio.sleep(0.001)
+
+
+def broken():
+    raise ValueError("boom")
+"""
+
+
+def _run_here(args: list[str], *, cwd: Path, env: dict[str, str]) -> subprocess.CompletedProcess[str]:
+    """Stand in for `uv run` by running the runner with this interpreter."""
+    pythonpath = os.pathsep.join([env["PYTHONPATH"], str(cwd)])
+    return subprocess.run(
+        [sys.executable, *args[1:]],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": pythonpath},
+    )
+
+
+@pytest.fixture()
+def app(tmp_path: Path) -> Path:
+    (tmp_path / "app.py").write_text(APP)
+    return tmp_path
+
+
+def test_histogram_percentiles_within_precision() -> None:
+    hist = Histogram()
+    for value in range(1, 10_001):
+        hist.record(value)
+    assert hist.total == 10_000
+    assert hist.max == 10_000
+    for percent, exact in ((50, 5_000), (99, 9_900), (99.9, 9_990)):
+        assert abs(hist.percentile(percent) - exact) / exact < 0.01
+    assert hist.percentile(100) == 10_000
+    assert hist.mean() == pytest.approx(5_000.5)
+
+
+def test_histogram_merge_and_round_trip() -> None:
+    a, b = Histogram(), Histogram()
+    a.record(10, 3)
+    b.record(1_000_000)
+    a.merge(Histogram.from_json(b.to_json()))
+    assert a.total == 4
+    assert a.max == 1_000_000
+    assert a.percentile(50) == 10
+    assert Histogram().percentile(99) == 0
+
+
+@pytest.mark.parametrize(("target", "mode"), [("app:handle", "auto"), ("app:ahandle", "auto"), ("app:handle", "process")])
+def test_run_load_modes(app: Path, target: str, mode: str) -> None:
+    with patch("sully.load.uv") as mock_uv:
+        mock_uv.run_captured.side_effect = _run_here
+        report = run_load(app, target, mode=mode, concurrency=2, duration=0.3)
+    assert report.mode == ("async" if target == "app:ahandle" else "thread" if mode == "auto" else "process")
+    assert report.requests > 10
+    assert report.errors == 0
+    assert report.latency_ms["p50"] >= 1.0
+    assert report.latency_ms["p50"] <= report.latency_ms["p99"] <= report.latency_ms["max"]
+
+
+def test_run_load_open_loop_rate(app: Path) -> None:
+    with patch("sully.load.uv") as mock_uv:
+        mock_uv.run_captured.side_effect = _run_here
+        report = run_load(app, "app:handle", concurrency=2, rate=100, duration=0.5)
+    assert report.requests == 50
+
+
+def test_run_load_counts_errors(app: Path) -> None:
+    with patch("sully.load.uv") as mock_uv:
+        mock_uv.run_captured.side_effect = _run_here
+        report = run_load(app, "app:broken", duration=0.1)
+    assert report.requests == report.errors > 0
+    assert report.error_rate == 1.0
+
+
+def test_run_load_reports_runner_failure(app: Path) -> None:
+    with patch("sully.load.uv") as mock_uv:
+        mock_uv.run_captured.side_effect = _run_here
+        with pytest.raises(RuntimeError, match="Load run failed"):
+            run_load(app, "app:ahandle", mode="thread", duration=0.1)
+
+
+def test_slo_violations() -> None:
+    latency = {"p50": 2.0, "p90": 4.0, "p99": 30.0, "p999": 80.0, "max": 90.0, "mean": 3.0}
+    report = LoadReport("thread", 1000, 20, 10.0, 100.0, latency)
+    assert slo_violations(report, {"p99-ms": 50, "max-error-rate": 0.05, "min-rps": 50}) == []
+    problems = slo_violations(report, {"p99-ms": 20, "p999-ms": 100, "min-rps": 500, "max-error-rate": 0.01})
+    assert problems == [
+        "p99 latency 30.00 ms exceeds 20 ms",
+        "throughput 100/s is below 500/s",
+        "error rate 2.00% exceeds 1.00%",
+    ]
@@ -0,0 +1,73 @@
+"""Tests for sully.lockfile — uv.lock parsing and closures."""
+
+from pathlib import Path
+
+from sully.lockfile import closure, read_lock
+
+_LOCK = """\
+version = 1
+requires-python = ">=3.12"
+
+[[package]]
+name = "demo"
+version = "0.1.0"
+source = { editable = "." }
+dependencies = [
+    { name = "httpx" },
+    { name = "requests", extra = ["socks"] },
+]
+
+[[package]]
+name = "httpx"
+version = "0.27.0"
+source = { registry = "https://pypi.org/simple" }
+dependencies = [
+    { name = "anyio" },
+    { name = "certifi" },
+]
+
+[[package]]
+name = "anyio"
+version = "4.4.0"
+source = { registry = "https://pypi.org/simple" }
+
+[[package]]
+name = "certifi"
+version = "2024.7.4"
+source = { registry = "https://pypi.org/simple" }
+
+[[package]]
+name = "requests"
+version = "2.32.3"
+source = { registry = "https://pypi.org/simple" }
+dependencies = [
+    { name = "certifi" },
+]
+
+[package.optional-dependencies]
+socks = [
+    { name = "pysocks" },
+]
+
+[[package]]
+name = "pysocks"
+version = "1.7.1"
+source = { registry = "https://pypi.org/simple" }
+"""
+
+
+def test_read_lock(tmp_path: Path) -> None:
+    (tmp_path / "uv.lock").write_text(_LOCK)
+    packages = read_lock(tmp_path / "uv.lock")
+    assert packages["httpx"].version == "0.27.0"
+    assert packages["demo"].dependencies == [("httpx", ()), ("requests", ("socks",))]
+    assert packages["requests"].optional == {"socks": [("pysocks", ())]}
+
+
+def test_closure_follows_extras(tmp_path: Path) -> None:
+    (tmp_path / "uv.lock").write_text(_LOCK)
+    packages = read_lock(tmp_path / "uv.lock")
+    assert closure(packages, "httpx") == {"httpx", "anyio", "certifi"}
+    assert closure(packages, "requests") == {"requests", "certifi"}
+    assert closure(packages, "requests", ("socks",)) == {"requests", "certifi", "pysocks"}
+    assert closure(packages, "missing") == set()
@@ -0,0 +1,74 @@
+"""Tests for the sully_loop event-loop stall detector."""
+
+import asyncio
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from sully.runners import runner_env
+from sully.runners.sully_loop import LoopMonitor
+
+
+def _block(seconds: float) -> None:
+    time.sleep(seconds)
+
+
+async def _handler() -> None:
+    await asyncio.sleep(0)
+    _block(0.06)
+
+
+async def _main() -> None:
+    await asyncio.gather(_handler(), asyncio.sleep(0.001))
+    asyncio.get_running_loop().call_soon(_block, 0.04)
+    await asyncio.sleep(0.06)
+
+
+def test_monitor_attributes_stalls_and_samples_the_blocking_stack() -> None:
+    with LoopMonitor(0.02) as monitor:
+        asyncio.run(_main())
+
+    by_function = {s.function.split(" ")[0]: s for s in monitor.stalls}
+    assert set(by_function) == {"_handler", "_block"}
+    task_step = by_function["_handler"]
+    assert task_step.task is not None
+    assert task_step.seconds >= 0.06
+    assert task_step.stack is not None
+    assert [frame.rsplit(" in ", 1)[1] for frame in task_step.stack[-2:]] == ["_handler", "_block"]
+    assert by_function["_block"].task is None
+    assert monitor.stats[by_function["_block"].function].count == 1
+
+
+def test_monitor_ignores_fast_steps_and_uninstalls() -> None:
+    original = asyncio.events.Handle._run
+    with LoopMonitor(0.05) as monitor:
+        assert asyncio.events.Handle._run is not original
+        asyncio.run(asyncio.sleep(0.01))
+    assert asyncio.events.Handle._run is original
+    assert monitor.stalls == []
+    assert monitor.report() == ["no loop steps over 50 ms"]
+
+
+def test_runner_reports_after_the_script_exits(tmp_path: Path) -> None:
+    script = tmp_path / "app.py"
+    script.write_text(
+        "import asyncio, sys, time\n\n\n"
+        "async def main():\n"
+        "    time.sleep(0.05)\n\n\n"
+        "asyncio.run(main())\n"
+        "sys.exit(3)\n"
+    )
+    env = {**os.environ, "PYTHONPATH": runner_env()["PYTHONPATH"]}
+    result = subprocess.run(
+        [sys.executable, "-m", "sully_loop", "--threshold-ms=20", str(script)],
+        cwd=tmp_path,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 3
+    assert "1 loop step(s) over 20 ms" in result.stderr
+    assert "main (app.py:4)" in result.stderr
+    assert "app.py:5 in main" in result.stderr
@@ -0,0 +1,129 @@
+"""Tests for sully.perf — AST performance anti-pattern detection."""
+
+import json
+from pathlib import Path
+
+from sully import perf
+
+
+def _rules(source: str) -> list[str]:
+    return [rule for _, _, rule, _ in perf.analyse_source(source)]
+
+
+def test_regex_compiled_in_loop() -> None:
+    source = "import re\nfor line in lines:\n    re.compile(r'\\d+').match(line)\n"
+    assert _rules(source) == ["reportRegexInLoop"]
+
+
+def test_regex_compiled_from_variable_pattern_is_fine() -> None:
+    assert _rules("import re\nx = [re.compile(p) for p in patterns]\n") == []
+
+
+def test_regex_at_module_level_is_fine() -> None:
+    assert _rules("import re\nPAT = re.compile(r'\\d+')\n") == []
+
+
+def test_regex_literal_in_comprehension() -> None:
+    assert _rules("import re\nx = [re.match('a+', s) for s in items]\n") == ["reportRegexInLoop"]
+
+
+def test_function_defined_in_loop_is_not_in_loop() -> None:
+    source = "import re\nfor i in range(3):\n    def f() -> None:\n        re.compile('a')\n"
+    assert _rules(source) == []
+
+
+def test_string_concat_in_loop() -> None:
+    source = "def f(xs: list[str]) -> str:\n    out = ''\n    for x in xs:\n        out += x\n    return out\n"
+    assert _rules(source) == ["reportStringConcatInLoop"]
+
+
+def test_int_accumulation_in_loop_is_fine() -> None:
+    source = "total = 0\nfor x in xs:\n    total += x\n"
+    assert _rules(source) == []
+
+
+def test_list_membership_in_loop() -> None:
+    source = "seen = []\nfor x in xs:\n    if x not in seen:\n        seen.append(x)\n"
+    assert _rules(source) == ["reportListMembershipInLoop"]
+
+
+def test_set_membership_in_loop_is_fine() -> None:
+    source = "seen = set()\nfor x in xs:\n    if x in seen:\n        pass\n"
+    assert _rules(source) == []
+
+
+def test_list_pop_front_and_insert_front() -> None:
+    assert _rules("queue.pop(0)\nqueue.insert(0, item)\n") == ["reportListFrontMutation"] * 2
+    assert _rules("queue.pop()\nd.pop(0, None)\n") == []
+
+
+def test_front_mutation_on_known_dict_is_fine() -> None:
+    assert _rules("d = {0: 'a'}\nd.pop(0)\ne: dict[int, str] = load()\ne.pop(0)\n") == []
+
+
+def test_sorted_for_min_max() -> None:
+    assert _rules("a = sorted(xs)[0]\nb = sorted(xs)[-1]\nc = sorted(xs)[1]\n") == ["reportSortedForMinMax"] * 2
+
+
+def test_dataclass_without_slots() -> None:
+    source = (
+        "from dataclasses import dataclass\n"
+        "@dataclass\nclass A:\n    x: int\n"
+        "@dataclass(slots=True)\nclass B:\n    x: int\n"
+    )
+    assert _rules(source) == ["reportDataclassWithoutSlots"]
+
+
+def test_syntax_error_yields_nothing() -> None:
+    assert perf.analyse_source("def oops(\n") == []
+
+
+def test_scan_applies_severity_and_hot_modules(tmp_path: Path) -> None:
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "hot.py").write_text("from dataclasses import dataclass\n@dataclass\nclass A:\n    x: int\nq.pop(0)\n")
+    (src / "cold.py").write_text("from dataclasses import dataclass\n@dataclass\nclass A:\n    x: int\n")
+
+    diags = perf.scan(
+        sorted(src.glob("*.py")),
+        tmp_path,
+        {"reportListFrontMutation": "information"},
+        ["src/hot.py"],
+    )
+    found = {(d.path.name, d.rule, d.severity) for d in diags}
+    assert found == {
+        ("hot.py", "reportDataclassWithoutSlots", "warning"),
+        ("hot.py", "reportListFrontMutation", "information"),
+    }
+
+
+def test_scan_severity_none_disables_rule(tmp_path: Path) -> None:
+    mod = tmp_path / "mod.py"
+    mod.write_text("q.pop(0)\n")
+    assert perf.scan([mod], tmp_path, {"reportListFrontMutation": "none"}, []) == []
+
+
+def test_scan_reuses_cache_for_unchanged_files(tmp_path: Path) -> None:
+    mod = tmp_path / "mod.py"
+    mod.write_text("q.pop(0)\n")
+    cache = tmp_path / "cache.json"
+    perf.scan([mod], tmp_path, {}, [], cache_file=cache)
+
+    # Tamper with the cached findings: an unchanged file must be served from cache.
+    data = json.loads(cache.read_text())
+    data["files"][str(mod)]["findings"] = []
+    cache.write_text(json.dumps(data))
+    assert perf.scan([mod], tmp_path, {}, [], cache_file=cache) == []
+
+    mod.write_text("q.pop(0)\n\n")
+    assert len(perf.scan([mod], tmp_path, {}, [], cache_file=cache)) == 1
+
+
+def test_scan_parallel_matches_serial(tmp_path: Path) -> None:
+    files = []
+    for i in range(perf._PARALLEL_THRESHOLD + 2):
+        mod = tmp_path / f"mod{i}.py"
+        mod.write_text("q.pop(0)\n")
+        files.append(mod)
+    diags = perf.scan(files, tmp_path, {}, [])
+    assert len(diags) == len(files)
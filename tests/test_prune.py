@@ -0,0 +1,85 @@
+"""Tests for sully.prune — declared versus imported dependencies."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+from sully.deps import Edit
+from sully.prune import Finding, find_prunable, fixes, scan_imports
+
+
+def _project(tmp_path: Path) -> Path:
+    (tmp_path / "pyproject.toml").write_text(
+        '[project]\nname = "demo"\n'
+        'dependencies = ["httpx>=0.27", "PyYAML", "rich", "freezegun", "gunicorn"]\n\n'
+        '[dependency-groups]\ndev = ["pytest", "hypothesis", "mock"]\n'
+    )
+    pkg = tmp_path / "src" / "demo"
+    pkg.mkdir(parents=True)
+    (pkg / "__init__.py").write_text("")
+    (pkg / "core.py").write_text(
+        "import os\nimport httpx\nfrom . import util\nfrom demo import core\n\n"
+        "def load():\n    import yaml\n    import attrs\n    import notinstalled\n"
+    )
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "tests" / "helpers.py").write_text("")
+    (tmp_path / "tests" / "test_core.py").write_text(
+        "import pytest\nimport helpers\nfrom freezegun import freeze_time\nfrom hypothesis import given\nimport httpx\n"
+    )
+    return tmp_path
+
+
+_ENV = (
+    {
+        "httpx": {"httpx"},
+        "yaml": {"pyyaml"},
+        "rich": {"rich"},
+        "freezegun": {"freezegun"},
+        "attrs": {"attrs"},
+        "pytest": {"pytest"},
+        "hypothesis": {"hypothesis"},
+        "mock": {"mock"},
+        "gunicorn": {"gunicorn"},
+    },
+    {"gunicorn", "pytest"},
+)
+
+
+def test_scan_imports_excludes_stdlib_and_first_party(tmp_path: Path) -> None:
+    src, tests = scan_imports(_project(tmp_path))
+    assert src == {"httpx", "yaml", "attrs", "notinstalled"}
+    assert tests == {"pytest", "freezegun", "hypothesis", "httpx"}
+
+
+def test_find_prunable(tmp_path: Path) -> None:
+    with patch("sully.prune.environment_modules", return_value=_ENV):
+        findings = find_prunable(_project(tmp_path), keep=[])
+    assert sorted(findings) == sorted(
+        [
+            Finding("unused", "rich", "runtime", "rich"),
+            Finding("test-only", "freezegun", "runtime", "freezegun"),
+            Finding("unused", "mock", "dev", "mock"),
+            Finding("undeclared", "attrs", "runtime", "attrs"),
+            Finding("undeclared", "notinstalled", "runtime", ""),
+        ]
+    )
+
+
+def test_find_prunable_respects_keep(tmp_path: Path) -> None:
+    with patch("sully.prune.environment_modules", return_value=_ENV):
+        findings = find_prunable(_project(tmp_path), keep=["rich", "mock"])
+    assert {f.name for f in findings if f.kind == "unused"} == set()
+
+
+def test_fixes() -> None:
+    findings = [
+        Finding("unused", "rich", "runtime", "rich>=13"),
+        Finding("test-only", "freezegun", "runtime", "freezegun"),
+        Finding("undeclared", "attrs", "runtime", "attrs"),
+        Finding("undeclared", "notinstalled", "runtime", ""),
+    ]
+    assert fixes(findings) == [
+        Edit("remove", "rich>=13", "runtime"),
+        Edit("remove", "freezegun", "runtime"),
+        Edit("add", "freezegun", "dev"),
+        Edit("add", "attrs", "runtime"),
+    ]
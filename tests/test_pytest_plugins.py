@@ -0,0 +1,434 @@
+"""Tests for the pytest plugins sully injects into project test runs."""
+
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from sully.pytest_plugins import PLUGIN_DIR, plugin_env
+from sully.pytest_plugins.sully_fixtures import evict, load, store
+from sully.pytest_plugins.sully_shard import assign_shards
+from sully.runners import RUNNER_DIR
+
+
+def _pytest(tmp_path: Path, source: str, *args: str) -> subprocess.CompletedProcess[str]:
+    """Run pytest in a subprocess on *source* with the sully plugins importable."""
+    (tmp_path / "test_sample.py").write_text(source)
+    return subprocess.run(
+        [sys.executable, "-m", "pytest", "-p", "no:cacheprovider", *args, str(tmp_path)],
+        cwd=tmp_path,
+        env={**os.environ, **plugin_env()},
+        capture_output=True,
+        text=True,
+    )
+
+
+def test_plugin_env_prepends_plugin_dir(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("PYTHONPATH", "/elsewhere")
+    assert plugin_env()["PYTHONPATH"] == os.pathsep.join([str(PLUGIN_DIR), str(RUNNER_DIR), "/elsewhere"])
+
+
+# ---------------------------------------------------------------------------
+# sully_memory
+# ---------------------------------------------------------------------------
+
+_MEMORY_TESTS = """\
+import pytest
+
+
+def test_small() -> None:
+    assert sum(range(10)) == 45
+
+
+def test_big() -> None:
+    blob = bytearray(8 * 1024 * 1024)
+    assert len(blob)
+
+
+KEPT = []
+
+
+@pytest.mark.heavy
+def test_big_but_marked() -> None:
+    KEPT.append(bytearray(8 * 1024 * 1024))
+    assert len(KEPT[0])
+"""
+
+
+def test_memory_budget_fails_only_oversized_tests(tmp_path: Path) -> None:
+    result = _pytest(
+        tmp_path,
+        _MEMORY_TESTS,
+        "-p", "sully_memory", "--sully-memory", "--sully-memory-budget=2", "--sully-memory-marker=heavy=64",
+    )
+    assert result.returncode == 1, result.stdout
+    assert "1 failed, 2 passed" in result.stdout
+    assert "FAILED test_sample.py::test_big -" in result.stdout
+    assert "Memory budget exceeded" in result.stdout
+    # test_big's buffer is freed before it returns, so no site is blamed for the peak.
+    assert "the peak came from temporaries" in result.stdout
+    assert "sully memory" in result.stdout
+    assert "peak RSS" in result.stdout
+
+
+def test_memory_report_without_budget_passes(tmp_path: Path) -> None:
+    result = _pytest(tmp_path, _MEMORY_TESTS, "-p", "sully_memory", "--sully-memory")
+    assert result.returncode == 0, result.stdout
+    lines = [line for line in result.stdout.splitlines() if " MB  " in line]
+    # Largest consumers come first.
+    assert "test_big" in lines[0]
+    assert "still allocated at end: " in result.stdout
+
+
+def test_memory_plugin_inactive_without_flag(tmp_path: Path) -> None:
+    result = _pytest(tmp_path, _MEMORY_TESTS, "-p", "sully_memory")
+    assert result.returncode == 0
+    assert "sully memory" not in result.stdout
+
+
+# ---------------------------------------------------------------------------
+# sully_shard
+# ---------------------------------------------------------------------------
+
+_SHARD_TESTS = """\
+import pytest
+
+
+@pytest.mark.parametrize("n", range(6))
+def test_case(n: int) -> None:
+    assert n >= 0
+"""
+
+
+def test_assign_shards_balances_durations() -> None:
+    durations = {"a": 10.0, "b": 6.0, "c": 5.0, "d": 1.0}
+    # Longest first onto the lightest shard; "new" weighs the mean (5.5): a | b, new | c | d
+    assert assign_shards(["a", "b", "c", "d", "new"], durations, 2) == [0, 1, 0, 1, 1]
+    assert assign_shards(["x", "y", "z"], {}, 3) == [0, 1, 2]
+
+
+def test_shards_partition_the_suite(tmp_path: Path) -> None:
+    outputs = [_pytest(tmp_path, _SHARD_TESTS, "-p", "sully_shard", f"--sully-shard={k}/3", "-q") for k in (1, 2, 3)]
+    assert all(out.returncode == 0 for out in outputs)
+    assert [out.stdout.count("passed") for out in outputs] == [1, 1, 1]
+    assert sum(int(out.stdout.split(" passed")[0].split()[-1]) for out in outputs) == 6
+
+
+def test_record_durations_merges_into_file(tmp_path: Path) -> None:
+    durations = tmp_path / "durations.json"
+    durations.write_text('{"old::test": 1.5}')
+    result = _pytest(
+        tmp_path, _SHARD_TESTS, "-p", "sully_shard", f"--sully-durations={durations}", "--sully-record-durations"
+    )
+    assert result.returncode == 0, result.stdout
+    recorded = json.loads(durations.read_text())
+    assert recorded["old::test"] == 1.5
+    assert sum(1 for k in recorded if "test_case[" in k) == 6
+
+
+def test_invalid_shard_is_a_usage_error(tmp_path: Path) -> None:
+    result = _pytest(tmp_path, _SHARD_TESTS, "-p", "sully_shard", "--sully-shard=4/3")
+    assert result.returncode == 4
+    assert "--sully-shard must be K/N" in result.stderr
+
+
+# ---------------------------------------------------------------------------
+# sully_stall
+# ---------------------------------------------------------------------------
+
+_STALL_TESTS = """\
+import asyncio
+import time
+
+
+async def _fast() -> None:
+    await asyncio.sleep(0.001)
+
+
+async def _blocking() -> None:
+    time.sleep(0.1)
+
+
+def test_fast() -> None:
+    asyncio.run(_fast())
+
+
+def test_blocking() -> None:
+    asyncio.run(_blocking())
+"""
+
+
+def test_loop_budget_fails_only_blocking_tests(tmp_path: Path) -> None:
+    result = _pytest(tmp_path, _STALL_TESTS, "-p", "sully_stall", "--sully-loop", "--sully-loop-budget=50")
+    assert result.returncode == 1, result.stdout
+    assert "1 failed, 1 passed" in result.stdout
+    assert "FAILED test_sample.py::test_blocking" in result.stdout
+    assert "Event loop blocked longer than the 50 ms budget" in result.stdout
+    assert "test_sample.py:10 in _blocking" in result.stdout
+    assert "sully loop" in result.stdout
+
+
+def test_loop_monitor_without_budget_only_reports(tmp_path: Path) -> None:
+    result = _pytest(tmp_path, _STALL_TESTS, "-p", "sully_stall", "--sully-loop", "--sully-loop-threshold=50")
+    assert result.returncode == 0, result.stdout
+    assert "1 loop step(s) over 50 ms" in result.stdout
+    assert "test_sample.py::test_blocking" in result.stdout.split("longest stall per test:")[1]
+
+
+# ---------------------------------------------------------------------------
+# sully_async
+# ---------------------------------------------------------------------------
+
+_ASYNC_TESTS = """\
+import asyncio
+import time
+
+import pytest
+
+ORDER = []
+
+
+@pytest.fixture
+def resource():
+    ORDER.append("setup")
+    yield "ok"
+    ORDER.append("teardown")
+
+
+@pytest.mark.concurrent
+async def test_first(resource):
+    await asyncio.sleep(0.4)
+    assert resource == "ok"
+
+
+@pytest.mark.concurrent
+async def test_second(resource):
+    await asyncio.sleep(0.4)
+
+
+@pytest.mark.concurrent
+async def test_broken():
+    await asyncio.sleep(0.1)
+    raise ValueError("boom")
+
+
+@pytest.mark.concurrent
+async def test_hangs():
+    await asyncio.sleep(30)
+
+
+def test_serial():
+    assert ORDER == ["setup", "setup", "teardown", "teardown"]
+"""
+
+
+def test_async_batch_overlaps_and_isolates_failures(tmp_path: Path) -> None:
+    start = time.perf_counter()
+    result = _pytest(
+        tmp_path, _ASYNC_TESTS, "-p", "sully_async", "--sully-async-concurrency=4", "--sully-async-timeout=1", "-rA"
+    )
+    elapsed = time.perf_counter() - start
+    assert result.returncode == 1, result.stdout
+    assert "2 failed, 3 passed" in result.stdout
+    assert "FAILED test_sample.py::test_broken - ValueError: boom" in result.stdout
+    assert "FAILED test_sample.py::test_hangs - Failed: Timed out after 1 s" in result.stdout
+    assert "PASSED test_sample.py::test_serial" in result.stdout
+    assert elapsed < 5
+
+
+def test_async_concurrency_is_bounded(tmp_path: Path) -> None:
+    source = "import asyncio\n\nimport pytest\n" + "".join(
+        f"\n\n@pytest.mark.concurrent\nasync def test_{i}():\n    await asyncio.sleep(0.3)\n" for i in range(4)
+    )
+    result = _pytest(tmp_path, source, "-p", "sully_async", "--sully-async-concurrency=2", "--durations=0")
+    assert result.returncode == 0, result.stdout
+    assert "4 passed" in result.stdout
+    # Two rounds of two overlapping sleeps.
+    assert 0.6 <= float(result.stdout.split(" passed in ")[1].split("s")[0]) < 1.2
+
+
+_TEARDOWN_ORDER_TESTS = """\
+import asyncio
+
+import pytest
+
+EVENTS = []
+
+
+@pytest.fixture(scope="module")
+def shared():
+    EVENTS.append("setup shared")
+    yield
+    EVENTS.append("teardown shared")
+
+
+@pytest.fixture
+def outer(request, shared):
+    EVENTS.append(f"setup outer {request.node.name}")
+    yield request.node.name
+    EVENTS.append(f"teardown outer {request.node.name}")
+
+
+@pytest.fixture
+def inner(request, outer):
+    request.addfinalizer(lambda: EVENTS.append(f"finalizer {outer}"))
+    EVENTS.append(f"setup inner {outer}")
+    yield outer
+    EVENTS.append(f"teardown inner {outer}")
+
+
+@pytest.mark.concurrent
+async def test_a(inner):
+    await asyncio.sleep(0.05)
+    assert inner == "test_a"
+
+
+@pytest.mark.concurrent
+async def test_b(inner):
+    assert inner == "test_b"
+
+
+def test_zz_order():
+    assert EVENTS == [
+        "setup shared",
+        "setup outer test_a", "setup inner test_a",
+        "setup outer test_b", "setup inner test_b",
+        "teardown inner test_a", "finalizer test_a", "teardown outer test_a",
+        "teardown inner test_b", "finalizer test_b", "teardown outer test_b",
+    ], EVENTS
+"""
+
+
+def test_async_batch_tears_each_item_down_with_its_own_fixtures(tmp_path: Path) -> None:
+    """Detached items get their own fixture values back and tear down in order, as pytest would serially."""
+    result = _pytest(tmp_path, _TEARDOWN_ORDER_TESTS, "-p", "sully_async", "--sully-async-concurrency=2")
+    assert result.returncode == 0, result.stdout
+    assert "3 passed" in result.stdout
+
+
+def test_async_refuses_a_pytest_without_the_internals_it_needs(tmp_path: Path) -> None:
+    (tmp_path / "conftest.py").write_text("import _pytest.runner\n\ndel _pytest.runner.call_and_report\n")
+    result = _pytest(tmp_path, "def test_x():\n    pass\n", "-p", "sully_async", "--sully-async-concurrency=2")
+    assert result.returncode == 4
+    assert "needs pytest>=8.0,<10" in result.stderr
+    assert "lacks _pytest.runner.call_and_report" in result.stderr
+
+
+# ---------------------------------------------------------------------------
+# sully_fixtures
+# ---------------------------------------------------------------------------
+
+_FIXTURE_CONFTEST = """\
+from pathlib import Path
+
+from sully_fixtures import cached_fixture
+
+SCALE = 2
+
+
+def scaled(text):
+    return [len(line) * SCALE for line in text.splitlines()]
+
+
+@cached_fixture(inputs=["data/*.txt"])
+def table(tmp_path_factory):
+    with open("builds.log", "a") as log:
+        log.write("built\\n")
+    return {"lengths": scaled(Path("data/corpus.txt").read_text()), "blob": bytearray(b"x" * 100_000)}
+"""
+
+_FIXTURE_TESTS = """\
+def test_table(table):
+    assert table["lengths"] == [2 * 5, 2 * 3]
+    assert len(table["blob"]) == 100_000
+"""
+
+
+def test_cached_fixture_is_built_once_and_rebuilt_on_change(tmp_path: Path) -> None:
+    (tmp_path / "conftest.py").write_text(_FIXTURE_CONFTEST)
+    (tmp_path / "data").mkdir()
+    (tmp_path / "data" / "corpus.txt").write_text("hello\nabc\n")
+    builds = tmp_path / "builds.log"
+
+    first = _pytest(tmp_path, _FIXTURE_TESTS)
+    assert first.returncode == 0, first.stdout
+    assert "miss  table: built and stored" in first.stdout
+    second = _pytest(tmp_path, _FIXTURE_TESTS)
+    assert second.returncode == 0, second.stdout
+    assert "hit  table: loaded" in second.stdout
+    assert builds.read_text().count("built") == 1
+
+    # A helper the fixture calls changed: rebuild.
+    (tmp_path / "conftest.py").write_text(_FIXTURE_CONFTEST.replace("SCALE = 2", "SCALE = 3"))
+    assert _pytest(tmp_path, _FIXTURE_TESTS).returncode == 1
+    (tmp_path / "conftest.py").write_text(_FIXTURE_CONFTEST)
+    # A declared input changed: rebuild.
+    (tmp_path / "data" / "corpus.txt").write_text("hello\nxyz\n")
+    assert _pytest(tmp_path, _FIXTURE_TESTS).returncode == 0
+    assert builds.read_text().count("built") == 3
+    assert len(list((tmp_path / ".sully" / "fixtures").iterdir())) == 3
+
+
+_KEYED_CONFTEST = """\
+from sully_fixtures import cached_fixture
+
+KINDS = frozenset({"alpha", "beta", "gamma", "delta", "epsilon"})
+SIZES = [10, 20]
+
+
+@cached_fixture
+def sizes(tmp_path_factory):
+    with open("builds.log", "a") as log:
+        log.write("built\\n")
+    return sorted(KINDS), list(SIZES)
+"""
+
+
+def test_cached_fixture_key_is_stable_and_follows_mutable_globals(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (tmp_path / "conftest.py").write_text(_KEYED_CONFTEST)
+    tests = "def test_sizes(sizes):\n    assert sizes\n"
+    for seed in ("1", "2", "3"):  # frozenset repr order differs per hash seed
+        monkeypatch.setenv("PYTHONHASHSEED", seed)
+        assert _pytest(tmp_path, tests).returncode == 0
+    assert (tmp_path / "builds.log").read_text().count("built") == 1
+
+    (tmp_path / "conftest.py").write_text(_KEYED_CONFTEST.replace("[10, 20]", "[10, 30]"))
+    assert _pytest(tmp_path, tests).returncode == 0
+    assert (tmp_path / "builds.log").read_text().count("built") == 2
+
+
+def test_fixture_cache_off(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    (tmp_path / "conftest.py").write_text(_FIXTURE_CONFTEST)
+    (tmp_path / "data").mkdir()
+    (tmp_path / "data" / "corpus.txt").write_text("hello\nabc\n")
+    monkeypatch.setenv("SULLY_FIXTURE_CACHE", "off")
+    assert _pytest(tmp_path, _FIXTURE_TESTS).returncode == 0
+    assert _pytest(tmp_path, _FIXTURE_TESTS).returncode == 0
+    assert (tmp_path / "builds.log").read_text().count("built") == 2
+    assert not (tmp_path / ".sully").exists()
+
+
+def test_store_maps_buffers_back_copy_on_write(tmp_path: Path) -> None:
+    entry = tmp_path / "cache" / "blob-1"
+    value = {"blob": bytearray(range(256)) * 100, "label": "x"}
+    store(entry, value)
+    loaded = load(entry)
+    assert loaded == value
+    loaded["blob"][0] = 255
+    assert load(entry)["blob"][0] == 0
+
+
+def test_evict_by_age_then_least_recently_used(tmp_path: Path) -> None:
+    now = time.time()
+    for name, age in (("old", 40 * 86400), ("stale", 300), ("recent", 200), ("fresh", 0)):
+        store(tmp_path / name, bytearray(1000))
+        os.utime(tmp_path / name / "meta.json", (now - age, now - age))
+    removed = evict(tmp_path, max_bytes=2500, max_age=30 * 86400)
+    assert sorted(p.name for p in removed) == ["old", "stale"]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["fresh", "recent"]
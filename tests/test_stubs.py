@@ -0,0 +1,176 @@
+"""Tests for sully.stubs and the sully_stubgen runner — trimmed stubs for untyped dependencies."""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from sully.runners import runner_env
+from sully.stubs import STUB_DIR, build, is_fresh, pyright_config, register, stub_path, used_api
+
+_FANCY = """\
+from . import sub
+
+
+class Frame:
+    def __init__(self, data, *, copy=False):
+        self.data = data
+
+    def head(self, n=5):
+        return self
+
+    def __add__(self, other):
+        return self
+
+
+def read(path, /, sep=",", *cols, engine=None, **kw):
+    return Frame(path)
+
+
+async def fetch(url): ...
+
+
+VERSION = "1.0"
+"""
+
+
+@pytest.fixture
+def site(tmp_path: Path) -> Path:
+    """A directory of installed packages: ``fancy`` is untyped, ``typedpkg`` ships py.typed."""
+    site = tmp_path / "site"
+    (site / "fancy" / "sub").mkdir(parents=True)
+    (site / "fancy" / "__init__.py").write_text(_FANCY)
+    (site / "fancy" / "sub" / "__init__.py").write_text("def helper(x): return x\n")
+    (site / "typedpkg").mkdir()
+    (site / "typedpkg" / "__init__.py").write_text("")
+    (site / "typedpkg" / "py.typed").write_text("")
+    return site
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    root = tmp_path / "proj"
+    (root / "src" / "app").mkdir(parents=True)
+    (root / "pyproject.toml").write_text('[project]\nname = "app"\n')
+    (root / "uv.lock").write_text("version = 1\n")
+    (root / "src" / "app" / "__init__.py").write_text("")
+    (root / "src" / "app" / "main.py").write_text(
+        "import json\n"
+        "import fancy as fy\n"
+        "from fancy.sub import helper\n"
+        "from typedpkg import thing\n"
+        "from app import util\n"
+        "import absent\n\n"
+        "frame = fy.read('x').head()\n"
+        "fy.fetch\n"
+    )
+    return root
+
+
+def _run_here(site: Path) -> object:
+    """Stand in for `uv run` by running the runner with this interpreter and *site* importable."""
+
+    def run(args: list[str], *, cwd: Path, env: dict[str, str]) -> subprocess.CompletedProcess[str]:
+        path = os.pathsep.join([env["PYTHONPATH"], str(site)])
+        return subprocess.run(
+            [sys.executable, *args[1:]], cwd=cwd, env={**os.environ, "PYTHONPATH": path}, capture_output=True, text=True
+        )
+
+    return run
+
+
+def test_used_api_collects_third_party_names(project: Path) -> None:
+    assert used_api(project / "src") == {
+        "absent": [],
+        "fancy": ["fetch", "read"],
+        "fancy.sub": ["helper"],
+        "typedpkg": ["thing"],
+    }
+
+
+def test_stubgen_writes_trimmed_stubs(tmp_path: Path, site: Path) -> None:
+    api = {"fancy": ["Frame", "read", "fetch", "VERSION", "sub", "gone"], "typedpkg": ["x"], "absent": []}
+    proc = subprocess.run(
+        [sys.executable, "-m", "sully_stubgen", str(tmp_path / "out"), json.dumps(api)],
+        env={**os.environ, "PYTHONPATH": os.pathsep.join([runner_env()["PYTHONPATH"], str(site)])},
+        capture_output=True,
+        text=True,
+    )
+    assert proc.returncode == 0, proc.stderr
+    summary = json.loads(proc.stdout)
+    assert summary["stubbed"]["fancy"]["modules"] == 2
+    assert summary["stubbed"]["fancy"]["names"] == 5
+    assert summary["typed"] == {"typedpkg": "ships py.typed"}
+    assert summary["missing"] == ["absent"]
+
+    stub = (tmp_path / "out" / "fancy" / "__init__.pyi").read_text()
+    assert "from . import sub as sub" in stub
+    assert "    def __init__(self, data: Any, *, copy: Any = ...) -> None: ..." in stub
+    assert "    def __add__(self, *args: Any, **kwargs: Any) -> Any: ..." in stub
+    assert "    head: Any" in stub
+    assert "def read(path: Any, /, sep: Any = ..., *cols: Any, engine: Any = ..., **kw: Any) -> Any: ..." in stub
+    assert "async def fetch(url: Any) -> Any: ..." in stub
+    assert "VERSION: Any" in stub
+    assert "gone" not in stub
+    assert stub.endswith("def __getattr__(name: str) -> Any: ...\n")
+    assert (tmp_path / "out" / "fancy" / "sub" / "__init__.pyi").is_file()
+    assert not (tmp_path / "out" / "typedpkg").exists()
+
+
+def test_build_is_keyed_on_lock_and_imports(project: Path, site: Path) -> None:
+    with patch("sully.stubs.uv") as mock_uv:
+        mock_uv.run_captured.side_effect = _run_here(site)
+        assert not is_fresh(project, [])
+        report = build(project, [])
+    assert report.stubbed == {"fancy": "fancy: 2 module(s), 3 name(s)"}
+    assert report.typed == {"typedpkg": "ships py.typed"}
+    assert report.missing == ["absent"]
+    assert (project / STUB_DIR / "fancy" / "sub" / "__init__.pyi").is_file()
+    assert not list((project / ".sully").glob(".stubs-*"))
+    assert is_fresh(project, [])
+
+    (project / "src" / "app" / "more.py").write_text("import fancy\nfancy.VERSION\n")
+    assert not is_fresh(project, [])
+    (project / "src" / "app" / "more.py").unlink()
+    assert is_fresh(project, [])
+    (project / "uv.lock").write_text("version = 1\n# fancy upgraded\n")
+    assert not is_fresh(project, [])
+
+
+def test_build_leaves_excluded_packages_to_pyright(project: Path, site: Path) -> None:
+    with patch("sully.stubs.uv") as mock_uv:
+        mock_uv.run_captured.side_effect = _run_here(site)
+        report = build(project, ["fancy"])
+    assert report.stubbed == {}
+    assert not (project / STUB_DIR / "fancy").exists()
+
+
+def test_register_sets_stub_path_unless_taken(tmp_path: Path) -> None:
+    config = tmp_path / "pyrightconfig.json"
+    config.write_text(json.dumps({"include": ["src"], "typeCheckingMode": "strict"}))
+    assert register(tmp_path)
+    assert json.loads(config.read_text()) == {"include": ["src"], "typeCheckingMode": "strict", "stubPath": STUB_DIR}
+    assert stub_path(tmp_path) == STUB_DIR
+
+    config.write_text(json.dumps({"stubPath": "typings"}))
+    assert not register(tmp_path)
+    assert stub_path(tmp_path) == "typings"
+
+
+def test_register_uses_tool_pyright_and_needs_a_config(tmp_path: Path) -> None:
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text('[project]\nname = "app"\n')
+    assert pyright_config(tmp_path) is None
+    with pytest.raises(FileNotFoundError):
+        register(tmp_path)
+    assert not (tmp_path / "pyrightconfig.json").exists()
+
+    pyproject.write_text('[project]\nname = "app"\n\n[tool.pyright]\ntypeCheckingMode = "strict"  # keep\n')
+    assert register(tmp_path)
+    assert not (tmp_path / "pyrightconfig.json").exists()
+    assert 'typeCheckingMode = "strict"  # keep' in pyproject.read_text()
+    assert stub_path(tmp_path) == STUB_DIR
@@ -0,0 +1,114 @@
+"""Tests for sully.tasks — task graph planning and scheduling."""
+
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+from sully.tasks import BUILTIN_TASKS, Task, TaskResult, critical_path, fingerprint, load_tasks, plan, run_graph
+
+
+def _spec(cmd: object = None, inputs: list[str] = [], outputs: list[str] = [], deps: list[str] = []) -> dict:
+    return {"cmd": cmd, "inputs": inputs, "outputs": outputs, "deps": deps}
+
+
+def _py(code: str) -> list[str]:
+    return [sys.executable, "-c", code]
+
+
+def test_load_tasks_includes_builtins_and_splits_strings() -> None:
+    tasks = load_tasks({"gen": _spec("python gen.py --out 'a b'", deps=["check"])})
+    assert set(BUILTIN_TASKS) <= set(tasks)
+    assert tasks["gen"].cmd == ["python", "gen.py", "--out", "a b"]
+    assert tasks["gen"].deps == ["check"]
+
+
+def test_load_tasks_overrides_builtin() -> None:
+    tasks = load_tasks({"test": _spec(["pytest", "-x"])})
+    assert tasks["test"].cmd == ["pytest", "-x"]
+
+
+def test_plan_orders_dependencies_first() -> None:
+    tasks = load_tasks({"a": _spec("x", deps=["b", "c"]), "b": _spec("x", deps=["c"]), "c": _spec("x")})
+    assert [t.name for t in plan(tasks, ["a"])] == ["c", "b", "a"]
+
+
+def test_plan_rejects_cycles() -> None:
+    tasks = load_tasks({"a": _spec("x", deps=["b"]), "b": _spec("x", deps=["a"])})
+    with pytest.raises(ValueError, match="a -> b -> a"):
+        plan(tasks, ["a"])
+
+
+def test_plan_rejects_unknown_dep() -> None:
+    tasks = load_tasks({"a": _spec("x", deps=["missing"])})
+    with pytest.raises(ValueError, match="Unknown task 'missing' \\(required by 'a'\\)"):
+        plan(tasks, ["a"])
+
+
+def test_fingerprint_tracks_inputs(tmp_path: Path) -> None:
+    (tmp_path / "data").mkdir()
+    (tmp_path / "data" / "in.txt").write_text("one")
+    task = Task("t", ["true"], ["data/*.txt"], [], [])
+    before = fingerprint(tmp_path, task)
+    (tmp_path / "data" / "in.txt").write_text("two")
+    assert fingerprint(tmp_path, task) != before
+    assert fingerprint(tmp_path, task._replace(inputs=[])) is None
+
+
+def test_run_graph_skips_up_to_date_tasks(tmp_path: Path) -> None:
+    (tmp_path / "in.txt").write_text("x")
+    task = Task("copy", _py("open('out.txt','w').write(open('in.txt').read())"), ["in.txt"], ["out.txt"], [])
+    state = tmp_path / ".sully" / "tasks.json"
+
+    assert run_graph(tmp_path, [task], state_file=state)["copy"].status == "ran"
+    assert run_graph(tmp_path, [task], state_file=state)["copy"].status == "skipped"
+
+    (tmp_path / "out.txt").write_text("tampered")
+    assert run_graph(tmp_path, [task], state_file=state)["copy"].status == "ran"
+    assert run_graph(tmp_path, [task], state_file=state, force=True)["copy"].status == "ran"
+
+
+def test_run_graph_runs_independent_tasks_concurrently(tmp_path: Path) -> None:
+    # Both tasks wait for the other's marker file, so they only finish if run at the same time.
+    wait = "import os,time\nopen('{me}','w').close()\nfor _ in range(200):\n    if os.path.exists('{other}'): break\n    time.sleep(0.02)\nelse: raise SystemExit(1)"
+    a = Task("a", _py(wait.format(me="a.flag", other="b.flag")), [], [], [])
+    b = Task("b", _py(wait.format(me="b.flag", other="a.flag")), [], [], [])
+    results = run_graph(tmp_path, [a, b], jobs=2)
+    assert results["a"].status == results["b"].status == "ran"
+
+
+def test_run_graph_blocks_dependents_of_failures(tmp_path: Path) -> None:
+    bad = Task("bad", _py("raise SystemExit(3)"), [], [], [])
+    after = Task("after", _py("pass"), [], [], ["bad"])
+    seen: list[str] = []
+    lock = threading.Lock()
+
+    def record(result: TaskResult) -> None:
+        with lock:
+            seen.append(result.task.name)
+
+    results = run_graph(tmp_path, [bad, after], on_done=record)
+    assert results["bad"].status == "failed"
+    assert results["bad"].returncode == 3
+    assert results["after"].status == "blocked"
+    assert seen == ["bad", "after"]
+
+
+def test_run_graph_reports_a_missing_command_as_a_failure(tmp_path: Path) -> None:
+    missing = Task("gen", ["no-such-command-for-sully"], [], [], [])
+    results = run_graph(tmp_path, [missing, Task("after", _py("pass"), [], [], ["gen"])])
+    assert results["gen"].status == "failed"
+    assert results["gen"].returncode == 127
+    assert "no-such-command-for-sully" in results["gen"].output
+    assert results["after"].status == "blocked"
+
+
+def test_critical_path_follows_slowest_chain() -> None:
+    tasks = [Task("a", None, [], [], []), Task("b", None, [], [], []), Task("c", None, [], [], ["a", "b"])]
+    results = {
+        "a": TaskResult(tasks[0], "ran", 0, "", 1.0),
+        "b": TaskResult(tasks[1], "ran", 0, "", 3.0),
+        "c": TaskResult(tasks[2], "ran", 0, "", 0.5),
+    }
+    assert critical_path(tasks, results) == (["b", "c"], 3.5)
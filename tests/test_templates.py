@@ -0,0 +1,89 @@
+"""Tests for sully.templates — the hard-linked init template cache."""
+
+import json
+import os
+import time
+from pathlib import Path
+
+from sully import templates
+
+DEV = ["pyright", "pytest", "pdoc"]
+
+
+def _fake_synced_project(root: Path, name: str) -> Path:
+    venv = root / ".venv"
+    (venv / "bin").mkdir(parents=True)
+    (venv / "lib" / "site-packages" / "pytest").mkdir(parents=True)
+    (venv / "lib" / "site-packages" / "pytest" / "__init__.py").write_text("# pytest\n")
+    script = venv / "bin" / "pytest"
+    script.write_text(f"#!{venv}/bin/python\nimport pytest\n")
+    script.chmod(0o755)
+    (venv / "bin" / "python").symlink_to("/usr/bin/python3")
+    (venv / "lib64").symlink_to("lib")
+    (root / "uv.lock").write_text(
+        f'version = 1\n\n[[package]]\nname = "{name}"\nversion = "0.1.0"\nsource = {{ virtual = "." }}\n\n'
+        '[[package]]\nname = "pytest"\nversion = "8.0.0"\n'
+    )
+    return root
+
+
+def test_link_tree_hard_links_and_rewrites_scripts(tmp_path: Path) -> None:
+    src = _fake_synced_project(tmp_path / "a", "a") / ".venv"
+    dst = tmp_path / "b" / ".venv"
+    templates.link_tree(src, dst, str(src), str(dst))
+
+    lib_file = dst / "lib" / "site-packages" / "pytest" / "__init__.py"
+    assert os.stat(lib_file).st_ino == os.stat(src / "lib" / "site-packages" / "pytest" / "__init__.py").st_ino
+
+    script = dst / "bin" / "pytest"
+    assert script.read_text().startswith(f"#!{dst}/bin/python")
+    assert os.access(script, os.X_OK)
+    # The source script is untouched.
+    assert (src / "bin" / "pytest").read_text().startswith(f"#!{src}/bin/python")
+
+    assert os.readlink(dst / "bin" / "python") == "/usr/bin/python3"
+    assert (dst / "lib64").is_symlink()
+
+
+def test_seed_find_materialise_roundtrip(tmp_path: Path) -> None:
+    first = _fake_synced_project(tmp_path / "first-app", "first-app")
+    assert templates.find_template("3.12", DEV) is None
+
+    tdir = templates.seed_template(first, "first-app", "3.12", DEV)
+    assert tdir is not None
+    assert templates.find_template("3.12", DEV) == tdir
+    assert templates.find_template("3.11", DEV) is None
+    assert templates.find_template("3.12", ["pytest"]) is None
+    assert f"#!{tdir / '.venv'}/bin/python" in (tdir / ".venv" / "bin" / "pytest").read_text()
+
+    second = tmp_path / "Second_App"
+    second.mkdir()
+    templates.materialise(tdir, second, "Second_App")
+    assert f"#!{second / '.venv'}/bin/python" in (second / ".venv" / "bin" / "pytest").read_text()
+    lock = (second / "uv.lock").read_text()
+    assert 'name = "second-app"' in lock
+    assert 'name = "first-app"' not in lock
+    assert 'name = "pytest"' in lock
+
+
+def test_seed_without_environment_is_skipped(tmp_path: Path) -> None:
+    (tmp_path / "proj").mkdir()
+    assert templates.seed_template(tmp_path / "proj", "proj", "3.12", DEV) is None
+
+
+def test_stale_template_is_ignored(tmp_path: Path) -> None:
+    tdir = templates.seed_template(_fake_synced_project(tmp_path / "p", "p"), "p", "3.12", DEV)
+    assert tdir is not None
+    stamp = json.loads((tdir / "template.json").read_text())
+    stamp["created"] = time.time() - templates.MAX_AGE_SECONDS - 1
+    (tdir / "template.json").write_text(json.dumps(stamp))
+    assert templates.find_template("3.12", DEV) is None
+    assert templates.seed_template(_fake_synced_project(tmp_path / "q", "q"), "q", "3.12", DEV) == tdir
+    assert json.loads((tdir / "template.json").read_text())["name"] == "q"
+    assert sorted(p.name for p in tdir.parent.iterdir()) == [tdir.name]
+
+
+def test_seed_keeps_a_fresh_template_from_a_concurrent_init(tmp_path: Path) -> None:
+    tdir = templates.seed_template(_fake_synced_project(tmp_path / "a", "a"), "a", "3.12", DEV)
+    assert templates.seed_template(_fake_synced_project(tmp_path / "b", "b"), "b", "3.12", DEV) == tdir
+    assert json.loads((tdir / "template.json").read_text())["name"] == "a"
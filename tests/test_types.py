@@ -0,0 +1,143 @@
+"""Tests for the sully_types runtime type-check runner."""
+
+import os
+import subprocess
+import sys
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from typing import Literal, TypedDict
+
+import pytest
+
+from sully.runners import runner_env
+from sully.runners.sully_types import REPORT, checker, instrument, wrap
+
+
+class _Point(TypedDict):
+    x: int
+
+
+class _Refuses(type):
+    def __instancecheck__(cls, instance: object) -> bool:
+        raise TypeError("no instance checks")
+
+
+class _Opaque(metaclass=_Refuses):
+    pass
+
+
+@pytest.fixture(autouse=True)
+def _fresh_report() -> Iterator[None]:
+    REPORT.violations.clear()
+    REPORT.calls = REPORT.checked = 0
+    yield
+
+
+@pytest.mark.parametrize(
+    ("tp", "good", "bad"),
+    [
+        (int, 3, "3"),
+        (float, 3, "3.0"),
+        (str | None, None, b"x"),
+        (list[int], [1, 2], ["1"]),
+        (Sequence[str], ("a",), [1]),
+        (dict[str, int], {"a": 1}, {"a": "1"}),
+        (tuple[int, str], (1, "a"), (1, 2)),
+        (tuple[int, ...], (1, 2, 3), ("a",)),
+        (Literal["r", "w"], "r", "x"),
+        (set[bytes], set(), {1}),
+        (_Point, {"x": 1}, [("x", 1)]),
+    ],
+)
+def test_checker_accepts_and_rejects(tp: object, good: object, bad: object) -> None:
+    check = checker(tp)
+    assert check is not None
+    assert check(good)
+    assert not check(bad)
+
+
+def test_checker_skips_what_it_cannot_check() -> None:
+    from typing import Any, TypeVar
+
+    assert checker(Any) is None
+    assert checker(TypeVar("T")) is None
+    assert checker(int | Any) is None
+
+
+def test_wrapper_survives_a_checker_that_raises() -> None:
+    def ident(x: _Opaque) -> _Opaque:
+        return x
+
+    assert wrap(ident, first=1, sample=1)(3) == 3
+    assert not REPORT.violations
+
+
+def test_wrapper_samples_calls() -> None:
+    def double(x: int) -> int:
+        return x * 2
+
+    wrapped = wrap(double, first=2, sample=10)
+    for _ in range(30):
+        assert wrapped("a") == "aa"
+    violation = next(iter(REPORT.violations.values()))
+    # Calls 1, 2, 10, 20 and 30 are checked: the argument and the return value each fail.
+    assert (REPORT.calls, REPORT.checked) == (30, 5)
+    assert violation.count == 5
+    assert violation.sites == [f"tests/test_types.py:{test_wrapper_samples_calls.__code__.co_firstlineno + 6}"]
+
+
+def test_instrument_wraps_functions_and_methods() -> None:
+    import types
+
+    module = types.ModuleType("fake")
+    exec(
+        "class Box:\n"
+        "    def put(self, item: str) -> None: ...\n"
+        "    @staticmethod\n"
+        "    def make(n: int) -> 'Box': return Box()\n"
+        "    class Lid:\n"
+        "        def close(self, force: bool) -> None: ...\n"
+        "def plain(x): return x\n"
+        "def typed(x: int) -> int: return x\n",
+        module.__dict__,
+    )
+    assert instrument(module, first=10, sample=10) == 4
+    module.Box().put(1)
+    module.Box.make("3")
+    module.Box.Lid().close(None)
+    assert {(v.function, v.what) for v in REPORT.violations.values()} == {
+        ("fake.Box.put", "item"),
+        ("fake.Box.make", "n"),
+        ("fake.Box.Lid.close", "force"),
+    }
+
+
+def test_runner_reports_violations_with_call_sites(tmp_path: Path) -> None:
+    pkg = tmp_path / "src" / "pkg"
+    pkg.mkdir(parents=True)
+    (pkg / "__init__.py").write_text("")
+    (pkg / "core.py").write_text(
+        "from __future__ import annotations\n\n\n"
+        "def count(prices: list[float]) -> int:\n"
+        "    return len(prices)\n"
+    )
+    (pkg / "main.py").write_text(
+        "from pkg.core import count\n\n"
+        "count([1.5, 2.5])\n"
+        "count([])\n"
+        "count(['1.5'])\n"
+        "count(['2.5'])\n"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join([runner_env()["PYTHONPATH"], str(tmp_path / "src")])}
+    result = subprocess.run(
+        [sys.executable, "-m", "sully_types", "--src=src", "--fail", "src/pkg/main.py"],
+        cwd=tmp_path,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 1, result.stderr
+    assert "Traceback" not in result.stderr
+    assert "1 runtime type violation(s); 4 of 4 call(s) checked" in result.stderr
+    assert "pkg.core.count: argument 'prices' expected list[float], got list[str]" in result.stderr
+    assert "called from src/pkg/main.py:5, src/pkg/main.py:6" in result.stderr
@@ -1,5 +1,7 @@
 """Tests for sully.uv — uv subprocess wrapper."""
 
+import subprocess
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest
@@ -73,7 +75,7 @@ def test_run_cmd_args() -> None:
     with patch.object(uv, "_run") as mock_run:
         uv.run_cmd(["pyright", "--level=strict"])
         mock_run.assert_called_once_with(
-            ["run", "pyright", "--level=strict"], cwd=None, check=True
+            ["run", "pyright", "--level=strict"], cwd=None, check=True, env=None
         )
 
 
@@ -96,3 +98,95 @@ def test_dev_flag_takes_precedence_over_group() -> None:
         args = mock_run.call_args[0][0]
         assert "--dev" in args
         assert "--group" not in args
+
+
+def test_run_with_args() -> None:
+    with patch.object(uv, "_run") as mock_run:
+        uv.run_with(["mypyc", "a.py"], with_=["mypy"])
+        mock_run.assert_called_once_with(["run", "--with", "mypy", "mypyc", "a.py"], cwd=None, check=True)
+
+
+def test_run_with_isolated_args() -> None:
+    with patch.object(uv, "_run") as mock_run:
+        uv.run_with(["pytest"], with_=["x.whl", "pytest"], isolated=True, check=False)
+        mock_run.assert_called_once_with(
+            ["run", "--isolated", "--no-project", "--with", "x.whl", "--with", "pytest", "pytest"],
+            cwd=None,
+            check=False,
+        )
+
+
+def test_build_args(tmp_path: Path) -> None:
+    with patch.object(uv, "_run") as mock_run:
+        uv.build(out_dir=tmp_path / "dist")
+        mock_run.assert_called_once_with(
+            ["build", "--wheel", "--out-dir", str(tmp_path / "dist")], cwd=None, check=False
+        )
+
+
+def test_export_requirements_args(tmp_path: Path) -> None:
+    with patch.object(uv, "_run") as mock_run:
+        uv.export_requirements(tmp_path / "req.txt")
+        args = mock_run.call_args[0][0]
+        assert args[0] == "export"
+        assert "--frozen" in args and "--no-dev" in args and "--no-emit-project" in args
+        assert args[-2:] == ["--output-file", str(tmp_path / "req.txt")]
+
+
+def test_pip_install_target_args(tmp_path: Path) -> None:
+    with patch.object(uv, "_run") as mock_run:
+        uv.pip_install_target(tmp_path / "req.txt", tmp_path / "app")
+        mock_run.assert_called_once_with(
+            ["pip", "install", "--target", str(tmp_path / "app"), "-r", str(tmp_path / "req.txt")], cwd=None
+        )
+
+
+def test_run_captured_merges_output(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(uv, "ensure_uv", lambda: "/usr/bin/uv")
+    with patch("subprocess.run") as mock_run:
+        uv.run_captured(["pyright"])
+        args, kwargs = mock_run.call_args
+        assert args[0] == ["/usr/bin/uv", "run", "pyright"]
+        assert kwargs["text"] is True
+        assert kwargs["stderr"] == subprocess.STDOUT
+
+
+def test_run_captured_can_keep_stderr_apart(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(uv, "ensure_uv", lambda: "/usr/bin/uv")
+    with patch("subprocess.run") as mock_run:
+        uv.run_captured(["pyright", "--outputjson"], merge_stderr=False)
+        assert mock_run.call_args.kwargs["stderr"] == subprocess.PIPE
+
+
+def test_sync_captured_args(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(uv, "ensure_uv", lambda: "/usr/bin/uv")
+    with patch("subprocess.run") as mock_run:
+        uv.sync_captured(cwd=tmp_path)
+        args, kwargs = mock_run.call_args
+        assert args[0] == ["/usr/bin/uv", "sync"]
+        assert kwargs["cwd"] == tmp_path
+        assert kwargs["stdout"] == subprocess.PIPE
+
+
+def test_add_and_sync_find_links(tmp_path: Path) -> None:
+    with patch.object(uv, "_run") as mock_run:
+        uv.add(["flask"], find_links=tmp_path)
+        mock_run.assert_called_once_with(["add", "--find-links", str(tmp_path), "flask"], cwd=None)
+    with patch.object(uv, "_run") as mock_run:
+        uv.sync(find_links=tmp_path)
+        mock_run.assert_called_once_with(["sync", "--find-links", str(tmp_path)], cwd=None)
+
+
+def test_download_wheels_args(tmp_path: Path) -> None:
+    with patch.object(uv, "_run") as mock_run:
+        uv.download_wheels(["pytest"], tmp_path, python_version="3.12")
+        args = mock_run.call_args[0][0]
+        assert args[:5] == ["run", "--isolated", "--no-project", "--with", "pip"]
+        assert "--only-binary=:all:" in args
+        assert args[-4:] == ["3.12", "--dest", str(tmp_path), "pytest"]
+
+
+def test_lock_args() -> None:
+    with patch.object(uv, "_run") as mock_run:
+        uv.lock()
+        mock_run.assert_called_once_with(["lock"], cwd=None)
@@ -0,0 +1,56 @@
+"""Tests for sully.wheels — the local wheel mirror."""
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sully import wheels
+from sully.config import DEV_GROUP
+
+
+def test_find_links_only_when_warmed(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(tmp_path)  # no pyproject: default directory under SULLY_CACHE_DIR
+    assert wheels.find_links() is None
+    directory = wheels.wheel_dir()
+    directory.mkdir(parents=True)
+    (directory / "pytest-8.0.0-py3-none-any.whl").write_bytes(b"")
+    assert wheels.find_links() == directory
+
+
+def test_wheel_dir_from_config(tmp_path: Path) -> None:
+    (tmp_path / "pyproject.toml").write_text('[tool.sully.cache]\nwheels = "/srv/wheels"\n')
+    assert wheels.wheel_dir(tmp_path) == Path("/srv/wheels")
+
+
+def test_python_versions_precedence(tmp_path: Path) -> None:
+    (tmp_path / "pyproject.toml").write_text("[project]\nname = 'x'\n")
+    (tmp_path / ".python-version").write_text("3.11\n")
+    assert wheels.python_versions(tmp_path, ["3.13"]) == ["3.13"]
+    assert wheels.python_versions(tmp_path, []) == ["3.11"]
+    (tmp_path / "pyproject.toml").write_text('[tool.sully.cache]\npythons = ["3.12", "3.13"]\n')
+    assert wheels.python_versions(tmp_path, []) == ["3.12", "3.13"]
+
+
+def test_warm_downloads_lock_and_dev_group_per_python(tmp_path: Path) -> None:
+    (tmp_path / "pyproject.toml").write_text("[project]\nname = 'x'\n")
+    (tmp_path / "uv.lock").write_text("")
+    dest = tmp_path / "wheels"
+    with patch("sully.wheels.uv") as mock_uv:
+        mock_uv.download_wheels.return_value = MagicMock(returncode=0)
+        failures = wheels.warm(tmp_path, dest, ["3.12", "3.13"])
+
+    assert failures == []
+    assert mock_uv.export_requirements.call_args.kwargs["all_groups"] is True
+    calls = mock_uv.download_wheels.call_args_list
+    assert [(c.args[0][0], c.kwargs["python_version"]) for c in calls] == [
+        ("-r", "3.12"), (DEV_GROUP[0], "3.12"), ("-r", "3.13"), (DEV_GROUP[0], "3.13"),
+    ]
+
+
+def test_warm_without_project_reports_failures(tmp_path: Path) -> None:
+    with patch("sully.wheels.uv") as mock_uv:
+        mock_uv.download_wheels.return_value = MagicMock(returncode=1)
+        failures = wheels.warm(None, tmp_path / "wheels", ["3.12"])
+    mock_uv.export_requirements.assert_not_called()
+    assert failures == ["Python 3.12: could not download wheels for pyright, pytest, pdoc"]
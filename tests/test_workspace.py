@@ -0,0 +1,72 @@
+"""Tests for sully.workspace — uv workspace discovery and member runs."""
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from sully import workspace
+
+
+def _workspace(tmp_path: Path) -> Path:
+    (tmp_path / "pyproject.toml").write_text(
+        '[project]\nname = "root-app"\n\n'
+        '[tool.uv.workspace]\nmembers = ["packages/*"]\nexclude = ["packages/skip"]\n'
+    )
+    for name in ("alpha", "beta", "skip"):
+        pkg = tmp_path / "packages" / name
+        pkg.mkdir(parents=True)
+        (pkg / "pyproject.toml").write_text(f'[project]\nname = "{name}"\n')
+    (tmp_path / "packages" / "not-a-package").mkdir()
+    return tmp_path
+
+
+def test_find_workspace_root_from_member(tmp_path: Path) -> None:
+    root = _workspace(tmp_path)
+    assert workspace.find_workspace_root(root / "packages" / "alpha") == root.resolve()
+
+
+def test_find_workspace_root_missing(tmp_path: Path) -> None:
+    (tmp_path / "pyproject.toml").write_text('[project]\nname = "solo"\n')
+    with pytest.raises(FileNotFoundError, match="No uv workspace"):
+        workspace.find_workspace_root(tmp_path)
+
+
+def test_members_expands_globs_and_excludes(tmp_path: Path) -> None:
+    root = _workspace(tmp_path)
+    names = [m.name for m in workspace.members(root)]
+    assert names == ["root-app", "alpha", "beta"]
+
+
+def test_members_without_root_project(tmp_path: Path) -> None:
+    root = _workspace(tmp_path)
+    (root / "pyproject.toml").write_text('[tool.uv.workspace]\nmembers = ["packages/*"]\n')
+    assert [m.name for m in workspace.members(root)] == ["alpha", "beta", "skip"]
+
+
+def test_changed_members_attributes_files_to_innermost_member(tmp_path: Path) -> None:
+    root = _workspace(tmp_path)
+    git = ["git", "-c", "user.email=t@t", "-c", "user.name=t"]
+    subprocess.run([*git, "init", "-q"], cwd=root, check=True)
+    subprocess.run([*git, "add", "-A"], cwd=root, check=True)
+    subprocess.run([*git, "commit", "-qm", "init"], cwd=root, check=True)
+
+    (root / "packages" / "beta" / "new.py").write_text("")
+    changed = workspace.changed_members(root, workspace.members(root))
+    assert [m.name for m in changed] == ["beta"]
+
+    with pytest.raises(RuntimeError, match="git diff failed: .*no-such-ref"):
+        workspace.changed_members(root, workspace.members(root), "no-such-ref")
+
+
+def test_run_in_members_runs_concurrently_and_collects(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    root = _workspace(tmp_path)
+    # Members run `python -m sully` from their own directory.
+    monkeypatch.setenv("PYTHONPATH", str(Path(workspace.__file__).parent.parent))
+    seen: list[str] = []
+    results = workspace.run_in_members(
+        ["--version"], workspace.members(root), jobs=2, on_done=lambda r: seen.append(r.member.name)
+    )
+    assert [r.member.name for r in results] == ["root-app", "alpha", "beta"]
+    assert all(r.returncode == 0 and "sully" in r.output for r in results)
+    assert sorted(seen) == ["alpha", "beta", "root-app"]